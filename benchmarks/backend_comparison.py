@@ -0,0 +1,208 @@
+"""Compare the MongoDB and PostgreSQL repositories on the survey read and vote paths.
+
+Seeds the same accounts, surveys and votes into the MongoDB at ``MONGO_URL``
+and the PostgreSQL at ``POSTGRES_URL``, then drives the repositories the
+survey endpoints use from a pool of threads, one event loop per call as the
+controllers do:
+
+- ``list_surveys``: ``SurveyRepository.load_all_view`` with ``didAnswer``.
+- ``load_results``: ``SurveyResultRepository.load_by_survey_id`` (the tally).
+- ``vote``: ``SurveyResultRepository.save`` (an upsert).
+
+Both databases are wiped first, so ``--reset`` is required. Neither
+docker-compose database publishes a port; ``make bench-backends`` runs this
+module inside the compose network.
+
+Usage:
+    python -m benchmarks.backend_comparison --reset --backends mongodb,postgres
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.load_test import percentile
+from domain.usecases.add_account import AddAccountModel
+from domain.usecases.add_survey import AddSurveyAnswerParams, AddSurveyParams
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from utils.email_validator_adapter import EmailValidatorAdapter
+
+BACKENDS = ("mongodb", "postgres")
+OPERATIONS = ("list_surveys", "load_results", "vote")
+
+
+def _mongodb() -> SimpleNamespace:
+    from infra.db import mongodb
+    from infra.db.mongodb.helpers import MongoHelper
+    from infra.db.mongodb.indexes import ensure_indexes
+
+    asyncio.run(MongoHelper.connect())
+    database = MongoHelper.get_db()
+    for name in database.list_collection_names():
+        database.drop_collection(name)
+    ensure_indexes()
+    return SimpleNamespace(
+        accounts=mongodb.AccountMongoRepository(EmailValidatorAdapter()),
+        surveys=mongodb.SurveyMongoRepository(),
+        survey_results=mongodb.SurveyResultMongoRepository(),
+        disconnect=MongoHelper.disconnect,
+    )
+
+
+def _postgres() -> SimpleNamespace:
+    from infra.db import postgres
+    from infra.db.postgres.helpers import PostgresHelper
+
+    asyncio.run(PostgresHelper.connect())
+    asyncio.run(PostgresHelper.execute("TRUNCATE accounts, surveys RESTART IDENTITY CASCADE"))
+    return SimpleNamespace(
+        accounts=postgres.AccountPostgresRepository(EmailValidatorAdapter()),
+        surveys=postgres.SurveyPostgresRepository(),
+        survey_results=postgres.SurveyResultPostgresRepository(),
+        disconnect=PostgresHelper.disconnect,
+    )
+
+
+_CONNECT: dict[str, Callable[[], SimpleNamespace]] = {"mongodb": _mongodb, "postgres": _postgres}
+
+
+async def _seed(repos: SimpleNamespace, config: argparse.Namespace) -> tuple[list[str], list[Any]]:
+    account_ids = []
+    for index in range(config.accounts):
+        account = await repos.accounts.add(AddAccountModel(
+            name=f"Bench {index}", email=f"bench{index}@example.com", password="not-a-hash",
+        ))
+        account_ids.append(account.id)
+    for index in range(config.surveys):
+        await repos.surveys.add(AddSurveyParams(
+            question=f"Question {index}?",
+            answers=[
+                AddSurveyAnswerParams(answer=f"Answer {answer}", image=None)
+                for answer in range(config.answers)
+            ],
+            date=datetime(2024, 1, 1),
+        ))
+    surveys = await repos.surveys.load_all(account_ids[0])
+    # Same seed per backend, so both hold the same votes.
+    rng = random.Random(config.seed)
+    for survey in surveys:
+        for account_id in rng.sample(account_ids, min(config.voters, len(account_ids))):
+            await repos.survey_results.save(SaveSurveyResultParams(
+                survey_id=survey.id,
+                account_id=account_id,
+                answer=rng.choice(survey.answers).answer,
+                date=datetime(2024, 1, 2),
+            ))
+    return account_ids, surveys
+
+
+def _operation(
+    name: str, repos: SimpleNamespace, account_ids: list[str], surveys: list[Any]
+) -> Callable[[int], Any]:
+    def pick(index: int) -> tuple[str, Any]:
+        return account_ids[index % len(account_ids)], surveys[index % len(surveys)]
+
+    if name == "list_surveys":
+        return lambda index: repos.surveys.load_all_view(pick(index)[0])
+    if name == "load_results":
+        return lambda index: repos.survey_results.load_by_survey_id(pick(index)[1].id, pick(index)[0])
+
+    def vote(index: int) -> Any:
+        account_id, survey = pick(index)
+        return repos.survey_results.save(SaveSurveyResultParams(
+            survey_id=survey.id,
+            account_id=account_id,
+            answer=survey.answers[index % len(survey.answers)].answer,
+        ))
+
+    return vote
+
+
+def _measure(call: Callable[[int], Any], requests: int, concurrency: int) -> dict[str, Any]:
+    def timed(index: int) -> float:
+        started = time.perf_counter()
+        asyncio.run(call(index))
+        return (time.perf_counter() - started) * 1000
+
+    for index in range(min(concurrency, requests)):
+        timed(index)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+    }
+
+
+def run(config: argparse.Namespace) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "accounts": config.accounts,
+        "surveys": config.surveys,
+        "answers": config.answers,
+        "voters": config.voters,
+        "concurrency": config.concurrency,
+        "backends": {},
+    }
+    for backend in config.backends:
+        repos = _CONNECT[backend]()
+        try:
+            seeding = time.perf_counter()
+            account_ids, surveys = asyncio.run(_seed(repos, config))
+            results = {"seed_s": round(time.perf_counter() - seeding, 2)}
+            for name in OPERATIONS:
+                call = _operation(name, repos, account_ids, surveys)
+                results[name] = _measure(call, config.requests, config.concurrency)
+            report["backends"][backend] = results
+        finally:
+            asyncio.run(repos.disconnect())
+    return report
+
+
+def _backends(value: str) -> list[str]:
+    backends = [backend.strip() for backend in value.split(",") if backend.strip()]
+    unknown = set(backends) - set(BACKENDS)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown backend(s): {', '.join(sorted(unknown))}")
+    return backends
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backends", type=_backends, default=list(BACKENDS))
+    parser.add_argument("--accounts", type=int, default=500)
+    parser.add_argument("--surveys", type=int, default=50)
+    parser.add_argument("--answers", type=int, default=4)
+    parser.add_argument("--voters", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--reset", action="store_true",
+        help="required: drops every collection and truncates every table first",
+    )
+    args = parser.parse_args(argv)
+    if not args.reset:
+        parser.error("--reset is required; the benchmark wipes both databases")
+    print(json.dumps(run(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,74 @@
+"""Diff two load test reports written by ``benchmarks.load_test --output``.
+
+Usage:
+    python -m benchmarks.compare baseline.json candidate.json --threshold 10
+
+Exits with status 1 when any scenario regresses by more than the threshold
+(percent) on p95 latency or throughput, or issues more queries per request.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def compare(baseline: dict[str, Any], candidate: dict[str, Any], threshold: float) -> list[dict]:
+    rows = []
+    for name, new in candidate["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old is None:
+            continue
+        p95_change = _change(old["latency_ms"]["p95"], new["latency_ms"]["p95"])
+        rps_change = _change(old["rps"], new["rps"])
+        old_queries = old.get("queries_per_request")
+        new_queries = new.get("queries_per_request")
+        more_queries = (
+            old_queries is not None and new_queries is not None and new_queries > old_queries
+        )
+        rows.append({
+            "scenario": name,
+            "p50_change": _change(old["latency_ms"]["p50"], new["latency_ms"]["p50"]),
+            "p95_change": p95_change,
+            "p99_change": _change(old["latency_ms"]["p99"], new["latency_ms"]["p99"]),
+            "rps_change": rps_change,
+            "queries": (old_queries, new_queries),
+            "regression": p95_change > threshold or rps_change < -threshold or more_queries,
+        })
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two load test reports")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed change in percent")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(args.baseline.read_text())
+    candidate = json.loads(args.candidate.read_text())
+    rows = compare(baseline, candidate, args.threshold)
+
+    print(f"{baseline['meta'].get('commit')} -> {candidate['meta'].get('commit')}")
+    print(
+        f"{'scenario':<14}{'p50':>9}{'p95':>9}{'p99':>9}{'rps':>9}{'queries':>14}"
+    )
+    for row in rows:
+        old_queries, new_queries = row["queries"]
+        print(
+            f"{row['scenario']:<14}{row['p50_change']:>+8.1f}%{row['p95_change']:>+8.1f}%"
+            f"{row['p99_change']:>+8.1f}%{row['rps_change']:>+8.1f}%"
+            f"{f'{old_queries} -> {new_queries}':>14}"
+            f"{'  REGRESSION' if row['regression'] else ''}"
+        )
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
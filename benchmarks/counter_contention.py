@@ -0,0 +1,160 @@
+"""Vote and tally throughput on one hot survey, with and without sharded counters.
+
+Every thread votes on the same survey of the MongoDB at ``MONGO_URL``, one
+new account per vote, then reads its tally, once per mode:
+
+- ``votes``: ``SurveyResultMongoRepository``; the tally groups every vote.
+- ``single``: ``ShardedSurveyResultMongoRepository`` held at one shard, i.e.
+  one counter document per answer that every voter increments.
+- ``sharded``: ``ShardedSurveyResultMongoRepository`` starting at
+  ``--base-shards`` and raised by the hot-survey detector.
+
+The database is wiped before each mode, so ``--reset`` is required. The
+docker-compose MongoDB publishes no port; ``make bench-counters`` runs this
+module inside the compose network.
+
+Usage:
+    python -m benchmarks.counter_contention --reset --votes 20000 --concurrency 32
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bson import ObjectId
+
+from benchmarks.load_test import percentile
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.mongodb.helpers import MongoHelper
+from infra.db.mongodb.indexes import ensure_indexes
+from infra.db.mongodb.sharded_survey_result_repository import (
+    HotSurveyDetector,
+    ShardedSurveyResultMongoRepository,
+)
+from infra.db.mongodb.survey_result_repository import SurveyResultMongoRepository
+
+MODES = ("votes", "single", "sharded")
+
+
+def _repository(mode: str, config: argparse.Namespace) -> Any:
+    if mode == "votes":
+        return SurveyResultMongoRepository()
+    if mode == "single":
+        return ShardedSurveyResultMongoRepository(HotSurveyDetector(1, 1))
+    return ShardedSurveyResultMongoRepository(HotSurveyDetector(
+        config.base_shards, config.max_shards, config.hot_votes_per_second
+    ))
+
+
+def _reset() -> str:
+    database = MongoHelper.get_db()
+    for name in database.list_collection_names():
+        database.drop_collection(name)
+    ensure_indexes()
+    return str(database.surveys.insert_one({
+        "question": "Hot question?",
+        "answers": [{"answer": f"Answer {index}"} for index in range(4)],
+        "date": datetime(2024, 1, 1),
+    }).inserted_id)
+
+
+def _measure(call: Callable[[int], Any], requests: int, concurrency: int) -> dict[str, Any]:
+    def timed(index: int) -> float:
+        started = time.perf_counter()
+        asyncio.run(call(index))
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed, range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50), 3),
+        "p95_ms": round(percentile(latencies, 0.95), 3),
+        "p99_ms": round(percentile(latencies, 0.99), 3),
+    }
+
+
+def _run_mode(mode: str, config: argparse.Namespace) -> dict[str, Any]:
+    survey_id = _reset()
+    repository = _repository(mode, config)
+    accounts = [str(ObjectId()) for _ in range(config.votes)]
+    rng = random.Random(config.seed)
+    answers = [f"Answer {rng.randrange(4)}" for _ in range(config.votes)]
+
+    def vote(index: int) -> Any:
+        return repository.save(SaveSurveyResultParams(survey_id, accounts[index], answers[index]))
+
+    def read(index: int) -> Any:
+        return repository.load_by_survey_id(survey_id, accounts[index % len(accounts)])
+
+    results: dict[str, Any] = {
+        "vote": _measure(vote, config.votes, config.concurrency),
+        "load_results": _measure(read, config.reads, config.concurrency),
+    }
+    tally = asyncio.run(repository.load_by_survey_id(survey_id, accounts[0]))
+    results["counted_votes"] = sum(answer.count for answer in tally.answers)
+    if mode != "votes":
+        results["shards"] = repository.detector.shards(survey_id)
+    return results
+
+
+def run(config: argparse.Namespace) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "votes": config.votes,
+        "reads": config.reads,
+        "concurrency": config.concurrency,
+        "modes": {},
+    }
+    asyncio.run(MongoHelper.connect())
+    try:
+        for mode in config.modes:
+            report["modes"][mode] = _run_mode(mode, config)
+    finally:
+        asyncio.run(MongoHelper.disconnect())
+    return report
+
+
+def _modes(value: str) -> list[str]:
+    modes = [mode.strip() for mode in value.split(",") if mode.strip()]
+    unknown = set(modes) - set(MODES)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown mode(s): {', '.join(sorted(unknown))}")
+    return modes
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modes", type=_modes, default=list(MODES))
+    parser.add_argument("--votes", type=int, default=20000)
+    parser.add_argument("--reads", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--base-shards", type=int, default=4)
+    parser.add_argument("--max-shards", type=int, default=64)
+    parser.add_argument("--hot-votes-per-second", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--reset", action="store_true", help="required: drops every collection first",
+    )
+    args = parser.parse_args(argv)
+    if not args.reset:
+        parser.error("--reset is required; the benchmark wipes the database")
+    print(json.dumps(run(args), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,107 @@
+"""Compare JWT verification throughput across signing algorithms and key handling.
+
+``cached`` verifies with key objects parsed once by ``JwtKeyRing``; ``reparsed``
+loads the public key from PEM for every token, which is what a verifier that
+keeps only key text pays.
+
+Usage:
+    python -m benchmarks.jwt_verification --tokens 2000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+
+from infra.cryptography import JwtAdapter, JwtKeyRing
+
+
+def _private_pem(algorithm: str) -> bytes:
+    if algorithm == "RS256":
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _measure(verify: Callable[[str], Awaitable[Any]], tokens: list[str]) -> dict:
+    async def verify_all() -> float:
+        await verify(tokens[0])
+        started = time.perf_counter()
+        for token in tokens:
+            if await verify(token) is None:
+                raise AssertionError("token failed verification")
+        return time.perf_counter() - started
+
+    # One event loop for the whole pass, so the numbers reflect signature checks.
+    elapsed = asyncio.run(verify_all())
+    return {
+        "verifications_per_second": round(len(tokens) / elapsed),
+        "latency_us": round(elapsed / len(tokens) * 1_000_000, 2),
+    }
+
+
+def _tokens(adapter: JwtAdapter, count: int) -> list[str]:
+    async def sign_all() -> list[str]:
+        return [await adapter.encrypt(f"account-{index}") for index in range(count)]
+
+    return asyncio.run(sign_all())
+
+
+def run(count: int) -> dict:
+    results: dict[str, Any] = {"tokens": count}
+    hmac_adapter = JwtAdapter("a-32-byte-benchmark-secret-value!")
+    tokens = _tokens(hmac_adapter, count)
+    results["HS256"] = {"cached": _measure(hmac_adapter.decrypt_claims, tokens)}
+
+    for algorithm in ("RS256", "EdDSA"):
+        pem = _private_pem(algorithm)
+        ring = JwtKeyRing.from_pem(pem, "bench", algorithm)
+        adapter = JwtAdapter("", key_ring=ring)
+        tokens = _tokens(adapter, count)
+        public_pem = ring.signing_key.public_key().public_bytes(
+            serialization.Encoding.PEM,
+            serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+
+        async def reparsed(token: str, algorithm: str = algorithm, public_pem: bytes = public_pem):
+            return jwt.decode(
+                token,
+                public_pem,
+                algorithms=[algorithm],
+                issuer=adapter.issuer,
+                audience=adapter.audience,
+            )
+
+        results[algorithm] = {
+            "cached": _measure(adapter.decrypt_claims, tokens),
+            "reparsed": _measure(reparsed, tokens),
+        }
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=2000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.tokens), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
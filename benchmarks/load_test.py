@@ -0,0 +1,414 @@
+"""End-to-end load test for the API.
+
+Boots ``create_app`` in-process against a seeded mongomock database (or the
+MongoDB at ``MONGO_URL`` with ``--backend mongo``), drives signup, login,
+survey listing, voting and result loading with a pool of concurrent clients,
+and reports latency percentiles, throughput and Mongo operations per request.
+``--url`` targets an already running server over HTTP instead.
+
+Usage:
+    python -m benchmarks.load_test --concurrency 8 --requests 200
+    python -m benchmarks.load_test --backend mongo --output benchmarks/results/main.json
+    python -m benchmarks.compare benchmarks/results/main.json benchmarks/results/branch.json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import http.client
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import urlparse
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+SCENARIOS = ("signup", "login", "list_surveys", "vote", "load_results")
+PASSWORD = "Bench_password123"
+
+_QUERY_METHODS = {
+    "aggregate",
+    "bulk_write",
+    "count_documents",
+    "delete_many",
+    "delete_one",
+    "distinct",
+    "find",
+    "find_one",
+    "find_one_and_update",
+    "insert_many",
+    "insert_one",
+    "update_many",
+    "update_one",
+}
+_counter = threading.local()
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class _CountingCollection:
+    """Collection proxy that counts Mongo operations issued on the calling thread."""
+
+    def __init__(self, collection: Any):
+        self._collection = collection
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._collection, name)
+        if name == "with_options":
+            return lambda *args, **kwargs: _CountingCollection(attribute(*args, **kwargs))
+        if name not in _QUERY_METHODS:
+            return attribute
+
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            _counter.queries = getattr(_counter, "queries", 0) + 1
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+class _InProcessClient:
+    def __init__(self, app: Any):
+        self._client = app.test_client()
+
+    def request(self, method: str, path: str, body: Any = None, token: str | None = None):
+        headers = {"x-access-token": token} if token else {}
+        response = self._client.open(path, method=method, json=body, headers=headers)
+        return response.status_code, response.get_json(silent=True)
+
+
+class _HttpClient:
+    def __init__(self, base_url: str):
+        parsed = urlparse(base_url)
+        connection_class = (
+            http.client.HTTPSConnection if parsed.scheme == "https" else http.client.HTTPConnection
+        )
+        self._connection = connection_class(parsed.netloc, timeout=30)
+
+    def request(self, method: str, path: str, body: Any = None, token: str | None = None):
+        headers = {"Content-Type": "application/json"}
+        if token:
+            headers["x-access-token"] = token
+        payload = json.dumps(body) if body is not None else None
+        self._connection.request(method, path, body=payload, headers=headers)
+        response = self._connection.getresponse()
+        data = response.read()
+        return response.status, json.loads(data) if data else None
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    statuses: dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    elapsed_s: float = 0.0
+
+    def summary(self) -> dict[str, Any]:
+        count = len(self.latencies_ms)
+        return {
+            "requests": count,
+            "errors": self.errors,
+            "statuses": self.statuses,
+            "rps": round(count / self.elapsed_s, 2) if self.elapsed_s else 0.0,
+            "latency_ms": {
+                "mean": round(statistics.fmean(self.latencies_ms), 3) if count else 0.0,
+                "p50": round(percentile(self.latencies_ms, 0.50), 3),
+                "p95": round(percentile(self.latencies_ms, 0.95), 3),
+                "p99": round(percentile(self.latencies_ms, 0.99), 3),
+                "max": round(max(self.latencies_ms), 3) if count else 0.0,
+            },
+            "queries_per_request": (
+                round(statistics.fmean(self.queries), 3) if self.queries else None
+            ),
+        }
+
+
+@dataclass
+class BenchmarkConfig:
+    concurrency: int = 4
+    requests: int = 100
+    surveys: int = 20
+    answers: int = 4
+    backend: str = "mongomock"
+    url: str | None = None
+    bcrypt_rounds: int = 10
+    scenarios: tuple[str, ...] = SCENARIOS
+
+
+def _configure_environment(config: BenchmarkConfig) -> None:
+    os.environ.setdefault("ENV", "test")
+    os.environ.setdefault("JWT_SECRET", "benchmark-secret-that-is-long-enough-for-hs256")
+    os.environ["BCRYPT_SALT"] = str(config.bcrypt_rounds)
+    os.environ["AUTH_RATE_LIMIT_MAX_REQUESTS"] = str(10 ** 9)
+
+
+def _connect(config: BenchmarkConfig) -> None:
+    from infra.db.mongodb.helpers import MongoHelper
+
+    if config.backend == "mongo":
+        asyncio.run(MongoHelper.connect())
+    else:
+        import mongomock
+
+        MongoHelper._client = mongomock.MongoClient()
+    os.environ["MONGO_DB_NAME"] = f"flask_tdd_bench_{uuid.uuid4().hex[:8]}"
+
+
+def _install_query_counter() -> Callable[[], None]:
+    from infra.db.mongodb.helpers import MongoHelper
+
+    original = MongoHelper.__dict__["get_collection"]
+    get_collection = MongoHelper.get_collection
+    MongoHelper.get_collection = classmethod(
+        lambda cls, name, db_name=None: _CountingCollection(get_collection(name, db_name))
+    )
+    return lambda: setattr(MongoHelper, "get_collection", original)
+
+
+def _seed_surveys(config: BenchmarkConfig) -> list[dict[str, Any]]:
+    from infra.db.mongodb.helpers import MongoHelper
+
+    surveys = [
+        {
+            "question": f"Benchmark question {index}?",
+            "answers": [{"answer": f"Answer {answer}"} for answer in range(config.answers)],
+            "date": datetime.now(timezone.utc),
+        }
+        for index in range(config.surveys)
+    ]
+    MongoHelper.get_collection("surveys").insert_many(surveys)
+    return [{"id": str(survey["_id"]), "answers": survey["answers"]} for survey in surveys]
+
+
+def _signup_payload(email: str) -> dict[str, str]:
+    return {
+        "name": "Bench User",
+        "email": email,
+        "password": PASSWORD,
+        "passwordConfirmation": PASSWORD,
+    }
+
+
+def _run_scenario(
+    name: str,
+    config: BenchmarkConfig,
+    make_client: Callable[[], Any],
+    operation: Callable[[Any, int, int], tuple[int, Any]],
+    count_queries: bool,
+) -> ScenarioResult:
+    result = ScenarioResult(name)
+    lock = threading.Lock()
+
+    def worker(worker_index: int) -> None:
+        client = make_client()
+        for index in range(worker_index, config.requests, config.concurrency):
+            _counter.queries = 0
+            started = time.perf_counter()
+            try:
+                status, _ = operation(client, worker_index, index)
+            except Exception:
+                status = None
+            latency_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                result.latencies_ms.append(latency_ms)
+                if count_queries:
+                    result.queries.append(_counter.queries)
+                if status is None or status >= 400:
+                    result.errors += 1
+                key = str(status)
+                result.statuses[key] = result.statuses.get(key, 0) + 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=config.concurrency) as executor:
+        list(executor.map(worker, range(config.concurrency)))
+    result.elapsed_s = time.perf_counter() - started
+    return result
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[1],
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(config: BenchmarkConfig) -> dict[str, Any]:
+    restore: Callable[[], None] = lambda: None
+    make_client: Callable[[], Any]
+    if config.url:
+        make_client = partial(_HttpClient, config.url)
+        count_queries = False
+        surveys: list[dict[str, Any]] = []
+    else:
+        _configure_environment(config)
+        _connect(config)
+        from main.config.app import create_app
+
+        make_client = partial(_InProcessClient, create_app())
+        surveys = _seed_surveys(config)
+        restore = _install_query_counter()
+        count_queries = True
+
+    try:
+        setup_client = make_client()
+        run_id = uuid.uuid4().hex[:8]
+        tokens = []
+        for index in range(config.concurrency):
+            status, body = setup_client.request(
+                "POST", "/api/signup", _signup_payload(f"bench-{run_id}-{index}@example.com")
+            )
+            if status != 200:
+                raise RuntimeError(f"Could not create benchmark account: {status} {body}")
+            tokens.append(body["accessToken"])
+        if not surveys:
+            status, body = setup_client.request("GET", "/api/surveys", token=tokens[0])
+            surveys = [
+                {"id": survey["id"], "answers": survey["answers"]} for survey in body or []
+            ]
+        if not surveys and set(config.scenarios) & {"vote", "load_results"}:
+            raise RuntimeError("Voting scenarios need at least one survey on the target server")
+
+        def survey_for(index: int) -> dict[str, Any]:
+            return surveys[index % len(surveys)]
+
+        def vote(client: Any, worker: int, index: int) -> tuple[int, Any]:
+            survey = survey_for(index)
+            answer = survey["answers"][index % len(survey["answers"])]["answer"]
+            return client.request(
+                "PUT", f"/api/surveys/{survey['id']}/results", {"answer": answer}, tokens[worker]
+            )
+
+        operations = {
+            "signup": lambda client, worker, index: client.request(
+                "POST", "/api/signup", _signup_payload(f"bench-{run_id}-s{index}@example.com")
+            ),
+            "login": lambda client, worker, index: client.request(
+                "POST",
+                "/api/login",
+                {"email": f"bench-{run_id}-{worker}@example.com", "password": PASSWORD},
+            ),
+            "list_surveys": lambda client, worker, index: client.request(
+                "GET", "/api/surveys", token=tokens[worker]
+            ),
+            "vote": vote,
+            "load_results": lambda client, worker, index: client.request(
+                "GET", f"/api/surveys/{survey_for(index)['id']}/results", token=tokens[worker]
+            ),
+        }
+        results = {
+            name: _run_scenario(
+                name, config, make_client, operations[name], count_queries
+            ).summary()
+            for name in config.scenarios
+        }
+    finally:
+        restore()
+
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "target": config.url or f"in-process ({config.backend})",
+            "concurrency": config.concurrency,
+            "requests": config.requests,
+            "surveys": config.surveys,
+            "bcrypt_rounds": None if config.url else config.bcrypt_rounds,
+        },
+        "scenarios": results,
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    meta = report["meta"]
+    print(
+        f"target={meta['target']} commit={meta['commit']} "
+        f"concurrency={meta['concurrency']} requests={meta['requests']}"
+    )
+    print(
+        f"{'scenario':<14}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}"
+        f"{'p99 ms':>10}{'errors':>8}{'queries':>9}"
+    )
+    for name, summary in report["scenarios"].items():
+        latency = summary["latency_ms"]
+        queries = summary["queries_per_request"]
+        print(
+            f"{name:<14}{summary['rps']:>10.1f}{latency['p50']:>10.2f}{latency['p95']:>10.2f}"
+            f"{latency['p99']:>10.2f}{summary['errors']:>8}"
+            f"{'-' if queries is None else f'{queries:.2f}':>9}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="API load test")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=100, help="Requests per scenario")
+    parser.add_argument("--surveys", type=int, default=20)
+    parser.add_argument("--answers", type=int, default=4)
+    parser.add_argument("--backend", choices=("mongomock", "mongo"), default="mongomock")
+    parser.add_argument("--url", help="Benchmark a running server instead of an in-process app")
+    parser.add_argument(
+        "--bcrypt-rounds", type=int, default=int(os.getenv("BCRYPT_SALT", "10"))
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma separated subset of {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--output", help="Write the JSON report to this path")
+    args = parser.parse_args(argv)
+
+    scenarios = tuple(name.strip() for name in args.scenarios.split(",") if name.strip())
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    report = run(BenchmarkConfig(
+        concurrency=args.concurrency,
+        requests=args.requests,
+        surveys=args.surveys,
+        answers=args.answers,
+        backend=args.backend,
+        url=args.url,
+        bcrypt_rounds=args.bcrypt_rounds,
+        scenarios=scenarios,
+    ))
+    _print_report(report)
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nSaved {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
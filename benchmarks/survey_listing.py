@@ -0,0 +1,97 @@
+"""Compare the decoded and raw BSON read paths behind GET /api/surveys.
+
+Both pipelines start from the BSON bytes a Mongo cursor receives off the wire,
+so the numbers isolate decoding and serialization from network and server time.
+
+Usage:
+    python -m benchmarks.survey_listing --surveys 200 --answers 5 --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+if __package__ is None or __package__ == "":
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import bson
+from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
+
+from infra.db.mongodb.survey_repository import SurveyMongoRepository
+from main.adapters.flask_route_adapter import _serialize
+
+
+def _seed(surveys: int, answers: int) -> list[bytes]:
+    return [
+        bson.encode({
+            "_id": ObjectId(),
+            "question": f"Question {index}?",
+            "answers": [
+                {"answer": f"Answer {answer}", "image": f"https://img/{answer}.png"}
+                for answer in range(answers)
+            ],
+            "date": datetime(2024, 1, 1),
+        })
+        for index in range(surveys)
+    ]
+
+
+def decoded_path(payloads: list[bytes]) -> list[dict[str, Any]]:
+    models = [SurveyMongoRepository._to_model(bson.decode(data)) for data in payloads]
+    return _serialize(models)
+
+
+def raw_path(payloads: list[bytes]) -> list[dict[str, Any]]:
+    return [SurveyMongoRepository._to_view(RawBSONDocument(data)) for data in payloads]
+
+
+def _measure(fn: Callable[[list[bytes]], Any], payloads: list[bytes], repeat: int) -> dict:
+    fn(payloads)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        fn(payloads)
+    latency_ms = (time.perf_counter() - started) / repeat * 1000
+
+    tracemalloc.start()
+    fn(payloads)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "latency_ms": round(latency_ms, 3),
+        "peak_bytes": peak,
+        "retained_bytes": current,
+    }
+
+
+def run(surveys: int, answers: int, repeat: int) -> dict:
+    payloads = _seed(surveys, answers)
+    if decoded_path(payloads) != raw_path(payloads):
+        raise AssertionError("raw BSON view diverges from the decoded response body")
+    return {
+        "surveys": surveys,
+        "answers": answers,
+        "repeat": repeat,
+        "decoded": _measure(decoded_path, payloads, repeat),
+        "raw": _measure(raw_path, payloads, repeat),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--surveys", type=int, default=200)
+    parser.add_argument("--answers", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+    print(json.dumps(run(args.surveys, args.answers, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
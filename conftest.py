@@ -65,8 +65,8 @@ def signup_payload(random_email: str) -> Dict[str, str]:
     return {
         "name": "Test User",
         "email": random_email,
-        "password": "valid_password_123",
-        "passwordConfirmation": "valid_password_123",
+        "password": "Valid_password_123",
+        "passwordConfirmation": "Valid_password_123",
     }
 
 
@@ -78,8 +78,8 @@ def make_signup_payload() -> Any:
         payload = {
             "name": "Test User",
             "email": f"test-{uuid.uuid4().hex[:8]}@example.com",
-            "password": "valid_password_123",
-            "passwordConfirmation": "valid_password_123",
+            "password": "Valid_password_123",
+            "passwordConfirmation": "Valid_password_123",
         }
         payload.update(overrides)
         return payload
@@ -2,12 +2,30 @@ from data.protocols.add_account_repository import (
     AddAccountRepository,
     CheckAccountByEmailRepository,
     LoadAccountByEmailRepository,
+    LoadAccountByIdRepository,
     LoadAccountByTokenRepository,
     UpdateAccessTokenRepository,
+    UpdatePasswordRepository,
+)
+from data.protocols.email_normalizer import EmailNormalizer
+from data.protocols.encrypter import (
+    ClaimsDecrypter,
+    ClaimsEncrypter,
+    Decrypter,
+    Encrypter,
+    HashComparer,
+    Hasher,
+    HashRehasher,
+)
+from data.protocols.refresh_token_repository import (
+    AddRefreshTokenRepository,
+    ConsumeRefreshTokenRepository,
+    RevokeRefreshTokenFamilyRepository,
 )
-from data.protocols.encrypter import Decrypter, Encrypter, HashComparer, Hasher
 from data.protocols.save_survey_result_repository import (
+    LoadAccountAnswersRepository,
     LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
     SaveSurveyResultRepository,
 )
 from data.protocols.survey_repository import (
@@ -15,24 +33,45 @@ from data.protocols.survey_repository import (
     CheckSurveyByIdRepository,
     LoadAnswersBySurveyRepository,
     LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
     LoadSurveysRepository,
+    LoadSurveysViewRepository,
+)
+from data.protocols.token_revocation_repository import (
+    LoadTokenRevocationsRepository,
+    RevokeAccountTokensRepository,
 )
 
 __all__ = [
     "AddAccountRepository",
+    "AddRefreshTokenRepository",
     "AddSurveyRepository",
     "CheckAccountByEmailRepository",
+    "ClaimsDecrypter",
+    "ClaimsEncrypter",
     "CheckSurveyByIdRepository",
+    "ConsumeRefreshTokenRepository",
     "Decrypter",
+    "EmailNormalizer",
     "Encrypter",
     "Hasher",
     "HashComparer",
+    "HashRehasher",
+    "LoadAccountAnswersRepository",
     "LoadAccountByEmailRepository",
+    "LoadAccountByIdRepository",
     "LoadAccountByTokenRepository",
     "LoadAnswersBySurveyRepository",
     "LoadSurveyByIdRepository",
     "LoadSurveyResultRepository",
+    "LoadSurveyResultsRepository",
+    "LoadSurveysByIdsRepository",
     "LoadSurveysRepository",
+    "LoadSurveysViewRepository",
+    "LoadTokenRevocationsRepository",
+    "RevokeAccountTokensRepository",
+    "RevokeRefreshTokenFamilyRepository",
     "SaveSurveyResultRepository",
     "UpdateAccessTokenRepository",
+    "UpdatePasswordRepository",
 ]
@@ -7,8 +7,8 @@ from domain.models.account import AccountModel
 
 class AddAccountRepository(ABC):
     @abstractmethod
-    async def add(self, account: AddAccountModel) -> bool | AccountModel:
-        pass
+    async def add(self, account: AddAccountModel) -> bool | AccountModel | None:
+        """Return ``None`` when an account with the same email already exists."""
 
 
 class CheckAccountByEmailRepository(ABC):
@@ -23,6 +23,12 @@ class LoadAccountByEmailRepository(ABC):
         pass
 
 
+class LoadAccountByIdRepository(ABC):
+    @abstractmethod
+    async def load_by_id(self, account_id: str) -> AccountModel | None:
+        pass
+
+
 class LoadAccountByTokenRepository(ABC):
     @abstractmethod
     async def load_by_token(self, token: str, role: str | None = None) -> AccountModel | None:
@@ -31,5 +37,13 @@ class LoadAccountByTokenRepository(ABC):
 
 class UpdateAccessTokenRepository(ABC):
     @abstractmethod
-    async def update_access_token(self, account_id: str, token: str) -> None:
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
+        pass
+
+
+class UpdatePasswordRepository(ABC):
+    @abstractmethod
+    async def update_password(self, account_id: str, password: str) -> None:
         pass
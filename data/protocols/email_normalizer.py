@@ -0,0 +1,7 @@
+from abc import ABC, abstractmethod
+
+
+class EmailNormalizer(ABC):
+    @abstractmethod
+    def normalize(self, email: str) -> str:
+        """Return the form two spellings of the same mailbox share."""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Any
 
 
 class Encrypter(ABC):
@@ -15,6 +16,18 @@ class Decrypter(ABC):
         pass
 
 
+class ClaimsEncrypter(ABC):
+    @abstractmethod
+    async def encrypt(self, value: str, claims: dict[str, Any] | None = None) -> str:
+        pass
+
+
+class ClaimsDecrypter(ABC):
+    @abstractmethod
+    async def decrypt_claims(self, value: str) -> dict[str, Any] | None:
+        pass
+
+
 class Hasher(ABC):
     @abstractmethod
     async def hash(self, value: str) -> str:
@@ -25,3 +38,9 @@ class HashComparer(ABC):
     @abstractmethod
     async def compare(self, value: str, digest: str) -> bool:
         pass
+
+
+class HashRehasher(Hasher):
+    @abstractmethod
+    async def needs_rehash(self, digest: str) -> bool:
+        """Whether ``digest`` was made by another scheme or with outdated parameters."""
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from domain.models.refresh_token import RefreshTokenModel
+
+
+class AddRefreshTokenRepository(ABC):
+    @abstractmethod
+    async def add_refresh_token(
+        self,
+        token_hash: str,
+        refresh_token: RefreshTokenModel,
+        expires_at: datetime,
+    ) -> None:
+        pass
+
+
+class ConsumeRefreshTokenRepository(ABC):
+    @abstractmethod
+    async def consume_refresh_token(self, token_hash: str) -> RefreshTokenModel | None:
+        """Mark an unexpired token as used and return it as it was before.
+
+        ``used`` on the result tells whether it had already been consumed.
+        """
+
+
+class RevokeRefreshTokenFamilyRepository(ABC):
+    @abstractmethod
+    async def revoke_refresh_token_family(self, family: str) -> None:
+        pass
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from typing import Dict, List
+
 from domain.usecases.save_survey_result import SaveSurveyResultModel
 from domain.models.survey_result import SurveyResultModel
 
@@ -17,3 +19,19 @@ class LoadSurveyResultRepository(ABC):
         self, survey_id: str, account_id: str
     ) -> SurveyResultModel | None:
         pass
+
+
+class LoadSurveyResultsRepository(ABC):
+    @abstractmethod
+    async def load_by_survey_ids(
+        self, survey_ids: List[str], account_id: str
+    ) -> Dict[str, SurveyResultModel]:
+        pass
+
+
+class LoadAccountAnswersRepository(ABC):
+    @abstractmethod
+    async def load_account_answers(
+        self, account_id: str, survey_ids: List[str]
+    ) -> Dict[str, str]:
+        pass
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, List, Mapping
 
 from domain.models.survey import SurveyModel
 from domain.usecases.add_survey import AddSurveyParams
@@ -15,7 +15,15 @@ class AddSurveyRepository(ABC):
 
 class LoadSurveysRepository(ABC):
     @abstractmethod
-    async def load_all(self, account_id: str) -> List[SurveyModel]:
+    async def load_all(
+        self, account_id: str, limit: int | None = None, offset: int = 0
+    ) -> List[SurveyModel]:
+        pass
+
+
+class LoadSurveysViewRepository(ABC):
+    @abstractmethod
+    async def load_all_view(self, account_id: str) -> List[Mapping[str, Any]]:
         pass
 
 
@@ -25,6 +33,12 @@ class LoadSurveyByIdRepository(ABC):
         pass
 
 
+class LoadSurveysByIdsRepository(ABC):
+    @abstractmethod
+    async def load_by_ids(self, survey_ids: List[str], account_id: str) -> List[SurveyModel]:
+        pass
+
+
 class CheckSurveyByIdRepository(ABC):
     @abstractmethod
     async def check_by_id(self, survey_id: str) -> bool:
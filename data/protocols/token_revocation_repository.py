@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class LoadTokenRevocationsRepository(ABC):
+    @abstractmethod
+    async def load_revocations(self) -> dict[str, int]:
+        """Return account id -> lowest token version that is still valid."""
+
+
+class RevokeAccountTokensRepository(ABC):
+    @abstractmethod
+    async def revoke_tokens(self, account_id: str) -> int | None:
+        """Invalidate every token issued so far and return the new token version.
+
+        Returns ``None`` when there is no such account.
+        """
@@ -1,23 +1,50 @@
 from data.usecases.add_account.db_add_account import DbAddAccount
 from data.usecases.authentication import DbAuthentication
+from data.usecases.load_account_by_claims import DbLoadAccountByClaims
 from data.usecases.load_account_by_token import DbLoadAccountByToken
 from data.usecases.load_survey_result import DbLoadSurveyResult
+from data.usecases.load_survey_results import DbLoadAccountAnswers, DbLoadSurveyResults
+from data.usecases.refresh_access_token import DbRefreshAccessToken
+from data.usecases.revoke_account_tokens import DbRevokeAccountTokens
 from data.usecases.save_survey_result.db_save_survey_result import DbSaveSurveyResult
+from data.usecases.single_flight import (
+    SingleFlight,
+    SingleFlightLoadSurveyResult,
+    SingleFlightLoadSurveys,
+    SingleFlightLoadSurveysView,
+)
 from data.usecases.survey import (
     DbAddSurvey,
     DbCheckSurveyById,
     DbLoadAnswersBySurvey,
     DbLoadSurveys,
+    DbLoadSurveysByIds,
+    DbLoadSurveysView,
 )
+from data.usecases.survey_result_cache import StaleWhileRevalidateSurveyResult
+from data.usecases.token_revocation_list import TokenRevocationList
 
 __all__ = [
     "DbAddAccount",
     "DbAddSurvey",
     "DbAuthentication",
     "DbCheckSurveyById",
+    "DbLoadAccountAnswers",
+    "DbLoadAccountByClaims",
     "DbLoadAccountByToken",
     "DbLoadAnswersBySurvey",
     "DbLoadSurveyResult",
+    "DbLoadSurveyResults",
     "DbLoadSurveys",
+    "DbLoadSurveysByIds",
+    "DbLoadSurveysView",
+    "DbRefreshAccessToken",
+    "DbRevokeAccountTokens",
     "DbSaveSurveyResult",
+    "SingleFlight",
+    "SingleFlightLoadSurveyResult",
+    "SingleFlightLoadSurveys",
+    "SingleFlightLoadSurveysView",
+    "StaleWhileRevalidateSurveyResult",
+    "TokenRevocationList",
 ]
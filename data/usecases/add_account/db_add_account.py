@@ -25,7 +25,7 @@ class DbAddAccount(AddAccount):
             exists = await self.check_account_by_email_repository.check_by_email(account.email)
             if exists:
                 return None
-        hash_method = getattr(self.hasher, "hash", self.hasher.encrypt)
+        hash_method = getattr(self.hasher, "hash", None) or self.hasher.encrypt
         hashed_password = await hash_method(account.password)
         account_with_hashed_password = AddAccountModel(
             name=account.name,
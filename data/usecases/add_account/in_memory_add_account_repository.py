@@ -45,7 +45,9 @@ class InMemoryAddAccountRepository(
     async def load_by_email(self, email: str) -> AccountModel | None:
         return next((account for account in self.accounts if account.email == email), None)
 
-    async def update_access_token(self, account_id: str, token: str) -> None:
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
         account = next((item for item in self.accounts if item.id == account_id), None)
         if account:
             account.access_token = token
@@ -1,26 +1,61 @@
 from __future__ import annotations
 
-from domain.usecases import Authentication, AuthenticationModel, AuthenticationParams
+import logging
+
+from domain.models.account import AccountModel
+from domain.usecases import (
+    AccountAuthentication,
+    Authentication,
+    AuthenticationModel,
+    AuthenticationParams,
+    RefreshableAuthenticationModel,
+    RefreshAccessToken,
+)
 from data.protocols import (
     Encrypter,
     HashComparer,
+    HashRehasher,
     LoadAccountByEmailRepository,
     UpdateAccessTokenRepository,
+    UpdatePasswordRepository,
 )
 
+logger = logging.getLogger(__name__)
+
+
+async def create_access_token(
+    encrypter: Encrypter,
+    account: AccountModel,
+    include_claims: bool = False,
+) -> str:
+    if include_claims:
+        return await encrypter.encrypt(account.id, {
+            "role": getattr(account, "role", None),
+            "ver": getattr(account, "token_version", 0),
+        })
+    return await encrypter.encrypt(account.id)
+
 
-class DbAuthentication(Authentication):
+class DbAuthentication(Authentication, AccountAuthentication):
     def __init__(
         self,
         load_account_by_email_repository: LoadAccountByEmailRepository,
         hash_comparer: HashComparer,
         encrypter: Encrypter,
         update_access_token_repository: UpdateAccessTokenRepository,
+        include_claims: bool = False,
+        refresh_access_token: RefreshAccessToken | None = None,
+        rehasher: HashRehasher | None = None,
+        update_password_repository: UpdatePasswordRepository | None = None,
     ):
         self.load_account_by_email_repository = load_account_by_email_repository
         self.hash_comparer = hash_comparer
         self.encrypter = encrypter
         self.update_access_token_repository = update_access_token_repository
+        self.include_claims = include_claims
+        self.refresh_access_token = refresh_access_token
+        self.rehasher = rehasher
+        self.update_password_repository = update_password_repository
 
     async def auth(
         self, params: AuthenticationParams | dict[str, str]
@@ -31,9 +66,32 @@ class DbAuthentication(Authentication):
         if account:
             is_valid = await self.hash_comparer.compare(password, account.password)
             if is_valid:
-                access_token = await self.encrypter.encrypt(account.id)
-                await self.update_access_token_repository.update_access_token(
-                    account.id, access_token
-                )
-                return AuthenticationModel(access_token=access_token, name=account.name)
+                await self._upgrade_password_hash(account, password)
+                return await self.auth_account(account)
         return None
+
+    async def auth_account(self, account: AccountModel) -> AuthenticationModel:
+        access_token = await create_access_token(self.encrypter, account, self.include_claims)
+        await self.update_access_token_repository.update_access_token(
+            account.id, access_token, getattr(account, "role", None)
+        )
+        if self.refresh_access_token is not None:
+            return RefreshableAuthenticationModel(
+                access_token=access_token,
+                name=account.name,
+                refresh_token=await self.refresh_access_token.issue(account),
+            )
+        return AuthenticationModel(access_token=access_token, name=account.name)
+
+    async def _upgrade_password_hash(self, account: AccountModel, password: str) -> None:
+        """Re-hash with the current scheme while the plain password is at hand."""
+        if self.rehasher is None or self.update_password_repository is None:
+            return
+        try:
+            if await self.rehasher.needs_rehash(account.password):
+                await self.update_password_repository.update_password(
+                    account.id, await self.rehasher.hash(password)
+                )
+        except Exception:
+            # The old digest still verifies, so a failed upgrade must not fail the login.
+            logger.warning("Could not upgrade password hash for account %s", account.id)
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from domain.models.account import AccountModel
+from domain.usecases import LoadAccountByToken
+from data.protocols import ClaimsDecrypter
+from data.usecases.token_revocation_list import TokenRevocationList
+
+
+class DbLoadAccountByClaims(LoadAccountByToken):
+    """Authorize from the verified token claims without reading the accounts collection."""
+
+    def __init__(self, decrypter: ClaimsDecrypter, revocation_list: TokenRevocationList):
+        self.decrypter = decrypter
+        self.revocation_list = revocation_list
+
+    async def load(self, access_token: str, role: str | None = None) -> AccountModel | None:
+        try:
+            claims = await self.decrypter.decrypt_claims(access_token)
+        except Exception:
+            return None
+        # Tokens minted without a version carry no trustworthy role either.
+        if not claims or "ver" not in claims:
+            return None
+        account_role = claims.get("role")
+        if account_role != role and account_role != "admin":
+            return None
+        if await self.revocation_list.is_revoked(claims["id"], int(claims["ver"])):
+            return None
+        account = AccountModel(id=claims["id"], name="", email="")
+        account.role = account_role
+        account.token_version = int(claims["ver"])
+        return account
@@ -0,0 +1,31 @@
+from typing import Dict, List
+
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases import LoadAccountAnswers, LoadSurveyResults
+from data.protocols import LoadAccountAnswersRepository, LoadSurveyResultsRepository
+
+
+class DbLoadSurveyResults(LoadSurveyResults):
+    """Tally several surveys at once; unknown ids are left out of the result."""
+
+    def __init__(self, load_survey_results_repository: LoadSurveyResultsRepository):
+        self.load_survey_results_repository = load_survey_results_repository
+
+    async def load(self, survey_ids: List[str], account_id: str) -> Dict[str, SurveyResultModel]:
+        if not survey_ids:
+            return {}
+        return await self.load_survey_results_repository.load_by_survey_ids(
+            list(dict.fromkeys(survey_ids)), account_id
+        )
+
+
+class DbLoadAccountAnswers(LoadAccountAnswers):
+    def __init__(self, load_account_answers_repository: LoadAccountAnswersRepository):
+        self.load_account_answers_repository = load_account_answers_repository
+
+    async def load(self, account_id: str, survey_ids: List[str]) -> Dict[str, str]:
+        if not account_id or not survey_ids:
+            return {}
+        return await self.load_account_answers_repository.load_account_answers(
+            account_id, list(dict.fromkeys(survey_ids))
+        )
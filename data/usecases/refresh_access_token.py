@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import hashlib
+import secrets
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from domain.models.account import AccountModel
+from domain.models.refresh_token import RefreshTokenModel
+from domain.usecases import RefreshableAuthenticationModel, RefreshAccessToken
+from data.protocols import (
+    AddRefreshTokenRepository,
+    ConsumeRefreshTokenRepository,
+    Encrypter,
+    LoadAccountByIdRepository,
+    RevokeRefreshTokenFamilyRepository,
+    UpdateAccessTokenRepository,
+)
+from data.usecases.authentication.db_authentication import create_access_token
+
+
+def hash_refresh_token(refresh_token: str) -> str:
+    """SHA-256 is enough at rest: refresh tokens are 256 random bits, not passwords."""
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+class DbRefreshAccessToken(RefreshAccessToken):
+    """Trade a refresh token for a new access token and a rotated refresh token.
+
+    Every login starts a token family. Presenting a refresh token that was
+    already rotated means it leaked, so the whole family is revoked.
+    """
+
+    def __init__(
+        self,
+        add_refresh_token_repository: AddRefreshTokenRepository,
+        consume_refresh_token_repository: ConsumeRefreshTokenRepository,
+        revoke_refresh_token_family_repository: RevokeRefreshTokenFamilyRepository,
+        load_account_by_id_repository: LoadAccountByIdRepository,
+        encrypter: Encrypter,
+        update_access_token_repository: UpdateAccessTokenRepository,
+        expires_in_seconds: int,
+        include_claims: bool = False,
+    ):
+        self.add_refresh_token_repository = add_refresh_token_repository
+        self.consume_refresh_token_repository = consume_refresh_token_repository
+        self.revoke_refresh_token_family_repository = revoke_refresh_token_family_repository
+        self.load_account_by_id_repository = load_account_by_id_repository
+        self.encrypter = encrypter
+        self.update_access_token_repository = update_access_token_repository
+        self.expires_in_seconds = expires_in_seconds
+        self.include_claims = include_claims
+
+    async def issue(self, account: AccountModel, family: str | None = None) -> str:
+        refresh_token = secrets.token_urlsafe(32)
+        await self.add_refresh_token_repository.add_refresh_token(
+            hash_refresh_token(refresh_token),
+            RefreshTokenModel(
+                account_id=account.id,
+                family=family or uuid.uuid4().hex,
+                token_version=getattr(account, "token_version", 0),
+            ),
+            datetime.now(timezone.utc) + timedelta(seconds=self.expires_in_seconds),
+        )
+        return refresh_token
+
+    async def refresh(self, refresh_token: str) -> RefreshableAuthenticationModel | None:
+        stored = await self.consume_refresh_token_repository.consume_refresh_token(
+            hash_refresh_token(refresh_token)
+        )
+        if stored is None:
+            return None
+        if stored.used:
+            await self.revoke_refresh_token_family_repository.revoke_refresh_token_family(
+                stored.family
+            )
+            return None
+        account = await self.load_account_by_id_repository.load_by_id(stored.account_id)
+        # Revoking an account's access tokens bumps its version; refresh tokens follow.
+        if account is None or getattr(account, "token_version", 0) != stored.token_version:
+            return None
+        access_token = await create_access_token(self.encrypter, account, self.include_claims)
+        await self.update_access_token_repository.update_access_token(
+            account.id, access_token, getattr(account, "role", None)
+        )
+        return RefreshableAuthenticationModel(
+            access_token=access_token,
+            name=account.name,
+            refresh_token=await self.issue(account, stored.family),
+        )
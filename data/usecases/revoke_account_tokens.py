@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from domain.usecases import RevokeAccountTokens
+from data.protocols import RevokeAccountTokensRepository
+
+
+class DbRevokeAccountTokens(RevokeAccountTokens):
+    """Bump the account's token version, rejecting its access and refresh tokens.
+
+    Workers notice once their revocation list reloads, after at most
+    ``TOKEN_REVOCATION_REFRESH_SECONDS``.
+    """
+
+    def __init__(self, revoke_account_tokens_repository: RevokeAccountTokensRepository):
+        self.revoke_account_tokens_repository = revoke_account_tokens_repository
+
+    async def revoke(self, account_id: str) -> int | None:
+        return await self.revoke_account_tokens_repository.revoke_tokens(account_id)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Mapping, TypeVar
+
+from domain.models.survey import SurveyModel
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases import (
+    LoadAccountAnswers,
+    LoadSurveyResult,
+    LoadSurveys,
+    LoadSurveysPage,
+    LoadSurveysView,
+)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Run one call per key at a time and hand its outcome to every concurrent caller.
+
+    Callers may sit on different threads, each with its own event loop (the
+    controllers run one ``asyncio.run`` per request), so waiters park on a
+    thread-safe ``concurrent.futures.Future``. Nothing is cached: a caller
+    arriving after the call finished starts a new one.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await call()
+        except BaseException as error:
+            self._finish(key)
+            future.set_exception(error)
+            raise
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            del self._calls[key]
+
+
+class SingleFlightLoadSurveyResult(LoadSurveyResult):
+    """Share one tally among concurrent loads of the same survey, whoever asks.
+
+    The shared result is loaded for no account; ``is_current_account_answer``
+    is then set on a copy from the caller's own answer.
+    """
+
+    def __init__(
+        self,
+        load_survey_result: LoadSurveyResult,
+        load_account_answers: LoadAccountAnswers,
+        single_flight: SingleFlight | None = None,
+    ):
+        self.load_survey_result = load_survey_result
+        self.load_account_answers = load_account_answers
+        self.single_flight = single_flight or SingleFlight()
+
+    async def load(self, survey_id: str, account_id: str) -> SurveyResultModel:
+        shared = await self.single_flight.do(
+            ("load_survey_result", survey_id), lambda: self.load_survey_result.load(survey_id, "")
+        )
+        answers = await self.load_account_answers.load(account_id, [shared.survey_id])
+        return _with_current_answer(shared, answers.get(shared.survey_id))
+
+
+class SingleFlightLoadSurveys(LoadSurveys, LoadSurveysPage):
+    """Share one survey list among concurrent callers, then mark each caller's answered surveys."""
+
+    def __init__(
+        self,
+        load_surveys: LoadSurveys,
+        load_account_answers: LoadAccountAnswers,
+        single_flight: SingleFlight | None = None,
+    ):
+        self.load_surveys = load_surveys
+        self.load_account_answers = load_account_answers
+        self.single_flight = single_flight or SingleFlight()
+
+    async def load(self, account_id: str) -> List[SurveyModel]:
+        shared = await self.single_flight.do(("load_surveys",), lambda: self.load_surveys.load(""))
+        return await self._mark_answered(shared, account_id)
+
+    async def load_page(self, account_id: str, first: int, offset: int) -> List[SurveyModel]:
+        shared = await self.single_flight.do(
+            ("load_surveys", first, offset),
+            lambda: self.load_surveys.load_page("", first, offset),
+        )
+        return await self._mark_answered(shared, account_id)
+
+    async def _mark_answered(self, shared: List[SurveyModel], account_id: str) -> List[SurveyModel]:
+        answered = await self.load_account_answers.load(
+            account_id, [survey.id for survey in shared]
+        )
+        return [
+            dataclasses.replace(survey, did_answer=survey.id in answered) for survey in shared
+        ]
+
+
+class SingleFlightLoadSurveysView(LoadSurveysView):
+    """Share one survey list view among concurrent callers, then mark each caller's answers.
+
+    The view's shape belongs to whoever builds it, so ``survey_id`` reads a
+    view's id and ``with_did_answer`` returns a copy carrying the caller's flag.
+    """
+
+    def __init__(
+        self,
+        load_surveys_view: LoadSurveysView,
+        load_account_answers: LoadAccountAnswers,
+        survey_id: Callable[[Mapping[str, Any]], str],
+        with_did_answer: Callable[[Mapping[str, Any], bool], Mapping[str, Any]],
+        single_flight: SingleFlight | None = None,
+    ):
+        self.load_surveys_view = load_surveys_view
+        self.load_account_answers = load_account_answers
+        self.survey_id = survey_id
+        self.with_did_answer = with_did_answer
+        self.single_flight = single_flight or SingleFlight()
+
+    async def load(self, account_id: str) -> List[Mapping[str, Any]]:
+        shared = await self.single_flight.do(
+            ("load_surveys_view",), lambda: self.load_surveys_view.load("")
+        )
+        answered = await self.load_account_answers.load(
+            account_id, [self.survey_id(survey) for survey in shared]
+        )
+        return [
+            self.with_did_answer(survey, self.survey_id(survey) in answered) for survey in shared
+        ]
+
+
+def _with_current_answer(shared: SurveyResultModel, current: str | None) -> SurveyResultModel:
+    """Copy a result loaded for no account, marking ``current`` as the caller's answer."""
+    return dataclasses.replace(shared, answers=[
+        dataclasses.replace(answer, is_current_account_answer=answer.answer == current)
+        for answer in shared.answers
+    ])
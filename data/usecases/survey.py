@@ -1,4 +1,4 @@
-from typing import List
+from typing import Any, List, Mapping
 
 from domain.models.survey import SurveyModel
 from domain.usecases import (
@@ -7,12 +7,17 @@ from domain.usecases import (
     CheckSurveyById,
     LoadAnswersBySurvey,
     LoadSurveys,
+    LoadSurveysByIds,
+    LoadSurveysPage,
+    LoadSurveysView,
 )
 from data.protocols import (
     AddSurveyRepository,
     CheckSurveyByIdRepository,
     LoadAnswersBySurveyRepository,
+    LoadSurveysByIdsRepository,
     LoadSurveysRepository,
+    LoadSurveysViewRepository,
 )
 
 
@@ -24,13 +29,38 @@ class DbAddSurvey(AddSurvey):
         await self.add_survey_repository.add(params)
 
 
-class DbLoadSurveys(LoadSurveys):
+class DbLoadSurveys(LoadSurveys, LoadSurveysPage):
     def __init__(self, load_surveys_repository: LoadSurveysRepository):
         self.load_surveys_repository = load_surveys_repository
 
     async def load(self, account_id: str) -> List[SurveyModel]:
         return await self.load_surveys_repository.load_all(account_id)
 
+    async def load_page(self, account_id: str, first: int, offset: int) -> List[SurveyModel]:
+        return await self.load_surveys_repository.load_all(account_id, first, offset)
+
+
+class DbLoadSurveysView(LoadSurveysView):
+    """Load surveys already shaped for the HTTP response, skipping the domain models."""
+
+    def __init__(self, load_surveys_view_repository: LoadSurveysViewRepository):
+        self.load_surveys_view_repository = load_surveys_view_repository
+
+    async def load(self, account_id: str) -> List[Mapping[str, Any]]:
+        return await self.load_surveys_view_repository.load_all_view(account_id)
+
+
+class DbLoadSurveysByIds(LoadSurveysByIds):
+    def __init__(self, load_surveys_by_ids_repository: LoadSurveysByIdsRepository):
+        self.load_surveys_by_ids_repository = load_surveys_by_ids_repository
+
+    async def load(self, survey_ids: List[str], account_id: str) -> List[SurveyModel]:
+        if not survey_ids:
+            return []
+        return await self.load_surveys_by_ids_repository.load_by_ids(
+            list(dict.fromkeys(survey_ids)), account_id
+        )
+
 
 class DbCheckSurveyById(CheckSurveyById):
     def __init__(self, check_survey_by_id_repository: CheckSurveyByIdRepository):
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, NamedTuple, Tuple
+
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases import (
+    CachedLoadSurveyResult,
+    LoadAccountAnswers,
+    LoadSurveyResult,
+    SurveyResultFreshness,
+)
+from data.usecases.single_flight import SingleFlight, _with_current_answer
+
+logger = logging.getLogger(__name__)
+
+
+class SurveyResultCacheInfo(NamedTuple):
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    refresh_failures: int
+    currsize: int
+
+
+@dataclass
+class _Entry:
+    result: SurveyResultModel
+    loaded_at: float
+
+
+class StaleWhileRevalidateSurveyResult(CachedLoadSurveyResult):
+    """Serve survey tallies from memory, refreshing them behind the callers.
+
+    A tally younger than ``fresh_seconds`` is served as is. An older one is
+    still served, and a single background refresh per survey replaces it.
+    One older than ``max_stale_seconds`` is never served: that caller loads a
+    new tally itself, shared with any concurrent caller through
+    ``SingleFlight``. Tallies are cached for no account; each caller's
+    ``is_current_account_answer`` is read fresh and set on a copy. The least
+    recently used survey is dropped beyond ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        load_survey_result: LoadSurveyResult,
+        load_account_answers: LoadAccountAnswers,
+        fresh_seconds: float = 2.0,
+        max_stale_seconds: float = 30.0,
+        max_entries: int = 1024,
+        executor: Executor | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_stale_seconds < fresh_seconds:
+            raise ValueError("max_stale_seconds must not be shorter than fresh_seconds")
+        self.load_survey_result = load_survey_result
+        self.load_account_answers = load_account_answers
+        self.fresh_seconds = fresh_seconds
+        self.max_stale_seconds = max_stale_seconds
+        self.max_entries = max_entries
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="survey-result-refresh"
+        )
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._single_flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._hits = self._stale_hits = self._misses = 0
+        self._refreshes = self._refresh_failures = 0
+
+    async def load(self, survey_id: str, account_id: str) -> SurveyResultModel:
+        survey_result, _ = await self.load_with_freshness(survey_id, account_id)
+        return survey_result
+
+    async def load_with_freshness(
+        self, survey_id: str, account_id: str
+    ) -> Tuple[SurveyResultModel, SurveyResultFreshness]:
+        entry, hit = self._lookup(survey_id), True
+        if entry is None:
+            hit = False
+            entry = await self._single_flight.do(survey_id, lambda: self._load(survey_id))
+        answers = await self.load_account_answers.load(account_id, [entry.result.survey_id])
+        freshness = SurveyResultFreshness(
+            hit=hit,
+            age_seconds=max(self._clock() - entry.loaded_at, 0.0),
+            fresh_seconds=self.fresh_seconds,
+        )
+        return _with_current_answer(entry.result, answers.get(entry.result.survey_id)), freshness
+
+    def cache_info(self) -> SurveyResultCacheInfo:
+        return SurveyResultCacheInfo(
+            self._hits, self._stale_hits, self._misses,
+            self._refreshes, self._refresh_failures, len(self._entries),
+        )
+
+    def _lookup(self, survey_id: str) -> _Entry | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(survey_id)
+            age = now - entry.loaded_at if entry else None
+            if entry is None or age > self.max_stale_seconds:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(survey_id)
+            self._hits += 1
+            if age <= self.fresh_seconds:
+                return entry
+            self._stale_hits += 1
+            if survey_id in self._refreshing:
+                return entry
+            self._refreshing.add(survey_id)
+        self._executor.submit(self._refresh, survey_id)
+        return entry
+
+    async def _load(self, survey_id: str) -> _Entry:
+        loaded_at = self._clock()
+        entry = _Entry(await self.load_survey_result.load(survey_id, ""), loaded_at)
+        with self._lock:
+            current = self._entries.get(survey_id)
+            # A slower load must not replace a newer tally.
+            if current is None or current.loaded_at <= loaded_at:
+                self._entries[survey_id] = entry
+                self._entries.move_to_end(survey_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def _refresh(self, survey_id: str) -> None:
+        refreshed = False
+        try:
+            asyncio.run(self._load(survey_id))
+            refreshed = True
+        except Exception:
+            # The stale copy stays until max_stale_seconds, then callers load it themselves.
+            logger.warning(
+                "Could not refresh the cached result of survey %s", survey_id, exc_info=True
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(survey_id)
+                if refreshed:
+                    self._refreshes += 1
+                else:
+                    self._refresh_failures += 1
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable
+
+from data.protocols import LoadTokenRevocationsRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationList:
+    """In-memory copy of the revocation table, reloaded at most every ``refresh_seconds``.
+
+    Only one caller reloads a stale list; the others keep answering from the
+    previous copy instead of queueing behind the database.
+    """
+
+    def __init__(
+        self,
+        load_token_revocations_repository: LoadTokenRevocationsRepository,
+        refresh_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.load_token_revocations_repository = load_token_revocations_repository
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._min_versions: dict[str, int] | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    async def is_revoked(self, account_id: str, token_version: int) -> bool:
+        await self._refresh_if_stale()
+        return token_version < (self._min_versions or {}).get(account_id, 0)
+
+    async def _refresh_if_stale(self) -> None:
+        if self._clock() < self._expires_at:
+            return
+        # Block only for the very first load; afterwards a stale copy is good enough.
+        if not self._lock.acquire(blocking=self._min_versions is None):
+            return
+        try:
+            if self._clock() < self._expires_at:
+                return
+            try:
+                self._min_versions = await self.load_token_revocations_repository.load_revocations()
+            except Exception:
+                if self._min_versions is None:
+                    raise
+                logger.warning("Could not refresh token revocations; using the previous list")
+            self._expires_at = self._clock() + self.refresh_seconds
+        finally:
+            self._lock.release()
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RefreshTokenModel:
+    account_id: str
+    family: str
+    token_version: int = 0
+    used: bool = False
@@ -1,9 +1,24 @@
 from domain.usecases.add_account import AddAccount, AddAccountModel
-from domain.usecases.authentication import Authentication, AuthenticationModel, AuthenticationParams
+from domain.usecases.authentication import (
+    AccountAuthentication,
+    Authentication,
+    AuthenticationModel,
+    AuthenticationParams,
+    RefreshableAuthenticationModel,
+)
 from domain.usecases.load_account_by_token import LoadAccountByToken
 from domain.usecases.add_survey import AddSurvey, AddSurveyAnswerParams, AddSurveyParams
-from domain.usecases.load_surveys import LoadSurveys
+from domain.usecases.load_surveys import LoadSurveys, LoadSurveysPage
+from domain.usecases.load_surveys_view import LoadSurveysView
 from domain.usecases.check_survey_by_id import CheckSurveyById
 from domain.usecases.load_answers_by_survey import LoadAnswersBySurvey
 from domain.usecases.save_survey_result import SaveSurveyResult, SaveSurveyResultParams
-from domain.usecases.load_survey_result import LoadSurveyResult
+from domain.usecases.load_survey_result import (
+    CachedLoadSurveyResult,
+    LoadSurveyResult,
+    SurveyResultFreshness,
+)
+from domain.usecases.refresh_access_token import RefreshAccessToken
+from domain.usecases.load_survey_results import LoadAccountAnswers, LoadSurveyResults
+from domain.usecases.load_surveys_by_ids import LoadSurveysByIds
+from domain.usecases.revoke_account_tokens import RevokeAccountTokens
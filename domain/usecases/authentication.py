@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
 
+from domain.models.account import AccountModel
+
 
 @dataclass
 class AuthenticationParams:
@@ -15,7 +17,18 @@ class AuthenticationModel:
     name: str
 
 
+@dataclass
+class RefreshableAuthenticationModel(AuthenticationModel):
+    refresh_token: str
+
+
 class Authentication(ABC):
     @abstractmethod
     async def auth(self, params: AuthenticationParams) -> Optional[AuthenticationModel]:
         pass
+
+
+class AccountAuthentication(ABC):
+    @abstractmethod
+    async def auth_account(self, account: AccountModel) -> AuthenticationModel:
+        """Issue tokens for an account whose credentials are already trusted."""
@@ -1,9 +1,33 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Tuple
 
 from domain.models.survey_result import SurveyResultModel
 
 
+@dataclass(frozen=True)
+class SurveyResultFreshness:
+    """How a cached result was served.
+
+    ``hit`` is true when it came from the cache, possibly stale, and false
+    when it was loaded for this request. ``age_seconds`` is how old the tally
+    is and ``fresh_seconds`` how long it counts as fresh.
+    """
+
+    hit: bool
+    age_seconds: float
+    fresh_seconds: float
+
+
 class LoadSurveyResult(ABC):
     @abstractmethod
     async def load(self, survey_id: str, account_id: str) -> SurveyResultModel:
         pass
+
+
+class CachedLoadSurveyResult(LoadSurveyResult):
+    @abstractmethod
+    async def load_with_freshness(
+        self, survey_id: str, account_id: str
+    ) -> Tuple[SurveyResultModel, SurveyResultFreshness]:
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from domain.models.survey_result import SurveyResultModel
+
+
+class LoadSurveyResults(ABC):
+    @abstractmethod
+    async def load(self, survey_ids: List[str], account_id: str) -> Dict[str, SurveyResultModel]:
+        pass
+
+
+class LoadAccountAnswers(ABC):
+    @abstractmethod
+    async def load(self, account_id: str, survey_ids: List[str]) -> Dict[str, str]:
+        pass
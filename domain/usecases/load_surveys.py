@@ -8,3 +8,9 @@ class LoadSurveys(ABC):
     @abstractmethod
     async def load(self, account_id: str) -> List[SurveyModel]:
         pass
+
+
+class LoadSurveysPage(ABC):
+    @abstractmethod
+    async def load_page(self, account_id: str, first: int, offset: int) -> List[SurveyModel]:
+        pass
@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from domain.models.survey import SurveyModel
+
+
+class LoadSurveysByIds(ABC):
+    @abstractmethod
+    async def load(self, survey_ids: List[str], account_id: str) -> List[SurveyModel]:
+        pass
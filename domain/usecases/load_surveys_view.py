@@ -0,0 +1,10 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Mapping
+
+
+class LoadSurveysView(ABC):
+    """Load the survey list already shaped for a response, without domain models."""
+
+    @abstractmethod
+    async def load(self, account_id: str) -> List[Mapping[str, Any]]:
+        pass
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from domain.models.account import AccountModel
+from domain.usecases.authentication import RefreshableAuthenticationModel
+
+
+class RefreshAccessToken(ABC):
+    @abstractmethod
+    async def issue(self, account: AccountModel, family: str | None = None) -> str:
+        pass
+
+    @abstractmethod
+    async def refresh(self, refresh_token: str) -> Optional[RefreshableAuthenticationModel]:
+        pass
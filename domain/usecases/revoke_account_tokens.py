@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+
+
+class RevokeAccountTokens(ABC):
+    @abstractmethod
+    async def revoke(self, account_id: str) -> int | None:
+        """Invalidate every token issued so far; ``None`` if there is no such account."""
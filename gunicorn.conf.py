@@ -0,0 +1,30 @@
+"""Gunicorn configuration: ``gunicorn -c gunicorn.conf.py main.server:app``.
+
+Send SIGHUP to the master for a graceful reload: new workers are started with
+fresh code and configuration, then old workers finish in-flight requests. With
+PRELOAD_APP=1 the code is imported once in the master, so a reload keeps the old
+code; deploy new code with a full restart or a USR2 binary upgrade instead.
+"""
+from main.config.server import (  # noqa: F401
+    post_fork,
+    prepare_metrics_dir,
+    server_settings,
+    when_ready,
+    worker_exit,
+)
+
+_settings = server_settings()
+prepare_metrics_dir()
+
+bind = _settings["bind"]
+workers = _settings["workers"]
+worker_class = _settings["worker_class"]
+threads = _settings.get("threads", 1)
+worker_connections = _settings.get("worker_connections", 1000)
+keepalive = _settings["keepalive"]
+timeout = _settings["timeout"]
+graceful_timeout = _settings["graceful_timeout"]
+max_requests = _settings["max_requests"]
+max_requests_jitter = _settings["max_requests_jitter"]
+preload_app = _settings["preload_app"]
+accesslog = _settings["accesslog"]
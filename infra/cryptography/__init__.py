@@ -1,4 +1,16 @@
-from infra.cryptography.bcrypt_adapter import BcryptAdapter
+from infra.cryptography.argon2_adapter import Argon2Adapter
+from infra.cryptography.bcrypt_adapter import BcryptAdapter, BcryptPool, bcrypt_pool
 from infra.cryptography.jwt_adapter import JwtAdapter
+from infra.cryptography.jwt_key_ring import JwtKeyRing, key_ring_from_env
+from infra.cryptography.password_hasher import MultiSchemeHasher
 
-__all__ = ["BcryptAdapter", "JwtAdapter"]
+__all__ = [
+    "Argon2Adapter",
+    "BcryptAdapter",
+    "BcryptPool",
+    "JwtAdapter",
+    "JwtKeyRing",
+    "MultiSchemeHasher",
+    "bcrypt_pool",
+    "key_ring_from_env",
+]
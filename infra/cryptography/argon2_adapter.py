@@ -0,0 +1,49 @@
+from typing import Optional
+
+from data.protocols.encrypter import HashComparer, HashRehasher
+from infra.cryptography.bcrypt_adapter import BcryptPool, bcrypt_pool
+
+
+class Argon2Adapter(HashRehasher, HashComparer):
+    """argon2id password hashing; digests are PHC strings carrying their parameters.
+
+    Shares the bcrypt pool, so both schemes together stay within one hash per core.
+    """
+
+    def __init__(
+        self,
+        time_cost: int = 3,
+        memory_cost: int = 65536,
+        parallelism: int = 1,
+        pool: Optional[BcryptPool] = None,
+    ):
+        # Optional dependency, only needed when argon2id is configured.
+        from argon2 import PasswordHasher, Type
+
+        self._hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            type=Type.ID,
+        )
+        self._pool = pool or bcrypt_pool
+
+    async def hash(self, value: str) -> str:
+        with self._pool.slot():
+            return self._hasher.hash(value)
+
+    async def compare(self, value: str, digest: str) -> bool:
+        from argon2.exceptions import InvalidHashError, VerificationError
+
+        with self._pool.slot():
+            try:
+                return self._hasher.verify(digest, value)
+            except (InvalidHashError, VerificationError):
+                return False
+
+    @staticmethod
+    def identifies(digest: str) -> bool:
+        return digest.startswith("$argon2")
+
+    async def needs_rehash(self, digest: str) -> bool:
+        return not digest.startswith("$argon2id$") or self._hasher.check_needs_rehash(digest)
@@ -1,20 +1,90 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
 import bcrypt
-from data.protocols.encrypter import Encrypter, HashComparer, Hasher
+from data.protocols.encrypter import Encrypter, HashComparer, HashRehasher
+
+
+class BcryptPool:
+    """Cap concurrent password hashing at the core count and account for queueing.
+
+    bcrypt releases the GIL, so request threads already hash in parallel; past
+    one hash per core they only slow each other down, so extra callers wait
+    here and the wait shows up in metrics and readiness instead.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self.waiting = 0
+        self.active = 0
+        self.operations = 0
+        self.wait_seconds = 0.0
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        started = time.perf_counter()
+        with self._lock:
+            self.waiting += 1
+        self._slots.acquire()
+        waited = time.perf_counter() - started
+        with self._lock:
+            self.waiting -= 1
+            self.active += 1
+            self.operations += 1
+            self.wait_seconds += waited
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.active -= 1
+            self._slots.release()
 
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "waiting": self.waiting,
+                "active": self.active,
+                "operations": self.operations,
+                "wait_seconds": self.wait_seconds,
+            }
 
-class BcryptAdapter(Encrypter, Hasher, HashComparer):
-    def __init__(self, salt: int):
+
+bcrypt_pool = BcryptPool(int(os.getenv("BCRYPT_MAX_CONCURRENCY", "0")) or None)
+
+
+class BcryptAdapter(Encrypter, HashRehasher, HashComparer):
+    def __init__(self, salt: int, pool: Optional[BcryptPool] = None):
         self._salt = salt
+        self._pool = pool or bcrypt_pool
 
     async def hash(self, value: str) -> str:
         return await self.encrypt(value)
 
     async def encrypt(self, value: str) -> str:
         """Hash a password using bcrypt."""
-        salt = bcrypt.gensalt(rounds=self._salt)
-        hashed = bcrypt.hashpw(value.encode('utf-8'), salt)
+        with self._pool.slot():
+            salt = bcrypt.gensalt(rounds=self._salt)
+            hashed = bcrypt.hashpw(value.encode('utf-8'), salt)
         return hashed.decode('utf-8')
 
     async def compare(self, value: str, digest: str) -> bool:
         """Compare a plain text value with a bcrypt hash."""
-        return bcrypt.checkpw(value.encode('utf-8'), digest.encode('utf-8'))
+        with self._pool.slot():
+            return bcrypt.checkpw(value.encode('utf-8'), digest.encode('utf-8'))
+
+    @staticmethod
+    def identifies(digest: str) -> bool:
+        return digest.startswith(("$2a$", "$2b$", "$2y$"))
+
+    async def needs_rehash(self, digest: str) -> bool:
+        # Modular crypt format: $2b$<cost>$<salt+hash>
+        try:
+            return int(digest.split("$")[2]) != self._salt
+        except (IndexError, ValueError):
+            return True
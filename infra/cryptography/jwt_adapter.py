@@ -2,49 +2,72 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import jwt
 from jwt import InvalidTokenError
 
-from data.protocols.encrypter import Decrypter, Encrypter
+from data.protocols.encrypter import ClaimsDecrypter, ClaimsEncrypter, Decrypter, Encrypter
+from infra.cryptography.jwt_key_ring import JwtKeyRing, token_kid
 
 
-class JwtAdapter(Encrypter, Decrypter):
+class JwtAdapter(Encrypter, Decrypter, ClaimsEncrypter, ClaimsDecrypter):
     def __init__(
         self,
         secret: str,
         expires_in_seconds: int | None = None,
         issuer: str | None = None,
         audience: str | None = None,
+        key_ring: JwtKeyRing | None = None,
     ):
         self.secret = secret
+        self.key_ring = key_ring
         self.expires_in_seconds = expires_in_seconds or int(
             os.getenv("JWT_EXPIRES_IN_SECONDS", "3600")
         )
         self.issuer = issuer or os.getenv("JWT_ISSUER", "python-flask-tdd")
         self.audience = audience or os.getenv("JWT_AUDIENCE", "python-flask-tdd-api")
 
-    async def encrypt(self, value: str) -> str:
+    async def encrypt(self, value: str, claims: dict[str, Any] | None = None) -> str:
         now = datetime.now(timezone.utc)
-        payload = {
+        payload = {key: claim for key, claim in (claims or {}).items() if claim is not None}
+        payload.update({
             "id": value,
             "iat": now,
             "exp": now + timedelta(seconds=self.expires_in_seconds),
             "iss": self.issuer,
             "aud": self.audience,
-        }
-        return jwt.encode(payload, self.secret, algorithm="HS256")
+        })
+        if self.key_ring is None:
+            return jwt.encode(payload, self.secret, algorithm="HS256")
+        if not self.key_ring.can_sign:
+            raise RuntimeError("This node only holds verification keys and cannot sign tokens")
+        return jwt.encode(
+            payload,
+            self.key_ring.signing_key,
+            algorithm=self.key_ring.signing_algorithm,
+            headers={"kid": self.key_ring.signing_kid},
+        )
 
     async def decrypt(self, value: str) -> str | None:
+        claims = await self.decrypt_claims(value)
+        return claims.get("id") if claims else None
+
+    async def decrypt_claims(self, value: str) -> dict[str, Any] | None:
         try:
-            decoded = jwt.decode(
+            key, algorithm = self.secret, "HS256"
+            if self.key_ring is not None:
+                verification_key = self.key_ring.verification_key(token_kid(value))
+                if verification_key is None:
+                    return None
+                key, algorithm = verification_key
+            return jwt.decode(
                 value,
-                self.secret,
-                algorithms=["HS256"],
+                key,
+                algorithms=[algorithm],
                 issuer=self.issuer,
                 audience=self.audience,
                 options={"require": ["exp", "iat", "iss", "aud"]},
             )
         except InvalidTokenError:
             return None
-        return decoded.get("id")
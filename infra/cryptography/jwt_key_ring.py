@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from jwt import PyJWK
+from jwt.algorithms import get_default_algorithms
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "EdDSA")
+
+# JWK members that only belong in a private key and must never be published.
+_PRIVATE_MEMBERS = {"d", "p", "q", "dp", "dq", "qi", "oth", "k"}
+
+
+class JwtKeyRing:
+    """Signing key plus every key allowed to verify, indexed by ``kid``.
+
+    Keys are parsed once into ``cryptography`` key objects; verification
+    looks them up by the token's ``kid`` and never touches PEM or JWK text.
+    The JWKS file is re-read when its mtime changes (checked at most every
+    ``reload_seconds``), so adding or retiring a key needs no restart.
+    """
+
+    def __init__(
+        self,
+        jwks_path: str | None = None,
+        signing_key: Any = None,
+        signing_kid: str | None = None,
+        signing_algorithm: str = "RS256",
+        reload_seconds: float = 30.0,
+    ):
+        if signing_algorithm not in ASYMMETRIC_ALGORITHMS:
+            raise ValueError(f"signing_algorithm must be one of {', '.join(ASYMMETRIC_ALGORITHMS)}")
+        self.jwks_path = Path(jwks_path) if jwks_path else None
+        self.signing_key = signing_key
+        self.signing_kid = signing_kid
+        self.signing_algorithm = signing_algorithm
+        self.reload_seconds = reload_seconds
+        self._keys: Dict[str, Tuple[Any, str]] = {}
+        self._public_jwks: Dict[str, Any] = {"keys": []}
+        self._mtime: float | None = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+        if self.jwks_path is not None:
+            self._load_jwks()
+        elif self.can_sign:
+            self._keys = {signing_kid: (signing_key.public_key(), signing_algorithm)}
+            self._public_jwks = {"keys": [self._signing_jwk()]}
+
+    @classmethod
+    def from_pem(
+        cls,
+        private_key_pem: bytes,
+        kid: str,
+        algorithm: str = "RS256",
+        jwks_path: str | None = None,
+    ) -> "JwtKeyRing":
+        """Build a ring that signs with ``private_key_pem`` and also verifies its own tokens."""
+        private_key = get_default_algorithms()[algorithm].prepare_key(private_key_pem)
+        return cls(jwks_path, private_key, kid, algorithm)
+
+    @property
+    def can_sign(self) -> bool:
+        return self.signing_key is not None and self.signing_kid is not None
+
+    def verification_key(self, kid: str | None) -> Optional[Tuple[Any, str]]:
+        """Return ``(key, algorithm)`` for ``kid``; the algorithm is pinned per key."""
+        if self.jwks_path is not None and time.monotonic() >= self._next_check:
+            self._reload_if_changed()
+        return self._keys.get(kid) if kid else None
+
+    def public_jwks(self) -> Dict[str, Any]:
+        return self._public_jwks
+
+    def _signing_jwk(self) -> Dict[str, Any]:
+        jwk = get_default_algorithms()[self.signing_algorithm].to_jwk(
+            self.signing_key.public_key(), as_dict=True
+        )
+        return {**jwk, "kid": self.signing_kid, "alg": self.signing_algorithm, "use": "sig"}
+
+    def _reload_if_changed(self) -> None:
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            self._next_check = time.monotonic() + self.reload_seconds
+            if self.jwks_path.stat().st_mtime != self._mtime:
+                self._load_jwks()
+        except OSError:
+            pass
+        finally:
+            self._lock.release()
+
+    def _load_jwks(self) -> None:
+        mtime = self.jwks_path.stat().st_mtime
+        document = json.loads(self.jwks_path.read_text())
+        keys: Dict[str, Tuple[Any, str]] = {}
+        public = []
+        for jwk in document.get("keys", []):
+            if "kid" not in jwk or jwk.get("alg") not in ASYMMETRIC_ALGORITHMS:
+                continue
+            parsed = PyJWK(jwk, jwk["alg"])
+            key = parsed.key
+            keys[jwk["kid"]] = (key.public_key() if hasattr(key, "public_key") else key, jwk["alg"])
+            public.append({name: value for name, value in jwk.items() if name not in _PRIVATE_MEMBERS})
+        # A signing key missing from the file is still published, or nobody could verify it.
+        if self.can_sign and self.signing_kid not in keys:
+            keys[self.signing_kid] = (self.signing_key.public_key(), self.signing_algorithm)
+            public.append(self._signing_jwk())
+        # Swap whole dicts so concurrent readers never see a half-loaded ring.
+        self._keys = keys
+        self._public_jwks = {"keys": public}
+        self._mtime = mtime
+
+
+@lru_cache(maxsize=256)
+def _header_kid(segment: str) -> str | None:
+    try:
+        header = json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+    except (binascii.Error, ValueError):
+        return None
+    kid = header.get("kid") if isinstance(header, dict) else None
+    return kid if isinstance(kid, str) else None
+
+
+def token_kid(token: str) -> str | None:
+    """Read ``kid`` from an unverified token header.
+
+    Every token signed by one key shares the same header segment, so the
+    decoded value is cached instead of base64-decoding the whole token.
+    """
+    return _header_kid(token.partition(".")[0])
+
+
+def key_ring_from_env() -> JwtKeyRing | None:
+    """Build the key ring described by ``JWT_*`` variables, or ``None`` for HS256."""
+    algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+    if algorithm == "HS256":
+        return None
+    jwks_path = os.getenv("JWT_JWKS_FILE") or None
+    private_key_file = os.getenv("JWT_PRIVATE_KEY_FILE")
+    if private_key_file:
+        kid = os.getenv("JWT_SIGNING_KID")
+        if not kid:
+            raise RuntimeError("JWT_SIGNING_KID is required with JWT_PRIVATE_KEY_FILE")
+        return JwtKeyRing.from_pem(Path(private_key_file).read_bytes(), kid, algorithm, jwks_path)
+    if not jwks_path:
+        raise RuntimeError(f"JWT_ALGORITHM={algorithm} needs JWT_PRIVATE_KEY_FILE or JWT_JWKS_FILE")
+    return JwtKeyRing(jwks_path, signing_algorithm=algorithm)
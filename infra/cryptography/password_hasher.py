@@ -0,0 +1,30 @@
+from typing import Any
+
+from data.protocols.encrypter import HashComparer, HashRehasher
+
+
+class MultiSchemeHasher(HashRehasher, HashComparer):
+    """Hash with the preferred scheme and verify digests made by any known scheme.
+
+    Each scheme recognizes its own digests by prefix. A digest needs a rehash
+    when another scheme made it, or when the preferred scheme made it with
+    parameters that differ from the configured ones.
+    """
+
+    def __init__(self, preferred: Any, *legacy: Any):
+        self.preferred = preferred
+        self.schemes = (preferred, *legacy)
+
+    async def hash(self, value: str) -> str:
+        return await self.preferred.hash(value)
+
+    async def compare(self, value: str, digest: str) -> bool:
+        for scheme in self.schemes:
+            if scheme.identifies(digest):
+                return await scheme.compare(value, digest)
+        return False
+
+    async def needs_rehash(self, digest: str) -> bool:
+        if not self.preferred.identifies(digest):
+            return True
+        return await self.preferred.needs_rehash(digest)
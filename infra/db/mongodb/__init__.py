@@ -1,10 +1,18 @@
 """MongoDB infrastructure module."""
 from infra.db.mongodb.account_repository import AccountMongoRepository
+from infra.db.mongodb.refresh_token_repository import RefreshTokenMongoRepository
+from infra.db.mongodb.session_repository import SessionMongoRepository
+from infra.db.mongodb.sharded_survey_result_repository import ShardedSurveyResultMongoRepository
 from infra.db.mongodb.survey_repository import SurveyMongoRepository
 from infra.db.mongodb.survey_result_repository import SurveyResultMongoRepository
+from infra.db.mongodb.token_revocation_repository import TokenRevocationMongoRepository
 
 __all__ = [
     "AccountMongoRepository",
+    "RefreshTokenMongoRepository",
+    "SessionMongoRepository",
+    "ShardedSurveyResultMongoRepository",
     "SurveyMongoRepository",
     "SurveyResultMongoRepository",
+    "TokenRevocationMongoRepository",
 ]
@@ -2,36 +2,63 @@ from __future__ import annotations
 
 """MongoDB Account Repository implementation."""
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 
+from data.protocols.email_normalizer import EmailNormalizer
 from data.protocols.add_account_repository import (
     AddAccountRepository,
     CheckAccountByEmailRepository,
     LoadAccountByEmailRepository,
-    LoadAccountByTokenRepository,
-    UpdateAccessTokenRepository,
+    LoadAccountByIdRepository,
+    UpdatePasswordRepository,
 )
 from domain.usecases.add_account import AddAccountModel
 from domain.models.account import AccountModel
 from infra.db.mongodb.helpers.mongo_helper import MongoHelper
 
+_ACCOUNT_PROJECTION = {
+    "_id": 1,
+    "name": 1,
+    "email": 1,
+    "password": 1,
+    "role": 1,
+    "tokenVersion": 1,
+}
+
 
 class AccountMongoRepository(
     AddAccountRepository,
     CheckAccountByEmailRepository,
     LoadAccountByEmailRepository,
-    LoadAccountByTokenRepository,
-    UpdateAccessTokenRepository,
+    LoadAccountByIdRepository,
+    UpdatePasswordRepository,
 ):
-    """MongoDB implementation of AddAccountRepository."""
+    """MongoDB implementation of AddAccountRepository.
+
+    Emails are matched through ``emailNormalized``, so spellings that differ
+    only in case or in the IDNA form of the domain resolve to one account.
+    """
+
+    def __init__(self, email_normalizer: EmailNormalizer | None = None):
+        if email_normalizer is None:
+            from utils.email_validator_adapter import EmailValidatorAdapter
 
-    async def add(self, account_data: AddAccountModel) -> AccountModel:
+            email_normalizer = EmailValidatorAdapter()
+        self.email_normalizer = email_normalizer
+
+    async def add(self, account_data: AddAccountModel) -> AccountModel | None:
+        """Insert the account; ``None`` when a unique email index rejects it."""
         collection = MongoHelper.get_collection("accounts")
         account_dict = {
             "name": account_data.name,
             "email": account_data.email,
+            "emailNormalized": self.email_normalizer.normalize(account_data.email),
             "password": account_data.password
         }
-        result = collection.insert_one(account_dict)
+        try:
+            result = collection.insert_one(account_dict)
+        except DuplicateKeyError:
+            return None
         return AccountModel(
             id=str(result.inserted_id),
             name=account_data.name,
@@ -41,30 +68,30 @@ class AccountMongoRepository(
 
     async def load_by_email(self, email: str) -> AccountModel | None:
         collection = MongoHelper.get_collection("accounts")
-        account = collection.find_one(
-            {"email": email},
-            {"_id": 1, "name": 1, "email": 1, "password": 1, "accessToken": 1, "role": 1},
-        )
+        account = collection.find_one(self._email_filter(email), _ACCOUNT_PROJECTION)
         return self._to_model(account) if account else None
 
-    async def check_by_email(self, email: str) -> bool:
+    async def load_by_id(self, account_id: str) -> AccountModel | None:
+        if not ObjectId.is_valid(account_id):
+            return None
         collection = MongoHelper.get_collection("accounts")
-        return collection.find_one({"email": email}, {"_id": 1}) is not None
+        account = collection.find_one({"_id": ObjectId(account_id)}, _ACCOUNT_PROJECTION)
+        return self._to_model(account) if account else None
 
-    async def update_access_token(self, account_id: str, token: str) -> None:
+    async def check_by_email(self, email: str) -> bool:
         collection = MongoHelper.get_collection("accounts")
-        collection.update_one({"_id": ObjectId(account_id)}, {"$set": {"accessToken": token}})
+        return collection.find_one(self._email_filter(email), {"_id": 1}) is not None
 
-    async def load_by_token(self, token: str, role: str | None = None) -> AccountModel | None:
+    async def update_password(self, account_id: str, password: str) -> None:
         collection = MongoHelper.get_collection("accounts")
-        account = collection.find_one(
-            {
-                "accessToken": token,
-                "$or": [{"role": role}, {"role": "admin"}],
-            },
-            {"_id": 1, "name": 1, "email": 1, "password": 1, "accessToken": 1, "role": 1},
-        )
-        return self._to_model(account) if account else None
+        collection.update_one({"_id": ObjectId(account_id)}, {"$set": {"password": password}})
+
+    def _email_filter(self, email: str) -> dict:
+        # Accounts the backfill has not reached yet still match on the exact email.
+        return {"$or": [
+            {"emailNormalized": self.email_normalizer.normalize(email)},
+            {"email": email, "emailNormalized": {"$exists": False}},
+        ]}
 
     @staticmethod
     def _to_model(account: dict) -> AccountModel:
@@ -74,6 +101,6 @@ class AccountMongoRepository(
             email=account.get("email", ""),
             password=account.get("password", ""),
         )
-        model.access_token = account.get("accessToken") or account.get("access_token")
         model.role = account.get("role")
+        model.token_version = account.get("tokenVersion", 0)
         return model
@@ -0,0 +1,90 @@
+"""One-off migration that fills ``accounts.emailNormalized`` for existing accounts."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional
+
+from bson import ObjectId
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from data.protocols.email_normalizer import EmailNormalizer
+from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+
+_DUPLICATE_KEY = 11000
+
+
+@dataclass
+class BackfillReport:
+    scanned: int = 0
+    updated: int = 0
+    batches: int = 0
+    conflicts: List[str] = field(default_factory=list)
+
+
+def backfill_normalized_emails(
+    normalizer: EmailNormalizer,
+    batch_size: int = 500,
+    pause_seconds: float = 0.0,
+    dry_run: bool = False,
+    collection: Any = None,
+    on_batch: Optional[Callable[[BackfillReport], None]] = None,
+) -> BackfillReport:
+    """Stream accounts in ``_id`` order and set ``emailNormalized`` batch by batch.
+
+    Every batch is a fresh range query on ``_id`` followed by one unordered
+    bulk write. No cursor stays open between batches and each update touches a
+    single document, so signups and logins keep running alongside the job.
+    ``pause_seconds`` throttles it further. Updates only apply while the field is
+    still missing, so the job can be stopped and re-run. Accounts whose
+    normalized email belongs to another account are left untouched and listed
+    in ``conflicts`` for manual merging.
+    """
+    if collection is None:
+        collection = MongoHelper.get_collection("accounts")
+    report = BackfillReport()
+    last_id: ObjectId | None = None
+    while True:
+        query: dict[str, Any] = {"emailNormalized": {"$exists": False}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        batch = list(
+            collection.find(query, {"email": 1}).sort("_id", ASCENDING).limit(batch_size)
+        )
+        if not batch:
+            return report
+        last_id = batch[-1]["_id"]
+        report.scanned += len(batch)
+        report.batches += 1
+        operations = [
+            UpdateOne(
+                {"_id": account["_id"], "emailNormalized": {"$exists": False}},
+                {"$set": {"emailNormalized": normalizer.normalize(account.get("email", ""))}},
+            )
+            for account in batch
+        ]
+        if not dry_run:
+            _apply(collection, operations, [account["_id"] for account in batch], report)
+        if on_batch is not None:
+            on_batch(report)
+        if pause_seconds:
+            time.sleep(pause_seconds)
+
+
+def _apply(
+    collection: Any,
+    operations: List[UpdateOne],
+    account_ids: List[ObjectId],
+    report: BackfillReport,
+) -> None:
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        report.updated += result.modified_count
+    except BulkWriteError as error:
+        details = error.details
+        report.updated += details.get("nModified", 0)
+        for write_error in details.get("writeErrors", []):
+            if write_error.get("code") != _DUPLICATE_KEY:
+                raise
+            report.conflicts.append(str(account_ids[write_error["index"]]))
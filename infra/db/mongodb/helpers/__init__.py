@@ -1,5 +1,24 @@
 """MongoDB helpers module."""
 from .mongo_helper import MongoHelper
+from .pool_monitor import ConnectionPoolMonitor, install_pool_monitor, pool_stats
+from .query_monitor import (
+    CommandMonitor,
+    QueryStats,
+    begin_query_stats,
+    current_query_stats,
+    end_query_stats,
+    install_command_monitor,
+)
 
-__all__ = ["MongoHelper"]
-
+__all__ = [
+    "CommandMonitor",
+    "ConnectionPoolMonitor",
+    "MongoHelper",
+    "QueryStats",
+    "begin_query_stats",
+    "current_query_stats",
+    "end_query_stats",
+    "install_command_monitor",
+    "install_pool_monitor",
+    "pool_stats",
+]
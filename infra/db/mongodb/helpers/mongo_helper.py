@@ -1,10 +1,17 @@
 """MongoDB connection helper."""
+import logging
 import os
+import threading
 from typing import Any, Optional
 from pymongo import MongoClient
 from pymongo.database import Database
 from pymongo.errors import ServerSelectionTimeoutError
 
+from infra.db.mongodb.helpers.pool_monitor import install_pool_monitor
+from infra.db.mongodb.helpers.query_monitor import install_command_monitor
+
+logger = logging.getLogger(__name__)
+
 
 def _is_test_environment() -> bool:
     environment = (
@@ -18,23 +25,38 @@ def _is_test_environment() -> bool:
 
 
 class MongoHelper:
-    """Helper class for managing MongoDB connections."""
+    """Helper class for managing MongoDB connections.
+
+    With ``MONGO_URL`` set, the first ``get_db`` or ``ping`` connects on its
+    own, as the SQLite and PostgreSQL helpers open on first use, so ``flask
+    run`` needs no startup hook. Every connect creates the missing indexes
+    once per URI; forked workers inherit that from the master.
+    """
 
     _client: Optional[MongoClient] = None
     _db: Optional[Database] = None
+    _indexed_uris: set = set()
+    _lock = threading.Lock()
 
     @classmethod
     async def connect(cls, uri: Optional[str] = None) -> None:
         """
-        Connect to MongoDB.
+        Connect to MongoDB and create any missing index.
 
         Args:
             uri: MongoDB connection URI. If not provided, uses MONGO_URL env variable.
         """
+        with cls._lock:
+            cls._open(uri)
+
+    @classmethod
+    def _open(cls, uri: Optional[str] = None) -> None:
         connection_uri = uri or os.getenv("MONGO_URL")
         if not connection_uri:
             raise ValueError("MongoDB URI must be provided or set in MONGO_URL environment variable")
 
+        install_command_monitor()
+        install_pool_monitor()
         cls._client = MongoClient(connection_uri, serverSelectionTimeoutMS=500)
         try:
             cls._client.admin.command("ping")
@@ -46,6 +68,12 @@ class MongoHelper:
             import mongomock
 
             cls._client = mongomock.MongoClient()
+        if connection_uri not in cls._indexed_uris:
+            # Unique indexes back duplicate checks such as signup's email.
+            from infra.db.mongodb.indexes import ensure_indexes
+
+            logger.info("MongoDB indexes ready: %s", ", ".join(ensure_indexes()))
+            cls._indexed_uris.add(connection_uri)
 
     @classmethod
     async def disconnect(cls) -> None:
@@ -55,6 +83,21 @@ class MongoHelper:
             cls._client = None
             cls._db = None
 
+    @classmethod
+    def ping(cls) -> None:
+        """Round-trip to the server; raises if disconnected or unreachable."""
+        cls._connected_client().admin.command("ping")
+
+    @classmethod
+    def _connected_client(cls) -> MongoClient:
+        if not cls._client and os.getenv("MONGO_URL"):
+            with cls._lock:
+                if not cls._client:
+                    cls._open()
+        if not cls._client:
+            raise RuntimeError("MongoDB client is not connected. Call connect() first.")
+        return cls._client
+
     @classmethod
     def get_db(cls, db_name: Optional[str] = None) -> Database:
         """
@@ -66,11 +109,9 @@ class MongoHelper:
         Returns:
             Database instance.
         """
-        if not cls._client:
-            raise RuntimeError("MongoDB client is not connected. Call connect() first.")
-
+        client = cls._connected_client()
         database_name = db_name or os.getenv("MONGO_DB_NAME", "flask_db")
-        return cls._client[database_name]
+        return client[database_name]
 
     @classmethod
     def get_collection(cls, collection_name: str, db_name: Optional[str] = None):
@@ -0,0 +1,103 @@
+"""Connection pool accounting built on pymongo's ConnectionPoolListener."""
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict
+
+from pymongo import monitoring
+
+# pymongo only reports pool options that differ from their defaults.
+_DEFAULT_MAX_POOL_SIZE = 100
+
+
+class ConnectionPoolMonitor(monitoring.ConnectionPoolListener):
+    """Count checkouts and track how many connections each server pool lends out."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.checkout_failures = 0
+        self._checked_out: Dict[str, int] = {}
+        self._max_size: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def pool_created(self, event: Any) -> None:
+        max_size = event.options.get("maxPoolSize", _DEFAULT_MAX_POOL_SIZE)
+        with self._lock:
+            self._max_size[_address(event)] = max_size or 0
+            self._checked_out.setdefault(_address(event), 0)
+
+    def pool_closed(self, event: Any) -> None:
+        with self._lock:
+            self._max_size.pop(_address(event), None)
+            self._checked_out.pop(_address(event), None)
+
+    def connection_checked_out(self, event: Any) -> None:
+        with self._lock:
+            self.checkouts += 1
+            address = _address(event)
+            self._checked_out[address] = self._checked_out.get(address, 0) + 1
+
+    def connection_checked_in(self, event: Any) -> None:
+        with self._lock:
+            address = _address(event)
+            self._checked_out[address] = max(self._checked_out.get(address, 0) - 1, 0)
+
+    def connection_check_out_failed(self, event: Any) -> None:
+        with self._lock:
+            self.checkout_failures += 1
+
+    def pool_ready(self, event: Any) -> None:
+        pass
+
+    def pool_cleared(self, event: Any) -> None:
+        pass
+
+    def connection_created(self, event: Any) -> None:
+        pass
+
+    def connection_ready(self, event: Any) -> None:
+        pass
+
+    def connection_closed(self, event: Any) -> None:
+        pass
+
+    def connection_check_out_started(self, event: Any) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_failures": self.checkout_failures,
+                "pools": {
+                    address: {
+                        "checked_out": self._checked_out.get(address, 0),
+                        "max_size": max_size,
+                    }
+                    for address, max_size in self._max_size.items()
+                },
+            }
+
+
+def _address(event: Any) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+_pool_monitor: ConnectionPoolMonitor | None = None
+_pool_monitor_lock = threading.Lock()
+
+
+def install_pool_monitor() -> ConnectionPoolMonitor:
+    """Register the process-wide pool monitor once; it applies to clients created afterwards."""
+    global _pool_monitor
+    with _pool_monitor_lock:
+        if _pool_monitor is None:
+            _pool_monitor = ConnectionPoolMonitor()
+            monitoring.register(_pool_monitor)
+    return _pool_monitor
+
+
+def pool_stats() -> Dict[str, Any] | None:
+    """Return pool counters, or ``None`` when no client was ever connected."""
+    return _pool_monitor.stats() if _pool_monitor is not None else None
@@ -0,0 +1,116 @@
+"""Per-request MongoDB command instrumentation built on pymongo's CommandListener."""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from pymongo import monitoring
+
+# The stats live outside this module so requests can start them without importing pymongo.
+from infra.db.query_stats import (  # noqa: F401
+    QueryStats,
+    begin_query_stats,
+    current_query_stats,
+    end_query_stats,
+)
+
+logger = logging.getLogger(__name__)
+
+_FILTER_KEYS = ("filter", "query", "q", "pipeline")
+
+
+def filter_shape(value: Any) -> Any:
+    """Replace literal values with ``?`` so filters can be logged without user data."""
+    if isinstance(value, dict):
+        return {key: filter_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        shapes = []
+        for item in value:
+            shape = filter_shape(item)
+            if shape not in shapes:
+                shapes.append(shape)
+        return shapes
+    return "?"
+
+
+def _documents_returned(reply: Any) -> int:
+    if not isinstance(reply, dict):
+        return 0
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        return len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+    if "values" in reply:
+        return len(reply["values"])
+    if "value" in reply:
+        return 1 if reply["value"] is not None else 0
+    return int(reply.get("n", 0) or 0)
+
+
+class CommandMonitor(monitoring.CommandListener):
+    """Attribute every command to the current QueryStats and log slow ones."""
+
+    def __init__(self, slow_query_ms: float | None = None):
+        self.slow_query_ms = (
+            slow_query_ms
+            if slow_query_ms is not None
+            else float(os.getenv("MONGO_SLOW_QUERY_MS", "100"))
+        )
+        self._pending: Dict[Tuple[Any, int], Tuple[Optional[QueryStats], str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def started(self, event: Any) -> None:
+        command = event.command
+        collection = command.get(event.command_name)
+        shape = next(
+            (filter_shape(command[key]) for key in _FILTER_KEYS if key in command),
+            None,
+        )
+        with self._lock:
+            self._pending[(event.connection_id, event.request_id)] = (
+                current_query_stats(),
+                (
+                    f"{event.command_name} {collection}"
+                    if isinstance(collection, str)
+                    else event.command_name
+                ),
+                shape,
+            )
+
+    def succeeded(self, event: Any) -> None:
+        self._finish(event, _documents_returned(event.reply))
+
+    def failed(self, event: Any) -> None:
+        self._finish(event, 0)
+
+    def _finish(self, event: Any, documents: int) -> None:
+        with self._lock:
+            stats, description, shape = self._pending.pop(
+                (event.connection_id, event.request_id), (None, event.command_name, None)
+            )
+        duration_ms = event.duration_micros / 1000
+        if stats is not None:
+            stats.record(event.command_name, duration_ms, documents)
+        if duration_ms >= self.slow_query_ms:
+            logger.warning(
+                "Slow MongoDB command: %s filter=%s took %.1f ms and returned %d documents",
+                description,
+                shape,
+                duration_ms,
+                documents,
+            )
+
+
+_monitor: CommandMonitor | None = None
+_monitor_lock = threading.Lock()
+
+
+def install_command_monitor() -> CommandMonitor:
+    """Register the process-wide monitor once; it applies to clients created afterwards."""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is None:
+            _monitor = CommandMonitor()
+            monitoring.register(_monitor)
+    return _monitor
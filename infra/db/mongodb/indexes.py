@@ -0,0 +1,70 @@
+"""Indexes every MongoDB collection needs, created idempotently at startup."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+from pymongo import ASCENDING
+
+from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    keys: List[Tuple[str, int]]
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+INDEXES: List[IndexSpec] = [
+    IndexSpec("accounts", [("email", ASCENDING)], {"name": "email_unique", "unique": True}),
+    # Partial, so accounts created before the backfill (no field yet) do not collide.
+    IndexSpec(
+        "accounts",
+        [("emailNormalized", ASCENDING)],
+        {
+            "name": "emailNormalized_unique",
+            "unique": True,
+            "partialFilterExpression": {"emailNormalized": {"$type": "string"}},
+        },
+    ),
+    # Sessions are looked up by _id (the token hash), which is already unique.
+    IndexSpec(
+        "sessions",
+        [("expiresAt", ASCENDING)],
+        {"name": "expiresAt_ttl", "expireAfterSeconds": 0},
+    ),
+    IndexSpec(
+        "tokenRevocations",
+        [("expiresAt", ASCENDING)],
+        {"name": "expiresAt_ttl", "expireAfterSeconds": 0},
+    ),
+    IndexSpec(
+        "refreshTokens",
+        [("expiresAt", ASCENDING)],
+        {"name": "expiresAt_ttl", "expireAfterSeconds": 0},
+    ),
+    IndexSpec("refreshTokens", [("family", ASCENDING)], {"name": "family"}),
+    # Covers the per-answer tally: $match on surveyId and $group on answer read
+    # only index keys, and accountId marks the caller's own vote.
+    IndexSpec(
+        "surveyResults",
+        [("surveyId", ASCENDING), ("answer", ASCENDING), ("accountId", ASCENDING)],
+        {"name": "surveyId_answer_accountId"},
+    ),
+    # Sharded tallies: one counter per survey, answer and shard. Serves the
+    # $inc upserts and the $match/$group that sums them.
+    IndexSpec(
+        "surveyResultCounters",
+        [("surveyId", ASCENDING), ("answer", ASCENDING), ("shard", ASCENDING)],
+        {"name": "surveyId_answer_shard_unique", "unique": True},
+    ),
+]
+
+
+def ensure_indexes() -> List[str]:
+    """Create any missing index; existing ones with the same spec are left untouched."""
+    return [
+        MongoHelper.get_collection(spec.collection).create_index(spec.keys, **spec.options)
+        for spec in INDEXES
+    ]
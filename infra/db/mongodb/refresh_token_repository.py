@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+"""MongoDB refresh token repository."""
+from datetime import datetime, timezone
+
+from pymongo import ReturnDocument
+
+from data.protocols import (
+    AddRefreshTokenRepository,
+    ConsumeRefreshTokenRepository,
+    RevokeRefreshTokenFamilyRepository,
+)
+from domain.models.refresh_token import RefreshTokenModel
+from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+
+
+class RefreshTokenMongoRepository(
+    AddRefreshTokenRepository,
+    ConsumeRefreshTokenRepository,
+    RevokeRefreshTokenFamilyRepository,
+):
+    """Refresh tokens keyed by their SHA-256 hash, removed by a TTL on ``expiresAt``.
+
+    Rotated tokens stay until they expire so that replaying one can be detected.
+    """
+
+    async def add_refresh_token(
+        self,
+        token_hash: str,
+        refresh_token: RefreshTokenModel,
+        expires_at: datetime,
+    ) -> None:
+        MongoHelper.get_collection("refreshTokens").insert_one({
+            "_id": token_hash,
+            "accountId": refresh_token.account_id,
+            "family": refresh_token.family,
+            "tokenVersion": refresh_token.token_version,
+            "expiresAt": expires_at,
+        })
+
+    async def consume_refresh_token(self, token_hash: str) -> RefreshTokenModel | None:
+        now = datetime.now(timezone.utc)
+        # The TTL monitor runs about once a minute, so expiry is also checked here.
+        stored = MongoHelper.get_collection("refreshTokens").find_one_and_update(
+            {"_id": token_hash, "expiresAt": {"$gt": now}},
+            {"$set": {"usedAt": now}},
+            projection={"accountId": 1, "family": 1, "tokenVersion": 1, "usedAt": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if stored is None:
+            return None
+        return RefreshTokenModel(
+            account_id=stored["accountId"],
+            family=stored["family"],
+            token_version=stored.get("tokenVersion", 0),
+            used=stored.get("usedAt") is not None,
+        )
+
+    async def revoke_refresh_token_family(self, family: str) -> None:
+        MongoHelper.get_collection("refreshTokens").delete_many({"family": family})
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+"""MongoDB session repository."""
+from datetime import datetime, timedelta, timezone
+
+from data.protocols import LoadAccountByTokenRepository, UpdateAccessTokenRepository
+from domain.models.account import AccountModel
+from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+from infra.db.tokens import hash_access_token
+
+
+class SessionMongoRepository(LoadAccountByTokenRepository, UpdateAccessTokenRepository):
+    """One small document per issued access token, keyed by the token's SHA-256 hash.
+
+    Every login adds a session instead of overwriting the previous one, so an
+    account can stay signed in on several devices. The role is copied in at
+    login so that authorizing a request never reads ``accounts``; sessions are
+    removed by a TTL on ``expiresAt``.
+    """
+
+    def __init__(self, expires_in_seconds: int = 3600):
+        self.expires_in_seconds = expires_in_seconds
+
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
+        # Two logins in the same second mint the same token, hence the upsert.
+        MongoHelper.get_collection("sessions").update_one(
+            {"_id": hash_access_token(token)},
+            {"$set": {
+                "accountId": account_id,
+                "role": role,
+                "expiresAt": datetime.now(timezone.utc) + timedelta(seconds=self.expires_in_seconds),
+            }},
+            upsert=True,
+        )
+
+    async def load_by_token(self, token: str, role: str | None = None) -> AccountModel | None:
+        # The TTL monitor runs about once a minute, so expiry is also checked here.
+        session = MongoHelper.get_collection("sessions").find_one(
+            {
+                "_id": hash_access_token(token),
+                "expiresAt": {"$gt": datetime.now(timezone.utc)},
+                "role": {"$in": [role, "admin"]},
+            },
+            {"accountId": 1, "role": 1},
+        )
+        if session is None:
+            return None
+        account = AccountModel(id=session["accountId"], name="", email="")
+        account.access_token = token
+        account.role = session.get("role")
+        return account
@@ -0,0 +1,201 @@
+"""Survey results tallied from sharded counters instead of from every vote.
+
+Votes are still stored one per account in ``surveyResults``, which stays the
+source of truth for "what did this account answer". Each vote also moves a
+per-answer counter in ``surveyResultCounters``, split over K documents per
+answer; the shard is picked from a hash of the account id, so concurrent
+voters on one survey increment different documents. Reading a tally sums at
+most K documents per answer instead of grouping every vote.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
+
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+from infra.db.mongodb.survey_result_repository import (
+    SurveyResultMongoRepository,
+    _to_object_id,
+    _to_result,
+)
+
+COUNTERS = "surveyResultCounters"
+
+
+@dataclass
+class _SurveyLoad:
+    window_started: float
+    votes: int
+    shards: int
+
+
+class HotSurveyDetector:
+    """Pick how many counter shards each survey's votes are spread over.
+
+    Every survey starts on ``base_shards``. When one takes more than
+    ``hot_votes_per_second`` over a ``window_seconds`` window its shard count
+    doubles, up to ``max_shards``. It never shrinks: reads sum every shard
+    anyway, so a survey that cooled down only costs a few more documents per
+    read. Counts are kept per process, and a restarted process climbs back
+    within a few windows.
+    """
+
+    def __init__(
+        self,
+        base_shards: int = 4,
+        max_shards: int = 64,
+        hot_votes_per_second: float = 50.0,
+        window_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= base_shards <= max_shards:
+            raise ValueError("base_shards must be between 1 and max_shards")
+        self.base_shards = base_shards
+        self.max_shards = max_shards
+        self.window_votes = hot_votes_per_second * window_seconds
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._surveys: Dict[str, _SurveyLoad] = {}
+        self._lock = threading.Lock()
+
+    def shards(self, survey_id: str) -> int:
+        load = self._surveys.get(survey_id)
+        return load.shards if load else self.base_shards
+
+    def record(self, survey_id: str) -> int:
+        """Count one vote on ``survey_id`` and return the shard count to write it to."""
+        now = self._clock()
+        with self._lock:
+            load = self._surveys.get(survey_id)
+            if load is None:
+                load = self._surveys[survey_id] = _SurveyLoad(now, 0, self.base_shards)
+            elif now - load.window_started >= self.window_seconds:
+                load.window_started, load.votes = now, 0
+            load.votes += 1
+            if load.votes > self.window_votes and load.shards < self.max_shards:
+                load.shards = min(load.shards * 2, self.max_shards)
+                load.window_started, load.votes = now, 0
+            return load.shards
+
+
+def _shard(account_id: str, shards: int) -> int:
+    # crc32 rather than hash(): the same account lands on the same shard in
+    # every process.
+    return zlib.crc32(account_id.encode()) % shards
+
+
+class ShardedSurveyResultMongoRepository(SurveyResultMongoRepository):
+    """``SurveyResultMongoRepository`` that reads tallies from sharded counters.
+
+    Counters only cover votes saved through this class; run
+    ``rebuild_survey_counters`` once before switching an existing database to
+    it.
+    """
+
+    def __init__(self, detector: HotSurveyDetector | None = None):
+        self.detector = detector or HotSurveyDetector()
+
+    async def save(self, data: SaveSurveyResultParams) -> None:
+        survey_object_id = _to_object_id(data.survey_id)
+        account_object_id = _to_object_id(data.account_id)
+        if survey_object_id is None or account_object_id is None:
+            return None
+        previous = self._save_vote(survey_object_id, account_object_id, data)
+        if previous == data.answer:
+            return None
+        shard = _shard(data.account_id, self.detector.record(data.survey_id))
+        counters = MongoHelper.get_collection(COUNTERS)
+        _increment(counters, survey_object_id, data.answer, shard, 1)
+        # The old answer is taken off whichever shard this vote lands on now;
+        # only the sum over shards has to be right.
+        if previous is not None:
+            _increment(counters, survey_object_id, previous, shard, -1)
+
+    async def load_by_survey_id(
+        self, survey_id: str, account_id: str
+    ) -> SurveyResultModel | None:
+        survey_object_id = _to_object_id(survey_id)
+        if survey_object_id is None:
+            return None
+        survey = MongoHelper.get_collection("surveys").find_one({"_id": survey_object_id})
+        if not survey:
+            return None
+        counts, current = self._tallies([survey_object_id], _to_object_id(account_id))
+        if not counts[survey_object_id]:
+            return None
+        return _to_result(survey, counts[survey_object_id], current.get(survey_object_id))
+
+    @staticmethod
+    def _tallies(
+        object_ids: list[ObjectId], account_object_id: ObjectId | None
+    ) -> tuple[dict[ObjectId, Counter], dict[ObjectId, str]]:
+        counts: dict[ObjectId, Counter] = defaultdict(Counter)
+        for row in MongoHelper.get_collection(COUNTERS).aggregate([
+            {"$match": {"surveyId": {"$in": object_ids}}},
+            {"$group": {
+                "_id": {"surveyId": "$surveyId", "answer": "$answer"},
+                "count": {"$sum": "$count"},
+            }},
+        ]):
+            if row["count"] > 0:
+                counts[row["_id"]["surveyId"]][row["_id"]["answer"]] = row["count"]
+        current: dict[ObjectId, str] = {}
+        if account_object_id is not None:
+            for row in MongoHelper.get_collection("surveyResults").find(
+                {"surveyId": {"$in": object_ids}, "accountId": account_object_id},
+                {"_id": 0, "surveyId": 1, "answer": 1},
+            ):
+                current[row["surveyId"]] = row["answer"]
+        return counts, current
+
+
+def _increment(
+    counters: Any, survey_object_id: ObjectId, answer: str, shard: int, amount: int
+) -> None:
+    query = {"surveyId": survey_object_id, "answer": answer, "shard": shard}
+    try:
+        counters.update_one(query, {"$inc": {"count": amount}}, upsert=True)
+    except DuplicateKeyError:
+        # Another vote created this counter first; it exists now.
+        counters.update_one(query, {"$inc": {"count": amount}})
+
+
+def rebuild_survey_counters(batch_size: int = 500) -> int:
+    """Recompute every counter from the stored votes and return how many were written.
+
+    Needed once before enabling the sharded repository on a database that
+    already has votes, and to repair drift if a process died between saving
+    a vote and moving its counter. Votes cast while it runs can be lost from
+    or counted twice in the tallies, so pause voting first.
+    """
+    counters = MongoHelper.get_collection(COUNTERS)
+    counters.delete_many({})
+    written = 0
+    batch: List[Dict[str, Any]] = []
+    for row in MongoHelper.get_collection("surveyResults").aggregate([
+        {"$group": {
+            "_id": {"surveyId": "$surveyId", "answer": "$answer"},
+            "count": {"$sum": 1},
+        }},
+    ]):
+        batch.append({
+            "surveyId": row["_id"]["surveyId"],
+            "answer": row["_id"]["answer"],
+            "shard": 0,
+            "count": row["count"],
+        })
+        if len(batch) >= batch_size:
+            written += len(counters.insert_many(batch, ordered=False).inserted_ids)
+            batch = []
+    if batch:
+        written += len(counters.insert_many(batch, ordered=False).inserted_ids)
+    return written
@@ -1,29 +1,51 @@
 from __future__ import annotations
 
+from typing import Any, Iterable, Mapping
+
 from bson import ObjectId
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+from pymongo import ASCENDING
 
 from data.protocols import (
     AddSurveyRepository,
     CheckSurveyByIdRepository,
     LoadAnswersBySurveyRepository,
     LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
     LoadSurveysRepository,
+    LoadSurveysViewRepository,
 )
 from domain.models.survey import SurveyAnswerModel, SurveyModel
 from domain.usecases.add_survey import AddSurveyParams
 from infra.db.mongodb.helpers.mongo_helper import MongoHelper
 
 
+_RAW_CODEC_OPTIONS = CodecOptions(document_class=RawBSONDocument)
+_VIEW_PROJECTION = {"_id": 1, "question": 1, "answers": 1, "date": 1}
+
+
 def _to_object_id(value: str) -> ObjectId | None:
     return ObjectId(value) if ObjectId.is_valid(value) else None
 
 
+def _raw(collection):
+    """Return a collection view that yields undecoded BSON documents."""
+    try:
+        return collection.with_options(codec_options=_RAW_CODEC_OPTIONS)
+    except NotImplementedError:
+        # mongomock cannot return RawBSONDocument; plain dicts expose the same mapping API.
+        return collection
+
+
 class SurveyMongoRepository(
     AddSurveyRepository,
     CheckSurveyByIdRepository,
     LoadAnswersBySurveyRepository,
     LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
     LoadSurveysRepository,
+    LoadSurveysViewRepository,
 ):
     async def add(self, data: AddSurveyParams) -> None:
         collection = MongoHelper.get_collection("surveys")
@@ -36,21 +58,28 @@ class SurveyMongoRepository(
             "date": data.date,
         })
 
-    async def load_all(self, account_id: str) -> list[SurveyModel]:
-        surveys = list(MongoHelper.get_collection("surveys").find())
-        results = MongoHelper.get_collection("surveyResults")
-        account_object_id = _to_object_id(account_id)
+    async def load_all(
+        self, account_id: str, limit: int | None = None, offset: int = 0
+    ) -> list[SurveyModel]:
+        # A limit of 0 means no limit to MongoDB.
+        surveys = list(MongoHelper.get_collection("surveys").find(
+            {}, sort=[("_id", ASCENDING)], skip=offset, limit=limit or 0
+        ))
+        answered = self._answered_survey_ids(
+            [survey["_id"] for survey in surveys], account_id
+        )
         return [
-            self._to_model(
-                survey,
-                did_answer=(
-                    account_object_id is not None
-                    and results.find_one({
-                        "surveyId": survey["_id"],
-                        "accountId": account_object_id,
-                    }) is not None
-                ),
-            )
+            self._to_model(survey, did_answer=survey["_id"] in answered)
+            for survey in surveys
+        ]
+
+    async def load_all_view(self, account_id: str) -> list[dict[str, Any]]:
+        surveys = list(_raw(MongoHelper.get_collection("surveys")).find({}, _VIEW_PROJECTION))
+        answered = self._answered_survey_ids(
+            [survey["_id"] for survey in surveys], account_id
+        )
+        return [
+            self._to_view(survey, did_answer=survey["_id"] in answered)
             for survey in surveys
         ]
 
@@ -61,6 +90,19 @@ class SurveyMongoRepository(
         survey = MongoHelper.get_collection("surveys").find_one({"_id": object_id})
         return self._to_model(survey) if survey else None
 
+    async def load_by_ids(self, survey_ids: list[str], account_id: str) -> list[SurveyModel]:
+        object_ids = [object_id for object_id in map(_to_object_id, survey_ids) if object_id]
+        if not object_ids:
+            return []
+        surveys = list(MongoHelper.get_collection("surveys").find({"_id": {"$in": object_ids}}))
+        answered = self._answered_survey_ids(
+            [survey["_id"] for survey in surveys], account_id
+        )
+        return [
+            self._to_model(survey, did_answer=survey["_id"] in answered)
+            for survey in surveys
+        ]
+
     async def check_by_id(self, survey_id: str) -> bool:
         object_id = _to_object_id(survey_id)
         if object_id is None:
@@ -78,6 +120,30 @@ class SurveyMongoRepository(
         )
         return [answer["answer"] for answer in survey.get("answers", [])] if survey else []
 
+    @staticmethod
+    def _answered_survey_ids(survey_ids: Iterable[ObjectId], account_id: str) -> set:
+        account_object_id = _to_object_id(account_id)
+        if account_object_id is None or not survey_ids:
+            return set()
+        return set(MongoHelper.get_collection("surveyResults").distinct(
+            "surveyId",
+            {"surveyId": {"$in": list(survey_ids)}, "accountId": account_object_id},
+        ))
+
+    @staticmethod
+    def _to_view(survey: Mapping[str, Any], did_answer: bool = False) -> dict[str, Any]:
+        """Build the GET /api/surveys payload directly from a raw BSON document."""
+        return {
+            "id": str(survey["_id"]),
+            "question": survey["question"],
+            "answers": [
+                {"answer": answer["answer"], "image": answer.get("image")}
+                for answer in survey.get("answers", [])
+            ],
+            "date": survey.get("date"),
+            "didAnswer": did_answer,
+        }
+
     @staticmethod
     def _to_model(survey: dict, did_answer: bool = False) -> SurveyModel:
         return SurveyModel(
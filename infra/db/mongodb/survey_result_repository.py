@@ -1,29 +1,52 @@
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import datetime
 
 from bson import ObjectId
 
-from data.protocols import LoadSurveyResultRepository, SaveSurveyResultRepository
-from domain.models.survey_result import SurveyResultAnswerModel, SurveyResultModel
+from data.protocols import (
+    LoadAccountAnswersRepository,
+    LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
+    SaveSurveyResultRepository,
+)
+from domain.models.survey_result import SurveyResultModel
 from domain.usecases.save_survey_result import SaveSurveyResultParams
 from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+from infra.db.tally import build_survey_result
 
 
 def _to_object_id(value: str) -> ObjectId | None:
     return ObjectId(value) if ObjectId.is_valid(value) else None
 
 
-class SurveyResultMongoRepository(SaveSurveyResultRepository, LoadSurveyResultRepository):
+def _to_result(survey: dict, counts: Counter, current: str | None) -> SurveyResultModel:
+    return build_survey_result(
+        str(survey["_id"]), survey["question"], survey.get("date"),
+        survey.get("answers", []), counts, current,
+    )
+
+
+class SurveyResultMongoRepository(
+    LoadAccountAnswersRepository,
+    LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
+    SaveSurveyResultRepository,
+):
     async def save(self, data: SaveSurveyResultParams) -> None:
         survey_object_id = _to_object_id(data.survey_id)
         account_object_id = _to_object_id(data.account_id)
         if survey_object_id is None or account_object_id is None:
             return None
+        self._save_vote(survey_object_id, account_object_id, data)
 
-        collection = MongoHelper.get_collection("surveyResults")
-        collection.find_one_and_update(
+    @staticmethod
+    def _save_vote(
+        survey_object_id: ObjectId, account_object_id: ObjectId, data: SaveSurveyResultParams
+    ) -> str | None:
+        """Upsert the account's vote and return the answer it replaced, if any."""
+        previous = MongoHelper.get_collection("surveyResults").find_one_and_update(
             {
                 "surveyId": survey_object_id,
                 "accountId": account_object_id,
@@ -34,8 +57,10 @@ class SurveyResultMongoRepository(SaveSurveyResultRepository, LoadSurveyResultRe
                     "date": data.date or datetime.utcnow(),
                 }
             },
+            projection={"_id": 0, "answer": 1},
             upsert=True,
         )
+        return previous["answer"] if previous else None
 
     async def load_by_survey_id(
         self, survey_id: str, account_id: str
@@ -53,7 +78,6 @@ class SurveyResultMongoRepository(SaveSurveyResultRepository, LoadSurveyResultRe
         }))
         if not rows:
             return None
-        total = len(rows)
         counts = Counter(row["answer"] for row in rows)
         current = next(
             (
@@ -63,20 +87,55 @@ class SurveyResultMongoRepository(SaveSurveyResultRepository, LoadSurveyResultRe
             ),
             None,
         )
-        answers = []
-        for answer in survey.get("answers", []):
-            count = counts.get(answer["answer"], 0)
-            answers.append(SurveyResultAnswerModel(
-                answer=answer["answer"],
-                image=answer.get("image"),
-                count=count,
-                percent=round(count / total * 100) if total else 0,
-                is_current_account_answer=answer["answer"] == current,
-            ))
-        answers.sort(key=lambda item: item.count, reverse=True)
-        return SurveyResultModel(
-            survey_id=str(survey["_id"]),
-            question=survey["question"],
-            date=survey.get("date"),
-            answers=answers,
+        return _to_result(survey, counts, current)
+
+    async def load_by_survey_ids(
+        self, survey_ids: list[str], account_id: str
+    ) -> dict[str, SurveyResultModel]:
+        object_ids = [object_id for object_id in map(_to_object_id, survey_ids) if object_id]
+        if not object_ids:
+            return {}
+        surveys = MongoHelper.get_collection("surveys").find(
+            {"_id": {"$in": object_ids}}, {"question": 1, "answers": 1, "date": 1}
+        )
+        counts, current = self._tallies(object_ids, _to_object_id(account_id))
+        return {
+            str(survey["_id"]): _to_result(survey, counts[survey["_id"]], current.get(survey["_id"]))
+            for survey in surveys
+        }
+
+    @staticmethod
+    def _tallies(
+        object_ids: list[ObjectId], account_object_id: ObjectId | None
+    ) -> tuple[dict[ObjectId, Counter], dict[ObjectId, str]]:
+        """Return per-answer vote counts and the account's own answer, by survey."""
+        counts: dict[ObjectId, Counter] = defaultdict(Counter)
+        current: dict[ObjectId, str] = {}
+        # One grouped pass over surveyId_answer_accountId for every survey; only
+        # the per-answer counts leave the server.
+        for row in MongoHelper.get_collection("surveyResults").aggregate([
+            {"$match": {"surveyId": {"$in": object_ids}}},
+            {"$group": {
+                "_id": {"surveyId": "$surveyId", "answer": "$answer"},
+                "count": {"$sum": 1},
+                "current": {"$max": {"$eq": ["$accountId", account_object_id]}},
+            }},
+        ]):
+            survey_id, answer = row["_id"]["surveyId"], row["_id"]["answer"]
+            counts[survey_id][answer] = row["count"]
+            if row["current"] and account_object_id is not None:
+                current[survey_id] = answer
+        return counts, current
+
+    async def load_account_answers(
+        self, account_id: str, survey_ids: list[str]
+    ) -> dict[str, str]:
+        account_object_id = _to_object_id(account_id)
+        object_ids = [object_id for object_id in map(_to_object_id, survey_ids) if object_id]
+        if account_object_id is None or not object_ids:
+            return {}
+        rows = MongoHelper.get_collection("surveyResults").find(
+            {"surveyId": {"$in": object_ids}, "accountId": account_object_id},
+            {"_id": 0, "surveyId": 1, "answer": 1},
         )
+        return {str(row["surveyId"]): row["answer"] for row in rows}
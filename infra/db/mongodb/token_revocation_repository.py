@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+"""MongoDB token revocation repository."""
+import os
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from data.protocols import LoadTokenRevocationsRepository, RevokeAccountTokensRepository
+from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+
+
+class TokenRevocationMongoRepository(
+    LoadTokenRevocationsRepository,
+    RevokeAccountTokensRepository,
+):
+    """Revocations live until the last token they cover has expired (TTL on ``expiresAt``)."""
+
+    def __init__(self, token_lifetime_seconds: int | None = None):
+        self.token_lifetime_seconds = token_lifetime_seconds or int(
+            os.getenv("JWT_EXPIRES_IN_SECONDS", "3600")
+        )
+
+    async def revoke_tokens(self, account_id: str) -> int | None:
+        if not ObjectId.is_valid(account_id):
+            return None
+        account = MongoHelper.get_collection("accounts").find_one_and_update(
+            {"_id": ObjectId(account_id)},
+            {"$inc": {"tokenVersion": 1}},
+            projection={"tokenVersion": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if account is None:
+            return None
+        token_version = account["tokenVersion"]
+        MongoHelper.get_collection("tokenRevocations").update_one(
+            {"_id": account_id},
+            {"$set": {
+                "tokenVersion": token_version,
+                "expiresAt": datetime.now(timezone.utc)
+                + timedelta(seconds=self.token_lifetime_seconds),
+            }},
+            upsert=True,
+        )
+        return token_version
+
+    async def load_revocations(self) -> dict[str, int]:
+        revocations = MongoHelper.get_collection("tokenRevocations").find(
+            {"expiresAt": {"$gt": datetime.now(timezone.utc)}},
+            {"tokenVersion": 1},
+        )
+        return {revocation["_id"]: revocation["tokenVersion"] for revocation in revocations}
@@ -0,0 +1,12 @@
+"""PostgreSQL infrastructure module (needs ``pip install asyncpg``)."""
+from infra.db.postgres.account_repository import AccountPostgresRepository
+from infra.db.postgres.session_repository import SessionPostgresRepository
+from infra.db.postgres.survey_repository import SurveyPostgresRepository
+from infra.db.postgres.survey_result_repository import SurveyResultPostgresRepository
+
+__all__ = [
+    "AccountPostgresRepository",
+    "SessionPostgresRepository",
+    "SurveyPostgresRepository",
+    "SurveyResultPostgresRepository",
+]
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+"""PostgreSQL Account Repository implementation."""
+from data.protocols.add_account_repository import (
+    AddAccountRepository,
+    CheckAccountByEmailRepository,
+    LoadAccountByEmailRepository,
+    LoadAccountByIdRepository,
+    UpdatePasswordRepository,
+)
+from data.protocols.email_normalizer import EmailNormalizer
+from domain.models.account import AccountModel
+from domain.usecases.add_account import AddAccountModel
+from infra.db.postgres.helpers import PostgresHelper, to_row_id
+
+_COLUMNS = "id, name, email, password, role, token_version"
+# ON CONFLICT DO NOTHING turns a duplicate email into "no row returned"
+# instead of an error the pool has to recover from.
+_INSERT = (
+    "INSERT INTO accounts (name, email, email_normalized, password) VALUES ($1, $2, $3, $4) "
+    "ON CONFLICT (email_normalized) DO NOTHING RETURNING id"
+)
+_SELECT_BY_EMAIL = f"SELECT {_COLUMNS} FROM accounts WHERE email_normalized = $1"
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM accounts WHERE id = $1"
+_EXISTS_BY_EMAIL = "SELECT 1 FROM accounts WHERE email_normalized = $1"
+_UPDATE_PASSWORD = "UPDATE accounts SET password = $1 WHERE id = $2"
+
+
+class AccountPostgresRepository(
+    AddAccountRepository,
+    CheckAccountByEmailRepository,
+    LoadAccountByEmailRepository,
+    LoadAccountByIdRepository,
+    UpdatePasswordRepository,
+):
+    """PostgreSQL implementation of the account repositories, matched by normalized email."""
+
+    def __init__(self, email_normalizer: EmailNormalizer | None = None):
+        if email_normalizer is None:
+            from utils.email_validator_adapter import EmailValidatorAdapter
+
+            email_normalizer = EmailValidatorAdapter()
+        self.email_normalizer = email_normalizer
+
+    async def add(self, account_data: AddAccountModel) -> AccountModel | None:
+        """Insert the account; ``None`` when the unique email index rejects it."""
+        account_id = await PostgresHelper.fetchval(
+            _INSERT,
+            account_data.name,
+            account_data.email,
+            self.email_normalizer.normalize(account_data.email),
+            account_data.password,
+        )
+        if account_id is None:
+            return None
+        return AccountModel(
+            id=str(account_id),
+            name=account_data.name,
+            email=account_data.email,
+            password=account_data.password,
+        )
+
+    async def load_by_email(self, email: str) -> AccountModel | None:
+        row = await PostgresHelper.fetchrow(
+            _SELECT_BY_EMAIL, self.email_normalizer.normalize(email)
+        )
+        return self._to_model(row) if row else None
+
+    async def load_by_id(self, account_id: str) -> AccountModel | None:
+        row_id = to_row_id(account_id)
+        if row_id is None:
+            return None
+        row = await PostgresHelper.fetchrow(_SELECT_BY_ID, row_id)
+        return self._to_model(row) if row else None
+
+    async def check_by_email(self, email: str) -> bool:
+        return await PostgresHelper.fetchval(
+            _EXISTS_BY_EMAIL, self.email_normalizer.normalize(email)
+        ) is not None
+
+    async def update_password(self, account_id: str, password: str) -> None:
+        await PostgresHelper.execute(_UPDATE_PASSWORD, password, to_row_id(account_id))
+
+    @staticmethod
+    def _to_model(row) -> AccountModel:
+        model = AccountModel(
+            id=str(row["id"]),
+            name=row["name"],
+            email=row["email"],
+            password=row["password"],
+        )
+        model.role = row["role"]
+        model.token_version = row["token_version"]
+        return model
@@ -0,0 +1,4 @@
+"""PostgreSQL helpers module."""
+from .postgres_helper import PostgresHelper, to_row_id
+
+__all__ = ["PostgresHelper", "to_row_id"]
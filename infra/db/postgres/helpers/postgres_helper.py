@@ -0,0 +1,137 @@
+"""PostgreSQL connection helper."""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from typing import Any, Awaitable, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+async def _init_connection(connection: Any) -> None:
+    # Decode JSONB straight into Python lists and dicts.
+    await connection.set_type_codec(
+        "jsonb", encoder=json.dumps, decoder=json.loads, schema="pg_catalog"
+    )
+
+
+class PostgresHelper:
+    """Helper class for managing one asyncpg pool per process.
+
+    Controllers run every use case in a fresh event loop (``asyncio.run``),
+    but an asyncpg pool belongs to the loop that created it. The pool
+    therefore lives on a dedicated loop thread, and queries issued from any
+    request loop are handed to it. asyncpg prepares each distinct SQL string
+    once per connection and keeps it in the connection's statement cache, so
+    the repositories' constant queries are only re-bound after first use.
+    """
+
+    _pool: Any = None
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _thread: Optional[threading.Thread] = None
+    _owner_pid: Optional[int] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    async def connect(cls, dsn: Optional[str] = None) -> None:
+        """
+        Open the pool and create any missing table or index.
+
+        Args:
+            dsn: PostgreSQL URL. If not provided, uses POSTGRES_URL env variable.
+        """
+        cls._ensure_pool(dsn)
+
+    @classmethod
+    async def disconnect(cls) -> None:
+        """Close the pool and stop its loop thread."""
+        with cls._lock:
+            pool, loop, thread = cls._pool, cls._loop, cls._thread
+            cls._pool = cls._loop = cls._thread = None
+        if pool is None or cls._owner_pid != os.getpid():
+            return
+        asyncio.run_coroutine_threadsafe(pool.close(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+
+    @classmethod
+    async def ping(cls) -> None:
+        await cls.fetchval("SELECT 1")
+
+    @classmethod
+    async def fetch(cls, query: str, *args: Any) -> List[Any]:
+        return await cls._run(lambda pool: pool.fetch(query, *args))
+
+    @classmethod
+    async def fetchrow(cls, query: str, *args: Any) -> Any:
+        return await cls._run(lambda pool: pool.fetchrow(query, *args))
+
+    @classmethod
+    async def fetchval(cls, query: str, *args: Any) -> Any:
+        return await cls._run(lambda pool: pool.fetchval(query, *args))
+
+    @classmethod
+    async def execute(cls, query: str, *args: Any) -> str:
+        return await cls._run(lambda pool: pool.execute(query, *args))
+
+    @classmethod
+    async def _run(cls, operation: Callable[[Any], Awaitable[T]]) -> T:
+        pool = cls._ensure_pool()
+        future = asyncio.run_coroutine_threadsafe(operation(pool), cls._loop)
+        return await asyncio.wrap_future(future)
+
+    @classmethod
+    def _ensure_pool(cls, dsn: Optional[str] = None) -> Any:
+        # A pool inherited across fork belongs to the parent; the child opens its own.
+        if cls._pool is not None and cls._owner_pid == os.getpid():
+            return cls._pool
+        with cls._lock:
+            if cls._pool is not None and cls._owner_pid == os.getpid():
+                return cls._pool
+            import asyncpg
+
+            from infra.db.postgres.schema import SCHEMA
+
+            connection_dsn = dsn or os.getenv("POSTGRES_URL")
+            if not connection_dsn:
+                raise ValueError(
+                    "PostgreSQL URL must be provided or set in POSTGRES_URL environment variable"
+                )
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="postgres-pool", daemon=True
+            )
+            thread.start()
+
+            async def open_pool() -> Any:
+                pool = await asyncpg.create_pool(
+                    connection_dsn,
+                    min_size=int(os.getenv("POSTGRES_POOL_MIN_SIZE", "1")),
+                    max_size=int(os.getenv("POSTGRES_POOL_MAX_SIZE", "10")),
+                    init=_init_connection,
+                )
+                async with pool.acquire() as connection, connection.transaction():
+                    # Serialize schema creation between workers starting together.
+                    await connection.execute("SELECT pg_advisory_xact_lock(hashtext('schema'))")
+                    await connection.execute(SCHEMA)
+                return pool
+
+            try:
+                pool = asyncio.run_coroutine_threadsafe(open_pool(), loop).result()
+            except BaseException:
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+                raise
+            cls._pool, cls._loop, cls._thread = pool, loop, thread
+            cls._owner_pid = os.getpid()
+            return pool
+
+
+def to_row_id(value: str | None) -> int | None:
+    """Parse an id issued by this backend; anything else matches no row."""
+    # BIGINT holds at most 19 digits.
+    if not value or not value.isdigit() or len(value) > 18:
+        return None
+    return int(value)
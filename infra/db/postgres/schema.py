@@ -0,0 +1,41 @@
+"""Tables and indexes of the PostgreSQL backend, created idempotently when the pool opens."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_normalized TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL,
+    role TEXT,
+    token_version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    token_hash TEXT PRIMARY KEY,
+    account_id BIGINT NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+    role TEXT,
+    expires_at TIMESTAMPTZ NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at);
+CREATE INDEX IF NOT EXISTS sessions_account_id ON sessions (account_id);
+
+CREATE TABLE IF NOT EXISTS surveys (
+    id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+    question TEXT NOT NULL,
+    answers JSONB NOT NULL,
+    date TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS survey_results (
+    survey_id BIGINT NOT NULL REFERENCES surveys (id) ON DELETE CASCADE,
+    account_id BIGINT NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+    answer TEXT NOT NULL,
+    date TIMESTAMP NOT NULL,
+    PRIMARY KEY (survey_id, account_id)
+);
+-- Covering index for the per-answer tally: the GROUP BY is an index-only scan.
+CREATE INDEX IF NOT EXISTS survey_results_tally
+    ON survey_results (survey_id, answer) INCLUDE (account_id);
+CREATE INDEX IF NOT EXISTS survey_results_account_id ON survey_results (account_id);
+"""
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+"""PostgreSQL session repository."""
+from datetime import datetime, timedelta, timezone
+
+from data.protocols import LoadAccountByTokenRepository, UpdateAccessTokenRepository
+from domain.models.account import AccountModel
+from infra.db.postgres.helpers import PostgresHelper, to_row_id
+from infra.db.tokens import hash_access_token
+
+_DELETE_EXPIRED = "DELETE FROM sessions WHERE expires_at <= now()"
+_UPSERT = (
+    "INSERT INTO sessions (token_hash, account_id, role, expires_at) VALUES ($1, $2, $3, $4) "
+    "ON CONFLICT (token_hash) DO UPDATE SET "
+    "account_id = excluded.account_id, role = excluded.role, expires_at = excluded.expires_at"
+)
+_SELECT = (
+    "SELECT account_id, role FROM sessions "
+    "WHERE token_hash = $1 AND expires_at > now() "
+    "AND (role IS NOT DISTINCT FROM $2 OR role = 'admin')"
+)
+
+
+class SessionPostgresRepository(LoadAccountByTokenRepository, UpdateAccessTokenRepository):
+    """Sessions keyed by the SHA-256 of the access token; expired rows are purged on insert."""
+
+    def __init__(self, expires_in_seconds: int = 3600):
+        self.expires_in_seconds = expires_in_seconds
+
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
+        await PostgresHelper.execute(_DELETE_EXPIRED)
+        await PostgresHelper.execute(
+            _UPSERT,
+            hash_access_token(token),
+            to_row_id(account_id),
+            role,
+            datetime.now(timezone.utc) + timedelta(seconds=self.expires_in_seconds),
+        )
+
+    async def load_by_token(self, token: str, role: str | None = None) -> AccountModel | None:
+        row = await PostgresHelper.fetchrow(_SELECT, hash_access_token(token), role)
+        if row is None:
+            return None
+        account = AccountModel(id=str(row["account_id"]), name="", email="")
+        account.access_token = token
+        account.role = row["role"]
+        return account
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+"""PostgreSQL survey repository."""
+from typing import Any
+
+from data.protocols import (
+    AddSurveyRepository,
+    CheckSurveyByIdRepository,
+    LoadAnswersBySurveyRepository,
+    LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
+    LoadSurveysRepository,
+    LoadSurveysViewRepository,
+)
+from domain.models.survey import SurveyAnswerModel, SurveyModel
+from domain.usecases.add_survey import AddSurveyParams
+from infra.db.postgres.helpers import PostgresHelper, to_row_id
+
+_INSERT = "INSERT INTO surveys (question, answers, date) VALUES ($1, $2, $3)"
+# A single LEFT JOIN on the (survey_id, account_id) primary key answers
+# didAnswer for every survey; the MongoDB repository needs a second query.
+_SELECT_ALL = (
+    "SELECT s.id, s.question, s.answers, s.date, r.account_id IS NOT NULL AS did_answer "
+    "FROM surveys AS s "
+    "LEFT JOIN survey_results AS r ON r.survey_id = s.id AND r.account_id = $1 "
+    "ORDER BY s.id"
+)
+_SELECT_PAGE = _SELECT_ALL + " LIMIT $2 OFFSET $3"
+_SELECT_BY_IDS = (
+    "SELECT s.id, s.question, s.answers, s.date, r.account_id IS NOT NULL AS did_answer "
+    "FROM surveys AS s "
+    "LEFT JOIN survey_results AS r ON r.survey_id = s.id AND r.account_id = $1 "
+    "WHERE s.id = ANY($2::bigint[]) "
+    "ORDER BY s.id"
+)
+_SELECT_BY_ID = (
+    "SELECT id, question, answers, date, false AS did_answer FROM surveys WHERE id = $1"
+)
+_EXISTS_BY_ID = "SELECT 1 FROM surveys WHERE id = $1"
+_SELECT_ANSWERS = "SELECT answers FROM surveys WHERE id = $1"
+
+
+class SurveyPostgresRepository(
+    AddSurveyRepository,
+    CheckSurveyByIdRepository,
+    LoadAnswersBySurveyRepository,
+    LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
+    LoadSurveysRepository,
+    LoadSurveysViewRepository,
+):
+    """Answers are stored as a JSONB array on the survey row; they are always read together."""
+
+    async def add(self, data: AddSurveyParams) -> None:
+        answers = [
+            answer if isinstance(answer, dict) else answer.__dict__
+            for answer in data.answers
+        ]
+        await PostgresHelper.execute(
+            _INSERT,
+            data.question,
+            [{"answer": answer["answer"], "image": answer.get("image")} for answer in answers],
+            data.date,
+        )
+
+    async def load_all(
+        self, account_id: str, limit: int | None = None, offset: int = 0
+    ) -> list[SurveyModel]:
+        # LIMIT NULL is LIMIT ALL.
+        rows = await PostgresHelper.fetch(_SELECT_PAGE, to_row_id(account_id), limit, offset)
+        return [self._to_model(row) for row in rows]
+
+    async def load_all_view(self, account_id: str) -> list[dict[str, Any]]:
+        rows = await PostgresHelper.fetch(_SELECT_ALL, to_row_id(account_id))
+        return [
+            {
+                "id": str(row["id"]),
+                "question": row["question"],
+                "answers": row["answers"],
+                "date": row["date"],
+                "didAnswer": row["did_answer"],
+            }
+            for row in rows
+        ]
+
+    async def load_by_id(self, survey_id: str) -> SurveyModel | None:
+        row_id = to_row_id(survey_id)
+        if row_id is None:
+            return None
+        row = await PostgresHelper.fetchrow(_SELECT_BY_ID, row_id)
+        return self._to_model(row) if row else None
+
+    async def load_by_ids(self, survey_ids: list[str], account_id: str) -> list[SurveyModel]:
+        row_ids = [row_id for row_id in map(to_row_id, survey_ids) if row_id is not None]
+        if not row_ids:
+            return []
+        rows = await PostgresHelper.fetch(_SELECT_BY_IDS, to_row_id(account_id), row_ids)
+        return [self._to_model(row) for row in rows]
+
+    async def check_by_id(self, survey_id: str) -> bool:
+        row_id = to_row_id(survey_id)
+        if row_id is None:
+            return False
+        return await PostgresHelper.fetchval(_EXISTS_BY_ID, row_id) is not None
+
+    async def load_answers(self, survey_id: str) -> list[str]:
+        row_id = to_row_id(survey_id)
+        if row_id is None:
+            return []
+        answers = await PostgresHelper.fetchval(_SELECT_ANSWERS, row_id)
+        return [answer["answer"] for answer in answers] if answers else []
+
+    @staticmethod
+    def _to_model(row) -> SurveyModel:
+        return SurveyModel(
+            id=str(row["id"]),
+            question=row["question"],
+            answers=[
+                SurveyAnswerModel(answer=answer["answer"], image=answer.get("image"))
+                for answer in row["answers"]
+            ],
+            date=row["date"],
+            did_answer=row["did_answer"],
+        )
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+"""PostgreSQL survey result repository."""
+from collections import defaultdict
+from datetime import datetime
+
+from data.protocols import (
+    LoadAccountAnswersRepository,
+    LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
+    SaveSurveyResultRepository,
+)
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.postgres.helpers import PostgresHelper, to_row_id
+from infra.db.tally import build_survey_result
+
+_UPSERT = (
+    "INSERT INTO survey_results (survey_id, account_id, answer, date) VALUES ($1, $2, $3, $4) "
+    "ON CONFLICT (survey_id, account_id) DO UPDATE SET "
+    "answer = excluded.answer, date = excluded.date"
+)
+_SELECT_SURVEY = "SELECT id, question, answers, date FROM surveys WHERE id = $1"
+# Index-only scan of survey_results_tally, which includes account_id.
+_TALLY = (
+    "SELECT answer, count(*) AS count, coalesce(bool_or(account_id = $2), false) AS is_current "
+    "FROM survey_results WHERE survey_id = $1 GROUP BY answer"
+)
+# Id lists are bound as one bigint[] parameter, so each statement is prepared once.
+_SELECT_SURVEYS = "SELECT id, question, answers, date FROM surveys WHERE id = ANY($1::bigint[])"
+_TALLIES = (
+    "SELECT survey_id, answer, count(*) AS count, "
+    "coalesce(bool_or(account_id = $2), false) AS is_current "
+    "FROM survey_results WHERE survey_id = ANY($1::bigint[]) GROUP BY survey_id, answer"
+)
+_ACCOUNT_ANSWERS = (
+    "SELECT survey_id, answer FROM survey_results "
+    "WHERE account_id = $1 AND survey_id = ANY($2::bigint[])"
+)
+
+
+def _row_ids(survey_ids: list[str]) -> list[int]:
+    return [row_id for row_id in map(to_row_id, survey_ids) if row_id is not None]
+
+
+def _to_result(survey, counts: dict[str, int], current: str | None) -> SurveyResultModel:
+    return build_survey_result(
+        str(survey["id"]), survey["question"], survey["date"], survey["answers"], counts, current
+    )
+
+
+class SurveyResultPostgresRepository(
+    LoadAccountAnswersRepository,
+    LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
+    SaveSurveyResultRepository,
+):
+    async def save(self, data: SaveSurveyResultParams) -> None:
+        survey_id = to_row_id(data.survey_id)
+        account_id = to_row_id(data.account_id)
+        if survey_id is None or account_id is None:
+            return None
+        await PostgresHelper.execute(
+            _UPSERT, survey_id, account_id, data.answer, data.date or datetime.utcnow()
+        )
+
+    async def load_by_survey_id(
+        self, survey_id: str, account_id: str
+    ) -> SurveyResultModel | None:
+        row_id = to_row_id(survey_id)
+        if row_id is None:
+            return None
+        survey = await PostgresHelper.fetchrow(_SELECT_SURVEY, row_id)
+        if not survey:
+            return None
+        tallies = await PostgresHelper.fetch(_TALLY, row_id, to_row_id(account_id))
+        if not tallies:
+            return None
+        counts = {row["answer"]: row["count"] for row in tallies}
+        current = next((row["answer"] for row in tallies if row["is_current"]), None)
+        return _to_result(survey, counts, current)
+
+    async def load_by_survey_ids(
+        self, survey_ids: list[str], account_id: str
+    ) -> dict[str, SurveyResultModel]:
+        row_ids = _row_ids(survey_ids)
+        if not row_ids:
+            return {}
+        counts: dict[int, dict[str, int]] = defaultdict(dict)
+        current: dict[int, str] = {}
+        for row in await PostgresHelper.fetch(_TALLIES, row_ids, to_row_id(account_id)):
+            counts[row["survey_id"]][row["answer"]] = row["count"]
+            if row["is_current"]:
+                current[row["survey_id"]] = row["answer"]
+        return {
+            str(survey["id"]): _to_result(survey, counts[survey["id"]], current.get(survey["id"]))
+            for survey in await PostgresHelper.fetch(_SELECT_SURVEYS, row_ids)
+        }
+
+    async def load_account_answers(
+        self, account_id: str, survey_ids: list[str]
+    ) -> dict[str, str]:
+        account_row_id = to_row_id(account_id)
+        row_ids = _row_ids(survey_ids)
+        if account_row_id is None or not row_ids:
+            return {}
+        rows = await PostgresHelper.fetch(_ACCOUNT_ANSWERS, account_row_id, row_ids)
+        return {str(row["survey_id"]): row["answer"] for row in rows}
@@ -0,0 +1,37 @@
+"""Per-request database command totals, kept free of any driver import."""
+from __future__ import annotations
+
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+_current_stats: ContextVar[Optional["QueryStats"]] = ContextVar("mongo_query_stats", default=None)
+
+
+@dataclass
+class QueryStats:
+    """Mongo commands attributed to one unit of work, usually an HTTP request."""
+
+    commands: int = 0
+    duration_ms: float = 0.0
+    documents: int = 0
+    by_command: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, command_name: str, duration_ms: float, documents: int) -> None:
+        self.commands += 1
+        self.duration_ms += duration_ms
+        self.documents += documents
+        self.by_command[command_name] = self.by_command.get(command_name, 0) + 1
+
+
+def begin_query_stats() -> Tuple[QueryStats, Token]:
+    stats = QueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_query_stats(token: Token) -> None:
+    _current_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _current_stats.get()
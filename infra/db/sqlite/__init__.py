@@ -0,0 +1,16 @@
+"""SQLite infrastructure module."""
+from infra.db.sqlite.account_repository import AccountSqliteRepository
+from infra.db.sqlite.refresh_token_repository import RefreshTokenSqliteRepository
+from infra.db.sqlite.session_repository import SessionSqliteRepository
+from infra.db.sqlite.survey_repository import SurveySqliteRepository
+from infra.db.sqlite.survey_result_repository import SurveyResultSqliteRepository
+from infra.db.sqlite.token_revocation_repository import TokenRevocationSqliteRepository
+
+__all__ = [
+    "AccountSqliteRepository",
+    "RefreshTokenSqliteRepository",
+    "SessionSqliteRepository",
+    "SurveySqliteRepository",
+    "SurveyResultSqliteRepository",
+    "TokenRevocationSqliteRepository",
+]
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+"""SQLite Account Repository implementation."""
+import sqlite3
+
+from data.protocols.add_account_repository import (
+    AddAccountRepository,
+    CheckAccountByEmailRepository,
+    LoadAccountByEmailRepository,
+    LoadAccountByIdRepository,
+    UpdatePasswordRepository,
+)
+from data.protocols.email_normalizer import EmailNormalizer
+from domain.models.account import AccountModel
+from domain.usecases.add_account import AddAccountModel
+from infra.db.sqlite.helpers import SqliteHelper, to_row_id
+
+_COLUMNS = "id, name, email, password, role, token_version"
+_INSERT = "INSERT INTO accounts (name, email, email_normalized, password) VALUES (?, ?, ?, ?)"
+_SELECT_BY_EMAIL = f"SELECT {_COLUMNS} FROM accounts WHERE email_normalized = ?"
+_SELECT_BY_ID = f"SELECT {_COLUMNS} FROM accounts WHERE id = ?"
+_EXISTS_BY_EMAIL = "SELECT 1 FROM accounts WHERE email_normalized = ?"
+_UPDATE_PASSWORD = "UPDATE accounts SET password = ? WHERE id = ?"
+
+
+class AccountSqliteRepository(
+    AddAccountRepository,
+    CheckAccountByEmailRepository,
+    LoadAccountByEmailRepository,
+    LoadAccountByIdRepository,
+    UpdatePasswordRepository,
+):
+    """SQLite implementation of the account repositories.
+
+    Emails are matched through the unique ``email_normalized`` column, like
+    ``emailNormalized`` in the MongoDB repository.
+    """
+
+    def __init__(self, email_normalizer: EmailNormalizer | None = None):
+        if email_normalizer is None:
+            from utils.email_validator_adapter import EmailValidatorAdapter
+
+            email_normalizer = EmailValidatorAdapter()
+        self.email_normalizer = email_normalizer
+
+    async def add(self, account_data: AddAccountModel) -> AccountModel | None:
+        """Insert the account; ``None`` when the unique email index rejects it."""
+        try:
+            cursor = SqliteHelper.connection().execute(_INSERT, (
+                account_data.name,
+                account_data.email,
+                self.email_normalizer.normalize(account_data.email),
+                account_data.password,
+            ))
+        except sqlite3.IntegrityError:
+            return None
+        return AccountModel(
+            id=str(cursor.lastrowid),
+            name=account_data.name,
+            email=account_data.email,
+            password=account_data.password,
+        )
+
+    async def load_by_email(self, email: str) -> AccountModel | None:
+        row = SqliteHelper.connection().execute(
+            _SELECT_BY_EMAIL, (self.email_normalizer.normalize(email),)
+        ).fetchone()
+        return self._to_model(row) if row else None
+
+    async def load_by_id(self, account_id: str) -> AccountModel | None:
+        row_id = to_row_id(account_id)
+        if row_id is None:
+            return None
+        row = SqliteHelper.connection().execute(_SELECT_BY_ID, (row_id,)).fetchone()
+        return self._to_model(row) if row else None
+
+    async def check_by_email(self, email: str) -> bool:
+        return SqliteHelper.connection().execute(
+            _EXISTS_BY_EMAIL, (self.email_normalizer.normalize(email),)
+        ).fetchone() is not None
+
+    async def update_password(self, account_id: str, password: str) -> None:
+        SqliteHelper.connection().execute(_UPDATE_PASSWORD, (password, to_row_id(account_id)))
+
+    @staticmethod
+    def _to_model(row: tuple) -> AccountModel:
+        account_id, name, email, password, role, token_version = row
+        model = AccountModel(id=str(account_id), name=name, email=email, password=password)
+        model.role = role
+        model.token_version = token_version
+        return model
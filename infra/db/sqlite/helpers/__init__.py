@@ -0,0 +1,4 @@
+"""SQLite helpers module."""
+from .sqlite_helper import SqliteHelper, to_row_id
+
+__all__ = ["SqliteHelper", "to_row_id"]
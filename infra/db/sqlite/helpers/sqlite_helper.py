@@ -0,0 +1,103 @@
+"""SQLite connection helper."""
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+# Applied to every connection; journal_mode=WAL is also persisted in the file.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+class SqliteHelper:
+    """Helper class for managing SQLite connections.
+
+    Each thread gets its own connection, opened on first use: in WAL mode
+    readers never block the single writer, so gthread workers can serve
+    requests concurrently. Connections run in autocommit mode, which gives
+    every statement the single-document atomicity the MongoDB repositories
+    rely on. ``sqlite3`` keeps up to ``SQLITE_STATEMENT_CACHE`` compiled
+    statements per connection, so the repositories' constant SQL strings are
+    prepared once and then only re-bound.
+    """
+
+    _path: Optional[str] = None
+    _local = threading.local()
+    _connections: List[sqlite3.Connection] = []
+    _owner_pid: Optional[int] = None
+    _schema_paths: set = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def connect(cls, path: Optional[str] = None) -> None:
+        """
+        Select the database file and create any missing table or index.
+
+        Args:
+            path: Database file. If not provided, uses SQLITE_PATH env variable.
+        """
+        cls._path = path or os.getenv("SQLITE_PATH", "flask_db.sqlite3")
+        cls.connection()
+
+    @classmethod
+    def disconnect(cls) -> None:
+        """Close every connection this process opened."""
+        with cls._lock:
+            if cls._owner_pid == os.getpid():
+                for connection in cls._connections:
+                    connection.close()
+            cls._connections = []
+            cls._local = threading.local()
+            cls._schema_paths = set()
+            cls._path = None
+
+    @classmethod
+    def ping(cls) -> None:
+        cls.connection().execute("SELECT 1").fetchone()
+
+    @classmethod
+    def connection(cls) -> sqlite3.Connection:
+        """Return this thread's connection, opening it if needed."""
+        connection = getattr(cls._local, "connection", None)
+        if connection is not None and cls._owner_pid == os.getpid():
+            return connection
+        return cls._open()
+
+    @classmethod
+    def _open(cls) -> sqlite3.Connection:
+        with cls._lock:
+            if cls._owner_pid != os.getpid():
+                # Connections must not cross a fork; drop the parent's without closing them.
+                cls._connections = []
+                cls._local = threading.local()
+                cls._owner_pid = os.getpid()
+            path = cls._path or os.getenv("SQLITE_PATH", "flask_db.sqlite3")
+            connection = sqlite3.connect(
+                path,
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=int(os.getenv("SQLITE_STATEMENT_CACHE", "256")),
+            )
+            for pragma in _PRAGMAS:
+                connection.execute(pragma)
+            if path not in cls._schema_paths:
+                from infra.db.sqlite.schema import ensure_schema
+
+                ensure_schema(connection)
+                cls._schema_paths.add(path)
+            cls._connections.append(connection)
+            cls._local.connection = connection
+            return connection
+
+
+def to_row_id(value: str | None) -> int | None:
+    """Parse an id issued by this backend; anything else matches no row."""
+    if not value or not value.isdigit():
+        return None
+    return int(value)
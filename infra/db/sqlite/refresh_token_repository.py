@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+"""SQLite refresh token repository."""
+import time
+from datetime import datetime
+
+from data.protocols import (
+    AddRefreshTokenRepository,
+    ConsumeRefreshTokenRepository,
+    RevokeRefreshTokenFamilyRepository,
+)
+from domain.models.refresh_token import RefreshTokenModel
+from infra.db.sqlite.helpers import SqliteHelper, to_row_id
+
+_DELETE_EXPIRED = "DELETE FROM refresh_tokens WHERE expires_at <= ?"
+_INSERT = (
+    "INSERT INTO refresh_tokens (token_hash, account_id, family, token_version, expires_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+# Counting uses in the same statement that returns the row makes consuming
+# atomic: only the first caller ever sees use_count = 1.
+_CONSUME = (
+    "UPDATE refresh_tokens SET use_count = use_count + 1 "
+    "WHERE token_hash = ? AND expires_at > ? "
+    "RETURNING account_id, family, token_version, use_count"
+)
+_DELETE_FAMILY = "DELETE FROM refresh_tokens WHERE family = ?"
+
+
+class RefreshTokenSqliteRepository(
+    AddRefreshTokenRepository,
+    ConsumeRefreshTokenRepository,
+    RevokeRefreshTokenFamilyRepository,
+):
+    """Refresh tokens keyed by their SHA-256 hash; expired rows are purged on insert."""
+
+    async def add_refresh_token(
+        self,
+        token_hash: str,
+        refresh_token: RefreshTokenModel,
+        expires_at: datetime,
+    ) -> None:
+        connection = SqliteHelper.connection()
+        connection.execute(_DELETE_EXPIRED, (time.time(),))
+        connection.execute(_INSERT, (
+            token_hash,
+            to_row_id(refresh_token.account_id),
+            refresh_token.family,
+            refresh_token.token_version,
+            expires_at.timestamp(),
+        ))
+
+    async def consume_refresh_token(self, token_hash: str) -> RefreshTokenModel | None:
+        row = SqliteHelper.connection().execute(
+            _CONSUME, (token_hash, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        account_id, family, token_version, use_count = row
+        return RefreshTokenModel(
+            account_id=str(account_id),
+            family=family,
+            token_version=token_version,
+            used=use_count > 1,
+        )
+
+    async def revoke_refresh_token_family(self, family: str) -> None:
+        SqliteHelper.connection().execute(_DELETE_FAMILY, (family,))
@@ -0,0 +1,68 @@
+"""Tables and indexes of the SQLite backend, created idempotently on first connection."""
+from __future__ import annotations
+
+import sqlite3
+
+# Tables keyed by a token hash or a composite key are WITHOUT ROWID, so the
+# primary key is the table itself and a lookup is a single B-tree search.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS accounts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    email_normalized TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL,
+    role TEXT,
+    token_version INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS sessions (
+    token_hash TEXT PRIMARY KEY,
+    account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+    role TEXT,
+    expires_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at);
+CREATE INDEX IF NOT EXISTS sessions_account_id ON sessions (account_id);
+
+CREATE TABLE IF NOT EXISTS surveys (
+    id INTEGER PRIMARY KEY,
+    question TEXT NOT NULL,
+    answers TEXT NOT NULL,
+    date TEXT
+);
+
+CREATE TABLE IF NOT EXISTS survey_results (
+    survey_id INTEGER NOT NULL REFERENCES surveys (id) ON DELETE CASCADE,
+    account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+    answer TEXT NOT NULL,
+    date TEXT NOT NULL,
+    PRIMARY KEY (survey_id, account_id)
+) WITHOUT ROWID;
+-- Covers the per-answer tally, so counting votes never reads the table rows.
+CREATE INDEX IF NOT EXISTS survey_results_survey_answer ON survey_results (survey_id, answer);
+CREATE INDEX IF NOT EXISTS survey_results_account_id ON survey_results (account_id);
+
+CREATE TABLE IF NOT EXISTS refresh_tokens (
+    token_hash TEXT PRIMARY KEY,
+    account_id INTEGER NOT NULL REFERENCES accounts (id) ON DELETE CASCADE,
+    family TEXT NOT NULL,
+    token_version INTEGER NOT NULL DEFAULT 0,
+    expires_at REAL NOT NULL,
+    use_count INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS refresh_tokens_family ON refresh_tokens (family);
+CREATE INDEX IF NOT EXISTS refresh_tokens_expires_at ON refresh_tokens (expires_at);
+CREATE INDEX IF NOT EXISTS refresh_tokens_account_id ON refresh_tokens (account_id);
+
+CREATE TABLE IF NOT EXISTS token_revocations (
+    account_id INTEGER PRIMARY KEY REFERENCES accounts (id) ON DELETE CASCADE,
+    token_version INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS token_revocations_expires_at ON token_revocations (expires_at);
+"""
+
+
+def ensure_schema(connection: sqlite3.Connection) -> None:
+    connection.executescript(SCHEMA)
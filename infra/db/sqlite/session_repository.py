@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+"""SQLite session repository."""
+import time
+
+from data.protocols import LoadAccountByTokenRepository, UpdateAccessTokenRepository
+from domain.models.account import AccountModel
+from infra.db.sqlite.helpers import SqliteHelper, to_row_id
+from infra.db.tokens import hash_access_token
+
+_UPSERT = (
+    "INSERT INTO sessions (token_hash, account_id, role, expires_at) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (token_hash) DO UPDATE SET "
+    "account_id = excluded.account_id, role = excluded.role, expires_at = excluded.expires_at"
+)
+_DELETE_EXPIRED = "DELETE FROM sessions WHERE expires_at <= ?"
+_SELECT = (
+    "SELECT account_id, role FROM sessions "
+    "WHERE token_hash = ? AND expires_at > ? AND (role IS ? OR role = 'admin')"
+)
+
+
+class SessionSqliteRepository(LoadAccountByTokenRepository, UpdateAccessTokenRepository):
+    """Sessions keyed by the SHA-256 of the access token, as in ``SessionMongoRepository``.
+
+    SQLite has no TTL index, so expired sessions are deleted whenever a new
+    one is stored; ``sessions_expires_at`` keeps that a range delete.
+    """
+
+    def __init__(self, expires_in_seconds: int = 3600):
+        self.expires_in_seconds = expires_in_seconds
+
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
+        now = time.time()
+        connection = SqliteHelper.connection()
+        connection.execute(_DELETE_EXPIRED, (now,))
+        connection.execute(_UPSERT, (
+            hash_access_token(token),
+            to_row_id(account_id),
+            role,
+            now + self.expires_in_seconds,
+        ))
+
+    async def load_by_token(self, token: str, role: str | None = None) -> AccountModel | None:
+        row = SqliteHelper.connection().execute(
+            _SELECT, (hash_access_token(token), time.time(), role)
+        ).fetchone()
+        if row is None:
+            return None
+        account = AccountModel(id=str(row[0]), name="", email="")
+        account.access_token = token
+        account.role = row[1]
+        return account
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+"""SQLite survey repository."""
+import json
+from datetime import datetime
+from typing import Any
+
+from data.protocols import (
+    AddSurveyRepository,
+    CheckSurveyByIdRepository,
+    LoadAnswersBySurveyRepository,
+    LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
+    LoadSurveysRepository,
+    LoadSurveysViewRepository,
+)
+from domain.models.survey import SurveyAnswerModel, SurveyModel
+from domain.usecases.add_survey import AddSurveyParams
+from infra.db.sqlite.helpers import SqliteHelper, to_row_id
+
+_INSERT = "INSERT INTO surveys (question, answers, date) VALUES (?, ?, ?)"
+# One LEFT JOIN on the (survey_id, account_id) primary key of survey_results
+# answers didAnswer for every survey in the same query.
+_SELECT_ALL = (
+    "SELECT s.id, s.question, s.answers, s.date, r.account_id IS NOT NULL "
+    "FROM surveys AS s "
+    "LEFT JOIN survey_results AS r ON r.survey_id = s.id AND r.account_id = ? "
+    "ORDER BY s.id"
+)
+_SELECT_PAGE = _SELECT_ALL + " LIMIT ? OFFSET ?"
+_SELECT_BY_IDS = (
+    "SELECT s.id, s.question, s.answers, s.date, r.account_id IS NOT NULL "
+    "FROM surveys AS s "
+    "LEFT JOIN survey_results AS r ON r.survey_id = s.id AND r.account_id = ? "
+    "WHERE s.id IN (SELECT value FROM json_each(?)) "
+    "ORDER BY s.id"
+)
+_SELECT_BY_ID = "SELECT id, question, answers, date, 0 FROM surveys WHERE id = ?"
+_EXISTS_BY_ID = "SELECT 1 FROM surveys WHERE id = ?"
+_SELECT_ANSWERS = "SELECT answers FROM surveys WHERE id = ?"
+
+
+def to_date(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+class SurveySqliteRepository(
+    AddSurveyRepository,
+    CheckSurveyByIdRepository,
+    LoadAnswersBySurveyRepository,
+    LoadSurveyByIdRepository,
+    LoadSurveysByIdsRepository,
+    LoadSurveysRepository,
+    LoadSurveysViewRepository,
+):
+    """Answers are stored as a JSON array on the survey row; they are always read together."""
+
+    async def add(self, data: AddSurveyParams) -> None:
+        answers = [
+            answer if isinstance(answer, dict) else answer.__dict__
+            for answer in data.answers
+        ]
+        SqliteHelper.connection().execute(_INSERT, (
+            data.question,
+            json.dumps([
+                {"answer": answer["answer"], "image": answer.get("image")}
+                for answer in answers
+            ]),
+            data.date.isoformat() if data.date else None,
+        ))
+
+    async def load_all(
+        self, account_id: str, limit: int | None = None, offset: int = 0
+    ) -> list[SurveyModel]:
+        # SQLite reads a negative LIMIT as "no limit".
+        rows = SqliteHelper.connection().execute(
+            _SELECT_PAGE, (to_row_id(account_id), -1 if limit is None else limit, offset)
+        )
+        return [self._to_model(row) for row in rows]
+
+    async def load_all_view(self, account_id: str) -> list[dict[str, Any]]:
+        rows = SqliteHelper.connection().execute(_SELECT_ALL, (to_row_id(account_id),))
+        return [
+            {
+                "id": str(survey_id),
+                "question": question,
+                "answers": json.loads(answers),
+                "date": to_date(date),
+                "didAnswer": bool(did_answer),
+            }
+            for survey_id, question, answers, date, did_answer in rows
+        ]
+
+    async def load_by_id(self, survey_id: str) -> SurveyModel | None:
+        row = SqliteHelper.connection().execute(
+            _SELECT_BY_ID, (to_row_id(survey_id),)
+        ).fetchone()
+        return self._to_model(row) if row else None
+
+    async def load_by_ids(self, survey_ids: list[str], account_id: str) -> list[SurveyModel]:
+        # One JSON array parameter keeps the statement text constant for any number of ids.
+        row_ids = json.dumps([row_id for row_id in map(to_row_id, survey_ids) if row_id is not None])
+        rows = SqliteHelper.connection().execute(_SELECT_BY_IDS, (to_row_id(account_id), row_ids))
+        return [self._to_model(row) for row in rows]
+
+    async def check_by_id(self, survey_id: str) -> bool:
+        return SqliteHelper.connection().execute(
+            _EXISTS_BY_ID, (to_row_id(survey_id),)
+        ).fetchone() is not None
+
+    async def load_answers(self, survey_id: str) -> list[str]:
+        row = SqliteHelper.connection().execute(
+            _SELECT_ANSWERS, (to_row_id(survey_id),)
+        ).fetchone()
+        return [answer["answer"] for answer in json.loads(row[0])] if row else []
+
+    @staticmethod
+    def _to_model(row: tuple) -> SurveyModel:
+        survey_id, question, answers, date, did_answer = row
+        return SurveyModel(
+            id=str(survey_id),
+            question=question,
+            answers=[
+                SurveyAnswerModel(answer=answer["answer"], image=answer.get("image"))
+                for answer in json.loads(answers)
+            ],
+            date=to_date(date),
+            did_answer=bool(did_answer),
+        )
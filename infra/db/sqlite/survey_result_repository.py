@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+"""SQLite survey result repository."""
+import json
+from collections import defaultdict
+from datetime import datetime
+
+from data.protocols import (
+    LoadAccountAnswersRepository,
+    LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
+    SaveSurveyResultRepository,
+)
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.sqlite.helpers import SqliteHelper, to_row_id
+from infra.db.sqlite.survey_repository import to_date
+from infra.db.tally import build_survey_result
+
+_UPSERT = (
+    "INSERT INTO survey_results (survey_id, account_id, answer, date) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (survey_id, account_id) DO UPDATE SET "
+    "answer = excluded.answer, date = excluded.date"
+)
+_SELECT_SURVEY = "SELECT id, question, answers, date FROM surveys WHERE id = ?"
+# Served from survey_results_survey_answer alone: the index holds survey_id and
+# answer, plus account_id from the primary key.
+_TALLY = (
+    "SELECT answer, COUNT(*), MAX(account_id = ?) FROM survey_results "
+    "WHERE survey_id = ? GROUP BY answer"
+)
+# Id lists are bound as one JSON array, so each statement text stays constant
+# and is compiled once per connection whatever the number of ids.
+_IN_IDS = "IN (SELECT value FROM json_each(?))"
+_SELECT_SURVEYS = f"SELECT id, question, answers, date FROM surveys WHERE id {_IN_IDS}"
+_TALLIES = (
+    "SELECT survey_id, answer, COUNT(*), MAX(account_id = ?) FROM survey_results "
+    f"WHERE survey_id {_IN_IDS} GROUP BY survey_id, answer"
+)
+_ACCOUNT_ANSWERS = (
+    f"SELECT survey_id, answer FROM survey_results WHERE account_id = ? AND survey_id {_IN_IDS}"
+)
+
+
+def _row_ids(survey_ids: list[str]) -> str:
+    return json.dumps([row_id for row_id in map(to_row_id, survey_ids) if row_id is not None])
+
+
+def _to_result(survey: tuple, counts: dict[str, int], current: str | None) -> SurveyResultModel:
+    survey_id, question, answers, date = survey
+    return build_survey_result(
+        str(survey_id), question, to_date(date), json.loads(answers), counts, current
+    )
+
+
+class SurveyResultSqliteRepository(
+    LoadAccountAnswersRepository,
+    LoadSurveyResultRepository,
+    LoadSurveyResultsRepository,
+    SaveSurveyResultRepository,
+):
+    async def save(self, data: SaveSurveyResultParams) -> None:
+        survey_id = to_row_id(data.survey_id)
+        account_id = to_row_id(data.account_id)
+        if survey_id is None or account_id is None:
+            return None
+        SqliteHelper.connection().execute(_UPSERT, (
+            survey_id,
+            account_id,
+            data.answer,
+            (data.date or datetime.utcnow()).isoformat(),
+        ))
+
+    async def load_by_survey_id(
+        self, survey_id: str, account_id: str
+    ) -> SurveyResultModel | None:
+        row_id = to_row_id(survey_id)
+        if row_id is None:
+            return None
+        connection = SqliteHelper.connection()
+        survey = connection.execute(_SELECT_SURVEY, (row_id,)).fetchone()
+        if not survey:
+            return None
+        tallies = connection.execute(_TALLY, (to_row_id(account_id), row_id)).fetchall()
+        if not tallies:
+            return None
+        counts = {answer: count for answer, count, _ in tallies}
+        current = next((answer for answer, _, is_current in tallies if is_current), None)
+        return _to_result(survey, counts, current)
+
+    async def load_by_survey_ids(
+        self, survey_ids: list[str], account_id: str
+    ) -> dict[str, SurveyResultModel]:
+        row_ids = _row_ids(survey_ids)
+        if row_ids == "[]":
+            return {}
+        connection = SqliteHelper.connection()
+        counts: dict[int, dict[str, int]] = defaultdict(dict)
+        current: dict[int, str] = {}
+        for survey_id, answer, count, is_current in connection.execute(
+            _TALLIES, (to_row_id(account_id), row_ids)
+        ):
+            counts[survey_id][answer] = count
+            if is_current:
+                current[survey_id] = answer
+        return {
+            str(survey[0]): _to_result(survey, counts[survey[0]], current.get(survey[0]))
+            for survey in connection.execute(_SELECT_SURVEYS, (row_ids,))
+        }
+
+    async def load_account_answers(
+        self, account_id: str, survey_ids: list[str]
+    ) -> dict[str, str]:
+        account_row_id = to_row_id(account_id)
+        row_ids = _row_ids(survey_ids)
+        if account_row_id is None or row_ids == "[]":
+            return {}
+        rows = SqliteHelper.connection().execute(_ACCOUNT_ANSWERS, (account_row_id, row_ids))
+        return {str(survey_id): answer for survey_id, answer in rows}
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+"""SQLite token revocation repository."""
+import os
+import time
+
+from data.protocols import LoadTokenRevocationsRepository, RevokeAccountTokensRepository
+from infra.db.sqlite.helpers import SqliteHelper, to_row_id
+
+_BUMP_VERSION = (
+    "UPDATE accounts SET token_version = token_version + 1 WHERE id = ? "
+    "RETURNING token_version"
+)
+_DELETE_EXPIRED = "DELETE FROM token_revocations WHERE expires_at <= ?"
+_UPSERT = (
+    "INSERT INTO token_revocations (account_id, token_version, expires_at) VALUES (?, ?, ?) "
+    "ON CONFLICT (account_id) DO UPDATE SET "
+    "token_version = excluded.token_version, expires_at = excluded.expires_at"
+)
+_SELECT_ACTIVE = "SELECT account_id, token_version FROM token_revocations WHERE expires_at > ?"
+
+
+class TokenRevocationSqliteRepository(
+    LoadTokenRevocationsRepository,
+    RevokeAccountTokensRepository,
+):
+    """Revocations live until the last token they cover has expired."""
+
+    def __init__(self, token_lifetime_seconds: int | None = None):
+        self.token_lifetime_seconds = token_lifetime_seconds or int(
+            os.getenv("JWT_EXPIRES_IN_SECONDS", "3600")
+        )
+
+    async def revoke_tokens(self, account_id: str) -> int | None:
+        now = time.time()
+        connection = SqliteHelper.connection()
+        row = connection.execute(_BUMP_VERSION, (to_row_id(account_id),)).fetchone()
+        if row is None:
+            return None
+        (token_version,) = row
+        connection.execute(_DELETE_EXPIRED, (now,))
+        connection.execute(_UPSERT, (
+            to_row_id(account_id),
+            token_version,
+            now + self.token_lifetime_seconds,
+        ))
+        return token_version
+
+    async def load_revocations(self) -> dict[str, int]:
+        rows = SqliteHelper.connection().execute(_SELECT_ACTIVE, (time.time(),))
+        return {str(account_id): token_version for account_id, token_version in rows}
@@ -0,0 +1,13 @@
+"""The ``GET /api/surveys`` item every backend's ``load_all_view`` returns."""
+from __future__ import annotations
+
+from typing import Any, Mapping
+
+
+def survey_view_id(view: Mapping[str, Any]) -> str:
+    return view["id"]
+
+
+def with_did_answer(view: Mapping[str, Any], did_answer: bool) -> dict[str, Any]:
+    """Copy ``view`` with the requesting account's ``didAnswer`` flag."""
+    return {**view, "didAnswer": did_answer}
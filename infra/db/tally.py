@@ -0,0 +1,34 @@
+"""Survey result assembly shared by every database backend."""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Iterable, Mapping
+
+from domain.models.survey_result import SurveyResultAnswerModel, SurveyResultModel
+
+
+def build_survey_result(
+    survey_id: str,
+    question: str,
+    date: datetime | None,
+    answers: Iterable[Mapping[str, Any]],
+    counts: Mapping[str, int],
+    current: str | None,
+) -> SurveyResultModel:
+    """Merge per-answer vote ``counts`` into the survey's answers, most voted first.
+
+    ``current`` is the requesting account's answer, if it voted.
+    """
+    total = sum(counts.values())
+    results = []
+    for answer in answers:
+        count = counts.get(answer["answer"], 0)
+        results.append(SurveyResultAnswerModel(
+            answer=answer["answer"],
+            image=answer.get("image"),
+            count=count,
+            percent=round(count / total * 100) if total else 0,
+            is_current_account_answer=answer["answer"] == current,
+        ))
+    results.sort(key=lambda item: item.count, reverse=True)
+    return SurveyResultModel(survey_id=survey_id, question=question, date=date, answers=results)
@@ -0,0 +1,7 @@
+"""Token hashing shared by every database backend."""
+import hashlib
+
+
+def hash_access_token(access_token: str) -> str:
+    """Sessions are stored under this hash, so a leaked table holds no usable token."""
+    return hashlib.sha256(access_token.encode()).hexdigest()
@@ -1,4 +1,12 @@
-from main.adapters.flask_middleware_adapter import adapt_middleware
-from main.adapters.flask_route_adapter import adapt_route
+from main.adapters.flask_middleware_adapter import adapt_lazy_middleware, adapt_middleware
+from main.adapters.flask_route_adapter import adapt_lazy_route, adapt_route
+from main.adapters.lazy import LazyController, LazyMiddleware
 
-__all__ = ["adapt_middleware", "adapt_route"]
+__all__ = [
+    "LazyController",
+    "LazyMiddleware",
+    "adapt_lazy_middleware",
+    "adapt_lazy_route",
+    "adapt_middleware",
+    "adapt_route",
+]
@@ -1,11 +1,31 @@
 from functools import wraps
+from typing import Any, Callable
 
 from flask import jsonify, request
 
+from main.adapters.lazy import LazyMiddleware
+from main.config.tracing import get_tracer
 from presentation.protocols import HttpRequest, Middleware
 
 
+def _traced_handle(middleware: Middleware) -> Callable[[HttpRequest], Any]:
+    tracer = get_tracer()
+    if tracer is None:
+        return middleware.handle
+
+    def handle(http_request: HttpRequest) -> Any:
+        name = type(getattr(middleware, "target", middleware)).__name__
+        with tracer.span(f"{name}.handle", attributes={"app.layer": "middleware"}) as span:
+            http_response = middleware.handle(http_request)
+            span.set_attribute("app.status_code", http_response.status_code)
+            return http_response
+
+    return handle
+
+
 def adapt_middleware(middleware: Middleware):
+    handle = _traced_handle(middleware)
+
     def decorator(view):
         @wraps(view)
         def wrapped(*args, **kwargs):
@@ -13,7 +33,7 @@ def adapt_middleware(middleware: Middleware):
             http_request = HttpRequest(
                 headers=headers,
             )
-            http_response = middleware.handle(http_request)
+            http_response = handle(http_request)
             if http_response.status_code == 200:
                 for key, value in http_response.body.items():
                     setattr(request, key, value)
@@ -24,3 +44,7 @@ def adapt_middleware(middleware: Middleware):
         return wrapped
 
     return decorator
+
+
+def adapt_lazy_middleware(middleware_factory: Callable[[], Middleware]):
+    return adapt_middleware(LazyMiddleware(middleware_factory))
@@ -1,9 +1,12 @@
 from dataclasses import asdict, is_dataclass
 import logging
-from typing import Any
+from typing import Any, Callable
 
 from flask import jsonify, request
 
+from main.adapters.lazy import LazyController
+from main.config.profiler import profiled_view
+from main.config.tracing import get_tracer
 from presentation.protocols import Controller, HttpRequest
 
 
@@ -27,18 +30,38 @@ def _serialize(value: Any) -> Any:
     return value
 
 
+def _traced_handle(controller: Controller) -> Callable[[HttpRequest], Any]:
+    tracer = get_tracer()
+    if tracer is None:
+        return controller.handle
+
+    def handle(http_request: HttpRequest) -> Any:
+        name = type(getattr(controller, "target", controller)).__name__
+        with tracer.span(f"{name}.handle", attributes={"app.layer": "controller"}) as span:
+            http_response = controller.handle(http_request)
+            span.set_attribute("app.status_code", http_response.status_code)
+            return http_response
+
+    return handle
+
+
 def adapt_route(controller: Controller):
+    handle = _traced_handle(controller)
+
     def route(**params):
         http_request = HttpRequest(
             body=request.get_json(silent=True) or {},
             params=params,
             account_id=getattr(request, "account_id", None),
+            query=request.args.to_dict(flat=False),
         )
-        http_response = controller.handle(http_request)
+        http_response = handle(http_request)
         if 200 <= http_response.status_code <= 299:
             body = _serialize(http_response.body)
             if http_response.status_code == 204:
                 return ("", 204)
+            if http_response.headers:
+                return jsonify(body), http_response.status_code, http_response.headers
             return jsonify(body), http_response.status_code
         if http_response.status_code >= 500:
             logger.error(
@@ -47,4 +70,8 @@ def adapt_route(controller: Controller):
             )
         return jsonify({"error": str(http_response.body)}), http_response.status_code
 
-    return route
+    return profiled_view(route)
+
+
+def adapt_lazy_route(controller_factory: Callable[[], Controller]):
+    return adapt_route(LazyController(controller_factory))
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Generic, TypeVar
+
+from presentation.protocols import Controller, HttpRequest, HttpResponse, Middleware
+
+T = TypeVar("T")
+
+
+class _Lazy(Generic[T]):
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._instance: T | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+
+class LazyController(Controller):
+    """Controller proxy that builds the real controller graph on its first request."""
+
+    def __init__(self, factory: Callable[[], Controller]):
+        self._controller = _Lazy(factory)
+
+    @property
+    def target(self) -> Controller:
+        return self._controller.get()
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        return self._controller.get().handle(http_request)
+
+
+class LazyMiddleware(Middleware):
+    """Middleware proxy that builds the real middleware on its first request."""
+
+    def __init__(self, factory: Callable[[], Middleware]):
+        self._middleware = _Lazy(factory)
+
+    @property
+    def target(self) -> Middleware:
+        return self._middleware.get()
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        return self._middleware.get().handle(http_request)
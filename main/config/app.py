@@ -1,18 +1,28 @@
 """Flask application factory and configuration."""
 
-from flask import Flask, jsonify
+from flask import Flask
 
+from main.config.health import setup_health
+from main.config.metrics import setup_metrics
 from main.config.middlewares import setup_middlewares
+from main.config.query_stats import setup_query_stats
 from main.config.routes import setup_routes
+from main.config.tracing import setup_tracing
+from main.factories.container import check_backend_features, container
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    check_backend_features()
+    container.reset()
+    app.extensions["container"] = container
+    # Metrics hooks go first so requests rejected by the rate limiter are counted.
+    setup_metrics(app)
     setup_middlewares(app)
+    setup_query_stats(app)
+    # Before routes: the route adapters only add spans when a tracer exists.
+    setup_tracing(app)
     setup_routes(app)
-
-    @app.route("/health", methods=["GET"])
-    def health() -> tuple:
-        return jsonify({"status": "healthy"}), 200
+    setup_health(app)
 
     return app
@@ -23,3 +23,14 @@ def jwt_secret() -> str:
     if not _is_local_context():
         raise RuntimeError("JWT_SECRET is required outside local and test environments")
     return secrets.token_urlsafe(32)
+
+
+DATABASE_BACKENDS = ("mongodb", "sqlite", "postgres")
+
+
+def database_backend() -> str:
+    """Return the storage selected by ``DB_BACKEND`` (MongoDB unless set)."""
+    backend = os.getenv("DB_BACKEND", "mongodb").lower()
+    if backend not in DATABASE_BACKENDS:
+        raise RuntimeError(f"DB_BACKEND must be one of {', '.join(DATABASE_BACKENDS)}")
+    return backend
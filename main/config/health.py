@@ -0,0 +1,160 @@
+"""Liveness and readiness probes.
+
+``/health/live`` only proves the worker can serve a request. ``/health/ready``
+checks the dependencies a request needs and caches the verdict for
+``HEALTH_CACHE_SECONDS`` so a burst of probes costs at most one database ping.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from flask import Flask, jsonify
+
+Check = Callable[[], Tuple[bool, Dict[str, Any]]]
+
+
+def _float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+
+def check_mongo() -> Tuple[bool, Dict[str, Any]]:
+    from infra.db.mongodb.helpers import MongoHelper
+
+    started = time.perf_counter()
+    try:
+        MongoHelper.ping()
+    except Exception as error:
+        return False, {"error": str(error) or error.__class__.__name__}
+    return True, {"latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+
+def check_sqlite() -> Tuple[bool, Dict[str, Any]]:
+    from infra.db.sqlite.helpers import SqliteHelper
+
+    started = time.perf_counter()
+    try:
+        SqliteHelper.ping()
+    except Exception as error:
+        return False, {"error": str(error) or error.__class__.__name__}
+    return True, {"latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+
+def check_postgres() -> Tuple[bool, Dict[str, Any]]:
+    import asyncio
+
+    from infra.db.postgres.helpers import PostgresHelper
+
+    started = time.perf_counter()
+    try:
+        asyncio.run(PostgresHelper.ping())
+    except Exception as error:
+        return False, {"error": str(error) or error.__class__.__name__}
+    return True, {"latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+
+def check_mongo_pool() -> Tuple[bool, Dict[str, Any]]:
+    module = sys.modules.get("infra.db.mongodb.helpers.pool_monitor")
+    stats = module.pool_stats() if module is not None else None
+    if not stats:
+        return True, {"pools": {}}
+    limit = _float_env("HEALTH_MAX_POOL_SATURATION", 0.9)
+    pools = {
+        address: round(pool["checked_out"] / pool["max_size"], 3) if pool["max_size"] else 0.0
+        for address, pool in stats["pools"].items()
+    }
+    return all(saturation < limit for saturation in pools.values()), {
+        "saturation": pools,
+        "limit": limit,
+    }
+
+
+def check_bcrypt_queue() -> Tuple[bool, Dict[str, Any]]:
+    module = sys.modules.get("infra.cryptography.bcrypt_adapter")
+    if module is None:
+        return True, {"waiting": 0}
+    stats = module.bcrypt_pool.stats()
+    # By default tolerate a queue of four callers per slot before shedding load.
+    limit = int(_float_env("HEALTH_MAX_BCRYPT_QUEUE", 4 * stats["max_workers"]))
+    return stats["waiting"] <= limit, {"waiting": stats["waiting"], "limit": limit}
+
+
+DEFAULT_CHECKS: Dict[str, Check] = {
+    "mongo": check_mongo,
+    "mongo_pool": check_mongo_pool,
+    "bcrypt_queue": check_bcrypt_queue,
+}
+
+SQLITE_CHECKS: Dict[str, Check] = {
+    "sqlite": check_sqlite,
+    "bcrypt_queue": check_bcrypt_queue,
+}
+
+
+POSTGRES_CHECKS: Dict[str, Check] = {
+    "postgres": check_postgres,
+    "bcrypt_queue": check_bcrypt_queue,
+}
+
+
+def default_checks() -> Dict[str, Check]:
+    from main.config.env import database_backend
+
+    return {
+        "sqlite": SQLITE_CHECKS,
+        "postgres": POSTGRES_CHECKS,
+    }.get(database_backend(), DEFAULT_CHECKS)
+
+
+class ReadinessProbe:
+    """Run dependency checks at most once per ``ttl_seconds``."""
+
+    def __init__(self, checks: Dict[str, Check], ttl_seconds: float):
+        self.checks = checks
+        self.ttl_seconds = ttl_seconds
+        self._result: Tuple[bool, Dict[str, Any]] | None = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def run(self) -> Tuple[bool, Dict[str, Any]]:
+        if self._result is not None and time.monotonic() < self._expires_at:
+            return self._result
+        with self._lock:
+            # Concurrent probes wait for the first one instead of pinging again.
+            if self._result is None or time.monotonic() >= self._expires_at:
+                results = {name: check() for name, check in self.checks.items()}
+                ready = all(ok for ok, _ in results.values())
+                self._result = ready, {
+                    name: {"status": "up" if ok else "down", **details}
+                    for name, (ok, details) in results.items()
+                }
+                self._expires_at = time.monotonic() + self.ttl_seconds
+            return self._result
+
+
+def setup_health(app: Flask, checks: Dict[str, Check] | None = None) -> ReadinessProbe:
+    probe = ReadinessProbe(
+        checks if checks is not None else default_checks(),
+        _float_env("HEALTH_CACHE_SECONDS", 2.0),
+    )
+    app.extensions["readiness"] = probe
+
+    @app.route("/health", methods=["GET"])
+    def health() -> tuple:
+        return jsonify({"status": "healthy"}), 200
+
+    @app.route("/health/live", methods=["GET"])
+    def liveness() -> tuple:
+        return jsonify({"status": "alive"}), 200
+
+    @app.route("/health/ready", methods=["GET"])
+    def readiness() -> tuple:
+        ready, results = probe.run()
+        body = {"status": "ready" if ready else "not ready", "checks": results}
+        return jsonify(body), 200 if ready else 503
+
+    return probe
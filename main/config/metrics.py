@@ -0,0 +1,386 @@
+"""Prometheus text-format metrics for the Flask app.
+
+Recording never takes a lock: every thread updates its own shard and shards
+are only merged when ``/metrics`` is scraped. Under a pre-fork server each
+worker also writes its merged snapshot to ``PROMETHEUS_MULTIPROC_DIR`` (at
+most once per ``METRICS_FLUSH_SECONDS``), so whichever worker is scraped can
+report totals for all of them.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from flask import Flask, Response, g, request
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+Collector = Callable[[], Iterable[Tuple[str, Dict[str, str], float]]]
+
+METRICS: Dict[str, Tuple[str, str]] = {
+    "http_requests_total": ("counter", "HTTP requests by method, route and status."),
+    "http_request_duration_seconds": (
+        "histogram",
+        "HTTP request latency by method, route and status.",
+    ),
+    "http_requests_in_flight": ("gauge", "HTTP requests currently being served."),
+    "bcrypt_pool_operations_total": ("counter", "bcrypt hashes and comparisons performed."),
+    "bcrypt_pool_wait_seconds_total": ("counter", "Time spent waiting for a free bcrypt slot."),
+    "bcrypt_pool_waiting": ("gauge", "Callers currently waiting for a bcrypt slot."),
+    "bcrypt_pool_active": ("gauge", "bcrypt operations currently running."),
+    "mongo_pool_checkouts_total": ("counter", "MongoDB connections checked out of the pool."),
+    "mongo_pool_checkout_failures_total": ("counter", "Failed MongoDB connection checkouts."),
+    "mongo_pool_checked_out": ("gauge", "MongoDB connections currently checked out."),
+    "mongo_pool_max_size": ("gauge", "Maximum size of each MongoDB connection pool."),
+    "cache_hits_total": ("counter", "Cache lookups answered from the cache."),
+    "cache_misses_total": ("counter", "Cache lookups that had to compute the value."),
+    "cache_hit_ratio": ("gauge", "Share of cache lookups answered from the cache."),
+    "cache_stale_hits_total": ("counter", "Cache hits answered with a stale value."),
+    "cache_refreshes_total": ("counter", "Stale cache values refreshed in the background."),
+    "cache_refresh_failures_total": ("counter", "Background cache refreshes that failed."),
+    "rate_limiter_keys": ("gauge", "Client keys tracked by the auth rate limiter."),
+}
+
+# Container components whose ``cache_info()`` is reported as a cache.
+_CACHED_COMPONENTS = ("email_validator", "survey_result_cache")
+
+
+class _Shard:
+    __slots__ = ("counters", "gauges", "histograms")
+
+    def __init__(self):
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.gauges: Dict[Tuple[str, Labels], float] = {}
+        self.histograms: Dict[Tuple[str, Labels], List[float]] = {}
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms aggregated per thread, merged on read."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        self._shards_lock = threading.Lock()
+        self._collectors: List[Collector] = []
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def inc(self, name: str, labels: Labels = (), amount: float = 1.0) -> None:
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0.0) + amount
+
+    def add_gauge(self, name: str, labels: Labels = (), amount: float = 1.0) -> None:
+        gauges = self._shard().gauges
+        key = (name, labels)
+        gauges[key] = gauges.get(key, 0.0) + amount
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        histograms = self._shard().histograms
+        key = (name, labels)
+        counts = histograms.get(key)
+        if counts is None:
+            # One slot per bucket, one for +Inf, then the running sum.
+            counts = histograms[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        counts[bisect_left(self.buckets, value)] += 1
+        counts[-1] += value
+
+    def add_collector(self, collector: Collector) -> None:
+        """Register a callable read at scrape time for values owned elsewhere."""
+        self._collectors.append(collector)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Merge all shards and collectors into JSON-serialisable samples."""
+        counters: Dict[Tuple[str, Labels], float] = {}
+        gauges: Dict[Tuple[str, Labels], float] = {}
+        histograms: Dict[Tuple[str, Labels], List[float]] = {}
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            # dict()/list() copies are atomic, so owners never need to lock.
+            for key, value in dict(shard.counters).items():
+                counters[key] = counters.get(key, 0.0) + value
+            for key, value in dict(shard.gauges).items():
+                gauges[key] = gauges.get(key, 0.0) + value
+            for key, counts in dict(shard.histograms).items():
+                merged = histograms.setdefault(key, [0] * len(counts))
+                for index, count in enumerate(list(counts)):
+                    merged[index] += count
+
+        samples = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in {**counters, **gauges}.items()
+        ]
+        samples.extend(
+            {
+                "name": name,
+                "labels": dict(labels),
+                "bounds": list(self.buckets),
+                "buckets": counts[:-1],
+                "sum": counts[-1],
+            }
+            for (name, labels), counts in histograms.items()
+        )
+        for collector in self._collectors:
+            samples.extend(
+                {"name": name, "labels": labels, "value": value}
+                for name, labels, value in collector()
+            )
+        return samples
+
+
+class MultiprocessStore:
+    """One snapshot file per worker process, merged by whichever worker is scraped."""
+
+    def __init__(self, directory: str, flush_interval: float = 1.0):
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self._next_flush = 0.0
+        self._flush_lock = threading.Lock()
+
+    def write(self, samples: List[Dict[str, Any]], live: bool = True) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Resolved on every write: with preload_app the store is created before fork.
+        path = self.directory / f"metrics-{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps({"live": live, "samples": samples}))
+        os.replace(temporary, path)
+
+    def maybe_flush(self, registry: MetricsRegistry) -> None:
+        now = time.monotonic()
+        if now < self._next_flush or not self._flush_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_flush = now + self.flush_interval
+            self.write(registry.snapshot())
+        finally:
+            self._flush_lock.release()
+
+    def read_all(self) -> List[Tuple[List[Dict[str, Any]], bool]]:
+        snapshots = []
+        for path in sorted(self.directory.glob("metrics-*.json")):
+            try:
+                payload = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            snapshots.append((payload["samples"], payload["live"]))
+        return snapshots
+
+
+def merge_snapshots(
+    snapshots: Iterable[Tuple[List[Dict[str, Any]], bool]],
+) -> Dict[Tuple[str, Labels], Dict[str, Any]]:
+    """Sum samples across processes; gauges only count processes still alive."""
+    merged: Dict[Tuple[str, Labels], Dict[str, Any]] = {}
+    for samples, live in snapshots:
+        for sample in samples:
+            kind = METRICS.get(sample["name"], ("untyped", ""))[0]
+            if kind == "gauge" and not live:
+                continue
+            key = (sample["name"], tuple(sorted(sample["labels"].items())))
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = dict(sample)
+                if "buckets" in sample:
+                    merged[key]["buckets"] = list(sample["buckets"])
+            elif "buckets" in sample:
+                existing["buckets"] = [
+                    left + right for left, right in zip(existing["buckets"], sample["buckets"])
+                ]
+                existing["sum"] += sample["sum"]
+            else:
+                existing["value"] += sample["value"]
+    return merged
+
+
+def _with_hit_ratios(
+    merged: Dict[Tuple[str, Labels], Dict[str, Any]],
+) -> Dict[Tuple[str, Labels], Dict[str, Any]]:
+    for (name, labels), sample in list(merged.items()):
+        if name != "cache_hits_total":
+            continue
+        misses = merged.get(("cache_misses_total", labels), {"value": 0.0})["value"]
+        lookups = sample["value"] + misses
+        merged[("cache_hit_ratio", labels)] = {
+            "name": "cache_hit_ratio",
+            "labels": dict(labels),
+            "value": sample["value"] / lookups if lookups else 0.0,
+        }
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render(merged: Dict[Tuple[str, Labels], Dict[str, Any]]) -> str:
+    """Render merged samples in the Prometheus text exposition format."""
+    by_name: Dict[str, List[Tuple[Labels, Dict[str, Any]]]] = {}
+    for (name, labels), sample in sorted(merged.items()):
+        by_name.setdefault(name, []).append((labels, sample))
+
+    lines: List[str] = []
+    for name, samples in by_name.items():
+        kind, description = METRICS.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, sample in samples:
+            if kind != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(sample['value'])}")
+                continue
+            cumulative = 0
+            bounds = [_format_value(bound) for bound in sample["bounds"]] + ["+Inf"]
+            for bound, count in zip(bounds, sample["buckets"]):
+                cumulative += count
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels, ('le', bound))} {cumulative}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+    return "\n".join(lines) + "\n"
+
+
+def _bcrypt_samples() -> Iterable[Tuple[str, Dict[str, str], float]]:
+    # Only report modules this process has loaded; never import them to scrape.
+    module = sys.modules.get("infra.cryptography.bcrypt_adapter")
+    if module is None:
+        return
+    stats = module.bcrypt_pool.stats()
+    yield "bcrypt_pool_operations_total", {}, stats["operations"]
+    yield "bcrypt_pool_wait_seconds_total", {}, stats["wait_seconds"]
+    yield "bcrypt_pool_waiting", {}, stats["waiting"]
+    yield "bcrypt_pool_active", {}, stats["active"]
+
+
+def _mongo_pool_samples() -> Iterable[Tuple[str, Dict[str, str], float]]:
+    module = sys.modules.get("infra.db.mongodb.helpers.pool_monitor")
+    stats = module.pool_stats() if module is not None else None
+    if stats is None:
+        return
+    yield "mongo_pool_checkouts_total", {}, stats["checkouts"]
+    yield "mongo_pool_checkout_failures_total", {}, stats["checkout_failures"]
+    for address, pool in stats["pools"].items():
+        yield "mongo_pool_checked_out", {"address": address}, pool["checked_out"]
+        yield "mongo_pool_max_size", {"address": address}, pool["max_size"]
+
+
+def _cache_samples(app: Flask) -> Collector:
+    def collect() -> Iterable[Tuple[str, Dict[str, str], float]]:
+        container = app.extensions.get("container")
+        if container is None:
+            return
+        for name in _CACHED_COMPONENTS:
+            component = container.built(name)
+            if component is None or not hasattr(component, "cache_info"):
+                continue
+            info = component.cache_info()
+            yield "cache_hits_total", {"cache": name}, info.hits
+            yield "cache_misses_total", {"cache": name}, info.misses
+            # Stale-while-revalidate caches also report their background refreshes.
+            if hasattr(info, "refreshes"):
+                yield "cache_stale_hits_total", {"cache": name}, info.stale_hits
+                yield "cache_refreshes_total", {"cache": name}, info.refreshes
+                yield "cache_refresh_failures_total", {"cache": name}, info.refresh_failures
+
+    return collect
+
+
+def _rate_limiter_samples(app: Flask) -> Collector:
+    def collect() -> Iterable[Tuple[str, Dict[str, str], float]]:
+        attempts = app.extensions.get("auth_rate_limiter")
+        if attempts is not None:
+            yield "rate_limiter_keys", {}, len(attempts)
+
+    return collect
+
+
+def mark_process_dead(directory: str, pid: int) -> None:
+    """Keep a dead worker's counters but stop reporting its gauges."""
+    path = Path(directory) / f"metrics-{pid}.json"
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return
+    payload["live"] = False
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(payload))
+    os.replace(temporary, path)
+
+
+def setup_metrics(app: Flask) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    store = (
+        MultiprocessStore(directory, float(os.getenv("METRICS_FLUSH_SECONDS", "1")))
+        if directory
+        else None
+    )
+    registry.add_collector(_bcrypt_samples)
+    registry.add_collector(_mongo_pool_samples)
+    registry.add_collector(_cache_samples(app))
+    registry.add_collector(_rate_limiter_samples(app))
+    app.extensions["metrics"] = registry
+
+    @app.before_request
+    def start_request_metrics() -> None:
+        g.metrics_started = time.perf_counter()
+        registry.add_gauge("http_requests_in_flight", (), 1)
+
+    @app.after_request
+    def record_request_metrics(response: Response) -> Response:
+        started = g.get("metrics_started")
+        if started is None:
+            return response
+        labels = (
+            ("method", request.method),
+            ("route", request.url_rule.rule if request.url_rule is not None else "unmatched"),
+            ("status", str(response.status_code)),
+        )
+        registry.inc("http_requests_total", labels)
+        registry.observe("http_request_duration_seconds", labels, time.perf_counter() - started)
+        return response
+
+    @app.teardown_request
+    def finish_request_metrics(error: BaseException | None = None) -> None:
+        if g.pop("metrics_started", None) is not None:
+            registry.add_gauge("http_requests_in_flight", (), -1)
+        if store is not None:
+            store.maybe_flush(registry)
+
+    @app.get("/metrics")
+    def metrics() -> Response:
+        samples = registry.snapshot()
+        if store is None:
+            snapshots = [(samples, True)]
+        else:
+            store.write(samples)
+            snapshots = store.read_all()
+        return Response(render(_with_hit_ratios(merge_snapshots(snapshots))), content_type=CONTENT_TYPE)
+
+    return registry
@@ -19,6 +19,7 @@ def _csv_env(name: str, default: str) -> list[str]:
 
 def setup_middlewares(app: Flask) -> None:
     auth_attempts: dict[tuple[str, str], list[float]] = {}
+    app.extensions["auth_rate_limiter"] = auth_attempts
 
     @app.before_request
     def handle_preflight() -> Response | None:
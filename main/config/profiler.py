@@ -0,0 +1,192 @@
+"""Statistical profiler for diagnosing a live worker.
+
+A background thread samples ``sys._current_frames()`` at a fixed interval and
+counts identical stacks, so the profiled code runs unmodified and the cost is
+one stack walk per thread per tick. Profiles render as collapsed stacks (for
+``flamegraph.pl``) or as a speedscope JSON file.
+"""
+from __future__ import annotations
+
+import hmac
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import wraps
+from types import CodeType, FrameType
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from flask import Response, request
+
+FORMATS = ("collapsed", "speedscope")
+
+Stack = Tuple[str, ...]
+
+
+@dataclass
+class Profile:
+    samples: Counter = field(default_factory=Counter)
+    interval: float = 0.01
+    duration: float = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.samples.values())
+
+
+def _short_path(filename: str) -> str:
+    marker = filename.rfind("site-packages" + os.sep)
+    if marker != -1:
+        return filename[marker + len("site-packages") + 1:]
+    cwd = os.getcwd() + os.sep
+    return filename[len(cwd):] if filename.startswith(cwd) else filename
+
+
+class SamplingProfiler:
+    """Sample the stacks of running threads until stopped."""
+
+    def __init__(
+        self,
+        interval: float = 0.01,
+        thread_ids: Optional[Set[int]] = None,
+        exclude_thread_ids: Iterable[int] = (),
+    ):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.exclude_thread_ids = set(exclude_thread_ids)
+        self.profile = Profile(interval=interval)
+        self._names: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started = 0.0
+
+    def __enter__(self) -> "SamplingProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.profile.duration = time.perf_counter() - self._started
+        return self.profile
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or thread_id in self.exclude_thread_ids:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    continue
+                self.profile.samples[self._stack(frame)] += 1
+
+    def _stack(self, frame: Optional[FrameType]) -> Stack:
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            name = self._names.get(code)
+            if name is None:
+                # Keyed by function, not line, so one function is one flame graph frame.
+                name = self._names[code] = (
+                    f"{code.co_name} ({_short_path(code.co_filename)}:{code.co_firstlineno})"
+                )
+            names.append(name)
+            frame = frame.f_back
+        names.reverse()
+        return tuple(names)
+
+
+def render_collapsed(profile: Profile) -> str:
+    return "".join(
+        f"{';'.join(stack)} {count}\n"
+        for stack, count in profile.samples.most_common()
+    )
+
+
+def render_speedscope(profile: Profile, name: str) -> Dict[str, Any]:
+    frames: Dict[str, int] = {}
+    samples = []
+    weights = []
+    for stack, count in profile.samples.most_common():
+        samples.append([frames.setdefault(frame, len(frames)) for frame in stack])
+        weights.append(round(count * profile.interval * 1000, 3))
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "shared": {"frames": [{"name": frame} for frame in frames]},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": round(sum(weights), 3),
+            "samples": samples,
+            "weights": weights,
+        }],
+        "name": name,
+        "exporter": "python-flask-tdd-api",
+    }
+
+
+def profile_response(profile: Profile, output: str, name: str) -> Response:
+    if output == "speedscope":
+        response = Response(
+            json.dumps(render_speedscope(profile, name)),
+            content_type="application/json",
+        )
+        response.headers["Content-Disposition"] = (
+            f'attachment; filename="{name}.speedscope.json"'
+        )
+    else:
+        response = Response(render_collapsed(profile), content_type="text/plain; charset=utf-8")
+    response.headers["X-Profile-Samples"] = str(profile.sample_count)
+    response.headers["X-Profile-Duration-Ms"] = f"{profile.duration * 1000:.1f}"
+    return response
+
+
+def _request_profiling_token() -> str:
+    return os.getenv("PROFILER_TOKEN", "")
+
+
+def profiled_view(view: Callable[..., Any]) -> Callable[..., Any]:
+    """Let a request opt in to profiling with ``X-Profile: <PROFILER_TOKEN>``.
+
+    The profile replaces the response body; the status the view would have
+    returned is sent as ``X-Profiled-Status``. Without ``PROFILER_TOKEN`` the
+    view is returned unwrapped.
+    """
+    token = _request_profiling_token()
+    if not token:
+        return view
+    interval = float(os.getenv("PROFILER_REQUEST_INTERVAL_MS", "1")) / 1000
+
+    @wraps(view)
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        offered = request.headers.get("X-Profile")
+        if not offered or not hmac.compare_digest(offered, token):
+            return view(*args, **kwargs)
+        output = request.headers.get("X-Profile-Format", "collapsed")
+        profiler = SamplingProfiler(interval, thread_ids={threading.get_ident()})
+        with profiler:
+            result = view(*args, **kwargs)
+        status_code = result[1] if isinstance(result, tuple) else 200
+        response = profile_response(
+            profiler.profile,
+            output if output in FORMATS else "collapsed",
+            f"{request.method} {request.path}",
+        )
+        response.headers["X-Profiled-Status"] = str(status_code)
+        return response, 200
+
+    return wrapped
@@ -0,0 +1,90 @@
+"""Attribute MongoDB commands to Flask requests and aggregate them per endpoint."""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from typing import Any, Dict
+
+from flask import Flask, Response, g, jsonify, request
+
+from infra.db.query_stats import QueryStats, begin_query_stats, end_query_stats
+
+_QUERY_MONITOR = "infra.db.mongodb.helpers.query_monitor"
+
+
+class EndpointQueryStats:
+    """Running totals of Mongo commands per ``METHOD rule`` endpoint."""
+
+    def __init__(self):
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, stats: QueryStats) -> None:
+        with self._lock:
+            totals = self._endpoints.setdefault(endpoint, {
+                "requests": 0,
+                "commands": 0,
+                "duration_ms": 0.0,
+                "documents": 0,
+                "max_commands": 0,
+            })
+            totals["requests"] += 1
+            totals["commands"] += stats.commands
+            totals["duration_ms"] += stats.duration_ms
+            totals["documents"] += stats.documents
+            totals["max_commands"] = max(totals["max_commands"], stats.commands)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                endpoint: {
+                    **totals,
+                    "duration_ms": round(totals["duration_ms"], 3),
+                    "commands_per_request": round(totals["commands"] / totals["requests"], 3),
+                }
+                for endpoint, totals in self._endpoints.items()
+            }
+
+
+def _server_timing_enabled(app: Flask) -> bool:
+    return app.debug or os.getenv("SERVER_TIMING") == "1"
+
+
+def setup_query_stats(app: Flask) -> EndpointQueryStats:
+    endpoint_stats = EndpointQueryStats()
+    app.extensions["query_stats"] = endpoint_stats
+
+    @app.before_request
+    def begin_request_query_stats() -> None:
+        g.query_stats, g.query_stats_token = begin_query_stats()
+
+    @app.after_request
+    def record_request_query_stats(response: Response) -> Response:
+        # Checked after the request, so the one that first connects to MongoDB
+        # is counted, while the SQLite and PostgreSQL backends report nothing.
+        stats = g.get("query_stats")
+        if stats is None or _QUERY_MONITOR not in sys.modules:
+            return response
+        if request.url_rule is not None:
+            endpoint_stats.record(f"{request.method} {request.url_rule.rule}", stats)
+        if _server_timing_enabled(app):
+            response.headers.add(
+                "Server-Timing",
+                f'db;dur={stats.duration_ms:.2f};desc="{stats.commands} queries, '
+                f'{stats.documents} docs"',
+            )
+        return response
+
+    @app.teardown_request
+    def end_request_query_stats(error: BaseException | None = None) -> None:
+        token = g.pop("query_stats_token", None)
+        if token is not None:
+            end_query_stats(token)
+
+    if app.debug:
+        @app.get("/debug/query-stats")
+        def query_stats() -> tuple:
+            return jsonify(endpoint_stats.snapshot()), 200
+
+    return endpoint_stats
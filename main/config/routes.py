@@ -3,7 +3,11 @@
 from flask import Flask
 
 from main.routes import (
+    register_account_routes,
+    register_graphql_routes,
+    register_jwks_routes,
     register_login_routes,
+    register_profiler_routes,
     register_survey_result_routes,
     register_survey_routes,
 )
@@ -12,5 +16,9 @@ from main.routes import (
 def setup_routes(app: Flask) -> None:
     """Register every public API route on the Flask application."""
     register_login_routes(app)
+    register_account_routes(app)
     register_survey_routes(app)
     register_survey_result_routes(app)
+    register_graphql_routes(app)
+    register_profiler_routes(app)
+    register_jwks_routes(app)
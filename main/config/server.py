@@ -0,0 +1,143 @@
+"""Production server settings for the pre-fork (gunicorn) entry point."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_WORKER_CLASSES = {
+    "sync": "sync",
+    "thread": "gthread",
+    "threaded": "gthread",
+    "gthread": "gthread",
+    "gevent": "gevent",
+}
+
+
+def default_workers(cpu_count: int | None = None) -> int:
+    """Return the classic ``2 * cores + 1`` worker count."""
+    cores = cpu_count or multiprocessing.cpu_count()
+    return 2 * cores + 1
+
+
+def _int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+def request_deadline_seconds() -> int:
+    """Return how long a request may run before gunicorn kills its worker or a reload ends it."""
+    return min(_int_env("WORKER_TIMEOUT_SECONDS", 30), _int_env("GRACEFUL_TIMEOUT_SECONDS", 30))
+
+
+def server_settings() -> dict[str, Any]:
+    """Build gunicorn settings from the environment with production defaults."""
+    worker_class = os.getenv("WORKER_CLASS", "gthread").lower()
+    if worker_class not in _WORKER_CLASSES:
+        raise ValueError(
+            f"WORKER_CLASS must be one of {', '.join(sorted(_WORKER_CLASSES))}"
+        )
+    settings = {
+        "bind": f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '5000')}",
+        "workers": _int_env("WEB_CONCURRENCY", default_workers()),
+        "worker_class": _WORKER_CLASSES[worker_class],
+        "keepalive": _int_env("KEEPALIVE_SECONDS", 5),
+        "timeout": _int_env("WORKER_TIMEOUT_SECONDS", 30),
+        "graceful_timeout": _int_env("GRACEFUL_TIMEOUT_SECONDS", 30),
+        "max_requests": _int_env("MAX_REQUESTS", 10000),
+        "max_requests_jitter": _int_env("MAX_REQUESTS_JITTER", 1000),
+        # Off so SIGHUP reloads code: a preloaded app stays the master's old import.
+        "preload_app": os.getenv("PRELOAD_APP", "0") == "1",
+        "accesslog": os.getenv("ACCESS_LOG", "-") or None,
+    }
+    if settings["worker_class"] == "gthread":
+        settings["threads"] = _int_env("WORKER_THREADS", 4)
+    if settings["worker_class"] == "gevent":
+        settings["worker_connections"] = _int_env("WORKER_CONNECTIONS", 1000)
+    return settings
+
+
+def prepare_metrics_dir() -> str:
+    """Give workers a shared, empty directory for their metrics snapshots."""
+    directory = os.environ.setdefault(
+        "PROMETHEUS_MULTIPROC_DIR", tempfile.mkdtemp(prefix="flask-metrics-")
+    )
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    for stale in Path(directory).glob("metrics-*.json"):
+        stale.unlink(missing_ok=True)
+    return directory
+
+
+def when_ready(server: Any) -> None:
+    """Create missing indexes or SQL tables once, from the master, before serving traffic."""
+    from main.config.env import database_backend
+
+    if database_backend() == "sqlite":
+        from infra.db.sqlite.helpers import SqliteHelper
+
+        SqliteHelper.connect()
+        logger.info("SQLite schema ready")
+        SqliteHelper.disconnect()
+        return
+    if database_backend() == "postgres":
+        from infra.db.postgres.helpers import PostgresHelper
+
+        asyncio.run(PostgresHelper.connect())
+        logger.info("PostgreSQL schema ready")
+        asyncio.run(PostgresHelper.disconnect())
+        return
+    if not os.getenv("MONGO_URL"):
+        return
+    from infra.db.mongodb.helpers import MongoHelper
+
+    # connect() creates the indexes; workers inherit that and skip it.
+    asyncio.run(MongoHelper.connect())
+    asyncio.run(MongoHelper.disconnect())
+
+
+def post_fork(server: Any, worker: Any) -> None:
+    """Open this worker's own Mongo connection pool; pools must not cross a fork.
+
+    The SQLite and PostgreSQL helpers notice the fork themselves and reconnect on first use.
+    """
+    from main.config.env import database_backend
+
+    if database_backend() != "mongodb":
+        return
+    from infra.db.mongodb.helpers import MongoHelper
+
+    # Drop any client inherited from the master without closing its sockets,
+    # which still belong to the parent process.
+    MongoHelper._client = None
+    MongoHelper._db = None
+    if os.getenv("MONGO_URL"):
+        asyncio.run(MongoHelper.connect())
+        logger.info("Worker %s connected to MongoDB", worker.pid)
+
+
+def worker_exit(server: Any, worker: Any) -> None:
+    from main.config.env import database_backend
+    from main.config.metrics import mark_process_dead
+
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        mark_process_dead(directory, worker.pid)
+
+    if database_backend() == "sqlite":
+        from infra.db.sqlite.helpers import SqliteHelper
+
+        SqliteHelper.disconnect()
+    elif database_backend() == "postgres":
+        from infra.db.postgres.helpers import PostgresHelper
+
+        asyncio.run(PostgresHelper.disconnect())
+    else:
+        from infra.db.mongodb.helpers import MongoHelper
+
+        asyncio.run(MongoHelper.disconnect())
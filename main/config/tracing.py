@@ -0,0 +1,409 @@
+"""OpenTelemetry-compatible request tracing without a hard dependency on the SDK.
+
+Spans follow the OpenTelemetry data model (W3C trace context, span kinds,
+status codes) and can be shipped to any OTLP/HTTP collector. Tracing is off
+unless ``TRACING_ENABLED=1``; while off, ``traced`` hands back the original
+object and the Flask adapters register their plain views, so nothing is
+added to the request path.
+"""
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from flask import Flask, Response, g, request
+
+logger = logging.getLogger(__name__)
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+# OTLP enum values.
+_KINDS = {"INTERNAL": 1, "SERVER": 2, "CLIENT": 3}
+_STATUS_CODES = {"UNSET": 0, "OK": 1, "ERROR": 2}
+
+# Module prefix -> (layer attribute, span kind) for components passed to ``traced``.
+_LAYERS = (
+    ("data.usecases", "usecase", "INTERNAL"),
+    ("infra.db", "repository", "CLIENT"),
+    ("infra.cryptography", "cryptography", "INTERNAL"),
+)
+
+# OpenTelemetry ``db.system`` values by ``infra.db`` backend package.
+_DB_SYSTEMS = {"mongodb": "mongodb", "sqlite": "sqlite", "postgres": "postgresql"}
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str] = None
+    kind: str = "INTERNAL"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_ns: int = 0
+    end_ns: int = 0
+    status: str = "UNSET"
+    status_message: str = ""
+    sampled: bool = True
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if self.sampled:
+            self.attributes[key] = value
+
+    def record_exception(self, error: BaseException) -> None:
+        if not self.sampled:
+            return
+        self.status = "ERROR"
+        self.status_message = str(error) or error.__class__.__name__
+        self.set_attribute("exception.type", error.__class__.__name__)
+
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _KINDS[self.kind],
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": _STATUS_CODES[self.status], "message": self.status_message},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class InMemorySpanExporter:
+    """Keep finished spans in a list; meant for tests."""
+
+    def __init__(self):
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class LoggingSpanExporter:
+    """Write each finished span to the log as one OTLP-shaped JSON line."""
+
+    def export(self, span: Span) -> None:
+        logger.info("span %s", json.dumps(span.to_otlp()))
+
+
+class OtlpHttpSpanExporter:
+    """Batch spans and POST them as OTLP/HTTP JSON from a background thread."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        max_batch: int = 512,
+        flush_seconds: float = 2.0,
+        max_queue: int = 2048,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.flush_seconds = flush_seconds
+        self._queue: queue.Queue[Span] = queue.Queue(maxsize=max_queue)
+        self._worker_pid: Optional[int] = None
+        self._start_lock = threading.Lock()
+        self.dropped = 0
+
+    def export(self, span: Span) -> None:
+        # Started lazily so each pre-fork worker owns its sender thread.
+        if self._worker_pid != os.getpid():
+            self._start()
+        try:
+            self._queue.put_nowait(span)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._worker_pid == os.getpid():
+                return
+            self._worker_pid = os.getpid()
+            threading.Thread(target=self._run, name="otlp-exporter", daemon=True).start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_seconds
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.send(batch)
+
+    def payload(self, spans: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "python-flask-tdd"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+
+    def send(self, spans: List[Span]) -> None:
+        import urllib.request
+
+        body = json.dumps(self.payload(spans)).encode("utf-8")
+        http_request = urllib.request.Request(
+            self.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(http_request, timeout=5):
+                pass
+        except OSError as error:
+            logger.warning("Dropped %d spans: %s", len(spans), error)
+
+
+_NOT_SAMPLED = Span(name="", trace_id="0" * 32, span_id="0" * 16, sampled=False)
+
+
+class Tracer:
+    def __init__(self, exporter: Any, sample_ratio: float = 1.0):
+        self.exporter = exporter
+        self.sample_ratio = sample_ratio
+
+    def start_span(
+        self,
+        name: str,
+        kind: str = "INTERNAL",
+        attributes: Optional[Dict[str, Any]] = None,
+        traceparent: Optional[str] = None,
+    ) -> Tuple[Span, Token]:
+        parent = _current_span.get()
+        if parent is None and traceparent:
+            parent = _parse_traceparent(traceparent)
+        if parent is not None and not parent.sampled:
+            return _NOT_SAMPLED, _current_span.set(_NOT_SAMPLED)
+        if parent is None and random.random() >= self.sample_ratio:
+            return _NOT_SAMPLED, _current_span.set(_NOT_SAMPLED)
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent else None,
+            kind=kind,
+            attributes=dict(attributes or {}),
+            start_ns=time.time_ns(),
+        )
+        return span, _current_span.set(span)
+
+    def end_span(self, span: Span, token: Token) -> None:
+        _current_span.reset(token)
+        if not span.sampled:
+            return
+        span.end_ns = time.time_ns()
+        if span.status == "UNSET":
+            span.status = "OK"
+        self.exporter.export(span)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        kind: str = "INTERNAL",
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Span]:
+        span, token = self.start_span(name, kind, attributes)
+        try:
+            yield span
+        except BaseException as error:
+            span.record_exception(error)
+            raise
+        finally:
+            self.end_span(span, token)
+
+
+def _parse_traceparent(value: str) -> Optional[Span]:
+    match = _TRACEPARENT.match(value.strip().lower())
+    if not match:
+        return None
+    trace_id, span_id, flags = match.groups()
+    return Span(name="remote", trace_id=trace_id, span_id=span_id, sampled=flags == "01")
+
+
+_tracer: Optional[Tracer] = None
+
+
+def configure_tracing(exporter: Any = None, sample_ratio: float = 1.0) -> Optional[Tracer]:
+    """Install a tracer for the process; ``None`` turns tracing off."""
+    global _tracer
+    _tracer = Tracer(exporter, sample_ratio) if exporter is not None else None
+    return _tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
+
+
+def current_span() -> Optional[Span]:
+    span = _current_span.get()
+    return span if span is not None and span.sampled else None
+
+
+def _exporter_from_env() -> Any:
+    name = os.getenv("TRACING_EXPORTER", "log").lower()
+    if name == "memory":
+        return InMemorySpanExporter()
+    if name == "log":
+        return LoggingSpanExporter()
+    if name == "otlp":
+        return OtlpHttpSpanExporter(
+            os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "http://localhost:4318").rstrip("/")
+            + "/v1/traces",
+            os.getenv("OTEL_SERVICE_NAME", "python-flask-tdd-api"),
+        )
+    raise ValueError("TRACING_EXPORTER must be one of log, memory, otlp")
+
+
+class _TracedComponent:
+    """Proxy that runs every public method of a component inside a span."""
+
+    def __init__(self, target: Any, layer: str, kind: str):
+        self._target = target
+        self._layer = layer
+        self._kind = kind
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+        span_name = f"{type(self._target).__name__}.{name}"
+        attributes = {"code.namespace": type(self._target).__name__, "code.function": name,
+                      "app.layer": self._layer}
+        if self._layer == "repository":
+            backend = type(self._target).__module__.split(".")[2:3]
+            db_system = _DB_SYSTEMS.get(backend[0]) if backend else None
+            if db_system is not None:
+                attributes["db.system"] = db_system
+        kind = self._kind
+
+        if inspect.iscoroutinefunction(attribute):
+            @functools.wraps(attribute)
+            async def wrapper(*args: Any, **kwargs: Any) -> Any:
+                tracer = _tracer
+                if tracer is None:
+                    return await attribute(*args, **kwargs)
+                with tracer.span(span_name, kind, attributes):
+                    return await attribute(*args, **kwargs)
+        else:
+            @functools.wraps(attribute)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                tracer = _tracer
+                if tracer is None:
+                    return attribute(*args, **kwargs)
+                with tracer.span(span_name, kind, attributes):
+                    return attribute(*args, **kwargs)
+
+        # Cache on the proxy so later lookups skip __getattr__ entirely.
+        self.__dict__[name] = wrapper
+        return wrapper
+
+
+def traced(component: Any) -> Any:
+    """Wrap a use case, repository or crypto adapter in spans when tracing is on."""
+    if _tracer is None:
+        return component
+    module = type(component).__module__
+    for prefix, layer, kind in _LAYERS:
+        if module.startswith(prefix):
+            return _TracedComponent(component, layer, kind)
+    return component
+
+
+def setup_tracing(app: Flask) -> Optional[Tracer]:
+    """Configure tracing from the environment and open a server span per request.
+
+    Must run before routes are registered: adapters decide at registration
+    time whether to add their spans.
+    """
+    if os.getenv("TRACING_ENABLED") != "1":
+        return configure_tracing(None)
+    tracer = configure_tracing(
+        _exporter_from_env(), float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+    )
+    app.extensions["tracer"] = tracer
+
+    @app.before_request
+    def start_server_span() -> None:
+        g.server_span, g.server_span_token = tracer.start_span(
+            f"{request.method} {request.url_rule.rule if request.url_rule else request.path}",
+            "SERVER",
+            {"http.request.method": request.method, "url.path": request.path},
+            traceparent=request.headers.get("traceparent"),
+        )
+
+    @app.after_request
+    def record_server_span(response: Response) -> Response:
+        span = g.get("server_span")
+        if span is not None and span.sampled:
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.status = "ERROR"
+            response.headers["traceparent"] = span.traceparent()
+        return response
+
+    @app.teardown_request
+    def end_server_span(error: BaseException | None = None) -> None:
+        span = g.pop("server_span", None)
+        token = g.pop("server_span_token", None)
+        if span is None or token is None:
+            return
+        if error is not None:
+            span.record_exception(error)
+        tracer.end_span(span, token)
+
+    return tracer
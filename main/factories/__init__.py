@@ -1,19 +1,37 @@
+from main.factories.container import (
+    Container,
+    Scope,
+    check_backend_features,
+    container,
+    refresh_tokens_enabled,
+    stateless_auth_enabled,
+)
 from main.factories.controllers import (
     make_add_survey_controller,
     make_load_survey_result_controller,
     make_load_surveys_controller,
     make_login_controller,
+    make_refresh_token_controller,
+    make_revoke_account_tokens_controller,
     make_save_survey_result_controller,
     make_signup_controller,
 )
 from main.factories.middlewares import make_auth_middleware
 
 __all__ = [
+    "Container",
+    "Scope",
+    "check_backend_features",
+    "container",
     "make_add_survey_controller",
     "make_auth_middleware",
     "make_load_survey_result_controller",
     "make_load_surveys_controller",
     "make_login_controller",
+    "make_refresh_token_controller",
+    "make_revoke_account_tokens_controller",
     "make_save_survey_result_controller",
     "make_signup_controller",
+    "refresh_tokens_enabled",
+    "stateless_auth_enabled",
 ]
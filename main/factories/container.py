@@ -0,0 +1,343 @@
+"""Lightweight dependency container shared by the factories."""
+from __future__ import annotations
+
+import importlib
+import os
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Union
+
+from flask import g, has_request_context
+
+from main.config.tracing import traced
+
+
+class Scope(str, Enum):
+    SINGLETON = "singleton"
+    REQUEST = "request"
+    TRANSIENT = "transient"
+
+
+@dataclass
+class _Registration:
+    factory: Union[Callable[[], Any], str]
+    scope: Scope
+
+
+def _import_factory(path: str) -> Callable[[], Any]:
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class Container:
+    """Resolve named components lazily in singleton, per-request or transient scope.
+
+    Nothing is built at registration time: a component's factory runs on the
+    first ``resolve`` call, so cold start only pays for what the served routes
+    need. A factory may be given as a ``"package.module:attribute"`` string to
+    defer the import itself until then. Construction time of every built
+    component is recorded, excluding the time spent building its own
+    dependencies.
+    """
+
+    def __init__(self):
+        self._registrations: Dict[str, _Registration] = {}
+        self._singletons: Dict[str, Any] = {}
+        self._timings: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._building = threading.local()
+
+    def register(
+        self,
+        name: str,
+        factory: Union[Callable[[], Any], str],
+        scope: Scope = Scope.SINGLETON,
+    ) -> None:
+        with self._lock:
+            self._registrations[name] = _Registration(factory, Scope(scope))
+            self._singletons.pop(name, None)
+
+    def resolve(self, name: str) -> Any:
+        registration = self._registrations.get(name)
+        if registration is None:
+            raise KeyError(f"No component registered as '{name}'")
+        if registration.scope is Scope.SINGLETON:
+            if name not in self._singletons:
+                with self._lock:
+                    if name not in self._singletons:
+                        self._singletons[name] = self._build(name, registration)
+            return self._singletons[name]
+        if registration.scope is Scope.REQUEST and has_request_context():
+            instances = g.setdefault("_container_instances", {})
+            if name not in instances:
+                instances[name] = self._build(name, registration)
+            return instances[name]
+        return self._build(name, registration)
+
+    def built(self, name: str) -> Any | None:
+        """Return a singleton only if it was already built; never builds it."""
+        return self._singletons.get(name)
+
+    def reset(self) -> None:
+        """Drop built singletons so the next resolve rebuilds them from the environment."""
+        with self._lock:
+            self._singletons.clear()
+            self._timings.clear()
+
+    def startup_report(self) -> List[Dict[str, Any]]:
+        """Return built components ordered by construction time, slowest first."""
+        return [
+            {
+                "component": name,
+                "scope": self._registrations[name].scope.value,
+                "ms": round(seconds * 1000, 3),
+            }
+            for name, seconds in sorted(
+                self._timings.items(), key=lambda item: item[1], reverse=True
+            )
+        ]
+
+    def _build(self, name: str, registration: _Registration) -> Any:
+        stack = getattr(self._building, "stack", None)
+        if stack is None:
+            stack = self._building.stack = []
+        if name in stack:
+            raise RuntimeError(f"Circular dependency: {' -> '.join(stack + [name])}")
+        stack.append(name)
+        nested_before = getattr(self._building, "nested", 0.0)
+        self._building.nested = 0.0
+        started = time.perf_counter()
+        try:
+            factory = registration.factory
+            if isinstance(factory, str):
+                factory = _import_factory(factory)
+            instance = factory()
+        finally:
+            elapsed = time.perf_counter() - started
+            own = elapsed - self._building.nested
+            stack.pop()
+            self._building.nested = nested_before + elapsed
+        self._timings[name] = self._timings.get(name, 0.0) + own
+        return instance
+
+
+_REPOSITORIES = {
+    "mongodb": {
+        "account": "infra.db.mongodb.account_repository:AccountMongoRepository",
+        "session": "infra.db.mongodb.session_repository:SessionMongoRepository",
+        "survey": "infra.db.mongodb.survey_repository:SurveyMongoRepository",
+        "survey_result": "infra.db.mongodb.survey_result_repository:SurveyResultMongoRepository",
+        "sharded_survey_result": (
+            "infra.db.mongodb.sharded_survey_result_repository:ShardedSurveyResultMongoRepository"
+        ),
+        "refresh_token": "infra.db.mongodb.refresh_token_repository:RefreshTokenMongoRepository",
+        "token_revocation": (
+            "infra.db.mongodb.token_revocation_repository:TokenRevocationMongoRepository"
+        ),
+    },
+    "sqlite": {
+        "account": "infra.db.sqlite.account_repository:AccountSqliteRepository",
+        "session": "infra.db.sqlite.session_repository:SessionSqliteRepository",
+        "survey": "infra.db.sqlite.survey_repository:SurveySqliteRepository",
+        "survey_result": "infra.db.sqlite.survey_result_repository:SurveyResultSqliteRepository",
+        "refresh_token": "infra.db.sqlite.refresh_token_repository:RefreshTokenSqliteRepository",
+        "token_revocation": (
+            "infra.db.sqlite.token_revocation_repository:TokenRevocationSqliteRepository"
+        ),
+    },
+    # No refresh tokens or stateless revocation yet; check_backend_features rejects them.
+    "postgres": {
+        "account": "infra.db.postgres.account_repository:AccountPostgresRepository",
+        "session": "infra.db.postgres.session_repository:SessionPostgresRepository",
+        "survey": "infra.db.postgres.survey_repository:SurveyPostgresRepository",
+        "survey_result": (
+            "infra.db.postgres.survey_result_repository:SurveyResultPostgresRepository"
+        ),
+    },
+}
+
+
+def _repository_class(kind: str) -> Callable[..., Any]:
+    """Import the ``kind`` repository of the ``DB_BACKEND`` backend; only that backend is loaded."""
+    from main.config.env import database_backend
+
+    backend = database_backend()
+    if kind not in _REPOSITORIES[backend]:
+        raise RuntimeError(f"DB_BACKEND={backend} has no {kind} repository")
+    return _import_factory(_REPOSITORIES[backend][kind])
+
+
+def _make_account_repository():
+    return traced(_repository_class("account")(container.resolve("email_validator")))
+
+
+def _make_session_repository():
+    return traced(_repository_class("session")(int(os.getenv("JWT_EXPIRES_IN_SECONDS", "3600"))))
+
+
+def _make_survey_repository():
+    return traced(_repository_class("survey")())
+
+
+def _make_survey_result_repository():
+    if os.getenv("SURVEY_COUNTER_SHARDS_ENABLED") != "1":
+        return traced(_repository_class("survey_result")())
+    repository_class = _repository_class("sharded_survey_result")
+    from infra.db.mongodb.sharded_survey_result_repository import HotSurveyDetector
+
+    return traced(repository_class(HotSurveyDetector(
+        int(os.getenv("SURVEY_COUNTER_SHARDS", "4")),
+        int(os.getenv("SURVEY_COUNTER_MAX_SHARDS", "64")),
+        float(os.getenv("SURVEY_COUNTER_HOT_VOTES_PER_SECOND", "50")),
+    )))
+
+
+def _make_hasher():
+    from importlib.util import find_spec
+
+    from infra.cryptography import Argon2Adapter, BcryptAdapter, MultiSchemeHasher
+
+    schemes = {"bcrypt": lambda: BcryptAdapter(int(os.getenv("BCRYPT_SALT", "12")))}
+    # argon2-cffi is optional; without it only bcrypt digests can be verified.
+    if find_spec("argon2") is not None:
+        schemes["argon2id"] = lambda: Argon2Adapter(
+            int(os.getenv("ARGON2_TIME_COST", "3")),
+            int(os.getenv("ARGON2_MEMORY_COST", "65536")),
+            int(os.getenv("ARGON2_PARALLELISM", "1")),
+        )
+    preferred = os.getenv("PASSWORD_HASH_SCHEME", "bcrypt")
+    if preferred not in schemes:
+        raise RuntimeError(f"PASSWORD_HASH_SCHEME={preferred} is not available")
+    return traced(MultiSchemeHasher(
+        schemes[preferred](),
+        *(build() for name, build in schemes.items() if name != preferred),
+    ))
+
+
+def _make_encrypter():
+    from infra.cryptography import JwtAdapter, key_ring_from_env
+    from main.config.env import jwt_secret
+
+    key_ring = key_ring_from_env()
+    # The HMAC secret is only needed when tokens are not signed by the key ring.
+    secret = jwt_secret() if key_ring is None else ""
+    return traced(JwtAdapter(secret, key_ring=key_ring))
+
+
+def stateless_auth_enabled() -> bool:
+    return os.getenv("AUTH_MODE", "stateful").lower() == "stateless"
+
+
+def refresh_tokens_enabled() -> bool:
+    return os.getenv("REFRESH_TOKENS_ENABLED") == "1"
+
+
+def check_backend_features() -> None:
+    """Refuse to start when an enabled feature needs a repository ``DB_BACKEND`` lacks.
+
+    Otherwise the app would boot and fail every login or authenticated request.
+    """
+    from main.config.env import database_backend
+
+    backend = database_backend()
+    features = (
+        ("REFRESH_TOKENS_ENABLED=1", refresh_tokens_enabled(), "refresh_token"),
+        ("AUTH_MODE=stateless", stateless_auth_enabled(), "token_revocation"),
+        (
+            "SURVEY_COUNTER_SHARDS_ENABLED=1",
+            os.getenv("SURVEY_COUNTER_SHARDS_ENABLED") == "1",
+            "sharded_survey_result",
+        ),
+    )
+    for setting, enabled, kind in features:
+        if enabled and kind not in _REPOSITORIES[backend]:
+            raise RuntimeError(f"{setting} is not supported with DB_BACKEND={backend}")
+
+
+def _make_authentication():
+    from data.usecases import DbAuthentication
+
+    account_repository = container.resolve("account_repository")
+    hasher = container.resolve("hasher")
+    rehash_on_login = os.getenv("PASSWORD_REHASH_ON_LOGIN", "1") == "1"
+    return traced(DbAuthentication(
+        account_repository,
+        hasher,
+        container.resolve("encrypter"),
+        container.resolve("session_repository"),
+        include_claims=stateless_auth_enabled(),
+        refresh_access_token=(
+            container.resolve("refresh_access_token") if refresh_tokens_enabled() else None
+        ),
+        rehasher=hasher if rehash_on_login else None,
+        update_password_repository=account_repository if rehash_on_login else None,
+    ))
+
+
+def _make_refresh_token_repository():
+    return traced(_repository_class("refresh_token")())
+
+
+def _make_refresh_access_token():
+    from data.usecases import DbRefreshAccessToken
+
+    account_repository = container.resolve("account_repository")
+    refresh_token_repository = container.resolve("refresh_token_repository")
+    return traced(DbRefreshAccessToken(
+        refresh_token_repository,
+        refresh_token_repository,
+        refresh_token_repository,
+        account_repository,
+        container.resolve("encrypter"),
+        container.resolve("session_repository"),
+        int(os.getenv("REFRESH_TOKEN_EXPIRES_IN_SECONDS", str(30 * 24 * 3600))),
+        include_claims=stateless_auth_enabled(),
+    ))
+
+
+def _make_token_revocation_repository():
+    return traced(_repository_class("token_revocation")())
+
+
+def _make_token_revocation_list():
+    from data.usecases import TokenRevocationList
+
+    return TokenRevocationList(
+        container.resolve("token_revocation_repository"),
+        float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "30")),
+    )
+
+
+def _make_load_account_by_token():
+    if stateless_auth_enabled():
+        from data.usecases import DbLoadAccountByClaims
+
+        return traced(DbLoadAccountByClaims(
+            container.resolve("encrypter"),
+            container.resolve("token_revocation_list"),
+        ))
+
+    from data.usecases import DbLoadAccountByToken
+
+    return traced(DbLoadAccountByToken(
+        container.resolve("encrypter"),
+        container.resolve("session_repository"),
+    ))
+
+
+container = Container()
+container.register("account_repository", _make_account_repository)
+container.register("session_repository", _make_session_repository)
+container.register("survey_repository", _make_survey_repository)
+container.register("survey_result_repository", _make_survey_result_repository)
+container.register("hasher", _make_hasher)
+container.register("encrypter", _make_encrypter)
+container.register("email_validator", "utils.email_validator_adapter:EmailValidatorAdapter")
+container.register("refresh_token_repository", _make_refresh_token_repository)
+container.register("refresh_access_token", _make_refresh_access_token)
+container.register("authentication", _make_authentication)
+container.register("token_revocation_repository", _make_token_revocation_repository)
+container.register("token_revocation_list", _make_token_revocation_list)
+container.register("load_account_by_token", _make_load_account_by_token)
@@ -3,125 +3,294 @@ import os
 from data.usecases import (
     DbAddAccount,
     DbAddSurvey,
-    DbAuthentication,
     DbCheckSurveyById,
+    DbLoadAccountAnswers,
     DbLoadAnswersBySurvey,
     DbLoadSurveyResult,
-    DbLoadSurveys,
+    DbLoadSurveyResults,
+    DbLoadSurveysView,
+    DbRevokeAccountTokens,
     DbSaveSurveyResult,
+    SingleFlightLoadSurveyResult,
+    SingleFlightLoadSurveys,
+    SingleFlightLoadSurveysView,
+    StaleWhileRevalidateSurveyResult,
 )
-from infra.cryptography import BcryptAdapter, JwtAdapter
-from infra.db.mongodb import (
-    AccountMongoRepository,
-    SurveyMongoRepository,
-    SurveyResultMongoRepository,
-)
-from main.config.env import jwt_secret
+from infra.db.survey_view import survey_view_id, with_did_answer
+from main.config.tracing import traced
+from main.factories.container import container
 from presentation.controllers import (
     AddSurveyController,
     LoadSurveyResultController,
+    LoadSurveyResultsController,
     LoadSurveysController,
     LoginController,
+    RefreshTokenController,
+    RevokeAccountTokensController,
     SaveSurveyResultController,
     SignUpController,
 )
-from utils.email_validator_adapter import EmailValidatorAdapter
 from validation import (
     CompareFieldsValidation,
     EmailValidation,
     PasswordStrengthValidation,
     RequiredFieldValidation,
     ValidationComposite,
+    compile_validation,
 )
 
-def make_signup_validation():
-    email_validator = EmailValidatorAdapter()
-    return ValidationComposite([
+
+def make_email_validator():
+    return container.resolve("email_validator")
+
+
+def _build_signup_validation():
+    return compile_validation(ValidationComposite([
         RequiredFieldValidation("name"),
         RequiredFieldValidation("email"),
         RequiredFieldValidation("password"),
         RequiredFieldValidation("passwordConfirmation"),
         CompareFieldsValidation("password", "passwordConfirmation"),
         PasswordStrengthValidation("password"),
-        EmailValidation("email", email_validator),
-    ])
+        EmailValidation("email", make_email_validator()),
+    ]))
 
 
-def make_login_validation():
-    email_validator = EmailValidatorAdapter()
-    return ValidationComposite([
+def _build_login_validation():
+    return compile_validation(ValidationComposite([
         RequiredFieldValidation("email"),
         RequiredFieldValidation("password"),
-        EmailValidation("email", email_validator),
-    ])
+        EmailValidation("email", make_email_validator()),
+    ]))
 
 
-def make_add_survey_validation():
-    return ValidationComposite([
+def _build_refresh_token_validation():
+    return compile_validation(ValidationComposite([
+        RequiredFieldValidation("refreshToken"),
+    ]))
+
+
+def _build_add_survey_validation():
+    return compile_validation(ValidationComposite([
         RequiredFieldValidation("question"),
         RequiredFieldValidation("answers"),
-    ])
+    ]))
+
+
+def make_signup_validation():
+    return container.resolve("signup_validation")
+
+
+def make_login_validation():
+    return container.resolve("login_validation")
+
+
+def make_refresh_token_validation():
+    return container.resolve("refresh_token_validation")
+
+
+def make_add_survey_validation():
+    return container.resolve("add_survey_validation")
 
 
 def make_account_repository():
-    return AccountMongoRepository()
+    return container.resolve("account_repository")
 
 
 def make_survey_repository():
-    return SurveyMongoRepository()
+    return container.resolve("survey_repository")
 
 
 def make_survey_result_repository():
-    return SurveyResultMongoRepository()
+    return container.resolve("survey_result_repository")
+
+
+def make_token_revocation_repository():
+    return container.resolve("token_revocation_repository")
 
 
 def make_authentication():
-    account_repository = make_account_repository()
-    bcrypt_adapter = BcryptAdapter(int(os.getenv("BCRYPT_SALT", "12")))
-    jwt_adapter = JwtAdapter(jwt_secret())
-    return DbAuthentication(
-        account_repository,
-        bcrypt_adapter,
-        jwt_adapter,
-        account_repository,
-    )
+    return container.resolve("authentication")
 
 
-def make_signup_controller():
-    account_repository = make_account_repository()
-    add_account = DbAddAccount(
-        BcryptAdapter(int(os.getenv("BCRYPT_SALT", "12"))),
-        account_repository,
-        account_repository,
-    )
+def request_coalescing_enabled() -> bool:
+    return os.getenv("REQUEST_COALESCING_ENABLED") == "1"
+
+
+def survey_result_cache_enabled() -> bool:
+    return os.getenv("SURVEY_RESULT_CACHE_ENABLED") == "1"
+
+
+def _coalesce_surveys(load_surveys):
+    """Share the survey list among concurrent identical requests when coalescing is on."""
+    if not request_coalescing_enabled():
+        return load_surveys
+    load_account_answers = traced(DbLoadAccountAnswers(make_survey_result_repository()))
+    return traced(SingleFlightLoadSurveys(load_surveys, load_account_answers))
+
+
+def _coalesce_surveys_view(load_surveys_view):
+    """Share the survey list view among concurrent identical requests when coalescing is on."""
+    if not request_coalescing_enabled():
+        return load_surveys_view
+    load_account_answers = traced(DbLoadAccountAnswers(make_survey_result_repository()))
+    return traced(SingleFlightLoadSurveysView(
+        load_surveys_view, load_account_answers, survey_view_id, with_did_answer
+    ))
+
+
+def _build_signup_controller():
+    # No separate email check: the unique email index rejects duplicates on insert.
+    add_account = traced(DbAddAccount(container.resolve("hasher"), make_account_repository()))
     return SignUpController(add_account, make_signup_validation(), make_authentication())
 
 
-def make_login_controller():
+def _build_login_controller():
     return LoginController(make_authentication(), make_login_validation())
 
 
-def make_add_survey_controller():
-    return AddSurveyController(make_add_survey_validation(), DbAddSurvey(make_survey_repository()))
+def _build_refresh_token_controller():
+    return RefreshTokenController(
+        container.resolve("refresh_access_token"),
+        make_refresh_token_validation(),
+    )
 
 
-def make_load_surveys_controller():
-    return LoadSurveysController(DbLoadSurveys(make_survey_repository()))
+def _build_revoke_account_tokens_controller():
+    return RevokeAccountTokensController(
+        traced(DbRevokeAccountTokens(make_token_revocation_repository()))
+    )
 
 
-def make_save_survey_result_controller():
+def _build_add_survey_controller():
+    return AddSurveyController(
+        make_add_survey_validation(),
+        traced(DbAddSurvey(make_survey_repository())),
+    )
+
+
+def _build_load_surveys_controller():
+    return LoadSurveysController(
+        _coalesce_surveys_view(traced(DbLoadSurveysView(make_survey_repository())))
+    )
+
+
+def _build_save_survey_result_controller():
     survey_repository = make_survey_repository()
     survey_result_repository = make_survey_result_repository()
     return SaveSurveyResultController(
-        DbLoadAnswersBySurvey(survey_repository),
-        DbSaveSurveyResult(survey_result_repository, survey_result_repository),
+        traced(DbLoadAnswersBySurvey(survey_repository)),
+        traced(DbSaveSurveyResult(survey_result_repository, survey_result_repository)),
     )
 
 
-def make_load_survey_result_controller():
+def _build_survey_result_cache():
+    survey_result_repository = make_survey_result_repository()
+    return traced(StaleWhileRevalidateSurveyResult(
+        traced(DbLoadSurveyResult(survey_result_repository, make_survey_repository())),
+        traced(DbLoadAccountAnswers(survey_result_repository)),
+        fresh_seconds=float(os.getenv("SURVEY_RESULT_CACHE_FRESH_SECONDS", "2")),
+        max_stale_seconds=float(os.getenv("SURVEY_RESULT_CACHE_MAX_STALE_SECONDS", "30")),
+        max_entries=int(os.getenv("SURVEY_RESULT_CACHE_MAX_ENTRIES", "1024")),
+    ))
+
+
+def _build_load_survey_result_controller():
     survey_repository = make_survey_repository()
     survey_result_repository = make_survey_result_repository()
+    if survey_result_cache_enabled():
+        # Cache misses are already coalesced by the cache itself.
+        load_survey_result = container.resolve("survey_result_cache")
+    else:
+        load_survey_result = traced(
+            DbLoadSurveyResult(survey_result_repository, survey_repository)
+        )
+        if request_coalescing_enabled():
+            load_survey_result = traced(SingleFlightLoadSurveyResult(
+                load_survey_result, traced(DbLoadAccountAnswers(survey_result_repository))
+            ))
     return LoadSurveyResultController(
-        DbCheckSurveyById(survey_repository),
-        DbLoadSurveyResult(survey_result_repository, survey_repository),
+        traced(DbCheckSurveyById(survey_repository)), load_survey_result
+    )
+
+
+def _build_load_survey_results_controller():
+    return LoadSurveyResultsController(
+        traced(DbLoadSurveyResults(make_survey_result_repository())),
+        max_ids=int(os.getenv("SURVEY_RESULTS_MAX_IDS", "100")),
+    )
+
+
+def _build_graphql_controller():
+    from data.usecases import DbLoadSurveys, DbLoadSurveysByIds
+    # Imported here so graphene stays off the create_app import path.
+    from presentation.controllers.graphql_controller import GraphQLController
+
+    survey_repository = make_survey_repository()
+    survey_result_repository = make_survey_result_repository()
+    return GraphQLController(
+        _coalesce_surveys(traced(DbLoadSurveys(survey_repository))),
+        traced(DbLoadSurveysByIds(survey_repository)),
+        traced(DbLoadSurveyResults(survey_result_repository)),
+        traced(DbLoadAccountAnswers(survey_result_repository)),
+        max_depth=int(os.getenv("GRAPHQL_MAX_DEPTH", "6")),
+        max_cost=int(os.getenv("GRAPHQL_MAX_COST", "1000")),
+        max_page_size=int(os.getenv("GRAPHQL_MAX_PAGE_SIZE", "50")),
     )
+
+
+def make_signup_controller():
+    return container.resolve("signup_controller")
+
+
+def make_login_controller():
+    return container.resolve("login_controller")
+
+
+def make_refresh_token_controller():
+    return container.resolve("refresh_token_controller")
+
+
+def make_revoke_account_tokens_controller():
+    return container.resolve("revoke_account_tokens_controller")
+
+
+def make_add_survey_controller():
+    return container.resolve("add_survey_controller")
+
+
+def make_load_surveys_controller():
+    return container.resolve("load_surveys_controller")
+
+
+def make_save_survey_result_controller():
+    return container.resolve("save_survey_result_controller")
+
+
+def make_load_survey_result_controller():
+    return container.resolve("load_survey_result_controller")
+
+
+def make_load_survey_results_controller():
+    return container.resolve("load_survey_results_controller")
+
+
+def make_graphql_controller():
+    return container.resolve("graphql_controller")
+
+
+container.register("signup_validation", _build_signup_validation)
+container.register("login_validation", _build_login_validation)
+container.register("refresh_token_validation", _build_refresh_token_validation)
+container.register("add_survey_validation", _build_add_survey_validation)
+container.register("signup_controller", _build_signup_controller)
+container.register("login_controller", _build_login_controller)
+container.register("refresh_token_controller", _build_refresh_token_controller)
+container.register("revoke_account_tokens_controller", _build_revoke_account_tokens_controller)
+container.register("add_survey_controller", _build_add_survey_controller)
+container.register("load_surveys_controller", _build_load_surveys_controller)
+container.register("save_survey_result_controller", _build_save_survey_result_controller)
+container.register("survey_result_cache", _build_survey_result_cache)
+container.register("load_survey_result_controller", _build_load_survey_result_controller)
+container.register("load_survey_results_controller", _build_load_survey_results_controller)
+container.register("graphql_controller", _build_graphql_controller)
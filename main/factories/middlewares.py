@@ -1,17 +1,8 @@
 from __future__ import annotations
 
-from data.usecases import DbLoadAccountByToken
-from infra.cryptography import JwtAdapter
-from infra.db.mongodb import AccountMongoRepository
-from main.config.env import jwt_secret
+from main.factories.container import container
 from presentation.middlewares import AuthMiddleware
 
 
 def make_auth_middleware(role: str | None = None):
-    return AuthMiddleware(
-        DbLoadAccountByToken(
-            JwtAdapter(jwt_secret()),
-            AccountMongoRepository(),
-        ),
-        role,
-    )
+    return AuthMiddleware(container.resolve("load_account_by_token"), role)
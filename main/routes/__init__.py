@@ -1,11 +1,19 @@
 """Flask route registration modules."""
 
+from main.routes.account_routes import register_account_routes
+from main.routes.graphql_routes import register_graphql_routes
+from main.routes.jwks_routes import register_jwks_routes
 from main.routes.login_routes import register_login_routes
+from main.routes.profiler_routes import register_profiler_routes
 from main.routes.survey_result_routes import register_survey_result_routes
 from main.routes.survey_routes import register_survey_routes
 
 __all__ = [
+    "register_account_routes",
+    "register_graphql_routes",
+    "register_jwks_routes",
     "register_login_routes",
+    "register_profiler_routes",
     "register_survey_result_routes",
     "register_survey_routes",
 ]
@@ -0,0 +1,22 @@
+"""Account administration route registration."""
+
+from flask import Flask
+
+from main.adapters import adapt_lazy_middleware, adapt_lazy_route
+from main.factories.container import stateless_auth_enabled
+from main.factories.controllers import make_revoke_account_tokens_controller
+from main.factories.middlewares import make_auth_middleware
+
+
+def register_account_routes(app: Flask) -> None:
+    """Register token revocation; only stateless tokens check the account's token version."""
+    if not stateless_auth_enabled():
+        return
+    admin_auth = adapt_lazy_middleware(lambda: make_auth_middleware("admin"))
+
+    app.add_url_rule(
+        "/api/accounts/<account_id>/revoke-tokens",
+        "api_revoke_account_tokens",
+        admin_auth(adapt_lazy_route(lambda: make_revoke_account_tokens_controller())),
+        methods=["POST"],
+    )
@@ -0,0 +1,19 @@
+"""GraphQL route registration."""
+
+from flask import Flask
+
+from main.adapters import adapt_lazy_middleware, adapt_lazy_route
+from main.factories.controllers import make_graphql_controller
+from main.factories.middlewares import make_auth_middleware
+
+
+def register_graphql_routes(app: Flask) -> None:
+    """Register the GraphQL endpoint over surveys and their results."""
+    auth = adapt_lazy_middleware(lambda: make_auth_middleware())
+
+    app.add_url_rule(
+        "/graphql",
+        "api_graphql",
+        auth(adapt_lazy_route(lambda: make_graphql_controller())),
+        methods=["POST"],
+    )
@@ -0,0 +1,21 @@
+"""Public signing keys for nodes that verify tokens on their own."""
+
+import os
+
+from flask import Flask, jsonify
+
+from main.factories.container import container
+
+
+def register_jwks_routes(app: Flask) -> None:
+    """Register ``GET /.well-known/jwks.json`` when tokens are signed asymmetrically."""
+    if os.getenv("JWT_ALGORITHM", "HS256") == "HS256":
+        return
+
+    def jwks():
+        key_ring = container.resolve("encrypter").key_ring
+        response = jsonify(key_ring.public_jwks())
+        response.headers["Cache-Control"] = "public, max-age=300"
+        return response, 200
+
+    app.add_url_rule("/.well-known/jwks.json", "jwks", jwks, methods=["GET"])
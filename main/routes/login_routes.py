@@ -2,15 +2,18 @@
 
 from flask import Flask, jsonify
 
-from main.adapters import adapt_route
-from main.factories.controllers import make_login_controller, make_signup_controller
+from main.adapters import adapt_lazy_route
+from main.factories.container import refresh_tokens_enabled
+from main.factories.controllers import (
+    make_login_controller,
+    make_refresh_token_controller,
+    make_signup_controller,
+)
 
 
 def register_login_routes(app: Flask) -> None:
     """Register account routes, including the backwards-compatible signup route."""
-    signup_controller = make_signup_controller()
-    login_controller = make_login_controller()
-    signup_route = adapt_route(signup_controller)
+    signup_route = adapt_lazy_route(lambda: make_signup_controller())
 
     app.add_url_rule(
         "/api/signup",
@@ -21,9 +24,16 @@ def register_login_routes(app: Flask) -> None:
     app.add_url_rule(
         "/api/login",
         "api_login",
-        adapt_route(login_controller),
+        adapt_lazy_route(lambda: make_login_controller()),
         methods=["POST"],
     )
+    if refresh_tokens_enabled():
+        app.add_url_rule(
+            "/api/login/refresh",
+            "api_login_refresh",
+            adapt_lazy_route(lambda: make_refresh_token_controller()),
+            methods=["POST"],
+        )
 
     def legacy_signup():
         response, status_code = signup_route()
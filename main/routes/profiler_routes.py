@@ -0,0 +1,54 @@
+"""Admin-only sampling profiler route."""
+
+import os
+import threading
+import time
+
+from flask import Flask, jsonify, request
+
+from main.adapters import adapt_lazy_middleware
+from main.config.profiler import FORMATS, SamplingProfiler, profile_response
+from main.config.server import request_deadline_seconds
+from main.factories.middlewares import make_auth_middleware
+
+
+def register_profiler_routes(app: Flask) -> None:
+    """Register ``GET /api/admin/profile``, which profiles this worker for N seconds."""
+    admin_auth = adapt_lazy_middleware(lambda: make_auth_middleware("admin"))
+    # One profile per worker at a time; a second caller gets 409 instead of queueing.
+    running = threading.Lock()
+
+    def profile():
+        # The profile sleeps in the request: end it, with time left to render the
+        # response, before the worker timeout or a graceful reload stops the worker.
+        max_seconds = min(
+            float(os.getenv("PROFILER_MAX_SECONDS", "20")),
+            max(request_deadline_seconds() - 5, 1),
+        )
+        try:
+            seconds = float(request.args.get("seconds", "10"))
+            interval = float(request.args.get("interval_ms", "10")) / 1000
+        except ValueError:
+            return jsonify({"error": "seconds and interval_ms must be numbers"}), 400
+        output = request.args.get("format", "collapsed")
+        if not 0 < seconds <= max_seconds:
+            return jsonify({"error": f"seconds must be between 0 and {max_seconds:g}"}), 400
+        if not 0.001 <= interval <= 1:
+            return jsonify({"error": "interval_ms must be between 1 and 1000"}), 400
+        if output not in FORMATS:
+            return jsonify({"error": f"format must be one of {', '.join(FORMATS)}"}), 400
+        if not running.acquire(blocking=False):
+            return jsonify({"error": "A profile is already running on this worker"}), 409
+        try:
+            with SamplingProfiler(interval, exclude_thread_ids={threading.get_ident()}) as profiler:
+                time.sleep(seconds)
+        finally:
+            running.release()
+        return profile_response(profiler.profile, output, f"worker-{os.getpid()}")
+
+    app.add_url_rule(
+        "/api/admin/profile",
+        "api_admin_profile",
+        admin_auth(profile),
+        methods=["GET"],
+    )
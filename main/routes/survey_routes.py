@@ -2,7 +2,7 @@
 
 from flask import Flask
 
-from main.adapters import adapt_middleware, adapt_route
+from main.adapters import adapt_lazy_middleware, adapt_lazy_route
 from main.factories.controllers import (
     make_add_survey_controller,
     make_load_surveys_controller,
@@ -12,18 +12,18 @@ from main.factories.middlewares import make_auth_middleware
 
 def register_survey_routes(app: Flask) -> None:
     """Register survey creation and listing routes."""
-    admin_auth = adapt_middleware(make_auth_middleware("admin"))
-    auth = adapt_middleware(make_auth_middleware())
+    admin_auth = adapt_lazy_middleware(lambda: make_auth_middleware("admin"))
+    auth = adapt_lazy_middleware(lambda: make_auth_middleware())
 
     app.add_url_rule(
         "/api/surveys",
         "api_add_survey",
-        admin_auth(adapt_route(make_add_survey_controller())),
+        admin_auth(adapt_lazy_route(lambda: make_add_survey_controller())),
         methods=["POST"],
     )
     app.add_url_rule(
         "/api/surveys",
         "api_load_surveys",
-        auth(adapt_route(make_load_surveys_controller())),
+        auth(adapt_lazy_route(lambda: make_load_surveys_controller())),
         methods=["GET"],
     )
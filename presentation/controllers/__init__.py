@@ -1,15 +1,23 @@
 from presentation.controllers.add_survey_controller import AddSurveyController
 from presentation.controllers.load_survey_result_controller import LoadSurveyResultController
+from presentation.controllers.load_survey_results_controller import LoadSurveyResultsController
 from presentation.controllers.load_surveys_controller import LoadSurveysController
 from presentation.controllers.login_controller import LoginController
+from presentation.controllers.refresh_token_controller import RefreshTokenController
+from presentation.controllers.revoke_account_tokens_controller import (
+    RevokeAccountTokensController,
+)
 from presentation.controllers.save_survey_result_controller import SaveSurveyResultController
 from presentation.controllers.signup.signup import SignUpController
 
 __all__ = [
     "AddSurveyController",
     "LoadSurveyResultController",
+    "LoadSurveyResultsController",
     "LoadSurveysController",
     "LoginController",
+    "RefreshTokenController",
+    "RevokeAccountTokensController",
     "SaveSurveyResultController",
     "SignUpController",
 ]
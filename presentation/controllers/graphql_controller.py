@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from inspect import isawaitable
+from typing import Any, Dict, List, Optional, Tuple
+
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    GraphQLError,
+    execute,
+    parse,
+    specified_rules,
+    validate,
+)
+
+from domain.usecases import (
+    LoadAccountAnswers,
+    LoadSurveyResults,
+    LoadSurveysByIds,
+    LoadSurveysPage,
+)
+from presentation.controllers._helpers import run_async
+from presentation.errors import InvalidParamError, MissingParamError
+from presentation.graphql import GraphQLContext, cost_limit_rule, depth_limit_rule, schema
+from presentation.helpers.http_helper import bad_request, ok, server_error
+from presentation.protocols import Controller, HttpRequest, HttpResponse
+
+
+class GraphQLController(Controller):
+    """Run a GraphQL query for the authenticated account.
+
+    Query errors are reported in the body with status 200, as GraphQL over
+    HTTP expects; only a failing use case turns into a 500.
+    """
+
+    def __init__(
+        self,
+        load_surveys: LoadSurveysPage,
+        load_surveys_by_ids: LoadSurveysByIds,
+        load_survey_results: LoadSurveyResults,
+        load_account_answers: LoadAccountAnswers,
+        max_depth: int = 6,
+        max_cost: int = 1000,
+        max_page_size: int = 50,
+    ):
+        self.load_surveys = load_surveys
+        self.load_surveys_by_ids = load_surveys_by_ids
+        self.load_survey_results = load_survey_results
+        self.load_account_answers = load_account_answers
+        self.max_page_size = max_page_size
+        self.rules = [
+            *specified_rules,
+            depth_limit_rule(max_depth),
+            cost_limit_rule(max_cost, max_page_size),
+        ]
+        # Clients send the same few query texts; parse and validate each once.
+        self._prepare = lru_cache(maxsize=256)(self._parse_and_validate)
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            body = http_request.body
+            query = body.get("query")
+            if not query:
+                return bad_request(MissingParamError("query"))
+            if not isinstance(query, str):
+                return bad_request(InvalidParamError("query"))
+            variables = body.get("variables")
+            if variables is not None and not isinstance(variables, dict):
+                return bad_request(InvalidParamError("variables"))
+            document, errors = self._prepare(query)
+            if errors:
+                return ok({"errors": [error.formatted for error in errors]})
+            result = run_async(self._execute(
+                document, variables, body.get("operationName"), http_request.account_id
+            ))
+            failure = next(
+                (
+                    error.original_error
+                    for error in result.errors or ()
+                    if error.original_error is not None
+                    and not isinstance(error.original_error, GraphQLError)
+                ),
+                None,
+            )
+            if failure is not None:
+                return server_error(failure)
+            return ok(self._to_body(result))
+        except Exception as error:
+            return server_error(error)
+
+    def _parse_and_validate(self, query: str) -> Tuple[Optional[DocumentNode], List[GraphQLError]]:
+        try:
+            document = parse(query)
+        except GraphQLError as error:
+            return None, [error]
+        return document, validate(schema.graphql_schema, document, self.rules)
+
+    async def _execute(
+        self,
+        document: DocumentNode,
+        variables: Optional[Dict[str, Any]],
+        operation_name: Optional[str],
+        account_id: Optional[str],
+    ) -> ExecutionResult:
+        context = GraphQLContext.create(
+            account_id,
+            self.load_surveys,
+            self.load_surveys_by_ids,
+            self.load_survey_results,
+            self.load_account_answers,
+            self.max_page_size,
+        )
+        result = execute(
+            schema.graphql_schema,
+            document,
+            context_value=context,
+            variable_values=variables,
+            operation_name=operation_name,
+        )
+        return await result if isawaitable(result) else result
+
+    @staticmethod
+    def _to_body(result: ExecutionResult) -> Dict[str, Any]:
+        body: Dict[str, Any] = {"data": result.data}
+        if result.errors:
+            body["errors"] = [error.formatted for error in result.errors]
+        return body
@@ -0,0 +1,34 @@
+from domain.usecases import LoadSurveyResults
+from presentation.controllers._helpers import run_async
+from presentation.errors import InvalidParamError, MissingParamError
+from presentation.helpers.http_helper import bad_request, ok, server_error
+from presentation.protocols import Controller, HttpRequest, HttpResponse
+
+
+class LoadSurveyResultsController(Controller):
+    """Tally several surveys at once, keyed by survey id.
+
+    ``ids`` is comma separated and may be repeated. Unknown ids are left out
+    of the response instead of failing the whole request.
+    """
+
+    def __init__(self, load_survey_results: LoadSurveyResults, max_ids: int = 100):
+        self.load_survey_results = load_survey_results
+        self.max_ids = max_ids
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            survey_ids = list(dict.fromkeys(
+                survey_id.strip()
+                for value in http_request.query.get("ids", [])
+                for survey_id in value.split(",")
+                if survey_id.strip()
+            ))
+            if not survey_ids:
+                return bad_request(MissingParamError("ids"))
+            if len(survey_ids) > self.max_ids:
+                return bad_request(InvalidParamError("ids"))
+            results = run_async(self.load_survey_results.load(survey_ids, http_request.account_id))
+            return ok(results)
+        except Exception as error:
+            return server_error(error)
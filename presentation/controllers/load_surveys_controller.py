@@ -1,11 +1,11 @@
-from domain.usecases import LoadSurveys
+from domain.usecases import LoadSurveysView
 from presentation.controllers._helpers import request_data, run_async
 from presentation.helpers.http_helper import no_content, ok, server_error
 from presentation.protocols import Controller, HttpRequest, HttpResponse
 
 
 class LoadSurveysController(Controller):
-    def __init__(self, load_surveys: LoadSurveys):
+    def __init__(self, load_surveys: LoadSurveysView):
         self.load_surveys = load_surveys
 
     def handle(self, http_request: HttpRequest) -> HttpResponse:
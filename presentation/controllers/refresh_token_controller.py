@@ -0,0 +1,28 @@
+from domain.usecases import RefreshAccessToken
+from presentation.controllers._helpers import request_data, run_async
+from presentation.errors import InvalidParamError
+from presentation.helpers.http_helper import bad_request, ok, server_error, unauthorized
+from presentation.protocols import Controller, HttpRequest, HttpResponse, Validation
+
+
+class RefreshTokenController(Controller):
+    def __init__(self, refresh_access_token: RefreshAccessToken, validation: Validation):
+        self.refresh_access_token = refresh_access_token
+        self.validation = validation
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            data = request_data(http_request)
+            error = self.validation.validate(data)
+            if error:
+                return bad_request(error)
+            if not isinstance(data["refreshToken"], str):
+                return bad_request(InvalidParamError("refreshToken"))
+            authentication_model = run_async(
+                self.refresh_access_token.refresh(data["refreshToken"])
+            )
+            if not authentication_model:
+                return unauthorized()
+            return ok(authentication_model)
+        except Exception as error:
+            return server_error(error)
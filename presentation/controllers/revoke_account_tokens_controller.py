@@ -0,0 +1,21 @@
+from domain.usecases import RevokeAccountTokens
+from presentation.controllers._helpers import run_async
+from presentation.errors import InvalidParamError
+from presentation.helpers.http_helper import forbidden, no_content, server_error
+from presentation.protocols import Controller, HttpRequest, HttpResponse
+
+
+class RevokeAccountTokensController(Controller):
+    def __init__(self, revoke_account_tokens: RevokeAccountTokens):
+        self.revoke_account_tokens = revoke_account_tokens
+
+    def handle(self, http_request: HttpRequest) -> HttpResponse:
+        try:
+            # The path names the account; http_request.account_id is the admin calling.
+            account_id = http_request.params.get("account_id")
+            token_version = run_async(self.revoke_account_tokens.revoke(account_id))
+            if token_version is None:
+                return forbidden(InvalidParamError("accountId"))
+            return no_content()
+        except Exception as error:
+            return server_error(error)
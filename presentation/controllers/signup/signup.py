@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from presentation.protocols import HttpRequest, HttpResponse, Controller
 from presentation.protocols.email_validator import EmailValidator
-from domain.usecases import AddAccount, AddAccountModel, Authentication, AuthenticationParams
+from domain.usecases import AccountAuthentication, AddAccount, AddAccountModel
 from presentation.controllers._helpers import request_data, run_async
 from presentation.errors import EmailInUseError, InvalidParamError, MissingParamError
 from presentation.helpers.http_helper import bad_request, forbidden, ok, server_error
@@ -14,6 +14,7 @@ from validation.validators import (
     RequiredFieldValidation,
     ValidationComposite,
 )
+from validation.compiler import compile_validation
 
 
 class SignUpController(Controller):
@@ -21,12 +22,12 @@ class SignUpController(Controller):
         self,
         add_account_or_email_validator: AddAccount | EmailValidator,
         validation_or_add_account: Validation | AddAccount,
-        authentication: Authentication | None = None,
+        authentication: AccountAuthentication | None = None,
     ):
         if authentication is None:
             email_validator = add_account_or_email_validator
             self.add_account = validation_or_add_account
-            self.validation = ValidationComposite([
+            self.validation = compile_validation(ValidationComposite([
                 RequiredFieldValidation("name"),
                 RequiredFieldValidation("email"),
                 RequiredFieldValidation("password"),
@@ -34,7 +35,7 @@ class SignUpController(Controller):
                 CompareFieldsValidation("password", "passwordConfirmation"),
                 PasswordStrengthValidation("password"),
                 EmailValidation("email", email_validator),
-            ])
+            ]))
             self.authentication = None
         else:
             self.add_account = add_account_or_email_validator
@@ -61,11 +62,8 @@ class SignUpController(Controller):
                 return forbidden(EmailInUseError())
 
             if self.authentication:
-                authentication_model = run_async(self.authentication.auth(AuthenticationParams(
-                    email=email,
-                    password=password,
-                )))
-                return ok(authentication_model)
+                # The password was just hashed from this request, so skip a second compare.
+                return ok(run_async(self.authentication.auth_account(account)))
             return ok(account)
         except Exception as error:
             return server_error(error)
@@ -0,0 +1,12 @@
+"""GraphQL schema over the survey use cases."""
+from presentation.graphql.context import GraphQLContext
+from presentation.graphql.limits import cost_limit_rule, depth_limit_rule
+from presentation.graphql.schema import DEFAULT_PAGE_SIZE, schema
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "GraphQLContext",
+    "cost_limit_rule",
+    "depth_limit_rule",
+    "schema",
+]
@@ -0,0 +1,65 @@
+"""Per-request state shared by the GraphQL resolvers."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from graphene.utils.dataloader import DataLoader
+
+from domain.usecases import (
+    LoadAccountAnswers,
+    LoadSurveyResults,
+    LoadSurveysByIds,
+    LoadSurveysPage,
+)
+
+
+@dataclass
+class GraphQLContext:
+    """Use cases, the caller's account and the DataLoaders of one request.
+
+    Loaders batch every ``load`` issued while the same level of the query
+    resolves into one use case call, and cache by survey id for the rest of
+    the request, so a page of surveys costs a fixed number of queries.
+    """
+
+    account_id: Optional[str]
+    load_surveys: LoadSurveysPage
+    surveys: DataLoader
+    survey_results: DataLoader
+    account_answers: DataLoader
+    max_page_size: int
+
+    @classmethod
+    def create(
+        cls,
+        account_id: Optional[str],
+        load_surveys: LoadSurveysPage,
+        load_surveys_by_ids: LoadSurveysByIds,
+        load_survey_results: LoadSurveyResults,
+        load_account_answers: LoadAccountAnswers,
+        max_page_size: int,
+    ) -> "GraphQLContext":
+        """Build fresh loaders; call inside the event loop that runs the query."""
+
+        async def batch_surveys(survey_ids: List[str]) -> List[Any]:
+            surveys = await load_surveys_by_ids.load(list(survey_ids), account_id)
+            by_id = {survey.id: survey for survey in surveys}
+            return [by_id.get(survey_id) for survey_id in survey_ids]
+
+        async def batch_survey_results(survey_ids: List[str]) -> List[Any]:
+            results = await load_survey_results.load(list(survey_ids), account_id)
+            return [results.get(survey_id) for survey_id in survey_ids]
+
+        async def batch_account_answers(survey_ids: List[str]) -> List[Optional[str]]:
+            answers: Dict[str, str] = await load_account_answers.load(account_id, list(survey_ids))
+            return [answers.get(survey_id) for survey_id in survey_ids]
+
+        return cls(
+            account_id=account_id,
+            load_surveys=load_surveys,
+            surveys=DataLoader(batch_surveys, max_batch_size=max_page_size),
+            survey_results=DataLoader(batch_survey_results, max_batch_size=max_page_size),
+            account_answers=DataLoader(batch_account_answers, max_batch_size=max_page_size),
+            max_page_size=max_page_size,
+        )
@@ -0,0 +1,146 @@
+"""Validation rules that reject GraphQL queries too deep or too expensive to run.
+
+Both rules run once per distinct query text, before execution, so a hostile
+query is refused without touching the database. Introspection fields
+(``__schema``, ``__type``, ``__typename``) are not counted.
+"""
+from __future__ import annotations
+
+from typing import Any, Optional, Set, Type
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLNamedType,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValidationContext,
+    ValidationRule,
+    get_named_type,
+    is_object_type,
+)
+
+PAGE_ARGUMENT = "first"
+
+
+def _is_introspection(node: FieldNode) -> bool:
+    return node.name.value.startswith("__")
+
+
+def depth_limit_rule(max_depth: int) -> Type[ValidationRule]:
+    """Reject operations whose fields nest more than ``max_depth`` levels."""
+
+    class DepthLimitRule(ValidationRule):
+        def enter_operation_definition(self, node: OperationDefinitionNode, *_: Any) -> None:
+            depth = self._depth(node.selection_set, set())
+            if depth > max_depth:
+                self.report_error(GraphQLError(
+                    f"Query depth {depth} exceeds the maximum of {max_depth}", node
+                ))
+
+        def _depth(self, selection_set: Optional[SelectionSetNode], fragments: Set[str]) -> int:
+            if selection_set is None:
+                return 0
+            deepest = 0
+            for selection in selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    if not _is_introspection(selection):
+                        deepest = max(deepest, 1 + self._depth(selection.selection_set, fragments))
+                elif isinstance(selection, InlineFragmentNode):
+                    deepest = max(deepest, self._depth(selection.selection_set, fragments))
+                elif isinstance(selection, FragmentSpreadNode):
+                    name = selection.name.value
+                    fragment = self.context.get_fragment(name)
+                    # Cycles are reported by NoFragmentCyclesRule; just stop here.
+                    if fragment is not None and name not in fragments:
+                        deepest = max(
+                            deepest, self._depth(fragment.selection_set, fragments | {name})
+                        )
+            return deepest
+
+    return DepthLimitRule
+
+
+def cost_limit_rule(max_cost: int, max_page_size: int) -> Type[ValidationRule]:
+    """Reject operations that would resolve more than ``max_cost`` fields.
+
+    Every field costs 1. Fields of a paginated list (one with a ``first``
+    argument) are counted once per item: a literal ``first`` is used as is, a
+    variable counts as ``max_page_size``, and an omitted one as its default.
+    """
+
+    class CostLimitRule(ValidationRule):
+        def __init__(self, context: ValidationContext):
+            super().__init__(context)
+            self.schema = context.schema
+
+        def enter_operation_definition(self, node: OperationDefinitionNode, *_: Any) -> None:
+            root = self.schema.get_root_type(node.operation)
+            if root is None:
+                return
+            cost = self._cost(node.selection_set, root, set())
+            if cost > max_cost:
+                self.report_error(GraphQLError(
+                    f"Query cost {cost} exceeds the maximum of {max_cost}", node
+                ))
+
+        def _cost(
+            self,
+            selection_set: Optional[SelectionSetNode],
+            parent_type: Optional[GraphQLNamedType],
+            fragments: Set[str],
+        ) -> int:
+            if selection_set is None or not is_object_type(parent_type):
+                return 0
+            total = 0
+            for selection in selection_set.selections:
+                if isinstance(selection, FieldNode):
+                    field = parent_type.fields.get(selection.name.value)
+                    if field is None or _is_introspection(selection):
+                        continue
+                    nested = self._cost(
+                        selection.selection_set, get_named_type(field.type), fragments
+                    )
+                    total += 1 + self._items(selection, field) * nested
+                elif isinstance(selection, InlineFragmentNode):
+                    total += self._cost(
+                        selection.selection_set, self._condition(selection, parent_type), fragments
+                    )
+                elif isinstance(selection, FragmentSpreadNode):
+                    name = selection.name.value
+                    fragment = self.context.get_fragment(name)
+                    if fragment is not None and name not in fragments:
+                        total += self._cost(
+                            fragment.selection_set,
+                            self._condition(fragment, parent_type),
+                            fragments | {name},
+                        )
+            return total
+
+        def _condition(self, fragment: Any, parent_type: GraphQLNamedType) -> Any:
+            if fragment.type_condition is None:
+                return parent_type
+            return self.schema.get_type(fragment.type_condition.name.value)
+
+        @staticmethod
+        def _items(node: FieldNode, field: GraphQLField) -> int:
+            argument = field.args.get(PAGE_ARGUMENT)
+            if argument is None:
+                return 1
+            value = next(
+                (item.value for item in node.arguments or () if item.name.value == PAGE_ARGUMENT),
+                None,
+            )
+            if value is None:
+                items = argument.default_value
+            elif isinstance(value, IntValueNode):
+                items = int(value.value)
+            else:
+                items = max_page_size
+            return min(max(int(items or 1), 1), max_page_size)
+
+    return CostLimitRule
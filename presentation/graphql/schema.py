@@ -0,0 +1,72 @@
+"""GraphQL types over the survey domain models."""
+from __future__ import annotations
+
+from typing import Any, List
+
+import graphene
+from graphql import GraphQLError
+
+DEFAULT_PAGE_SIZE = 20
+
+
+class SurveyAnswer(graphene.ObjectType):
+    answer = graphene.String(required=True)
+    image = graphene.String()
+
+
+class SurveyResultAnswer(graphene.ObjectType):
+    answer = graphene.String(required=True)
+    image = graphene.String()
+    count = graphene.Int(required=True)
+    percent = graphene.Int(required=True)
+    is_current_account_answer = graphene.Boolean(required=True)
+
+
+class SurveyResult(graphene.ObjectType):
+    survey_id = graphene.ID(required=True)
+    question = graphene.String(required=True)
+    date = graphene.DateTime()
+    answers = graphene.List(graphene.NonNull(SurveyResultAnswer), required=True)
+
+
+class Survey(graphene.ObjectType):
+    id = graphene.ID(required=True)
+    question = graphene.String(required=True)
+    answers = graphene.List(graphene.NonNull(SurveyAnswer), required=True)
+    date = graphene.DateTime()
+    did_answer = graphene.Boolean(required=True)
+    my_answer = graphene.String(description="The current account's answer, if it voted.")
+    result = graphene.Field(SurveyResult)
+
+    @staticmethod
+    def resolve_my_answer(survey: Any, info: graphene.ResolveInfo) -> Any:
+        return info.context.account_answers.load(survey.id)
+
+    @staticmethod
+    def resolve_result(survey: Any, info: graphene.ResolveInfo) -> Any:
+        return info.context.survey_results.load(survey.id)
+
+
+class Query(graphene.ObjectType):
+    surveys = graphene.List(
+        graphene.NonNull(Survey),
+        first=graphene.Int(default_value=DEFAULT_PAGE_SIZE),
+        offset=graphene.Int(default_value=0),
+    )
+    survey = graphene.Field(Survey, id=graphene.ID(required=True))
+
+    @staticmethod
+    async def resolve_surveys(root: Any, info: graphene.ResolveInfo, first: int, offset: int) -> List[Any]:
+        context = info.context
+        if not 1 <= first <= context.max_page_size:
+            raise GraphQLError(f"first must be between 1 and {context.max_page_size}")
+        if offset < 0:
+            raise GraphQLError("offset must not be negative")
+        return await context.load_surveys.load_page(context.account_id, first, offset)
+
+    @staticmethod
+    def resolve_survey(root: Any, info: graphene.ResolveInfo, id: str) -> Any:
+        return info.context.surveys.load(id)
+
+
+schema = graphene.Schema(query=Query)
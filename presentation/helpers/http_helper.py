@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from presentation.protocols.http import HttpResponse
 from presentation.errors.server_error import ServerError
@@ -18,10 +18,11 @@ def server_error(error: Optional[Exception] = None) -> HttpResponse:
     )
 
 
-def ok(data: any) -> HttpResponse:
+def ok(data: any, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
     return HttpResponse(
         status_code=200,
-        body=data
+        body=data,
+        headers=headers,
     )
 
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from dataclasses import dataclass
 
 
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 class HttpResponse:
     status_code: int
     body: Any
+    headers: Optional[Dict[str, str]] = None
 
 
 class HttpRequest:
@@ -15,8 +16,11 @@ class HttpRequest:
         headers: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
         account_id: Optional[str] = None,
+        query: Optional[Dict[str, List[str]]] = None,
     ):
         self.body = body or {}
         self.headers = headers or {}
         self.params = params or {}
         self.account_id = account_id
+        # Query string values, every key mapped to all of its values.
+        self.query = query or {}
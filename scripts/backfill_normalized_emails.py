@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Fill ``emailNormalized`` on accounts created before case-insensitive lookups.
+
+Safe to run against a live database and to re-run: see
+``infra.db.mongodb.email_backfill.backfill_normalized_emails``. Conflicting
+accounts (same mailbox, different spelling) are printed and must be merged by
+hand; they keep logging in with their exact email until then.
+
+Usage example:
+    MONGO_URL=... python scripts/backfill_normalized_emails.py --batch-size 500 --pause-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from infra.db.mongodb.email_backfill import backfill_normalized_emails  # noqa: E402
+from infra.db.mongodb.helpers import MongoHelper  # noqa: E402
+from utils.email_validator_adapter import EmailValidatorAdapter  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill accounts.emailNormalized")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause-ms", type=float, default=0.0, help="sleep between batches")
+    parser.add_argument("--dry-run", action="store_true", help="scan without writing")
+    args = parser.parse_args()
+
+    asyncio.run(MongoHelper.connect())
+    try:
+        report = backfill_normalized_emails(
+            EmailValidatorAdapter(),
+            batch_size=args.batch_size,
+            pause_seconds=args.pause_ms / 1000,
+            dry_run=args.dry_run,
+            on_batch=lambda progress: print(
+                f"batch {progress.batches}: scanned {progress.scanned}, "
+                f"updated {progress.updated}, conflicts {len(progress.conflicts)}",
+                file=sys.stderr,
+            ),
+        )
+    finally:
+        asyncio.run(MongoHelper.disconnect())
+
+    print(f"Scanned {report.scanned} accounts, updated {report.updated}")
+    for account_id in report.conflicts:
+        print(f"conflict: account {account_id} shares its normalized email with another account")
+    return 1 if report.conflicts else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Pick password hashing parameters for a target compare time on this machine.
+
+bcrypt doubles its work per cost step, so the script walks costs upwards and
+keeps the highest one whose median compare time stays under the target.
+For argon2id, memory and parallelism are fixed and the time cost is raised
+the same way. Run it on the production hardware and copy the printed
+variables into the environment. Accounts pick up the new parameters the next
+time they log in.
+
+Usage example:
+    python scripts/calibrate_password_hash.py --target-ms 250
+    python scripts/calibrate_password_hash.py --scheme argon2id --memory-mib 64 --target-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from infra.cryptography import Argon2Adapter, BcryptAdapter, BcryptPool  # noqa: E402
+
+_PASSWORD = "Calibrati0n!Passw0rd"
+
+
+def compare_ms(scheme: Any, samples: int) -> float:
+    digest = asyncio.run(scheme.hash(_PASSWORD))
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        asyncio.run(scheme.compare(_PASSWORD, digest))
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def calibrate(
+    candidates: Iterable[Tuple[Any, Callable[[], Any]]],
+    target_ms: float,
+    samples: int,
+) -> Tuple[Any, float] | None:
+    chosen = None
+    for parameters, build in candidates:
+        elapsed = compare_ms(build(), samples)
+        print(f"  {parameters}: {elapsed:.1f} ms", file=sys.stderr)
+        if elapsed > target_ms:
+            break
+        chosen = (parameters, elapsed)
+    return chosen
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Calibrate password hashing cost")
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2id"], default="bcrypt")
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--memory-mib", type=int, default=64, help="argon2id memory cost")
+    parser.add_argument("--parallelism", type=int, default=1, help="argon2id lanes")
+    args = parser.parse_args()
+
+    # A private pool so calibration is not throttled by BCRYPT_MAX_CONCURRENCY.
+    pool = BcryptPool(1)
+    print(f"Calibrating {args.scheme} for a {args.target_ms:g} ms compare", file=sys.stderr)
+    if args.scheme == "bcrypt":
+        chosen = calibrate(
+            ((cost, lambda cost=cost: BcryptAdapter(cost, pool)) for cost in range(4, 32)),
+            args.target_ms,
+            args.samples,
+        )
+        if chosen is None:
+            print("Even cost 4 exceeds the target", file=sys.stderr)
+            return 1
+        print("PASSWORD_HASH_SCHEME=bcrypt")
+        print(f"BCRYPT_SALT={chosen[0]}")
+    else:
+        memory_kib = args.memory_mib * 1024
+        chosen = calibrate(
+            (
+                (t, lambda t=t: Argon2Adapter(t, memory_kib, args.parallelism, pool))
+                for t in range(1, 64)
+            ),
+            args.target_ms,
+            args.samples,
+        )
+        if chosen is None:
+            print("Even time cost 1 exceeds the target; lower --memory-mib", file=sys.stderr)
+            return 1
+        print("PASSWORD_HASH_SCHEME=argon2id")
+        print(f"ARGON2_TIME_COST={chosen[0]}")
+        print(f"ARGON2_MEMORY_COST={memory_kib}")
+        print(f"ARGON2_PARALLELISM={args.parallelism}")
+    print(f"# median compare: {chosen[1]:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
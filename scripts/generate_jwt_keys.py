@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Generate a JWT signing key and add its public half to a JWKS file.
+
+Rotation: generate a key with a new kid, publish the updated JWKS to every
+verifying node, then point JWT_PRIVATE_KEY_FILE / JWT_SIGNING_KID at the new
+key on signing nodes. Remove the old kid once its tokens have expired.
+
+Usage example:
+    python scripts/generate_jwt_keys.py --algorithm EdDSA --kid 2026-10 --out-dir keys
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+
+def generate(algorithm: str):
+    if algorithm == "RS256":
+        private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        return private_key, RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    return private_key, OKPAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate a JWT signing key")
+    parser.add_argument("--algorithm", choices=["RS256", "EdDSA"], default="EdDSA")
+    parser.add_argument("--kid", required=True, help="Key id written to token headers")
+    parser.add_argument("--out-dir", default="keys")
+    parser.add_argument("--jwks", default=None, help="JWKS file to update (default: <out-dir>/jwks.json)")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jwks_path = Path(args.jwks) if args.jwks else out_dir / "jwks.json"
+    jwks = json.loads(jwks_path.read_text()) if jwks_path.exists() else {"keys": []}
+    if any(key.get("kid") == args.kid for key in jwks["keys"]):
+        print(f"kid {args.kid!r} already exists in {jwks_path}", file=sys.stderr)
+        return 1
+
+    private_key, public_jwk = generate(args.algorithm)
+    private_path = out_dir / f"{args.kid}.pem"
+    private_path.write_bytes(private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    private_path.chmod(0o600)
+    jwks["keys"].append({**public_jwk, "kid": args.kid, "alg": args.algorithm, "use": "sig"})
+    jwks_path.write_text(json.dumps(jwks, indent=2) + "\n")
+
+    print(f"JWT_ALGORITHM={args.algorithm}")
+    print(f"JWT_SIGNING_KID={args.kid}")
+    print(f"JWT_PRIVATE_KEY_FILE={private_path}")
+    print(f"JWT_JWKS_FILE={jwks_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
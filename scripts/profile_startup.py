@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Profile application cold start: import tree, create_app and first request.
+
+The probe runs in a fresh interpreter with ``-X importtime`` so nothing is
+already cached in ``sys.modules``.
+
+Usage example:
+    python scripts/profile_startup.py --path /api/surveys --min-ms 2
+    python scripts/profile_startup.py --json > startup.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+from main.config.app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+response = app.test_client().open({path!r}, method={method!r})
+served = time.perf_counter()
+container = app.extensions["container"]
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "first_request_ms": (served - created) * 1000,
+    "time_to_first_request_ms": (served - started) * 1000,
+    "status_code": response.status_code,
+    "components": container.startup_report(),
+}}))
+"""
+
+
+@dataclass
+class ImportNode:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: list[ImportNode] = field(default_factory=list)
+
+    def to_dict(self, min_us: int) -> dict:
+        return {
+            "name": self.name,
+            "self_ms": round(self.self_us / 1000, 3),
+            "cumulative_ms": round(self.cumulative_us / 1000, 3),
+            "children": [
+                child.to_dict(min_us)
+                for child in self.children
+                if child.cumulative_us >= min_us
+            ],
+        }
+
+
+def parse_import_tree(stderr: str) -> list[ImportNode]:
+    """Rebuild the import tree from ``-X importtime`` output (children print first)."""
+    pending: dict[int, list[ImportNode]] = {}
+    for line in stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        depth = (len(indent) - 1) // 2
+        node = ImportNode(name, int(self_us), int(cumulative_us))
+        node.children = pending.pop(depth + 1, [])
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def run_probe(path: str, method: str) -> tuple[dict, list[ImportNode]]:
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT)}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(path=path, method=method)],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    return timings, parse_import_tree(completed.stderr)
+
+
+def _print_tree(nodes: list[ImportNode], min_us: int, depth: int = 0) -> None:
+    for node in sorted(nodes, key=lambda item: item.cumulative_us, reverse=True):
+        if node.cumulative_us < min_us:
+            continue
+        print(
+            f"{node.cumulative_us / 1000:9.1f} ms {node.self_us / 1000:8.1f} ms  "
+            f"{'  ' * depth}{node.name}"
+        )
+        _print_tree(node.children, min_us, depth + 1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Profile application cold start")
+    parser.add_argument("--path", default="/health", help="Path used for the first request")
+    parser.add_argument("--method", default="GET")
+    parser.add_argument(
+        "--min-ms",
+        type=float,
+        default=5.0,
+        help="Hide imports whose cumulative time is below this threshold",
+    )
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    args = parser.parse_args()
+
+    timings, tree = run_probe(args.path, args.method.upper())
+    min_us = int(args.min_ms * 1000)
+    if args.json:
+        print(json.dumps({
+            **timings,
+            "imports": [node.to_dict(min_us) for node in tree if node.cumulative_us >= min_us],
+        }, indent=2))
+        return 0
+
+    print(f"import main.config.app   {timings['import_ms']:9.1f} ms")
+    print(f"create_app()             {timings['create_app_ms']:9.1f} ms")
+    print(
+        f"first {args.method.upper()} {args.path:<13} {timings['first_request_ms']:9.1f} ms"
+        f" (status {timings['status_code']})"
+    )
+    print(f"time to first request    {timings['time_to_first_request_ms']:9.1f} ms")
+    print("\nComponents built (own time):")
+    for component in timings["components"]:
+        print(f"{component['ms']:9.1f} ms  {component['component']} ({component['scope']})")
+    print("\nImport tree (cumulative, self):")
+    _print_tree(tree, min_us)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
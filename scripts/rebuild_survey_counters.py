@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Recompute the sharded survey counters from the stored votes.
+
+Run once before setting ``SURVEY_COUNTER_SHARDS_ENABLED=1`` on a database
+that already has votes, or to repair counters that drifted. Pause voting
+while it runs: see
+``infra.db.mongodb.sharded_survey_result_repository.rebuild_survey_counters``.
+
+Usage example:
+    MONGO_URL=... python scripts/rebuild_survey_counters.py --batch-size 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from infra.db.mongodb.helpers import MongoHelper  # noqa: E402
+from infra.db.mongodb.sharded_survey_result_repository import (  # noqa: E402
+    rebuild_survey_counters,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild surveyResultCounters from surveyResults")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(MongoHelper.connect())
+    try:
+        written = rebuild_survey_counters(batch_size=args.batch_size)
+    finally:
+        asyncio.run(MongoHelper.disconnect())
+
+    print(f"Wrote {written} counters")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,50 @@
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.load_test import SCENARIOS, BenchmarkConfig, percentile, run
+from infra.db.mongodb.helpers import MongoHelper
+from main.config.env import jwt_secret
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [float(value) for value in range(1, 101)]
+
+    assert percentile(samples, 0.50) == 50.0
+    assert percentile(samples, 0.95) == 95.0
+    assert percentile(samples, 0.99) == 99.0
+    assert percentile([], 0.99) == 0.0
+
+
+@pytest.mark.slow
+def test_load_test_drives_every_scenario_against_mongomock(monkeypatch):
+    # run() configures the process environment; monkeypatch restores it afterwards.
+    monkeypatch.setenv("ENV", "test")
+    monkeypatch.setenv("JWT_SECRET", "test-secret-that-is-long-enough-for-hs256")
+    monkeypatch.setenv("BCRYPT_SALT", "4")
+    monkeypatch.setenv("AUTH_RATE_LIMIT_MAX_REQUESTS", "5")
+    monkeypatch.setenv("MONGO_DB_NAME", "flask_tdd_test")
+    monkeypatch.setattr(MongoHelper, "_client", None)
+    jwt_secret.cache_clear()
+
+    report = run(BenchmarkConfig(concurrency=2, requests=4, surveys=2, bcrypt_rounds=4))
+    jwt_secret.cache_clear()
+
+    assert set(report["scenarios"]) == set(SCENARIOS)
+    for summary in report["scenarios"].values():
+        assert summary["requests"] == 4
+        assert summary["errors"] == 0
+        assert summary["queries_per_request"] > 0
+        assert summary["latency_ms"]["p99"] >= summary["latency_ms"]["p50"]
+
+
+def test_compare_flags_latency_and_query_regressions():
+    def report(p95, rps, queries):
+        return {"meta": {}, "scenarios": {"login": {
+            "rps": rps,
+            "latency_ms": {"p50": 1.0, "p95": p95, "p99": p95},
+            "queries_per_request": queries,
+        }}}
+
+    assert not compare(report(10, 100, 2), report(10.5, 99, 2), 10)[0]["regression"]
+    assert compare(report(10, 100, 2), report(12, 100, 2), 10)[0]["regression"]
+    assert compare(report(10, 100, 2), report(10, 100, 3), 10)[0]["regression"]
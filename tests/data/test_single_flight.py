@@ -0,0 +1,212 @@
+import asyncio
+import copy
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from data.usecases import (
+    SingleFlight,
+    SingleFlightLoadSurveyResult,
+    SingleFlightLoadSurveys,
+    SingleFlightLoadSurveysView,
+)
+from domain.models.survey import SurveyAnswerModel, SurveyModel
+from domain.models.survey_result import SurveyResultAnswerModel, SurveyResultModel
+
+
+class LoadSurveyResultSpy:
+    def __init__(self, release=None):
+        self.calls = []
+        self.release = release
+
+    async def load(self, survey_id, account_id):
+        self.calls.append((survey_id, account_id))
+        if self.release is not None:
+            await asyncio.to_thread(self.release.wait, 5)
+        await asyncio.sleep(0)
+        return SurveyResultModel(
+            survey_id=survey_id,
+            question="Favourite language?",
+            date=datetime(2026, 1, 2),
+            answers=[
+                SurveyResultAnswerModel("Python", 2, 67),
+                SurveyResultAnswerModel("Go", 1, 33),
+            ],
+        )
+
+
+class LoadAccountAnswersStub:
+    def __init__(self, answers):
+        self.answers = answers
+
+    async def load(self, account_id, survey_ids):
+        return {
+            survey_id: answer
+            for survey_id, answer in self.answers.get(account_id, {}).items()
+            if survey_id in survey_ids
+        }
+
+
+class LoadSurveysStub:
+    def __init__(self, surveys):
+        self.surveys = surveys
+        self.calls = []
+
+    async def load(self, account_id):
+        self.calls.append(account_id)
+        await asyncio.sleep(0)
+        return self.surveys
+
+    async def load_page(self, account_id, first, offset):
+        self.calls.append((account_id, first, offset))
+        await asyncio.sleep(0)
+        return self.surveys[offset:offset + first]
+
+
+def current_answers(result):
+    return [answer.answer for answer in result.answers if answer.is_current_account_answer]
+
+
+def test_concurrent_loads_of_one_survey_share_a_single_tally():
+    load_survey_result = LoadSurveyResultSpy()
+    sut = SingleFlightLoadSurveyResult(load_survey_result, LoadAccountAnswersStub({
+        "ada": {"survey": "Python"},
+        "bob": {"survey": "Go"},
+    }))
+
+    async def load_all():
+        return await asyncio.gather(
+            sut.load("survey", "ada"), sut.load("survey", "bob"), sut.load("survey", "eve"),
+        )
+
+    ada, bob, eve = asyncio.run(load_all())
+
+    assert load_survey_result.calls == [("survey", "")]
+    assert (current_answers(ada), current_answers(bob), current_answers(eve)) == (
+        ["Python"], ["Go"], [],
+    )
+    assert [answer.count for answer in ada.answers] == [2, 1]
+
+
+def test_callers_on_other_threads_wait_for_the_call_in_flight():
+    release = threading.Event()
+    load_survey_result = LoadSurveyResultSpy(release)
+    sut = SingleFlightLoadSurveyResult(
+        load_survey_result, LoadAccountAnswersStub({"ada": {"survey": "Go"}})
+    )
+    results = {}
+
+    def request(account_id):
+        results[account_id] = asyncio.run(sut.load("survey", account_id))
+
+    leader = threading.Thread(target=request, args=("leader",))
+    leader.start()
+    deadline = time.monotonic() + 5
+    while not load_survey_result.calls and time.monotonic() < deadline:
+        time.sleep(0.001)
+    followers = [threading.Thread(target=request, args=(name,)) for name in ("ada", "bob")]
+    for follower in followers:
+        follower.start()
+    flight = sut.single_flight._calls[("load_survey_result", "survey")]
+    while len(flight._done_callbacks) < 2 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert load_survey_result.calls == [("survey", "")]
+    assert current_answers(results["ada"]) == ["Go"]
+    assert current_answers(results["bob"]) == []
+
+
+def test_a_failed_call_reaches_every_waiter_and_is_not_remembered():
+    single_flight = SingleFlight()
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0)
+        raise RuntimeError("database down")
+
+    async def call_twice_at_once():
+        return await asyncio.gather(
+            single_flight.do("key", failing), single_flight.do("key", failing),
+            return_exceptions=True,
+        )
+
+    errors = asyncio.run(call_twice_at_once())
+    with pytest.raises(RuntimeError):
+        asyncio.run(single_flight.do("key", failing))
+
+    assert [str(error) for error in errors] == ["database down", "database down"]
+    assert len(attempts) == 2
+    assert single_flight._calls == {}
+
+
+def test_different_surveys_are_loaded_separately():
+    load_survey_result = LoadSurveyResultSpy()
+    sut = SingleFlightLoadSurveyResult(load_survey_result, LoadAccountAnswersStub({}))
+
+    async def load_both():
+        return await asyncio.gather(sut.load("first", "ada"), sut.load("second", "ada"))
+
+    asyncio.run(load_both())
+
+    assert sorted(load_survey_result.calls) == [("first", ""), ("second", "")]
+
+
+def _view_with_flag(view, did_answer):
+    return {**view, "flag": did_answer}
+
+
+@pytest.mark.parametrize("surveys, make_sut, did_answer", [
+    (
+        [
+            {"id": "a", "question": "A?", "flag": False},
+            {"id": "b", "question": "B?", "flag": False},
+        ],
+        lambda load_surveys, load_account_answers: SingleFlightLoadSurveysView(
+            load_surveys, load_account_answers, lambda view: view["id"], _view_with_flag
+        ),
+        lambda survey: survey["flag"],
+    ),
+    (
+        [SurveyModel("a", "A?", [SurveyAnswerModel("yes")]), SurveyModel("b", "B?", [])],
+        SingleFlightLoadSurveys,
+        lambda survey: survey.did_answer,
+    ),
+])
+def test_survey_lists_are_shared_and_marked_per_account(surveys, make_sut, did_answer):
+    shared = copy.deepcopy(surveys)
+    load_surveys = LoadSurveysStub(surveys)
+    sut = make_sut(load_surveys, LoadAccountAnswersStub({"ada": {"b": "no"}}))
+
+    async def load_all():
+        return await asyncio.gather(sut.load("ada"), sut.load("bob"))
+
+    ada, bob = asyncio.run(load_all())
+
+    assert load_surveys.calls == [""]
+    assert [did_answer(survey) for survey in ada] == [False, True]
+    assert [did_answer(survey) for survey in bob] == [False, False]
+    assert surveys == shared
+
+
+def test_survey_pages_are_shared_per_page():
+    surveys = [SurveyModel(id, f"{id}?", []) for id in "abc"]
+    load_surveys = LoadSurveysStub(surveys)
+    sut = SingleFlightLoadSurveys(load_surveys, LoadAccountAnswersStub({"ada": {"c": "no"}}))
+
+    async def load_pages():
+        return await asyncio.gather(
+            sut.load_page("ada", 2, 1), sut.load_page("bob", 2, 1), sut.load_page("ada", 1, 0)
+        )
+
+    ada, bob, first = asyncio.run(load_pages())
+
+    assert sorted(load_surveys.calls) == [("", 1, 0), ("", 2, 1)]
+    assert [(survey.id, survey.did_answer) for survey in ada] == [("b", False), ("c", True)]
+    assert [survey.did_answer for survey in bob] == [False, False]
+    assert [survey.id for survey in first] == ["a"]
@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from data.usecases import StaleWhileRevalidateSurveyResult
+from domain.models.survey_result import SurveyResultAnswerModel, SurveyResultModel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class LoadSurveyResultSpy:
+    """Each load returns one more vote for Python than the previous one."""
+
+    def __init__(self):
+        self.calls = []
+        self.error = None
+
+    async def load(self, survey_id, account_id):
+        self.calls.append((survey_id, account_id))
+        if self.error is not None:
+            raise self.error
+        return SurveyResultModel(
+            survey_id=survey_id,
+            question="Favourite language?",
+            answers=[
+                SurveyResultAnswerModel("Python", len(self.calls), 100),
+                SurveyResultAnswerModel("Go", 0, 0),
+            ],
+        )
+
+
+class LoadAccountAnswersStub:
+    async def load(self, account_id, survey_ids):
+        return {survey_id: "Go" for survey_id in survey_ids} if account_id == "ada" else {}
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class ManualExecutor:
+    """Hold submitted refreshes until ``run`` so tests decide when they finish."""
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn, *args):
+        self.tasks.append((fn, args))
+
+    def run(self):
+        tasks, self.tasks = self.tasks, []
+        for fn, args in tasks:
+            fn(*args)
+
+
+@pytest.fixture
+def executor():
+    return ManualExecutor()
+
+
+@pytest.fixture
+def inner():
+    return LoadSurveyResultSpy()
+
+
+@pytest.fixture
+def sut(inner, clock, executor):
+    return StaleWhileRevalidateSurveyResult(
+        inner, LoadAccountAnswersStub(), fresh_seconds=2, max_stale_seconds=10,
+        max_entries=2, executor=executor, clock=clock,
+    )
+
+
+def load(sut, survey_id="survey", account_id="bob"):
+    return asyncio.run(sut.load_with_freshness(survey_id, account_id))
+
+
+def python_votes(result):
+    return result.answers[0].count
+
+
+def test_fresh_results_are_served_from_the_cache_for_every_account(sut, inner, clock):
+    first, first_freshness = load(sut)
+    clock.now += 1.5
+    cached, freshness = load(sut, account_id="ada")
+
+    assert inner.calls == [("survey", "")]
+    assert (first_freshness.hit, freshness.hit, freshness.age_seconds) == (False, True, 1.5)
+    assert python_votes(cached) == python_votes(first) == 1
+    assert [answer.is_current_account_answer for answer in cached.answers] == [False, True]
+    assert not any(answer.is_current_account_answer for answer in first.answers)
+
+
+def test_stale_results_are_served_while_one_background_refresh_runs(
+    sut, inner, clock, executor
+):
+    load(sut)
+    clock.now += 5
+
+    stale = [load(sut) for _ in range(3)]
+    assert len(executor.tasks) == 1
+    executor.run()
+    refreshed, freshness = load(sut)
+
+    assert [python_votes(result) for result, _ in stale] == [1, 1, 1]
+    assert all(freshness.hit and freshness.age_seconds == 5 for _, freshness in stale)
+    assert len(inner.calls) == 2
+    assert (python_votes(refreshed), freshness.hit, freshness.age_seconds) == (2, True, 0)
+    assert sut.cache_info()[:5] == (4, 3, 1, 1, 0)
+
+
+def test_results_older_than_the_staleness_cap_are_never_served(sut, inner, clock):
+    load(sut)
+    clock.now += 10.5
+
+    result, freshness = load(sut)
+
+    assert (python_votes(result), freshness.hit, freshness.age_seconds) == (2, False, 0)
+    assert sut.cache_info().misses == 2
+
+
+def test_a_failed_refresh_keeps_the_stale_result(sut, inner, clock, executor):
+    load(sut)
+    clock.now += 5
+    inner.error = RuntimeError("database down")
+
+    load(sut)
+    executor.run()
+    assert sut.cache_info().refresh_failures == 1
+
+    # Still stale, so this hit starts another refresh, which fails as well.
+    result, freshness = load(sut)
+    executor.run()
+
+    assert (python_votes(result), freshness.hit) == (1, True)
+    assert sut.cache_info().refresh_failures == 2
+    clock.now += 6
+    with pytest.raises(RuntimeError):
+        load(sut)
+
+
+def test_least_recently_used_surveys_are_evicted(sut, inner):
+    load(sut, "first")
+    load(sut, "second")
+    load(sut, "first")
+    load(sut, "third")
+
+    load(sut, "first")
+    load(sut, "second")
+
+    assert [survey_id for survey_id, _ in inner.calls] == [
+        "first", "second", "third", "second",
+    ]
+    assert sut.cache_info().currsize == 2
+
+
+def test_staleness_cap_cannot_be_shorter_than_the_freshness_window(inner):
+    with pytest.raises(ValueError):
+        StaleWhileRevalidateSurveyResult(
+            inner, LoadAccountAnswersStub(), fresh_seconds=10, max_stale_seconds=5
+        )
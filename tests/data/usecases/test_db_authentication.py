@@ -43,10 +43,14 @@ class EncrypterStub:
 class UpdateAccessTokenRepositorySpy:
     account_id: str | None = None
     token: str | None = None
+    role: str | None = None
 
-    async def update_access_token(self, account_id: str, token: str) -> None:
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
         self.account_id = account_id
         self.token = token
+        self.role = role
 
 
 def make_sut(is_valid_password: bool = True):
@@ -100,3 +104,161 @@ def test_authentication_returns_none_for_invalid_password():
     assert authentication is None
     assert update_access_token_repository.account_id is None
     assert update_access_token_repository.token is None
+
+
+class ClaimsEncrypterSpy:
+    def __init__(self):
+        self.calls = []
+
+    async def encrypt(self, value: str, claims=None) -> str:
+        self.calls.append((value, claims))
+        return "generated_token"
+
+
+def test_authentication_embeds_role_and_token_version_when_requested():
+    account = AccountModel(id="account_id", name="Admin", email="a@mail.com", password="hash")
+    account.role = "admin"
+    account.token_version = 3
+    load_account_by_email_repository = LoadAccountByEmailRepositoryStub()
+
+    async def load_by_email(email):
+        return account
+
+    load_account_by_email_repository.load_by_email = load_by_email
+    encrypter = ClaimsEncrypterSpy()
+    update_access_token_repository = UpdateAccessTokenRepositorySpy()
+    sut = DbAuthentication(
+        load_account_by_email_repository,
+        HashComparerStub(),
+        encrypter,
+        update_access_token_repository,
+        include_claims=True,
+    )
+
+    asyncio.run(sut.auth(AuthenticationParams("a@mail.com", "password")))
+
+    assert encrypter.calls == [("account_id", {"role": "admin", "ver": 3})]
+    assert update_access_token_repository.role == "admin"
+
+
+class RefreshAccessTokenStub:
+    def __init__(self):
+        self.accounts = []
+
+    async def issue(self, account, family=None):
+        self.accounts.append(account)
+        return "refresh_token"
+
+    async def refresh(self, refresh_token):
+        return None
+
+
+def test_auth_also_issues_refresh_token_when_configured():
+    refresh_access_token = RefreshAccessTokenStub()
+    sut = DbAuthentication(
+        LoadAccountByEmailRepositoryStub(),
+        HashComparerStub(),
+        EncrypterStub(),
+        UpdateAccessTokenRepositorySpy(),
+        refresh_access_token=refresh_access_token,
+    )
+
+    result = asyncio.run(sut.auth(AuthenticationParams(
+        email="valid_email@mail.com",
+        password="any_password",
+    )))
+
+    assert result.access_token == "generated_token"
+    assert result.refresh_token == "refresh_token"
+    assert [account.id for account in refresh_access_token.accounts] == ["account_id"]
+
+
+class RehasherStub:
+    def __init__(self, needs_rehash: bool = True, error: Exception | None = None):
+        self._needs_rehash = needs_rehash
+        self.error = error
+        self.hashed = []
+
+    async def needs_rehash(self, digest: str) -> bool:
+        if self.error:
+            raise self.error
+        return self._needs_rehash
+
+    async def hash(self, value: str) -> str:
+        self.hashed.append(value)
+        return "upgraded_hash"
+
+
+class UpdatePasswordRepositorySpy:
+    def __init__(self):
+        self.calls = []
+
+    async def update_password(self, account_id: str, password: str) -> None:
+        self.calls.append((account_id, password))
+
+
+def _auth_with_rehasher(rehasher, is_valid_password=True):
+    update_password_repository = UpdatePasswordRepositorySpy()
+    sut = DbAuthentication(
+        LoadAccountByEmailRepositoryStub(),
+        HashComparerStub(is_valid_password),
+        EncrypterStub(),
+        UpdateAccessTokenRepositorySpy(),
+        rehasher=rehasher,
+        update_password_repository=update_password_repository,
+    )
+    result = asyncio.run(sut.auth(AuthenticationParams(
+        email="valid_email@mail.com",
+        password="any_password",
+    )))
+    return result, update_password_repository
+
+
+def test_auth_upgrades_outdated_password_hash():
+    rehasher = RehasherStub(needs_rehash=True)
+
+    result, update_password_repository = _auth_with_rehasher(rehasher)
+
+    assert result.access_token == "generated_token"
+    assert rehasher.hashed == ["any_password"]
+    assert update_password_repository.calls == [("account_id", "upgraded_hash")]
+
+
+def test_auth_keeps_current_password_hash():
+    rehasher = RehasherStub(needs_rehash=False)
+
+    _, update_password_repository = _auth_with_rehasher(rehasher)
+
+    assert rehasher.hashed == []
+    assert update_password_repository.calls == []
+
+
+def test_auth_never_rehashes_after_a_wrong_password():
+    rehasher = RehasherStub(needs_rehash=True)
+
+    result, update_password_repository = _auth_with_rehasher(rehasher, is_valid_password=False)
+
+    assert result is None
+    assert update_password_repository.calls == []
+
+
+def test_auth_succeeds_when_the_hash_upgrade_fails():
+    result, update_password_repository = _auth_with_rehasher(
+        RehasherStub(error=RuntimeError("database unavailable"))
+    )
+
+    assert result.access_token == "generated_token"
+    assert update_password_repository.calls == []
+
+
+def test_auth_account_issues_tokens_without_loading_or_comparing():
+    sut, hash_comparer, encrypter, update_spy = make_sut()
+    account = AccountModel(id="new_id", name="New User", email="new@mail.com")
+
+    result = asyncio.run(sut.auth_account(account))
+
+    assert result.access_token == "generated_token"
+    assert result.name == "New User"
+    assert hash_comparer.calls == []
+    assert encrypter.calls == ["new_id"]
+    assert update_spy.account_id == "new_id"
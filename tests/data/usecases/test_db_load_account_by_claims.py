@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from data.usecases import DbLoadAccountByClaims, TokenRevocationList
+
+
+class ClaimsDecrypterStub:
+    def __init__(self, claims):
+        self.claims = claims
+
+    async def decrypt_claims(self, value: str):
+        return self.claims
+
+
+class LoadTokenRevocationsRepositoryStub:
+    def __init__(self, revocations=None):
+        self.revocations = revocations or {}
+        self.calls = 0
+
+    async def load_revocations(self):
+        self.calls += 1
+        if isinstance(self.revocations, Exception):
+            raise self.revocations
+        return dict(self.revocations)
+
+
+def make_sut(claims, revocations=None):
+    repository = LoadTokenRevocationsRepositoryStub(revocations)
+    sut = DbLoadAccountByClaims(ClaimsDecrypterStub(claims), TokenRevocationList(repository))
+    return sut, repository
+
+
+def test_loads_account_from_claims_without_touching_accounts():
+    sut, _ = make_sut({"id": "account_id", "role": "admin", "ver": 2})
+
+    account = asyncio.run(sut.load("token", "admin"))
+
+    assert account.id == "account_id"
+    assert account.role == "admin"
+    assert account.token_version == 2
+
+
+@pytest.mark.parametrize(
+    ("claims", "role"),
+    [
+        (None, None),
+        ({"id": "account_id"}, None),
+        ({"id": "account_id", "ver": 0}, "admin"),
+        ({"id": "account_id", "role": "user", "ver": 0}, "admin"),
+    ],
+)
+def test_rejects_invalid_unversioned_or_underprivileged_tokens(claims, role):
+    sut, _ = make_sut(claims)
+
+    assert asyncio.run(sut.load("token", role)) is None
+
+
+def test_admin_tokens_pass_user_routes():
+    sut, _ = make_sut({"id": "account_id", "role": "admin", "ver": 0})
+
+    assert asyncio.run(sut.load("token")).id == "account_id"
+
+
+def test_rejects_tokens_older_than_the_revoked_version():
+    sut, _ = make_sut({"id": "account_id", "ver": 1}, revocations={"account_id": 2})
+
+    assert asyncio.run(sut.load("token")) is None
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_revocation_list_is_reloaded_only_after_the_refresh_interval():
+    repository = LoadTokenRevocationsRepositoryStub({"account_id": 1})
+    clock = Clock()
+    sut = TokenRevocationList(repository, refresh_seconds=30, clock=clock)
+
+    assert asyncio.run(sut.is_revoked("account_id", 0)) is True
+    repository.revocations = {}
+    assert asyncio.run(sut.is_revoked("account_id", 0)) is True
+    assert repository.calls == 1
+
+    clock.now = 31
+    assert asyncio.run(sut.is_revoked("account_id", 0)) is False
+    assert repository.calls == 2
+
+
+def test_revocation_list_keeps_the_previous_copy_when_a_refresh_fails():
+    repository = LoadTokenRevocationsRepositoryStub({"account_id": 1})
+    clock = Clock()
+    sut = TokenRevocationList(repository, refresh_seconds=30, clock=clock)
+    asyncio.run(sut.is_revoked("account_id", 0))
+
+    repository.revocations = RuntimeError("database down")
+    clock.now = 31
+
+    assert asyncio.run(sut.is_revoked("account_id", 0)) is True
+
+
+def test_revocation_list_raises_when_the_first_load_fails():
+    sut = TokenRevocationList(LoadTokenRevocationsRepositoryStub(RuntimeError("down")))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(sut.is_revoked("account_id", 0))
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+from data.usecases.refresh_access_token import DbRefreshAccessToken, hash_refresh_token
+from domain.models.account import AccountModel
+from domain.models.refresh_token import RefreshTokenModel
+
+
+class RefreshTokenRepositoryFake:
+    def __init__(self):
+        self.tokens: dict[str, dict] = {}
+        self.revoked_families = []
+
+    async def add_refresh_token(self, token_hash, refresh_token, expires_at):
+        self.tokens[token_hash] = {"model": refresh_token, "expires_at": expires_at}
+
+    async def consume_refresh_token(self, token_hash):
+        stored = self.tokens.get(token_hash)
+        if stored is None:
+            return None
+        model = stored["model"]
+        stored["model"] = RefreshTokenModel(
+            model.account_id, model.family, model.token_version, used=True
+        )
+        return model
+
+    async def revoke_refresh_token_family(self, family):
+        self.revoked_families.append(family)
+        self.tokens = {
+            token_hash: stored
+            for token_hash, stored in self.tokens.items()
+            if stored["model"].family != family
+        }
+
+
+class LoadAccountByIdRepositoryStub:
+    def __init__(self, token_version: int = 0):
+        self.token_version = token_version
+
+    async def load_by_id(self, account_id: str):
+        if account_id != "account_id":
+            return None
+        account = AccountModel(id=account_id, name="Valid User", email="any@mail.com")
+        account.role = "admin"
+        account.token_version = self.token_version
+        return account
+
+
+class EncrypterStub:
+    def __init__(self):
+        self.calls = []
+
+    async def encrypt(self, value: str, claims: dict | None = None) -> str:
+        self.calls.append((value, claims))
+        return f"access_token_{len(self.calls)}"
+
+
+class UpdateAccessTokenRepositorySpy:
+    def __init__(self):
+        self.calls = []
+
+    async def update_access_token(
+        self, account_id: str, token: str, role: str | None = None
+    ) -> None:
+        self.calls.append((account_id, token))
+
+
+def make_sut(token_version: int = 0, include_claims: bool = False):
+    repository = RefreshTokenRepositoryFake()
+    accounts = LoadAccountByIdRepositoryStub(token_version)
+    encrypter = EncrypterStub()
+    update_spy = UpdateAccessTokenRepositorySpy()
+    sut = DbRefreshAccessToken(
+        repository,
+        repository,
+        repository,
+        accounts,
+        encrypter,
+        update_spy,
+        expires_in_seconds=60,
+        include_claims=include_claims,
+    )
+    return sut, repository, accounts, encrypter, update_spy
+
+
+def _account():
+    account = AccountModel(id="account_id", name="Valid User", email="any@mail.com")
+    account.token_version = 0
+    return account
+
+
+def test_issue_stores_only_the_token_hash_with_an_expiry():
+    sut, repository, _, _, _ = make_sut()
+
+    refresh_token = asyncio.run(sut.issue(_account()))
+
+    assert refresh_token not in repository.tokens
+    stored = repository.tokens[hash_refresh_token(refresh_token)]
+    assert stored["model"].account_id == "account_id"
+    assert stored["expires_at"] > datetime.now(timezone.utc)
+
+
+def test_refresh_returns_new_access_token_and_rotates_refresh_token():
+    sut, repository, _, encrypter, update_spy = make_sut(include_claims=True)
+    refresh_token = asyncio.run(sut.issue(_account()))
+
+    result = asyncio.run(sut.refresh(refresh_token))
+
+    assert result.access_token == "access_token_1"
+    assert result.name == "Valid User"
+    assert result.refresh_token != refresh_token
+    assert encrypter.calls == [("account_id", {"role": "admin", "ver": 0})]
+    assert update_spy.calls == [("account_id", "access_token_1")]
+    families = {stored["model"].family for stored in repository.tokens.values()}
+    assert len(families) == 1
+
+
+def test_refresh_rejects_unknown_token():
+    sut, _, _, encrypter, _ = make_sut()
+
+    assert asyncio.run(sut.refresh("unknown")) is None
+    assert encrypter.calls == []
+
+
+def test_reusing_a_rotated_token_revokes_the_whole_family():
+    sut, repository, _, _, _ = make_sut()
+    first = asyncio.run(sut.issue(_account()))
+    second = asyncio.run(sut.refresh(first)).refresh_token
+
+    assert asyncio.run(sut.refresh(first)) is None
+    assert len(repository.revoked_families) == 1
+    assert asyncio.run(sut.refresh(second)) is None
+
+
+def test_refresh_rejects_tokens_issued_before_account_revocation():
+    sut, _, _, encrypter, _ = make_sut(token_version=1)
+    refresh_token = asyncio.run(sut.issue(_account()))
+
+    assert asyncio.run(sut.refresh(refresh_token)) is None
+    assert encrypter.calls == []
@@ -1,7 +1,7 @@
 import unittest
 import asyncio
 from unittest.mock import patch, MagicMock
-from infra.cryptography.bcrypt_adapter import BcryptAdapter
+from infra.cryptography.bcrypt_adapter import BcryptAdapter, BcryptPool
 
 
 def make_sut(salt: int = 12) -> BcryptAdapter:
@@ -94,6 +94,44 @@ class TestBcryptAdapter(unittest.TestCase):
             
 
 
+class TestBcryptPool(unittest.TestCase):
+    def test_should_account_for_every_operation(self):
+        pool = BcryptPool(max_workers=1)
+        sut = BcryptAdapter(12, pool=pool)
+
+        with patch('infra.cryptography.bcrypt_adapter.bcrypt.checkpw', return_value=True):
+            asyncio.run(sut.compare('any_value', 'hash'))
+            asyncio.run(sut.compare('any_value', 'hash'))
+
+        stats = pool.stats()
+        self.assertEqual(stats['operations'], 2)
+        self.assertEqual(stats['active'], 0)
+        self.assertEqual(stats['waiting'], 0)
+
+    def test_should_release_the_slot_when_bcrypt_throws(self):
+        pool = BcryptPool(max_workers=1)
+        sut = BcryptAdapter(12, pool=pool)
+
+        with patch('infra.cryptography.bcrypt_adapter.bcrypt.checkpw', side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                asyncio.run(sut.compare('any_value', 'hash'))
+
+        with patch('infra.cryptography.bcrypt_adapter.bcrypt.checkpw', return_value=True):
+            self.assertTrue(asyncio.run(sut.compare('any_value', 'hash')))
+
+
+class TestBcryptRehash(unittest.TestCase):
+    def test_should_need_rehash_only_when_cost_differs(self):
+        sut = BcryptAdapter(12)
+
+        self.assertFalse(asyncio.run(sut.needs_rehash('$2b$12$' + 'a' * 53)))
+        self.assertTrue(asyncio.run(sut.needs_rehash('$2b$10$' + 'a' * 53)))
+        self.assertTrue(asyncio.run(sut.needs_rehash('not-a-bcrypt-digest')))
+
+    def test_should_identify_bcrypt_digests(self):
+        self.assertTrue(BcryptAdapter.identifies('$2b$12$' + 'a' * 53))
+        self.assertFalse(BcryptAdapter.identifies('$argon2id$v=19$m=65536,t=3,p=1$abc$def'))
+
+
 if __name__ == '__main__':
     unittest.main()
-
@@ -54,3 +54,15 @@ def test_jwt_adapter_rejects_expired_tokens():
     )
 
     assert asyncio.run(sut.decrypt(token)) is None
+
+
+def test_jwt_adapter_embeds_extra_claims_without_overriding_registered_ones():
+    sut = JwtAdapter("secret", issuer="issuer", audience="audience")
+
+    token = asyncio.run(sut.encrypt("account_id", {"role": "admin", "ver": 2, "id": "other"}))
+    claims = asyncio.run(sut.decrypt_claims(token))
+
+    assert claims["id"] == "account_id"
+    assert claims["role"] == "admin"
+    assert claims["ver"] == 2
+    assert asyncio.run(sut.decrypt(token)) == "account_id"
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import os
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from jwt.algorithms import OKPAlgorithm, RSAAlgorithm
+
+from infra.cryptography.jwt_adapter import JwtAdapter
+from infra.cryptography.jwt_key_ring import JwtKeyRing, key_ring_from_env, token_kid
+
+
+def _private_pem(algorithm):
+    if algorithm == "RS256":
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    else:
+        key = ed25519.Ed25519PrivateKey.generate()
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _public_jwk(ring, kid, algorithm):
+    converter = RSAAlgorithm if algorithm == "RS256" else OKPAlgorithm
+    jwk = converter.to_jwk(ring.signing_key.public_key(), as_dict=True)
+    return {**jwk, "kid": kid, "alg": algorithm}
+
+
+def _write_jwks(path, keys):
+    path.write_text(json.dumps({"keys": keys}))
+    # Bump mtime explicitly; coarse filesystem clocks may not see the rewrite.
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+
+
+def _adapter(ring):
+    return JwtAdapter("", issuer="issuer", audience="audience", key_ring=ring)
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "EdDSA"])
+def test_key_ring_signs_with_kid_header_and_verifies(algorithm):
+    sut = _adapter(JwtKeyRing.from_pem(_private_pem(algorithm), "key-1", algorithm))
+
+    token = asyncio.run(sut.encrypt("account_id", {"role": "admin"}))
+
+    assert jwt.get_unverified_header(token) == {"alg": algorithm, "kid": "key-1", "typ": "JWT"}
+    assert token_kid(token) == "key-1"
+    claims = asyncio.run(sut.decrypt_claims(token))
+    assert claims["id"] == "account_id"
+    assert claims["role"] == "admin"
+
+
+def test_key_ring_rejects_unknown_kid_and_foreign_keys():
+    sut = _adapter(JwtKeyRing.from_pem(_private_pem("EdDSA"), "key-1", "EdDSA"))
+    other = _adapter(JwtKeyRing.from_pem(_private_pem("EdDSA"), "key-2", "EdDSA"))
+    impostor = _adapter(JwtKeyRing.from_pem(_private_pem("EdDSA"), "key-1", "EdDSA"))
+
+    assert asyncio.run(sut.decrypt(asyncio.run(other.encrypt("account_id")))) is None
+    assert asyncio.run(sut.decrypt(asyncio.run(impostor.encrypt("account_id")))) is None
+    assert asyncio.run(sut.decrypt("not-a-token")) is None
+
+
+def test_key_ring_pins_algorithm_per_kid():
+    ring = JwtKeyRing.from_pem(_private_pem("RS256"), "key-1", "RS256")
+    forged = jwt.encode(
+        {"id": "account_id", "iss": "issuer", "aud": "audience", "iat": 0, "exp": 2**31},
+        "a-guessable-shared-secret-value!",
+        algorithm="HS256",
+        headers={"kid": "key-1"},
+    )
+
+    assert asyncio.run(_adapter(ring).decrypt(forged)) is None
+
+
+def test_verify_only_ring_checks_tokens_but_cannot_sign(tmp_path):
+    signer_ring = JwtKeyRing.from_pem(_private_pem("RS256"), "key-1", "RS256")
+    jwks_path = tmp_path / "jwks.json"
+    _write_jwks(jwks_path, [_public_jwk(signer_ring, "key-1", "RS256")])
+    verifier = _adapter(JwtKeyRing(str(jwks_path), signing_algorithm="RS256"))
+
+    token = asyncio.run(_adapter(signer_ring).encrypt("account_id"))
+
+    assert asyncio.run(verifier.decrypt(token)) == "account_id"
+    with pytest.raises(RuntimeError):
+        asyncio.run(verifier.encrypt("account_id"))
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "EdDSA"])
+def test_signing_ring_without_jwks_file_publishes_its_own_key(tmp_path, algorithm):
+    signer_ring = JwtKeyRing.from_pem(_private_pem(algorithm), "key-1", algorithm)
+    jwks_path = tmp_path / "jwks.json"
+    _write_jwks(jwks_path, signer_ring.public_jwks()["keys"])
+    verifier = _adapter(JwtKeyRing(str(jwks_path), signing_algorithm=algorithm))
+
+    token = asyncio.run(_adapter(signer_ring).encrypt("account_id"))
+
+    (jwk,) = signer_ring.public_jwks()["keys"]
+    assert (jwk["kid"], jwk["alg"], jwk["use"]) == ("key-1", algorithm, "sig")
+    assert asyncio.run(verifier.decrypt(token)) == "account_id"
+
+
+def test_rotation_keeps_old_kid_valid_and_reloads_changed_jwks(tmp_path):
+    old_ring = JwtKeyRing.from_pem(_private_pem("EdDSA"), "old", "EdDSA")
+    new_ring = JwtKeyRing.from_pem(_private_pem("EdDSA"), "new", "EdDSA")
+    jwks_path = tmp_path / "jwks.json"
+    _write_jwks(jwks_path, [_public_jwk(old_ring, "old", "EdDSA")])
+    verifier_ring = JwtKeyRing(str(jwks_path), signing_algorithm="EdDSA", reload_seconds=0)
+    verifier = _adapter(verifier_ring)
+    old_token = asyncio.run(_adapter(old_ring).encrypt("old_account"))
+    new_token = asyncio.run(_adapter(new_ring).encrypt("new_account"))
+
+    assert asyncio.run(verifier.decrypt(new_token)) is None
+
+    _write_jwks(jwks_path, [
+        _public_jwk(old_ring, "old", "EdDSA"),
+        _public_jwk(new_ring, "new", "EdDSA"),
+    ])
+
+    assert asyncio.run(verifier.decrypt(new_token)) == "new_account"
+    assert asyncio.run(verifier.decrypt(old_token)) == "old_account"
+
+    _write_jwks(jwks_path, [_public_jwk(new_ring, "new", "EdDSA")])
+
+    assert asyncio.run(verifier.decrypt(old_token)) is None
+
+
+def test_public_jwks_never_publishes_private_members(tmp_path):
+    ring = JwtKeyRing.from_pem(_private_pem("RS256"), "key-1", "RS256")
+    private_jwk = {
+        **RSAAlgorithm.to_jwk(ring.signing_key, as_dict=True),
+        "kid": "key-1",
+        "alg": "RS256",
+    }
+    jwks_path = tmp_path / "jwks.json"
+    _write_jwks(jwks_path, [private_jwk, {"kty": "oct", "k": "c2VjcmV0", "kid": "hmac"}])
+
+    published = JwtKeyRing(str(jwks_path)).public_jwks()
+
+    assert [key["kid"] for key in published["keys"]] == ["key-1"]
+    assert not {"d", "p", "q", "dp", "dq", "qi"} & set(published["keys"][0])
+
+
+def test_key_ring_from_env(monkeypatch, tmp_path):
+    private_key_file = tmp_path / "key.pem"
+    private_key_file.write_bytes(_private_pem("EdDSA"))
+    monkeypatch.delenv("JWT_ALGORITHM", raising=False)
+
+    assert key_ring_from_env() is None
+
+    monkeypatch.setenv("JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setenv("JWT_PRIVATE_KEY_FILE", str(private_key_file))
+    monkeypatch.delenv("JWT_SIGNING_KID", raising=False)
+    with pytest.raises(RuntimeError):
+        key_ring_from_env()
+
+    monkeypatch.setenv("JWT_SIGNING_KID", "key-1")
+    ring = key_ring_from_env()
+
+    assert ring.can_sign
+    assert ring.verification_key("key-1")[1] == "EdDSA"
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from infra.cryptography import Argon2Adapter, BcryptAdapter, BcryptPool, MultiSchemeHasher
+
+pytest.importorskip("argon2")
+
+
+def _bcrypt(cost=4):
+    return BcryptAdapter(cost, pool=BcryptPool(1))
+
+
+def _argon2(time_cost=1, memory_cost=8):
+    return Argon2Adapter(time_cost, memory_cost, 1, pool=BcryptPool(1))
+
+
+def test_hashes_with_preferred_scheme_and_verifies_every_scheme():
+    bcrypt_digest = asyncio.run(_bcrypt().hash("any_password"))
+    sut = MultiSchemeHasher(_argon2(), _bcrypt())
+
+    digest = asyncio.run(sut.hash("any_password"))
+
+    assert digest.startswith("$argon2id$v=19$m=8,t=1,p=1$")
+    assert asyncio.run(sut.compare("any_password", digest)) is True
+    assert asyncio.run(sut.compare("any_password", bcrypt_digest)) is True
+    assert asyncio.run(sut.compare("wrong_password", digest)) is False
+    assert asyncio.run(sut.compare("wrong_password", bcrypt_digest)) is False
+
+
+def test_rejects_digests_of_unknown_schemes():
+    sut = MultiSchemeHasher(_bcrypt())
+
+    assert asyncio.run(sut.compare("any_password", "$argon2id$v=19$m=8,t=1,p=1$x$y")) is False
+    assert asyncio.run(sut.compare("any_password", "plain")) is False
+
+
+def test_needs_rehash_for_other_schemes_and_outdated_parameters():
+    sut = MultiSchemeHasher(_argon2(time_cost=2), _bcrypt())
+    current = asyncio.run(sut.hash("any_password"))
+    outdated = asyncio.run(_argon2(time_cost=1).hash("any_password"))
+    legacy = asyncio.run(_bcrypt().hash("any_password"))
+
+    assert asyncio.run(sut.needs_rehash(current)) is False
+    assert asyncio.run(sut.needs_rehash(outdated)) is True
+    assert asyncio.run(sut.needs_rehash(legacy)) is True
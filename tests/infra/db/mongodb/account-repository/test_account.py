@@ -10,6 +10,7 @@ from domain.usecases.add_account import AddAccountModel
 from infra.cryptography import BcryptAdapter, JwtAdapter
 from infra.db.mongodb.account_repository import AccountMongoRepository
 from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+from infra.db.mongodb.session_repository import SessionMongoRepository, hash_access_token
 
 
 @pytest_asyncio.fixture(scope="function", autouse=True)
@@ -33,12 +34,14 @@ async def setup_database():
             )
         raise
 
-    collection = MongoHelper.get_collection("accounts")
-    collection.delete_many({})
+    collections = [MongoHelper.get_collection(name) for name in ("accounts", "sessions")]
+    for collection in collections:
+        collection.delete_many({})
 
     yield
 
-    collection.delete_many({})
+    for collection in collections:
+        collection.delete_many({})
     await MongoHelper.disconnect()
 
 
@@ -79,14 +82,13 @@ async def test_check_by_email_returns_false_before_insert_and_true_after_insert(
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_load_by_email_returns_account_with_password_role_and_token():
+async def test_load_by_email_returns_account_with_password_and_role():
     sut = AccountMongoRepository()
     collection = MongoHelper.get_collection("accounts")
     account_id = collection.insert_one({
         "name": "any_name",
         "email": "any_email@mail.com",
         "password": "hashed_password",
-        "accessToken": "stored_token",
         "role": "admin",
     }).inserted_id
 
@@ -96,73 +98,23 @@ async def test_load_by_email_returns_account_with_password_role_and_token():
     assert account.name == "any_name"
     assert account.email == "any_email@mail.com"
     assert account.password == "hashed_password"
-    assert account.access_token == "stored_token"
     assert account.role == "admin"
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_update_access_token_stores_token_as_access_token():
+async def test_update_password_replaces_the_stored_digest():
     sut = AccountMongoRepository()
     account_id = MongoHelper.get_collection("accounts").insert_one({
         "name": "any_name",
         "email": "any_email@mail.com",
-        "password": "hashed_password",
+        "password": "old_digest",
     }).inserted_id
 
-    await sut.update_access_token(str(account_id), "new_token")
-
-    stored_account = MongoHelper.get_collection("accounts").find_one(
-        {"_id": account_id}
-    )
-    assert stored_account["accessToken"] == "new_token"
-    assert "access_token" not in stored_account
-
+    await sut.update_password(str(account_id), "new_digest")
+    account = await sut.load_by_id(str(account_id))
 
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_load_by_token_returns_account_by_token():
-    sut = AccountMongoRepository()
-    account_id = MongoHelper.get_collection("accounts").insert_one({
-        "name": "any_name",
-        "email": "any_email@mail.com",
-        "password": "hashed_password",
-        "accessToken": "stored_token",
-    }).inserted_id
-
-    account = await sut.load_by_token("stored_token")
-
-    assert account.id == str(account_id)
-    assert account.name == "any_name"
-    assert account.access_token == "stored_token"
-
-
-@pytest.mark.integration
-@pytest.mark.asyncio
-async def test_load_by_token_with_admin_role_allows_admin_and_rejects_non_admin():
-    sut = AccountMongoRepository()
-    collection = MongoHelper.get_collection("accounts")
-    admin_id = collection.insert_one({
-        "name": "admin_name",
-        "email": "admin@mail.com",
-        "password": "hashed_password",
-        "accessToken": "admin_token",
-        "role": "admin",
-    }).inserted_id
-    collection.insert_one({
-        "name": "user_name",
-        "email": "user@mail.com",
-        "password": "hashed_password",
-        "accessToken": "user_token",
-        "role": "user",
-    })
-
-    admin_account = await sut.load_by_token("admin_token", "admin")
-    user_account = await sut.load_by_token("user_token", "admin")
-
-    assert admin_account.id == str(admin_id)
-    assert admin_account.role == "admin"
-    assert user_account is None
+    assert account.password == "new_digest"
 
 
 @pytest.mark.integration
@@ -202,12 +154,13 @@ async def test_signup_authentication_generates_and_persists_access_token():
     repository = AccountMongoRepository()
     bcrypt_adapter = BcryptAdapter(4)
     jwt_adapter = JwtAdapter("test-secret-that-is-long-enough-for-hs256")
+    session_repository = SessionMongoRepository()
     add_account = DbAddAccount(bcrypt_adapter, repository, repository)
     authentication = DbAuthentication(
         repository,
         bcrypt_adapter,
         jwt_adapter,
-        repository,
+        session_repository,
     )
 
     account = await add_account.add(AddAccountModel(
@@ -220,27 +173,26 @@ async def test_signup_authentication_generates_and_persists_access_token():
         password="Valid_password123",
     ))
 
-    stored_account = MongoHelper.get_collection("accounts").find_one(
-        {"email": "any_email@mail.com"}
-    )
+    session = await session_repository.load_by_token(auth_model.access_token)
 
     assert auth_model is not None
-    assert auth_model.access_token == stored_account["accessToken"]
+    assert session.id == account.id
     assert await jwt_adapter.decrypt(auth_model.access_token) == account.id
 
 
 @pytest.mark.integration
 @pytest.mark.asyncio
-async def test_login_authentication_replaces_stored_access_token():
+async def test_login_authentication_keeps_earlier_sessions():
     repository = AccountMongoRepository()
     bcrypt_adapter = BcryptAdapter(4)
     jwt_adapter = JwtAdapter("test-secret-that-is-long-enough-for-hs256")
+    session_repository = SessionMongoRepository()
     add_account = DbAddAccount(bcrypt_adapter, repository, repository)
     authentication = DbAuthentication(
         repository,
         bcrypt_adapter,
         jwt_adapter,
-        repository,
+        session_repository,
     )
 
     account = await add_account.add(AddAccountModel(
@@ -248,16 +200,15 @@ async def test_login_authentication_replaces_stored_access_token():
         email="any_email@mail.com",
         password="Valid_password123"
     ))
-    await repository.update_access_token(account.id, "old_token")
+    await session_repository.update_access_token(account.id, "old_token")
 
     auth_model = await authentication.auth(AuthenticationParams(
         email="any_email@mail.com",
         password="Valid_password123",
     ))
-    stored_account = MongoHelper.get_collection("accounts").find_one(
-        {"email": "any_email@mail.com"}
-    )
+    sessions = MongoHelper.get_collection("sessions")
 
     assert auth_model is not None
-    assert stored_account["accessToken"] == auth_model.access_token
-    assert stored_account["accessToken"] != "old_token"
+    assert sessions.count_documents({"accountId": account.id}) == 2
+    assert sessions.find_one({"_id": hash_access_token(auth_model.access_token)}) is not None
+    assert (await session_repository.load_by_token("old_token")).id == account.id
@@ -1,11 +1,19 @@
 """Tests for MongoHelper."""
 import os
+import mongomock
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pymongo.errors import ServerSelectionTimeoutError
 from infra.db.mongodb.helpers import MongoHelper
 
 
+def _mock_client():
+    """A client mock whose collections return an index name from create_index."""
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value.create_index.return_value = "index"
+    return client
+
+
 class TestMongoHelper:
     """Test suite for MongoHelper."""
 
@@ -13,16 +21,18 @@ class TestMongoHelper:
         """Reset MongoHelper state before each test."""
         MongoHelper._client = None
         MongoHelper._db = None
+        MongoHelper._indexed_uris = set()
 
     def teardown_method(self):
         """Clean up after each test."""
         MongoHelper._client = None
         MongoHelper._db = None
+        MongoHelper._indexed_uris = set()
 
     @pytest.mark.asyncio
     async def test_connect_with_uri(self):
         """Test connecting to MongoDB with provided URI."""
-        mock_client = Mock()
+        mock_client = _mock_client()
         uri = "mongodb://localhost:27017"
 
         with patch("infra.db.mongodb.helpers.mongo_helper.MongoClient", return_value=mock_client) as mock_mongo_client:
@@ -32,10 +42,36 @@ class TestMongoHelper:
             mock_client.admin.command.assert_called_once_with("ping")
             assert MongoHelper._client == mock_client
 
+    @pytest.mark.asyncio
+    async def test_connect_creates_indexes_once_per_uri(self):
+        """Test that the first connect to a URI creates the indexes and later ones skip it."""
+        mock_client = _mock_client()
+        collection = mock_client.__getitem__.return_value.__getitem__.return_value
+        uri = "mongodb://localhost:27017"
+
+        with patch("infra.db.mongodb.helpers.mongo_helper.MongoClient", return_value=mock_client):
+            await MongoHelper.connect(uri)
+            created = collection.create_index.call_count
+            await MongoHelper.connect(uri)
+
+        assert created > 0
+        assert collection.create_index.call_count == created
+
+    def test_get_db_connects_on_first_use_with_env_variable(self):
+        """Test that get_db connects and creates the indexes when MONGO_URL is set."""
+        with patch.dict(os.environ, {"MONGO_URL": "mongodb://localhost:27017"}):
+            with patch(
+                "infra.db.mongodb.helpers.mongo_helper.MongoClient", mongomock.MongoClient
+            ):
+                db = MongoHelper.get_db()
+
+        assert MongoHelper._client is not None
+        assert "email_unique" in db.accounts.index_information()
+
     @pytest.mark.asyncio
     async def test_connect_with_env_variable(self):
         """Test connecting to MongoDB using MONGO_URL environment variable."""
-        mock_client = Mock()
+        mock_client = _mock_client()
         uri = "mongodb://localhost:27017"
 
         with patch.dict(os.environ, {"MONGO_URL": uri}):
@@ -0,0 +1,31 @@
+"""Tests for the MongoDB connection pool monitor."""
+from types import SimpleNamespace
+
+from infra.db.mongodb.helpers import ConnectionPoolMonitor
+
+_ADDRESS = ("db", 27017)
+
+
+def test_tracks_checkouts_and_connections_in_use_per_pool():
+    monitor = ConnectionPoolMonitor()
+    monitor.pool_created(SimpleNamespace(address=_ADDRESS, options={"maxPoolSize": 10}))
+    monitor.connection_checked_out(SimpleNamespace(address=_ADDRESS))
+    monitor.connection_checked_out(SimpleNamespace(address=_ADDRESS))
+    monitor.connection_checked_in(SimpleNamespace(address=_ADDRESS))
+    monitor.connection_check_out_failed(SimpleNamespace(address=_ADDRESS))
+
+    assert monitor.stats() == {
+        "checkouts": 2,
+        "checkout_failures": 1,
+        "pools": {"db:27017": {"checked_out": 1, "max_size": 10}},
+    }
+
+
+def test_default_pool_size_is_assumed_when_not_overridden():
+    monitor = ConnectionPoolMonitor()
+    monitor.pool_created(SimpleNamespace(address=_ADDRESS, options={}))
+
+    assert monitor.stats()["pools"]["db:27017"]["max_size"] == 100
+
+    monitor.pool_closed(SimpleNamespace(address=_ADDRESS))
+    assert monitor.stats()["pools"] == {}
@@ -0,0 +1,69 @@
+"""Tests for the MongoDB command monitor."""
+import logging
+from types import SimpleNamespace
+
+from infra.db.mongodb.helpers import CommandMonitor, begin_query_stats, end_query_stats
+from infra.db.mongodb.helpers.query_monitor import filter_shape
+
+
+def _started(request_id, command_name, command):
+    return SimpleNamespace(
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+        command_name=command_name,
+        command=command,
+    )
+
+
+def _succeeded(request_id, command_name, reply, duration_micros=1500):
+    return SimpleNamespace(
+        connection_id=("localhost", 27017),
+        request_id=request_id,
+        command_name=command_name,
+        reply=reply,
+        duration_micros=duration_micros,
+    )
+
+
+def test_commands_are_attributed_to_the_active_query_stats():
+    monitor = CommandMonitor(slow_query_ms=1000)
+    stats, token = begin_query_stats()
+    try:
+        monitor.started(_started(1, "find", {"find": "surveys", "filter": {}}))
+        monitor.succeeded(_succeeded(1, "find", {"cursor": {"firstBatch": [{}, {}]}}))
+        monitor.started(_started(2, "distinct", {"distinct": "surveyResults", "key": "surveyId"}))
+        monitor.succeeded(_succeeded(2, "distinct", {"values": [1, 2, 3]}))
+    finally:
+        end_query_stats(token)
+
+    assert stats.commands == 2
+    assert stats.documents == 5
+    assert stats.duration_ms == 3.0
+    assert stats.by_command == {"find": 1, "distinct": 1}
+
+
+def test_commands_outside_a_request_are_not_counted():
+    monitor = CommandMonitor(slow_query_ms=1000)
+    monitor.started(_started(1, "ping", {"ping": 1}))
+    monitor.succeeded(_succeeded(1, "ping", {"ok": 1}))
+
+    stats, token = begin_query_stats()
+    end_query_stats(token)
+    assert stats.commands == 0
+
+
+def test_slow_commands_are_logged_with_filter_shape_only(caplog):
+    monitor = CommandMonitor(slow_query_ms=10)
+    monitor.started(_started(7, "find", {"find": "accounts", "filter": {"email": "a@b.com"}}))
+    with caplog.at_level(logging.WARNING):
+        monitor.succeeded(_succeeded(7, "find", {"cursor": {"firstBatch": []}}, duration_micros=25_000))
+
+    assert "find accounts" in caplog.text
+    assert "{'email': '?'}" in caplog.text
+    assert "a@b.com" not in caplog.text
+
+
+def test_filter_shape_collapses_repeated_list_items():
+    shape = filter_shape({"_id": {"$in": [1, 2, 3]}, "$or": [{"a": 1}, {"b": 2}]})
+
+    assert shape == {"_id": {"$in": ["?"]}, "$or": [{"a": "?"}, {"b": "?"}]}
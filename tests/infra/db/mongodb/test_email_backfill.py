@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import mongomock
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from infra.db.mongodb.email_backfill import backfill_normalized_emails
+from infra.db.mongodb.indexes import ensure_indexes
+from utils.email_validator_adapter import EmailValidatorAdapter
+
+
+class BulkWriteCollection:
+    """mongomock's bulk_write does not accept current pymongo UpdateOne objects."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.bulk_writes = 0
+
+    def find(self, *args, **kwargs):
+        return self.collection.find(*args, **kwargs)
+
+    def bulk_write(self, operations, ordered=True):
+        self.bulk_writes += 1
+        modified, errors = 0, []
+        for index, operation in enumerate(operations):
+            try:
+                modified += self.collection.update_one(
+                    operation._filter, operation._doc
+                ).modified_count
+            except DuplicateKeyError:
+                errors.append({"index": index, "code": 11000})
+        if errors:
+            raise BulkWriteError({"nModified": modified, "writeErrors": errors})
+        return type("Result", (), {"modified_count": modified})()
+
+
+def _accounts(*emails):
+    db = mongomock.MongoClient().db
+    with patch("infra.db.mongodb.indexes.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        ensure_indexes()
+    ids = [db.accounts.insert_one({"email": email}).inserted_id for email in emails]
+    return db.accounts, ids
+
+
+def test_backfill_normalizes_every_account_in_batches():
+    accounts, _ = _accounts("Ada@Example.com", "bob@BÜCHER.de", "carol@example.com")
+    collection = BulkWriteCollection(accounts)
+
+    report = backfill_normalized_emails(EmailValidatorAdapter(), batch_size=2, collection=collection)
+
+    assert (report.scanned, report.updated, report.batches) == (3, 3, 2)
+    assert collection.bulk_writes == 2
+    assert sorted(account["emailNormalized"] for account in accounts.find()) == [
+        "ada@example.com",
+        "bob@xn--bcher-kva.de",
+        "carol@example.com",
+    ]
+
+
+def test_backfill_reports_conflicts_and_can_be_rerun():
+    accounts, ids = _accounts("ada@example.com", "ADA@example.com", "bob@example.com")
+    collection = BulkWriteCollection(accounts)
+
+    first = backfill_normalized_emails(EmailValidatorAdapter(), collection=collection)
+    second = backfill_normalized_emails(EmailValidatorAdapter(), collection=collection)
+
+    assert first.updated == 2
+    assert first.conflicts == [str(ids[1])]
+    assert "emailNormalized" not in accounts.find_one({"_id": ids[1]})
+    assert second.updated == 0
+    assert second.conflicts == [str(ids[1])]
+
+
+def test_dry_run_scans_without_writing():
+    accounts, _ = _accounts("ada@example.com", "bob@example.com")
+    collection = BulkWriteCollection(accounts)
+
+    report = backfill_normalized_emails(
+        EmailValidatorAdapter(), batch_size=1, dry_run=True, collection=collection
+    )
+
+    assert (report.scanned, report.updated) == (2, 0)
+    assert collection.bulk_writes == 0
+    assert accounts.count_documents({"emailNormalized": {"$exists": True}}) == 0
@@ -0,0 +1,70 @@
+import asyncio
+from unittest.mock import patch
+
+import mongomock
+
+from domain.usecases.add_account import AddAccountModel
+from infra.db.mongodb.account_repository import AccountMongoRepository
+from infra.db.mongodb.indexes import INDEXES, ensure_indexes
+
+
+def _indexed_db():
+    db = mongomock.MongoClient().db
+    with patch("infra.db.mongodb.indexes.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        ensure_indexes()
+    return db
+
+
+def test_ensure_indexes_creates_every_declared_index():
+    db = _indexed_db()
+
+    for spec in INDEXES:
+        assert spec.options["name"] in db[spec.collection].index_information()
+
+
+def test_add_returns_none_when_the_unique_email_index_rejects_the_insert():
+    db = _indexed_db()
+    sut = AccountMongoRepository()
+    account = AddAccountModel(name="any_name", email="any@mail.com", password="hash")
+
+    with patch("infra.db.mongodb.account_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        created = asyncio.run(sut.add(account))
+        duplicate = asyncio.run(sut.add(account))
+
+    assert created.email == "any@mail.com"
+    assert duplicate is None
+    assert db.accounts.count_documents({}) == 1
+
+
+def test_email_lookups_ignore_case_and_idna_spelling():
+    db = _indexed_db()
+    sut = AccountMongoRepository()
+    account = AddAccountModel(name="any_name", email="Ada@BÜCHER.de", password="hash")
+
+    with patch("infra.db.mongodb.account_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        asyncio.run(sut.add(account))
+        loaded = asyncio.run(sut.load_by_email("ada@xn--bcher-kva.de"))
+        exists = asyncio.run(sut.check_by_email("ADA@bücher.DE"))
+        duplicate = asyncio.run(sut.add(AddAccountModel("other", "ada@bücher.de", "hash")))
+
+    assert loaded.email == "Ada@BÜCHER.de"
+    assert exists is True
+    assert duplicate is None
+    assert db.accounts.find_one()["emailNormalized"] == "ada@xn--bcher-kva.de"
+
+
+def test_email_lookups_still_find_accounts_the_backfill_has_not_reached():
+    db = _indexed_db()
+    db.accounts.insert_one({"name": "legacy", "email": "Legacy@Example.com", "password": "h"})
+    sut = AccountMongoRepository()
+
+    with patch("infra.db.mongodb.account_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        exact = asyncio.run(sut.load_by_email("Legacy@Example.com"))
+        other_case = asyncio.run(sut.load_by_email("legacy@example.com"))
+
+    assert exact.name == "legacy"
+    assert other_case is None
@@ -0,0 +1,67 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import mongomock
+
+from domain.models.refresh_token import RefreshTokenModel
+from infra.db.mongodb.refresh_token_repository import RefreshTokenMongoRepository
+
+
+def _run(db, coro_factory):
+    with patch("infra.db.mongodb.refresh_token_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        return asyncio.run(coro_factory(RefreshTokenMongoRepository()))
+
+
+def _expires_in(seconds):
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def test_consume_returns_the_token_once_then_flags_reuse():
+    db = mongomock.MongoClient(tz_aware=True).db
+    _run(db, lambda sut: sut.add_refresh_token(
+        "hash", RefreshTokenModel("account_id", "family", token_version=2), _expires_in(60)
+    ))
+
+    first = _run(db, lambda sut: sut.consume_refresh_token("hash"))
+    second = _run(db, lambda sut: sut.consume_refresh_token("hash"))
+
+    assert first == RefreshTokenModel("account_id", "family", token_version=2, used=False)
+    assert second.used is True
+    assert db.refreshTokens.find_one({"_id": "hash"})["accountId"] == "account_id"
+
+
+def test_consume_ignores_unknown_and_expired_tokens():
+    db = mongomock.MongoClient(tz_aware=True).db
+    _run(db, lambda sut: sut.add_refresh_token(
+        "expired", RefreshTokenModel("account_id", "family"), _expires_in(-1)
+    ))
+
+    assert _run(db, lambda sut: sut.consume_refresh_token("expired")) is None
+    assert _run(db, lambda sut: sut.consume_refresh_token("unknown")) is None
+
+
+def test_revoke_family_deletes_every_token_of_that_login_only():
+    db = mongomock.MongoClient(tz_aware=True).db
+    for token_hash, family in [("a", "family"), ("b", "family"), ("c", "other")]:
+        _run(db, lambda sut: sut.add_refresh_token(
+            token_hash, RefreshTokenModel("account_id", family), _expires_in(60)
+        ))
+
+    _run(db, lambda sut: sut.revoke_refresh_token_family("family"))
+
+    assert [token["_id"] for token in db.refreshTokens.find()] == ["c"]
+
+
+def test_ensure_indexes_creates_the_refresh_token_indexes():
+    from infra.db.mongodb.indexes import ensure_indexes
+
+    db = mongomock.MongoClient().db
+    with patch("infra.db.mongodb.indexes.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        ensure_indexes()
+
+    indexes = db.refreshTokens.index_information()
+    assert indexes["expiresAt_ttl"]["expireAfterSeconds"] == 0
+    assert indexes["family"]["key"] == [("family", 1)]
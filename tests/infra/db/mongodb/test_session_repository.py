@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import patch
+
+import mongomock
+
+from infra.db.mongodb.session_repository import SessionMongoRepository, hash_access_token
+
+
+def _run(db, coro_factory, expires_in_seconds=3600):
+    with patch("infra.db.mongodb.session_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        return asyncio.run(coro_factory(SessionMongoRepository(expires_in_seconds)))
+
+
+def test_each_login_adds_a_session_keyed_by_token_hash():
+    db = mongomock.MongoClient(tz_aware=True).db
+    _run(db, lambda sut: sut.update_access_token("account_id", "laptop_token", "user"))
+    _run(db, lambda sut: sut.update_access_token("account_id", "phone_token", "user"))
+
+    laptop = _run(db, lambda sut: sut.load_by_token("laptop_token", "user"))
+    phone = _run(db, lambda sut: sut.load_by_token("phone_token", "user"))
+
+    assert (laptop.id, laptop.role, laptop.access_token) == ("account_id", "user", "laptop_token")
+    assert phone.id == "account_id"
+    assert db.sessions.count_documents({}) == 2
+    assert db.sessions.find_one({"_id": hash_access_token("laptop_token")}) is not None
+    assert db.sessions.find_one({"_id": "laptop_token"}) is None
+
+
+def test_load_by_token_requires_the_role_unless_admin():
+    db = mongomock.MongoClient(tz_aware=True).db
+    _run(db, lambda sut: sut.update_access_token("admin_id", "admin_token", "admin"))
+    _run(db, lambda sut: sut.update_access_token("user_id", "user_token"))
+
+    admin_as_user = _run(db, lambda sut: sut.load_by_token("admin_token"))
+    user = _run(db, lambda sut: sut.load_by_token("user_token"))
+    user_as_admin = _run(db, lambda sut: sut.load_by_token("user_token", "admin"))
+
+    assert admin_as_user.id == "admin_id"
+    assert user.id == "user_id"
+    assert user_as_admin is None
+
+
+def test_load_by_token_ignores_unknown_and_expired_sessions():
+    db = mongomock.MongoClient(tz_aware=True).db
+    _run(db, lambda sut: sut.update_access_token("account_id", "expired_token"), -1)
+
+    assert _run(db, lambda sut: sut.load_by_token("expired_token")) is None
+    assert _run(db, lambda sut: sut.load_by_token("unknown_token")) is None
+
+
+def test_reissuing_the_same_token_keeps_one_session():
+    db = mongomock.MongoClient(tz_aware=True).db
+    _run(db, lambda sut: sut.update_access_token("account_id", "same_token"))
+    _run(db, lambda sut: sut.update_access_token("account_id", "same_token"))
+
+    assert db.sessions.count_documents({}) == 1
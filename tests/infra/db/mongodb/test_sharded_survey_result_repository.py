@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.mongodb.helpers import MongoHelper
+from infra.db.mongodb.indexes import ensure_indexes
+from infra.db.mongodb.sharded_survey_result_repository import (
+    HotSurveyDetector,
+    ShardedSurveyResultMongoRepository,
+    rebuild_survey_counters,
+)
+from infra.db.mongodb.survey_result_repository import SurveyResultMongoRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def db(monkeypatch):
+    monkeypatch.setattr(MongoHelper, "_client", mongomock.MongoClient())
+    ensure_indexes()
+    return MongoHelper.get_db()
+
+
+def add_survey(db):
+    return str(db.surveys.insert_one({
+        "question": "Favourite language?",
+        "answers": [{"answer": "Python"}, {"answer": "Go"}],
+        "date": datetime(2026, 1, 2),
+    }).inserted_id)
+
+
+def vote(repository, survey_id, account_id, answer):
+    asyncio.run(repository.save(SaveSurveyResultParams(survey_id, account_id, answer)))
+
+
+def tally(repository, survey_id, account_id):
+    result = asyncio.run(repository.load_by_survey_id(survey_id, account_id))
+    return {answer.answer: answer.count for answer in result.answers}
+
+
+def test_detector_doubles_the_shards_of_a_hot_survey_up_to_the_maximum():
+    clock = FakeClock()
+    sut = HotSurveyDetector(base_shards=2, max_shards=8, hot_votes_per_second=3, clock=clock)
+
+    shards = [sut.record("hot") for _ in range(12)]
+
+    assert shards == [2, 2, 2, 4, 4, 4, 4, 8, 8, 8, 8, 8]
+    assert sut.shards("hot") == 8
+    assert sut.shards("cold") == 2
+
+
+def test_detector_leaves_a_survey_under_the_rate_on_its_base_shards():
+    clock = FakeClock()
+    sut = HotSurveyDetector(base_shards=2, max_shards=8, hot_votes_per_second=3, clock=clock)
+
+    for _ in range(10):
+        sut.record("steady")
+        sut.record("steady")
+        clock.now += 1.0
+
+    assert sut.shards("steady") == 2
+
+
+def test_detector_rejects_a_base_above_the_maximum():
+    with pytest.raises(ValueError):
+        HotSurveyDetector(base_shards=8, max_shards=4)
+
+
+def test_votes_are_spread_over_shards_and_summed_on_read(db):
+    survey_id = add_survey(db)
+    sut = ShardedSurveyResultMongoRepository(HotSurveyDetector(base_shards=4))
+    accounts = [str(ObjectId()) for _ in range(40)]
+
+    for index, account_id in enumerate(accounts):
+        vote(sut, survey_id, account_id, "Python" if index % 4 else "Go")
+
+    assert tally(sut, survey_id, accounts[0]) == {"Python": 30, "Go": 10}
+    assert len(db.surveyResultCounters.distinct("shard")) > 1
+    assert tally(sut, survey_id, accounts[0]) == tally(
+        SurveyResultMongoRepository(), survey_id, accounts[0]
+    )
+
+
+def test_changing_an_answer_moves_one_vote_even_after_the_shards_grow(db):
+    survey_id = add_survey(db)
+    clock = FakeClock()
+    detector = HotSurveyDetector(base_shards=1, max_shards=16, hot_votes_per_second=2, clock=clock)
+    sut = ShardedSurveyResultMongoRepository(detector)
+    voter = str(ObjectId())
+
+    vote(sut, survey_id, voter, "Python")
+    for _ in range(10):
+        vote(sut, survey_id, str(ObjectId()), "Python")
+    vote(sut, survey_id, voter, "Go")
+    vote(sut, survey_id, voter, "Go")
+
+    result = asyncio.run(sut.load_by_survey_id(survey_id, voter))
+    assert detector.shards(survey_id) > 1
+    assert {answer.answer: answer.count for answer in result.answers} == {"Python": 10, "Go": 1}
+    current = [answer.answer for answer in result.answers if answer.is_current_account_answer]
+    assert current == ["Go"]
+
+
+def test_rebuild_counts_votes_saved_before_sharding(db):
+    survey_id = add_survey(db)
+    plain = SurveyResultMongoRepository()
+    for answer in ["Python", "Python", "Go"]:
+        vote(plain, survey_id, str(ObjectId()), answer)
+    sut = ShardedSurveyResultMongoRepository()
+
+    assert asyncio.run(sut.load_by_survey_id(survey_id, str(ObjectId()))) is None
+    assert rebuild_survey_counters(batch_size=1) == 2
+    assert tally(sut, survey_id, str(ObjectId())) == {"Python": 2, "Go": 1}
@@ -1,7 +1,12 @@
 import asyncio
+from datetime import datetime
 from unittest.mock import Mock, patch
 
+import mongomock
+from bson import ObjectId
+
 from infra.db.mongodb.survey_repository import SurveyMongoRepository
+from main.adapters.flask_route_adapter import _serialize
 
 
 def test_check_by_id_returns_false_for_invalid_object_id_without_querying_db():
@@ -51,3 +56,50 @@ def test_load_all_does_not_query_results_for_invalid_account_id():
 
     assert result[0].did_answer is False
     results_collection.find_one.assert_not_called()
+
+
+def test_load_all_resolves_did_answer_with_a_single_results_query():
+    sut = SurveyMongoRepository()
+    answered_id, unanswered_id = ObjectId(), ObjectId()
+    surveys_collection = Mock()
+    surveys_collection.find.return_value = [
+        {"_id": answered_id, "question": "Answered?", "answers": []},
+        {"_id": unanswered_id, "question": "Unanswered?", "answers": []},
+    ]
+    results_collection = Mock()
+    results_collection.distinct.return_value = [answered_id]
+
+    with patch("infra.db.mongodb.survey_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = [
+            surveys_collection,
+            results_collection,
+        ]
+        result = asyncio.run(sut.load_all(str(ObjectId())))
+
+    assert [survey.did_answer for survey in result] == [True, False]
+    results_collection.distinct.assert_called_once()
+    results_collection.find_one.assert_not_called()
+
+
+def test_load_all_view_matches_serialized_models():
+    sut = SurveyMongoRepository()
+    account_id = ObjectId()
+    collection = mongomock.MongoClient().db
+    survey_id = collection.surveys.insert_one({
+        "question": "Question?",
+        "answers": [{"answer": "yes", "image": "image.png"}, {"answer": "no"}],
+        "date": datetime(2024, 1, 1),
+    }).inserted_id
+    collection.surveyResults.insert_one({
+        "surveyId": survey_id,
+        "accountId": account_id,
+        "answer": "yes",
+    })
+
+    with patch("infra.db.mongodb.survey_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: collection[name]
+        models = asyncio.run(sut.load_all(str(account_id)))
+        view = asyncio.run(sut.load_all_view(str(account_id)))
+
+    assert view == _serialize(models)
+    assert view[0]["didAnswer"] is True
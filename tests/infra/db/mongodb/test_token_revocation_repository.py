@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import mongomock
+from bson import ObjectId
+
+from infra.db.mongodb.token_revocation_repository import TokenRevocationMongoRepository
+
+
+def test_revoke_tokens_bumps_the_account_version_and_records_it():
+    db = mongomock.MongoClient(tz_aware=True).db
+    account_id = db.accounts.insert_one({"name": "Any", "tokenVersion": 1}).inserted_id
+    sut = TokenRevocationMongoRepository(token_lifetime_seconds=60)
+
+    with patch("infra.db.mongodb.token_revocation_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        version = asyncio.run(sut.revoke_tokens(str(account_id)))
+        revocations = asyncio.run(sut.load_revocations())
+
+    assert version == 2
+    assert db.accounts.find_one({"_id": account_id})["tokenVersion"] == 2
+    assert revocations == {str(account_id): 2}
+
+
+def test_load_revocations_skips_entries_whose_tokens_have_all_expired():
+    db = mongomock.MongoClient(tz_aware=True).db
+    db.tokenRevocations.insert_one({
+        "_id": str(ObjectId()),
+        "tokenVersion": 1,
+        "expiresAt": datetime.now(timezone.utc) - timedelta(seconds=1),
+    })
+
+    with patch("infra.db.mongodb.token_revocation_repository.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        revocations = asyncio.run(TokenRevocationMongoRepository().load_revocations())
+
+    assert revocations == {}
+
+
+def test_ensure_indexes_creates_the_revocation_ttl_index():
+    from infra.db.mongodb.indexes import ensure_indexes
+
+    db = mongomock.MongoClient().db
+    with patch("infra.db.mongodb.indexes.MongoHelper") as mongo_helper:
+        mongo_helper.get_collection.side_effect = lambda name: db[name]
+        ensure_indexes()
+
+    index = db.tokenRevocations.index_information()["expiresAt_ttl"]
+    assert index["expireAfterSeconds"] == 0
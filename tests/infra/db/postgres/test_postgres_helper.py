@@ -0,0 +1,66 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from infra.db.postgres.helpers import PostgresHelper, to_row_id
+
+
+class PoolSpy:
+    def __init__(self):
+        self.threads = []
+
+    async def fetchval(self, query, *args):
+        self.threads.append(threading.current_thread().name)
+        return (query, args)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="postgres-pool", daemon=True)
+    thread.start()
+    pool = PoolSpy()
+    monkeypatch.setattr(PostgresHelper, "_pool", pool)
+    monkeypatch.setattr(PostgresHelper, "_loop", loop)
+    monkeypatch.setattr(PostgresHelper, "_thread", thread)
+    monkeypatch.setattr(PostgresHelper, "_owner_pid", os.getpid())
+    yield pool
+    asyncio.run(PostgresHelper.disconnect())
+
+
+def test_queries_from_any_event_loop_run_on_the_pool_loop(pool):
+    first = asyncio.run(PostgresHelper.fetchval("SELECT $1", 1))
+    second = asyncio.run(PostgresHelper.fetchval("SELECT $1", 2))
+
+    assert (first, second) == (("SELECT $1", (1,)), ("SELECT $1", (2,)))
+    assert pool.threads == ["postgres-pool", "postgres-pool"]
+
+
+def test_disconnect_stops_the_pool_loop(pool):
+    thread = PostgresHelper._thread
+
+    asyncio.run(PostgresHelper.disconnect())
+
+    assert not thread.is_alive()
+    assert PostgresHelper._pool is None
+
+
+def test_connect_requires_a_url(monkeypatch):
+    pytest.importorskip("asyncpg")
+    monkeypatch.delenv("POSTGRES_URL", raising=False)
+    monkeypatch.setattr(PostgresHelper, "_pool", None)
+
+    with pytest.raises(ValueError, match="POSTGRES_URL"):
+        asyncio.run(PostgresHelper.connect())
+
+
+def test_to_row_id_accepts_only_bigint_ids():
+    assert to_row_id("42") == 42
+    assert to_row_id("6ad65bfa1a4f34ca41f8c823") is None
+    assert to_row_id("9" * 30) is None
+    assert to_row_id("") is None
@@ -0,0 +1,301 @@
+"""Behaviour every database backend must share, run against each of them."""
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import mongomock
+import pytest
+
+from domain.models.refresh_token import RefreshTokenModel
+from domain.usecases.add_account import AddAccountModel
+from domain.usecases.add_survey import AddSurveyAnswerParams, AddSurveyParams
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db import mongodb, sqlite
+from infra.db.mongodb.helpers import MongoHelper
+from infra.db.mongodb.indexes import ensure_indexes
+from infra.db.postgres.helpers import PostgresHelper
+from infra.db.sqlite.helpers import SqliteHelper
+from utils.email_validator_adapter import EmailValidatorAdapter
+
+
+def _mongodb(monkeypatch, tmp_path):
+    # Not tz_aware, like MongoHelper.connect, so dates round-trip as naive UTC.
+    monkeypatch.setattr(MongoHelper, "_client", mongomock.MongoClient())
+    ensure_indexes()
+    return SimpleNamespace(
+        accounts=mongodb.AccountMongoRepository(EmailValidatorAdapter()),
+        sessions=mongodb.SessionMongoRepository(60),
+        surveys=mongodb.SurveyMongoRepository(),
+        survey_results=mongodb.SurveyResultMongoRepository(),
+        refresh_tokens=mongodb.RefreshTokenMongoRepository(),
+        token_revocations=mongodb.TokenRevocationMongoRepository(60),
+    )
+
+
+def _mongodb_sharded(monkeypatch, tmp_path):
+    repos = _mongodb(monkeypatch, tmp_path)
+    repos.survey_results = mongodb.ShardedSurveyResultMongoRepository()
+    return repos
+
+
+def _sqlite(monkeypatch, tmp_path):
+    SqliteHelper.connect(str(tmp_path / "contract.sqlite3"))
+    return SimpleNamespace(
+        accounts=sqlite.AccountSqliteRepository(EmailValidatorAdapter()),
+        sessions=sqlite.SessionSqliteRepository(60),
+        surveys=sqlite.SurveySqliteRepository(),
+        survey_results=sqlite.SurveyResultSqliteRepository(),
+        refresh_tokens=sqlite.RefreshTokenSqliteRepository(),
+        token_revocations=sqlite.TokenRevocationSqliteRepository(60),
+    )
+
+
+def _postgres(monkeypatch, tmp_path):
+    pytest.importorskip("asyncpg")
+    postgres_url = os.getenv("POSTGRES_URL")
+    if not postgres_url:
+        pytest.skip("POSTGRES_URL is required for the PostgreSQL contract tests")
+    from infra.db import postgres
+
+    run(PostgresHelper.connect(postgres_url))
+    run(PostgresHelper.execute("TRUNCATE accounts, surveys RESTART IDENTITY CASCADE"))
+    return SimpleNamespace(
+        accounts=postgres.AccountPostgresRepository(EmailValidatorAdapter()),
+        sessions=postgres.SessionPostgresRepository(60),
+        surveys=postgres.SurveyPostgresRepository(),
+        survey_results=postgres.SurveyResultPostgresRepository(),
+    )
+
+
+@pytest.fixture(params=[
+    pytest.param(_mongodb, id="mongodb"),
+    pytest.param(_mongodb_sharded, id="mongodb-sharded"),
+    pytest.param(_sqlite, id="sqlite"),
+    pytest.param(_postgres, id="postgres", marks=pytest.mark.integration),
+])
+def repos(request, monkeypatch, tmp_path):
+    yield request.param(monkeypatch, tmp_path)
+    SqliteHelper.disconnect()
+    run(PostgresHelper.disconnect())
+
+
+def requires(repos, name):
+    if not hasattr(repos, name):
+        pytest.skip(f"this backend has no {name} repository")
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def add_account(repos, email="ada@example.com"):
+    return run(repos.accounts.add(AddAccountModel("Ada", email, "digest")))
+
+
+def add_survey(repos, question="Favourite language?"):
+    run(repos.surveys.add(AddSurveyParams(
+        question=question,
+        answers=[AddSurveyAnswerParams("Python", "python.png"), AddSurveyAnswerParams("Go")],
+        date=datetime(2026, 1, 2, 3, 4, 5),
+    )))
+    return next(
+        survey for survey in run(repos.surveys.load_all("")) if survey.question == question
+    )
+
+
+def test_accounts_are_found_by_any_spelling_of_their_email(repos):
+    account = add_account(repos, "Ada@BÜCHER.de")
+
+    by_email = run(repos.accounts.load_by_email("ada@xn--bcher-kva.de"))
+    by_id = run(repos.accounts.load_by_id(account.id))
+
+    assert (by_email.id, by_email.name, by_email.password) == (account.id, "Ada", "digest")
+    assert by_email.token_version == 0
+    assert by_id.email == "Ada@BÜCHER.de"
+    assert run(repos.accounts.check_by_email("ADA@bücher.de")) is True
+    assert run(repos.accounts.check_by_email("bob@bücher.de")) is False
+    assert run(repos.accounts.load_by_id("unknown")) is None
+
+
+def test_duplicate_email_is_rejected_and_password_can_be_replaced(repos):
+    account = add_account(repos)
+
+    duplicate = add_account(repos, "ADA@example.com")
+    run(repos.accounts.update_password(account.id, "new_digest"))
+
+    assert duplicate is None
+    assert run(repos.accounts.load_by_id(account.id)).password == "new_digest"
+
+
+def test_sessions_authorize_by_token_and_role(repos):
+    account = add_account(repos)
+    run(repos.sessions.update_access_token(account.id, "laptop", "user"))
+    run(repos.sessions.update_access_token(account.id, "phone", "user"))
+
+    laptop = run(repos.sessions.load_by_token("laptop", "user"))
+
+    assert (laptop.id, laptop.role) == (account.id, "user")
+    assert run(repos.sessions.load_by_token("phone", "user")).id == account.id
+    assert run(repos.sessions.load_by_token("laptop", "admin")) is None
+    assert run(repos.sessions.load_by_token("unknown", "user")) is None
+
+
+def test_surveys_report_whether_the_account_answered(repos):
+    account = add_account(repos)
+    answered = add_survey(repos, "Answered?")
+    open_survey = add_survey(repos, "Open?")
+    run(repos.survey_results.save(SaveSurveyResultParams(answered.id, account.id, "Go")))
+
+    surveys = {survey.question: survey for survey in run(repos.surveys.load_all(account.id))}
+    views = {view["question"]: view for view in run(repos.surveys.load_all_view(account.id))}
+
+    assert surveys["Answered?"].did_answer is True
+    assert surveys["Open?"].did_answer is False
+    assert [answer.answer for answer in surveys["Open?"].answers] == ["Python", "Go"]
+    assert views["Answered?"] == {
+        "id": answered.id,
+        "question": "Answered?",
+        "answers": [{"answer": "Python", "image": "python.png"}, {"answer": "Go", "image": None}],
+        "date": datetime(2026, 1, 2, 3, 4, 5),
+        "didAnswer": True,
+    }
+    assert run(repos.surveys.load_by_id(open_survey.id)).question == "Open?"
+    assert run(repos.surveys.check_by_id(open_survey.id)) is True
+    assert run(repos.surveys.check_by_id("unknown")) is False
+    assert run(repos.surveys.load_answers(open_survey.id)) == ["Python", "Go"]
+    assert run(repos.surveys.load_answers("unknown")) == []
+
+
+def test_surveys_are_paged_in_insertion_order(repos):
+    account = add_account(repos)
+    surveys = [add_survey(repos, f"Question {index}?") for index in range(5)]
+    run(repos.survey_results.save(SaveSurveyResultParams(surveys[2].id, account.id, "Go")))
+
+    page = run(repos.surveys.load_all(account.id, 2, 1))
+
+    assert [survey.id for survey in page] == [surveys[1].id, surveys[2].id]
+    assert [survey.did_answer for survey in page] == [False, True]
+    assert [survey.id for survey in run(repos.surveys.load_all("", 10, 3))] == [
+        surveys[3].id, surveys[4].id,
+    ]
+    assert run(repos.surveys.load_all("", 2, 5)) == []
+
+
+def test_survey_results_tally_votes_and_replace_an_accounts_answer(repos):
+    ada = add_account(repos)
+    bob = add_account(repos, "bob@example.com")
+    survey = add_survey(repos)
+    run(repos.survey_results.save(SaveSurveyResultParams(survey.id, ada.id, "Python")))
+    run(repos.survey_results.save(SaveSurveyResultParams(survey.id, ada.id, "Go")))
+    run(repos.survey_results.save(SaveSurveyResultParams(survey.id, bob.id, "Go")))
+
+    result = run(repos.survey_results.load_by_survey_id(survey.id, ada.id))
+
+    assert result.survey_id == survey.id
+    assert [(a.answer, a.count, a.percent, a.is_current_account_answer) for a in result.answers] == [
+        ("Go", 2, 100, True),
+        ("Python", 0, 0, False),
+    ]
+    assert result.answers[1].image == "python.png"
+
+
+def test_survey_result_is_none_without_votes_or_survey(repos):
+    survey = add_survey(repos)
+
+    assert run(repos.survey_results.load_by_survey_id(survey.id, "")) is None
+    assert run(repos.survey_results.load_by_survey_id("unknown", "")) is None
+
+
+def test_survey_results_are_tallied_for_several_surveys_at_once(repos):
+    ada = add_account(repos)
+    bob = add_account(repos, "bob@example.com")
+    voted = add_survey(repos, "Voted?")
+    unanswered = add_survey(repos, "Unanswered?")
+    run(repos.survey_results.save(SaveSurveyResultParams(voted.id, ada.id, "Python")))
+    run(repos.survey_results.save(SaveSurveyResultParams(voted.id, bob.id, "Go")))
+    run(repos.survey_results.save(SaveSurveyResultParams(voted.id, bob.id, "Python")))
+
+    results = run(repos.survey_results.load_by_survey_ids(
+        [voted.id, unanswered.id, "unknown"], bob.id
+    ))
+
+    assert set(results) == {voted.id, unanswered.id}
+    assert results[voted.id].question == "Voted?"
+    assert [(a.answer, a.count, a.percent, a.is_current_account_answer)
+            for a in results[voted.id].answers] == [("Python", 2, 100, True), ("Go", 0, 0, False)]
+    assert [(a.answer, a.count, a.percent) for a in results[unanswered.id].answers] == [
+        ("Python", 0, 0),
+        ("Go", 0, 0),
+    ]
+    assert run(repos.survey_results.load_by_survey_ids(["unknown"], bob.id)) == {}
+
+
+def test_account_answers_and_surveys_are_loaded_by_ids(repos):
+    account = add_account(repos)
+    answered = add_survey(repos, "Answered?")
+    open_survey = add_survey(repos, "Open?")
+    add_survey(repos, "Not requested?")
+    run(repos.survey_results.save(SaveSurveyResultParams(answered.id, account.id, "Go")))
+
+    answers = run(repos.survey_results.load_account_answers(
+        account.id, [answered.id, open_survey.id, "unknown"]
+    ))
+    surveys = run(repos.surveys.load_by_ids([open_survey.id, answered.id, "unknown"], account.id))
+
+    assert answers == {answered.id: "Go"}
+    assert {(survey.question, survey.did_answer) for survey in surveys} == {
+        ("Answered?", True),
+        ("Open?", False),
+    }
+    assert run(repos.surveys.load_by_ids(["unknown"], account.id)) == []
+
+
+def test_refresh_tokens_are_consumed_once_and_revoked_by_family(repos):
+    requires(repos, "refresh_tokens")
+    account = add_account(repos)
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=1)
+    for token_hash in ("first", "second"):
+        run(repos.refresh_tokens.add_refresh_token(
+            token_hash, RefreshTokenModel(account.id, "family", token_version=2), expires_at
+        ))
+
+    first = run(repos.refresh_tokens.consume_refresh_token("first"))
+    replayed = run(repos.refresh_tokens.consume_refresh_token("first"))
+    run(repos.refresh_tokens.revoke_refresh_token_family("family"))
+
+    assert first == RefreshTokenModel(account.id, "family", token_version=2, used=False)
+    assert replayed.used is True
+    assert run(repos.refresh_tokens.consume_refresh_token("second")) is None
+
+
+def test_expired_refresh_tokens_cannot_be_consumed(repos):
+    requires(repos, "refresh_tokens")
+    account = add_account(repos)
+    run(repos.refresh_tokens.add_refresh_token(
+        "expired",
+        RefreshTokenModel(account.id, "family"),
+        datetime.now(timezone.utc) - timedelta(seconds=1),
+    ))
+
+    assert run(repos.refresh_tokens.consume_refresh_token("expired")) is None
+
+
+def test_revoking_tokens_bumps_the_account_token_version(repos):
+    requires(repos, "token_revocations")
+    account = add_account(repos)
+
+    assert run(repos.token_revocations.revoke_tokens(account.id)) == 1
+    assert run(repos.token_revocations.revoke_tokens(account.id)) == 2
+    assert run(repos.token_revocations.load_revocations()) == {account.id: 2}
+    assert run(repos.accounts.load_by_id(account.id)).token_version == 2
+
+
+def test_revoking_tokens_of_an_unknown_account_returns_none(repos):
+    requires(repos, "token_revocations")
+    account = add_account(repos)
+    unknown_id = account.id[:-1] + ("1" if account.id.endswith("0") else "0")
+
+    assert run(repos.token_revocations.revoke_tokens("not-an-id")) is None
+    assert run(repos.token_revocations.revoke_tokens(unknown_id)) is None
+    assert run(repos.token_revocations.load_revocations()) == {}
@@ -0,0 +1,75 @@
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+
+from main.factories.container import Container, Scope
+
+
+def test_singleton_is_built_lazily_and_once():
+    factory = Mock(side_effect=object)
+    sut = Container()
+    sut.register("component", factory)
+
+    factory.assert_not_called()
+    first = sut.resolve("component")
+
+    assert sut.resolve("component") is first
+    factory.assert_called_once()
+
+
+def test_transient_is_built_on_every_resolve():
+    sut = Container()
+    sut.register("component", object, Scope.TRANSIENT)
+
+    assert sut.resolve("component") is not sut.resolve("component")
+
+
+def test_request_scope_is_shared_within_one_request_only():
+    sut = Container()
+    sut.register("component", object, Scope.REQUEST)
+    app = Flask(__name__)
+
+    with app.test_request_context():
+        first = sut.resolve("component")
+        assert sut.resolve("component") is first
+    with app.test_request_context():
+        assert sut.resolve("component") is not first
+
+
+def test_reset_rebuilds_singletons():
+    sut = Container()
+    sut.register("component", object)
+    first = sut.resolve("component")
+
+    sut.reset()
+
+    assert sut.resolve("component") is not first
+
+
+def test_resolve_unknown_component_raises():
+    with pytest.raises(KeyError):
+        Container().resolve("missing")
+
+
+def test_circular_dependencies_are_reported():
+    sut = Container()
+    sut.register("a", lambda: sut.resolve("b"))
+    sut.register("b", lambda: sut.resolve("a"))
+
+    with pytest.raises(RuntimeError, match="a -> b -> a"):
+        sut.resolve("a")
+
+
+def test_startup_report_lists_built_components_only():
+    sut = Container()
+    sut.register("dependency", object)
+    sut.register("component", lambda: (sut.resolve("dependency"), object()))
+    sut.register("unused", object)
+
+    sut.resolve("component")
+    report = {item["component"]: item for item in sut.startup_report()}
+
+    assert set(report) == {"component", "dependency"}
+    assert report["component"]["scope"] == "singleton"
+    assert report["component"]["ms"] >= 0
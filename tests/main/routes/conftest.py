@@ -0,0 +1,45 @@
+"""Fixtures for route tests that run the whole app against an in-memory MongoDB."""
+import mongomock
+import pytest
+
+from infra.db.mongodb.helpers import MongoHelper
+from main.config.app import create_app
+from main.config.env import jwt_secret
+
+APP_ENV = {
+    "JWT_SECRET": "test-secret-that-is-long-enough-for-hs256",
+    "BCRYPT_SALT": "4",
+    "AUTH_RATE_LIMIT_MAX_REQUESTS": "100",
+}
+
+
+@pytest.fixture
+def app_env():
+    """Environment added to ``APP_ENV``; override it in a module to switch features on."""
+    return {}
+
+
+@pytest.fixture
+def mongo_client():
+    """The client ``MongoHelper`` uses; override it for other client options or none at all."""
+    return mongomock.MongoClient()
+
+
+@pytest.fixture
+def client(monkeypatch, app_env, mongo_client):
+    for name, value in {**APP_ENV, **app_env}.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setattr(MongoHelper, "_client", mongo_client)
+    jwt_secret.cache_clear()
+    yield create_app().test_client()
+    jwt_secret.cache_clear()
+
+
+@pytest.fixture
+def signup(client, make_signup_payload):
+    """Post ``make_signup_payload(**overrides)`` to ``/api/signup`` and return the response."""
+
+    def _signup(**overrides):
+        return client.post("/api/signup", json=make_signup_payload(**overrides))
+
+    return _signup
@@ -1,12 +1,15 @@
 import asyncio
+from collections import defaultdict
 from copy import deepcopy
 from types import SimpleNamespace
 
 import pytest
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 
 from infra.cryptography import BcryptAdapter
 from infra.db.mongodb.helpers.mongo_helper import MongoHelper
+from infra.db.mongodb.session_repository import hash_access_token
 from main.config.app import create_app
 from main.config.env import jwt_secret
 
@@ -28,8 +31,13 @@ class FakeCollection:
         ]
 
     def insert_one(self, document):
+        # Mirrors the unique email index from infra.db.mongodb.indexes.
+        if "email" in document and any(
+            stored.get("email") == document["email"] for stored in self.documents
+        ):
+            raise DuplicateKeyError("E11000 duplicate key error: email_unique")
         stored_document = deepcopy(document)
-        stored_document["_id"] = ObjectId()
+        stored_document.setdefault("_id", ObjectId())
         self.documents.append(stored_document)
         return SimpleNamespace(inserted_id=stored_document["_id"])
 
@@ -39,11 +47,13 @@ class FakeCollection:
                 return deepcopy(document)
         return None
 
-    def update_one(self, query, update):
+    def update_one(self, query, update, upsert=False):
         for document in self.documents:
             if self._matches(document, query):
                 document.update(update.get("$set", {}))
                 return
+        if upsert:
+            self.documents.append({**deepcopy(query), **deepcopy(update.get("$set", {}))})
 
     def count_documents(self, query):
         return sum(1 for document in self.documents if self._matches(document, query))
@@ -67,11 +77,11 @@ def client(monkeypatch):
     monkeypatch.setenv("AUTH_RATE_LIMIT_MAX_REQUESTS", "100")
     monkeypatch.setenv("MONGO_DB_NAME", "flask_tdd_route_test")
     jwt_secret.cache_clear()
-    collection = FakeCollection()
+    collections = defaultdict(FakeCollection)
     monkeypatch.setattr(
         MongoHelper,
         "get_collection",
-        lambda collection_name, db_name=None: collection,
+        lambda collection_name, db_name=None: collections[collection_name],
     )
 
     app = create_app()
@@ -79,7 +89,7 @@ def client(monkeypatch):
 
     yield app.test_client()
 
-    collection.delete_many({})
+    collections.clear()
     jwt_secret.cache_clear()
 
 
@@ -170,7 +180,10 @@ def test_signup_route_success_returns_public_body_and_stores_hash_and_token(clie
     assert asyncio.run(
         bcrypt_adapter.compare("Valid_password123", stored_account["password"])
     )
-    assert stored_account["accessToken"] == body["accessToken"]
+    assert "accessToken" not in stored_account
+    assert MongoHelper.get_collection("sessions").find_one(
+        {"_id": hash_access_token(body["accessToken"])}
+    )["accountId"] == str(stored_account["_id"])
 
 
 @pytest.mark.parametrize(
@@ -218,18 +231,16 @@ def test_login_route_returns_401_for_wrong_password(client):
     assert response.get_json() == {"error": "Unauthorized"}
 
 
-def test_login_route_success_returns_public_body_and_updates_stored_token(client):
+def test_login_route_success_adds_a_session_without_ending_the_previous_one(client):
     client.post("/api/signup", json={
         "name": "Ada",
         "email": "ada@example.com",
         "password": "Valid_password123",
         "passwordConfirmation": "Valid_password123",
     })
-    collection = MongoHelper.get_collection("accounts")
-    collection.update_one(
-        {"email": "ada@example.com"},
-        {"$set": {"accessToken": "old_token"}},
-    )
+    sessions = MongoHelper.get_collection("sessions")
+    # Tokens minted in the same second are identical; make the first one distinct.
+    sessions.documents[0]["_id"] = hash_access_token("old_token")
 
     response = client.post("/api/login", json={
         "email": "ada@example.com",
@@ -237,9 +248,9 @@ def test_login_route_success_returns_public_body_and_updates_stored_token(client
     })
 
     body = response.get_json()
-    stored_account = collection.find_one({"email": "ada@example.com"})
 
     assert response.status_code == 200
     assert_public_auth_body(body, "Ada")
-    assert stored_account["accessToken"] == body["accessToken"]
-    assert stored_account["accessToken"] != "old_token"
+    assert sessions.count_documents({}) == 2
+    assert sessions.find_one({"_id": hash_access_token(body["accessToken"])}) is not None
+    assert sessions.find_one({"_id": hash_access_token("old_token")}) is not None
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from domain.usecases.add_survey import AddSurveyAnswerParams, AddSurveyParams
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.mongodb import SurveyMongoRepository, SurveyResultMongoRepository
+from infra.db.mongodb.helpers import MongoHelper
+
+DASHBOARD = """
+query Dashboard($first: Int) {
+  surveys(first: $first) {
+    id
+    question
+    didAnswer
+    myAnswer
+    result { answers { answer count percent isCurrentAccountAnswer } }
+  }
+}
+"""
+
+
+class CountingCollection:
+    def __init__(self, collection, operations):
+        self._collection = collection
+        self._operations = operations
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if not callable(attribute) or name in {"with_options", "name"}:
+            return attribute
+
+        def counted(*args, **kwargs):
+            self._operations.append(f"{self._collection.name}.{name}")
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+@pytest.fixture
+def operations(monkeypatch):
+    recorded = []
+    get_collection = MongoHelper.get_collection
+    monkeypatch.setattr(MongoHelper, "get_collection", classmethod(
+        lambda cls, name, db_name=None: CountingCollection(get_collection(name, db_name), recorded)
+    ))
+    return recorded
+
+
+def _signup(signup):
+    body = signup().get_json()
+    account_id = MongoHelper.get_collection("accounts").find_one()["_id"]
+    return {"x-access-token": body["accessToken"]}, str(account_id)
+
+
+def _seed(count, account_id):
+    async def seed():
+        for index in range(count):
+            await SurveyMongoRepository().add(AddSurveyParams(
+                question=f"Question {index}?",
+                answers=[AddSurveyAnswerParams("Yes"), AddSurveyAnswerParams("No")],
+                date=datetime(2026, 1, 1),
+            ))
+        surveys = MongoHelper.get_collection("surveys").find()
+        for survey in surveys:
+            await SurveyResultMongoRepository().save(
+                SaveSurveyResultParams(str(survey["_id"]), account_id, "No")
+            )
+
+    asyncio.run(seed())
+
+
+def test_graphql_requires_authentication(client):
+    response = client.post("/graphql", json={"query": "{ surveys { id } }"})
+
+    assert response.status_code == 403
+
+
+def test_a_page_of_surveys_with_tallies_costs_a_constant_number_of_queries(
+    client, signup, operations
+):
+    headers, account_id = _signup(signup)
+    _seed(12, account_id)
+
+    operations.clear()
+    small = client.post("/graphql", headers=headers, json={
+        "query": DASHBOARD, "variables": {"first": 3},
+    })
+    small_operations = [op for op in operations if not op.startswith("sessions.")]
+    operations.clear()
+    large = client.post("/graphql", headers=headers, json={
+        "query": DASHBOARD, "variables": {"first": 12},
+    })
+    large_operations = [op for op in operations if not op.startswith("sessions.")]
+
+    assert small.status_code == 200
+    surveys = large.get_json()["data"]["surveys"]
+    assert len(surveys) == 12
+    assert surveys[0]["didAnswer"] is True
+    assert surveys[0]["myAnswer"] == "No"
+    assert surveys[0]["result"]["answers"][0] == {
+        "answer": "No", "count": 1, "percent": 100, "isCurrentAccountAnswer": True,
+    }
+    assert sorted(small_operations) == sorted(large_operations) == sorted([
+        "surveys.find",
+        "surveyResults.distinct",
+        "surveys.find",
+        "surveyResults.aggregate",
+        "surveyResults.find",
+    ])
+
+
+def test_survey_lookups_by_id_are_batched(client, signup, operations):
+    headers, account_id = _signup(signup)
+    _seed(2, account_id)
+    first, second = (str(survey["_id"]) for survey in MongoHelper.get_collection("surveys").find())
+
+    operations.clear()
+    response = client.post("/graphql", headers=headers, json={"query": f"""{{
+        a: survey(id: "{first}") {{ question }}
+        b: survey(id: "{second}") {{ question }}
+        missing: survey(id: "unknown") {{ question }}
+    }}"""})
+
+    assert response.get_json() == {"data": {
+        "a": {"question": "Question 0?"},
+        "b": {"question": "Question 1?"},
+        "missing": None,
+    }}
+    assert [op for op in operations if op.startswith("surveys.")] == ["surveys.find"]
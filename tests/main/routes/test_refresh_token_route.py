@@ -0,0 +1,68 @@
+import mongomock
+import pytest
+
+from main.config.app import create_app
+
+
+@pytest.fixture
+def app_env():
+    return {"REFRESH_TOKENS_ENABLED": "1"}
+
+
+@pytest.fixture
+def mongo_client():
+    return mongomock.MongoClient(tz_aware=True)
+
+
+def test_refresh_route_is_not_registered_by_default(monkeypatch):
+    monkeypatch.delenv("REFRESH_TOKENS_ENABLED", raising=False)
+
+    response = create_app().test_client().post("/api/login/refresh", json={})
+
+    assert response.status_code == 404
+
+
+def test_login_refresh_rotates_tokens_without_a_password(client, signup_payload):
+    client.post("/api/signup", json=signup_payload)
+    login = client.post("/api/login", json={
+        "email": signup_payload["email"],
+        "password": signup_payload["password"],
+    }).get_json()
+
+    refreshed = client.post("/api/login/refresh", json={"refreshToken": login["refreshToken"]})
+
+    assert refreshed.status_code == 200
+    body = refreshed.get_json()
+    assert set(body) == {"accessToken", "name", "refreshToken"}
+    assert body["refreshToken"] != login["refreshToken"]
+    surveys = client.get("/api/surveys", headers={"x-access-token": body["accessToken"]})
+    assert surveys.status_code in (200, 204)
+
+
+def test_replayed_refresh_token_revokes_the_rotated_one(client, signup):
+    tokens = signup().get_json()
+    rotated = client.post(
+        "/api/login/refresh", json={"refreshToken": tokens["refreshToken"]}
+    ).get_json()
+
+    replay = client.post("/api/login/refresh", json={"refreshToken": tokens["refreshToken"]})
+    after_replay = client.post(
+        "/api/login/refresh", json={"refreshToken": rotated["refreshToken"]}
+    )
+
+    assert replay.status_code == 401
+    assert after_replay.status_code == 401
+
+
+def test_refresh_requires_a_refresh_token(client):
+    response = client.post("/api/login/refresh", json={})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize("refresh_token", [123, ["token"], {"token": "x"}])
+def test_refresh_rejects_a_refresh_token_that_is_not_a_string(client, refresh_token):
+    response = client.post("/api/login/refresh", json={"refreshToken": refresh_token})
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid param: refreshToken"
@@ -0,0 +1,51 @@
+import pytest
+
+from data.usecases import SingleFlightLoadSurveyResult, SingleFlightLoadSurveysView
+from infra.db.mongodb.helpers import MongoHelper
+from main.factories.controllers import (
+    make_load_survey_result_controller,
+    make_load_surveys_controller,
+)
+
+
+@pytest.fixture
+def app_env():
+    return {"REQUEST_COALESCING_ENABLED": "1"}
+
+
+def test_coalesced_reads_still_mark_each_accounts_own_answer(client, signup):
+    ada, bob = (signup().get_json()["accessToken"] for _ in range(2))
+    survey_id = str(MongoHelper.get_collection("surveys").insert_one({
+        "question": "Favourite language?",
+        "answers": [{"answer": "Python"}, {"answer": "Go"}],
+    }).inserted_id)
+    client.put(
+        f"/api/surveys/{survey_id}/results",
+        json={"answer": "Go"},
+        headers={"x-access-token": ada},
+    )
+
+    results = {
+        name: client.get(
+            f"/api/surveys/{survey_id}/results", headers={"x-access-token": token}
+        ).get_json()
+        for name, token in (("ada", ada), ("bob", bob))
+    }
+    surveys = {
+        name: client.get("/api/surveys", headers={"x-access-token": token}).get_json()
+        for name, token in (("ada", ada), ("bob", bob))
+    }
+
+    def current(result):
+        return [
+            answer["answer"] for answer in result["answers"] if answer["is_current_account_answer"]
+        ]
+
+    assert current(results["ada"]) == ["Go"]
+    assert current(results["bob"]) == []
+    assert [answer["count"] for answer in results["bob"]["answers"]] == [1, 0]
+    assert [survey["didAnswer"] for survey in surveys["ada"]] == [True]
+    assert [survey["didAnswer"] for survey in surveys["bob"]] == [False]
+    load_survey_result = make_load_survey_result_controller().load_survey_result
+    assert isinstance(load_survey_result, SingleFlightLoadSurveyResult)
+    assert isinstance(make_load_surveys_controller().load_surveys, SingleFlightLoadSurveysView)
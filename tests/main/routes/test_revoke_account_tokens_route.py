@@ -0,0 +1,72 @@
+import pytest
+
+from infra.db.mongodb.helpers import MongoHelper
+from main.config.app import create_app
+
+
+@pytest.fixture
+def app_env():
+    return {"AUTH_MODE": "stateless", "TOKEN_REVOCATION_REFRESH_SECONDS": "0"}
+
+
+@pytest.fixture
+def admin(client, make_signup_payload):
+    """Sign up an account named "admin", promote it and return a token issued afterwards."""
+    payload = make_signup_payload(name="admin")
+    client.post("/api/signup", json=payload)
+    MongoHelper.get_collection("accounts").update_one(
+        {"name": "admin"}, {"$set": {"role": "admin"}}
+    )
+    return _login(client, payload)
+
+
+def _login(client, payload):
+    return client.post("/api/login", json={
+        "email": payload["email"], "password": payload["password"],
+    }).get_json()["accessToken"]
+
+
+def _account_id(name):
+    return str(MongoHelper.get_collection("accounts").find_one({"name": name})["_id"])
+
+
+def _load_surveys(client, token):
+    return client.get("/api/surveys", headers={"x-access-token": token}).status_code
+
+
+def _revoke(client, token, account_id):
+    return client.post(
+        f"/api/accounts/{account_id}/revoke-tokens", headers={"x-access-token": token}
+    ).status_code
+
+
+def test_revoked_tokens_are_rejected_once_the_revocation_list_reloads(
+    client, make_signup_payload, admin
+):
+    bob_payload = make_signup_payload(name="bob")
+    bob = client.post("/api/signup", json=bob_payload).get_json()["accessToken"]
+    MongoHelper.get_collection("surveys").insert_one({
+        "question": "Favourite language?",
+        "answers": [{"answer": "Python"}],
+    })
+    assert _load_surveys(client, bob) == 200
+
+    assert _revoke(client, bob, _account_id("admin")) == 403
+    assert _revoke(client, admin, _account_id("bob")) == 204
+
+    assert _load_surveys(client, bob) == 403
+    assert _load_surveys(client, _login(client, bob_payload)) == 200
+    assert _load_surveys(client, admin) == 200
+
+
+def test_revoking_an_unknown_account_is_rejected(client, admin):
+    assert _revoke(client, admin, "0123456789abcdef01234567") == 403
+    assert _revoke(client, admin, "not-an-id") == 403
+
+
+def test_the_route_only_exists_for_stateless_tokens(client, monkeypatch):
+    monkeypatch.setenv("AUTH_MODE", "stateful")
+
+    response = create_app().test_client().post("/api/accounts/any/revoke-tokens")
+
+    assert response.status_code == 404
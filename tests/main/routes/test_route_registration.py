@@ -15,6 +15,8 @@ def controller_factories(monkeypatch):
         "load_surveys": Mock(),
         "save_survey_result": Mock(),
         "load_survey_result": Mock(),
+        "load_survey_results": Mock(),
+        "graphql": Mock(),
     }
     for controller in controllers.values():
         controller.handle.return_value = HttpResponse(200, {"ok": True})
@@ -43,6 +45,14 @@ def controller_factories(monkeypatch):
         "main.routes.survey_result_routes.make_load_survey_result_controller",
         Mock(return_value=controllers["load_survey_result"]),
     )
+    monkeypatch.setattr(
+        "main.routes.survey_result_routes.make_load_survey_results_controller",
+        Mock(return_value=controllers["load_survey_results"]),
+    )
+    monkeypatch.setattr(
+        "main.routes.graphql_routes.make_graphql_controller",
+        Mock(return_value=controllers["graphql"]),
+    )
     auth_middleware = Mock()
     auth_middleware.handle.return_value = HttpResponse(
         200,
@@ -56,6 +66,10 @@ def controller_factories(monkeypatch):
         "main.routes.survey_result_routes.make_auth_middleware",
         Mock(return_value=auth_middleware),
     )
+    monkeypatch.setattr(
+        "main.routes.graphql_routes.make_auth_middleware",
+        Mock(return_value=auth_middleware),
+    )
     return controllers
 
 
@@ -75,6 +89,8 @@ def client(controller_factories):
         ("get", "/api/surveys", "load_surveys"),
         ("put", "/api/surveys/survey-123/results", "save_survey_result"),
         ("get", "/api/surveys/survey-123/results", "load_survey_result"),
+        ("get", "/api/survey-results?ids=a,b", "load_survey_results"),
+        ("post", "/graphql", "graphql"),
     ],
 )
 def test_registers_all_api_routes(
@@ -209,3 +225,66 @@ def test_user_token_can_access_user_routes(
     http_request = controllers[controller_name].handle.call_args.args[0]
     assert http_request.account_id == "user-token-account"
     auth_factory.assert_any_call()
+
+
+def test_controllers_are_built_on_first_request_only(monkeypatch, controller_factories):
+    signup_factory = Mock(return_value=controller_factories["signup"])
+    monkeypatch.setattr("main.routes.login_routes.make_signup_controller", signup_factory)
+    client = create_app().test_client()
+
+    signup_factory.assert_not_called()
+    client.post("/api/signup", json={})
+    client.post("/api/signup", json={})
+
+    signup_factory.assert_called_once()
+
+
+def test_jwks_route_is_only_registered_for_asymmetric_signing(monkeypatch, tmp_path):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    monkeypatch.delenv("JWT_ALGORITHM", raising=False)
+    assert create_app().test_client().get("/.well-known/jwks.json").status_code == 404
+
+    private_key_file = tmp_path / "key.pem"
+    private_key_file.write_bytes(ed25519.Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    jwks_path = tmp_path / "jwks.json"
+    jwks_path.write_text(
+        '{"keys": [{"kty": "OKP", "crv": "Ed25519", "kid": "key-1", "alg": "EdDSA",'
+        ' "x": "11qYAYKxCrfVS_7TyWQHOg7hcvPapiMlrwIaaPcHURo"}]}'
+    )
+    monkeypatch.setenv("JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setenv("JWT_PRIVATE_KEY_FILE", str(private_key_file))
+    monkeypatch.setenv("JWT_SIGNING_KID", "key-1")
+    monkeypatch.setenv("JWT_JWKS_FILE", str(jwks_path))
+
+    response = create_app().test_client().get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert [key["kid"] for key in response.get_json()["keys"]] == ["key-1"]
+
+
+def test_jwks_route_publishes_the_signing_key_without_a_jwks_file(monkeypatch, tmp_path):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ed25519
+
+    private_key_file = tmp_path / "key.pem"
+    private_key_file.write_bytes(ed25519.Ed25519PrivateKey.generate().private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+    monkeypatch.setenv("JWT_ALGORITHM", "EdDSA")
+    monkeypatch.setenv("JWT_PRIVATE_KEY_FILE", str(private_key_file))
+    monkeypatch.setenv("JWT_SIGNING_KID", "key-1")
+    monkeypatch.delenv("JWT_JWKS_FILE", raising=False)
+
+    response = create_app().test_client().get("/.well-known/jwks.json")
+
+    (key,) = response.get_json()["keys"]
+    assert (key["kid"], key["alg"], key["use"], key["kty"]) == ("key-1", "EdDSA", "sig", "OKP")
+    assert "d" not in key
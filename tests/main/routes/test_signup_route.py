@@ -0,0 +1,27 @@
+import mongomock
+import pytest
+
+from infra.db.mongodb.helpers import MongoHelper
+
+
+@pytest.fixture
+def app_env():
+    return {"MONGO_URL": "mongodb://localhost:27017"}
+
+
+@pytest.fixture
+def mongo_client(monkeypatch):
+    """No client yet: the app connects to Mongo itself, as under ``flask run``."""
+    monkeypatch.setattr("infra.db.mongodb.helpers.mongo_helper.MongoClient", mongomock.MongoClient)
+    monkeypatch.setattr(MongoHelper, "_indexed_uris", set())
+    return None
+
+
+def test_duplicate_emails_are_rejected_by_the_indexes_created_on_connect(signup):
+    first = signup(email="ada@mail.com")
+    duplicate = signup(email="ada@mail.com")
+    other_case = signup(email="Ada@Mail.com")
+
+    assert first.status_code == 200
+    assert (duplicate.status_code, other_case.status_code) == (403, 403)
+    assert MongoHelper.get_collection("accounts").count_documents({}) == 1
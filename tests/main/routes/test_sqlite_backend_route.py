@@ -0,0 +1,71 @@
+import pytest
+
+from infra.db.sqlite.helpers import SqliteHelper
+from main.config.app import create_app
+
+
+@pytest.fixture
+def app_env(tmp_path):
+    return {"DB_BACKEND": "sqlite", "SQLITE_PATH": str(tmp_path / "api.sqlite3")}
+
+
+@pytest.fixture
+def mongo_client():
+    return None
+
+
+@pytest.fixture
+def client(client):
+    yield client
+    SqliteHelper.disconnect()
+
+
+def test_the_whole_api_runs_on_sqlite_without_a_mongo_server(client, signup_payload):
+    assert client.post("/api/signup", json=signup_payload).status_code == 200
+    SqliteHelper.connection().execute("UPDATE accounts SET role = 'admin'")
+    login = client.post("/api/login", json={
+        "email": signup_payload["email"].upper(),
+        "password": signup_payload["password"],
+    })
+    headers = {"x-access-token": login.get_json()["accessToken"]}
+
+    added = client.post("/api/surveys", headers=headers, json={
+        "question": "Favourite language?",
+        "answers": [{"answer": "Python"}, {"answer": "Go"}],
+    })
+    surveys = client.get("/api/surveys", headers=headers).get_json()
+    saved = client.put(
+        f"/api/surveys/{surveys[0]['id']}/results", headers=headers, json={"answer": "Go"}
+    )
+    result = client.get(f"/api/surveys/{surveys[0]['id']}/results", headers=headers)
+
+    assert added.status_code == 204
+    assert surveys[0]["didAnswer"] is False
+    assert saved.status_code == 200
+    assert result.get_json()["answers"][0]["answer"] == "Go"
+    assert result.get_json()["answers"][0]["count"] == 1
+    assert client.get("/api/surveys", headers=headers).get_json()[0]["didAnswer"] is True
+    assert client.get("/health/ready").get_json()["checks"]["sqlite"]["status"] == "up"
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setenv("DB_BACKEND", "cassandra")
+
+    with pytest.raises(RuntimeError, match="DB_BACKEND"):
+        create_app().test_client().get("/health/ready")
+
+
+@pytest.mark.parametrize("setting, value", [
+    ("REFRESH_TOKENS_ENABLED", "1"),
+    ("AUTH_MODE", "stateless"),
+    ("SURVEY_COUNTER_SHARDS_ENABLED", "1"),
+])
+def test_features_the_backend_cannot_store_are_rejected_at_startup(monkeypatch, setting, value):
+    monkeypatch.setenv("DB_BACKEND", "postgres")
+    monkeypatch.setenv(setting, value)
+
+    with pytest.raises(RuntimeError, match=f"{setting}={value} is not supported"):
+        create_app()
+
+    monkeypatch.delenv(setting)
+    create_app()
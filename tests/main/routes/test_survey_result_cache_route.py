@@ -0,0 +1,35 @@
+import pytest
+
+from infra.db.mongodb.helpers import MongoHelper
+
+
+@pytest.fixture
+def app_env():
+    return {
+        "SURVEY_RESULT_CACHE_ENABLED": "1",
+        "SURVEY_RESULT_CACHE_FRESH_SECONDS": "60",
+        "SURVEY_RESULT_CACHE_MAX_STALE_SECONDS": "120",
+    }
+
+
+def test_repeated_reads_are_served_from_the_cache_with_freshness_headers(client, signup):
+    token = signup().get_json()["accessToken"]
+    survey_id = str(MongoHelper.get_collection("surveys").insert_one({
+        "question": "Favourite language?",
+        "answers": [{"answer": "Python"}, {"answer": "Go"}],
+    }).inserted_id)
+    url = f"/api/surveys/{survey_id}/results"
+    client.put(url, json={"answer": "Go"}, headers={"x-access-token": token})
+
+    first = client.get(url, headers={"x-access-token": token})
+    second = client.get(url, headers={"x-access-token": token})
+
+    assert first.headers["Cache-Status"] == "survey-results; fwd=miss; stored"
+    assert second.headers["Cache-Status"].startswith("survey-results; hit; ttl=")
+    assert second.headers["Age"] == "0"
+    assert second.get_json() == first.get_json()
+    current = [
+        answer["answer"] for answer in second.get_json()["answers"]
+        if answer["is_current_account_answer"]
+    ]
+    assert current == ["Go"]
@@ -0,0 +1,79 @@
+import asyncio
+from datetime import datetime
+
+from domain.usecases.add_survey import AddSurveyAnswerParams, AddSurveyParams
+from domain.usecases.save_survey_result import SaveSurveyResultParams
+from infra.db.mongodb import SurveyMongoRepository, SurveyResultMongoRepository
+from infra.db.mongodb.helpers import MongoHelper
+
+
+class CountingCollection:
+    def __init__(self, collection, calls):
+        self._collection = collection
+        self._calls = calls
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if not callable(attribute):
+            return attribute
+
+        def counted(*args, **kwargs):
+            self._calls.append(f"{self._collection.name}.{name}")
+            return attribute(*args, **kwargs)
+
+        return counted
+
+
+def _seed(count, account_id):
+    async def seed():
+        for index in range(count):
+            await SurveyMongoRepository().add(AddSurveyParams(
+                question=f"Question {index}?",
+                answers=[AddSurveyAnswerParams("Yes"), AddSurveyAnswerParams("No")],
+                date=datetime(2026, 1, 1),
+            ))
+        survey_ids = [str(survey["_id"]) for survey in MongoHelper.get_collection("surveys").find()]
+        for survey_id in survey_ids[::2]:
+            await SurveyResultMongoRepository().save(
+                SaveSurveyResultParams(survey_id, account_id, "No")
+            )
+        return survey_ids
+
+    return asyncio.run(seed())
+
+
+def test_tallies_of_many_surveys_come_from_one_aggregation(client, signup, monkeypatch):
+    token = signup().get_json()["accessToken"]
+    account_id = str(MongoHelper.get_collection("accounts").find_one()["_id"])
+    survey_ids = _seed(50, account_id)
+    calls = []
+    get_collection = MongoHelper.get_collection
+    monkeypatch.setattr(MongoHelper, "get_collection", classmethod(
+        lambda cls, name, db_name=None: CountingCollection(get_collection(name, db_name), calls)
+    ))
+
+    response = client.get(
+        f"/api/survey-results?ids={','.join(survey_ids)},unknown",
+        headers={"x-access-token": token},
+    )
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert set(body) == set(survey_ids)
+    assert body[survey_ids[0]]["answers"][0] == {
+        "answer": "No", "image": None, "count": 1, "percent": 100, "is_current_account_answer": True,
+    }
+    assert [answer["count"] for answer in body[survey_ids[1]]["answers"]] == [0, 0]
+    assert sorted(call for call in calls if not call.startswith("sessions.")) == [
+        "surveyResults.aggregate",
+        "surveys.find",
+    ]
+
+
+def test_survey_results_require_ids(client, signup):
+    token = signup().get_json()["accessToken"]
+
+    response = client.get("/api/survey-results", headers={"x-access-token": token})
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "Missing param: ids"}
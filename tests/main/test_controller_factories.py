@@ -1,15 +1,112 @@
+import pytest
+
+from data.usecases import DbLoadAccountByClaims
 from data.usecases.add_account.db_add_account import DbAddAccount
-from infra.db.mongodb import AccountMongoRepository
-from main.factories.controllers import make_signup_controller
+from infra.cryptography import Argon2Adapter, BcryptAdapter
+from infra.db.mongodb import AccountMongoRepository, ShardedSurveyResultMongoRepository
+from main.factories.container import container
+from main.factories.controllers import (
+    make_login_controller,
+    make_signup_controller,
+    make_survey_result_repository,
+)
+from main.factories.middlewares import make_auth_middleware
 
 
-def test_signup_factory_uses_mongo_repository_for_add_and_duplicate_check():
+def test_signup_factory_relies_on_unique_email_index_instead_of_a_check():
     controller = make_signup_controller()
 
     add_account = controller.add_account
 
     assert isinstance(add_account, DbAddAccount)
     assert isinstance(add_account.add_account_repository, AccountMongoRepository)
-    assert add_account.check_account_by_email_repository is (
-        add_account.add_account_repository
+    assert add_account.check_account_by_email_repository is None
+
+
+def test_factories_share_singleton_dependencies():
+    signup_controller = make_signup_controller()
+    login_controller = make_login_controller()
+    auth_middleware = make_auth_middleware()
+
+    assert signup_controller.authentication is login_controller.authentication
+    assert (
+        auth_middleware.load_account_by_token.load_account_by_token_repository
+        is login_controller.authentication.update_access_token_repository
     )
+
+
+def test_stateless_auth_mode_authorizes_from_claims(monkeypatch):
+    monkeypatch.setenv("AUTH_MODE", "stateless")
+    container.reset()
+    try:
+        auth_middleware = make_auth_middleware()
+        login_controller = make_login_controller()
+    finally:
+        container.reset()
+
+    assert isinstance(auth_middleware.load_account_by_token, DbLoadAccountByClaims)
+    assert login_controller.authentication.include_claims is True
+
+
+def test_password_hash_scheme_selects_preferred_hasher(monkeypatch):
+    pytest.importorskip("argon2")
+    monkeypatch.setenv("PASSWORD_HASH_SCHEME", "argon2id")
+    container.reset()
+    try:
+        authentication = make_login_controller().authentication
+    finally:
+        container.reset()
+
+    assert isinstance(authentication.hash_comparer.preferred, Argon2Adapter)
+    assert [type(scheme) for scheme in authentication.hash_comparer.schemes] == [
+        Argon2Adapter,
+        BcryptAdapter,
+    ]
+    assert authentication.rehasher is authentication.hash_comparer
+
+
+@pytest.mark.parametrize("backend, module", [
+    ("sqlite", "infra.db.sqlite"),
+    ("postgres", "infra.db.postgres"),
+])
+def test_db_backend_selects_the_repositories_without_connecting(monkeypatch, backend, module):
+    monkeypatch.setenv("DB_BACKEND", backend)
+    container.reset()
+    try:
+        add_account = make_signup_controller().add_account
+        load_account_by_token = make_auth_middleware().load_account_by_token
+    finally:
+        container.reset()
+
+    assert type(add_account.add_account_repository).__module__.startswith(module)
+    assert type(load_account_by_token.load_account_by_token_repository).__module__.startswith(
+        module
+    )
+
+
+def test_postgres_backend_rejects_features_it_does_not_store(monkeypatch):
+    monkeypatch.setenv("DB_BACKEND", "postgres")
+    monkeypatch.setenv("REFRESH_TOKENS_ENABLED", "1")
+    container.reset()
+    try:
+        with pytest.raises(RuntimeError, match="no refresh_token repository"):
+            make_login_controller()
+    finally:
+        container.reset()
+
+
+def test_sharded_survey_counters_are_opt_in_and_mongodb_only(monkeypatch):
+    monkeypatch.setenv("SURVEY_COUNTER_SHARDS_ENABLED", "1")
+    monkeypatch.setenv("SURVEY_COUNTER_MAX_SHARDS", "16")
+    container.reset()
+    try:
+        repository = make_survey_result_repository()
+        monkeypatch.setenv("DB_BACKEND", "postgres")
+        container.reset()
+        with pytest.raises(RuntimeError, match="no sharded_survey_result repository"):
+            make_survey_result_repository()
+    finally:
+        container.reset()
+
+    assert isinstance(repository, ShardedSurveyResultMongoRepository)
+    assert (repository.detector.base_shards, repository.detector.max_shards) == (4, 16)
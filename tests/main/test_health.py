@@ -0,0 +1,98 @@
+"""Tests for the liveness and readiness probes."""
+from unittest.mock import patch
+
+from flask import Flask
+
+from infra.cryptography import BcryptPool
+from infra.db.mongodb.helpers import MongoHelper
+from main.config.app import create_app
+from main.config.health import ReadinessProbe, check_bcrypt_queue, check_mongo, setup_health
+
+
+def _make_client(checks):
+    app = Flask(__name__)
+    setup_health(app, checks)
+    return app.test_client()
+
+
+def test_liveness_does_not_touch_dependencies():
+    def failing_check():
+        raise AssertionError("liveness must not run readiness checks")
+
+    response = _make_client({"mongo": failing_check}).get("/health/live")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "alive"}
+
+
+def test_readiness_reports_every_check():
+    client = _make_client({
+        "mongo": lambda: (True, {"latency_ms": 1.0}),
+        "bcrypt_queue": lambda: (True, {"waiting": 0}),
+    })
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "status": "ready",
+        "checks": {
+            "mongo": {"status": "up", "latency_ms": 1.0},
+            "bcrypt_queue": {"status": "up", "waiting": 0},
+        },
+    }
+
+
+def test_readiness_fails_when_any_check_fails():
+    client = _make_client({
+        "mongo": lambda: (False, {"error": "unreachable"}),
+        "bcrypt_queue": lambda: (True, {"waiting": 0}),
+    })
+
+    response = client.get("/health/ready")
+
+    assert response.status_code == 503
+    assert response.get_json()["status"] == "not ready"
+    assert response.get_json()["checks"]["mongo"] == {"status": "down", "error": "unreachable"}
+
+
+def test_readiness_results_are_cached_between_probes():
+    calls = []
+
+    def counting_check():
+        calls.append(1)
+        return True, {}
+
+    probe = ReadinessProbe({"mongo": counting_check}, ttl_seconds=60)
+    for _ in range(5):
+        probe.run()
+
+    assert len(calls) == 1
+
+
+def test_mongo_check_is_down_without_a_client(monkeypatch):
+    monkeypatch.setattr(MongoHelper, "_client", None)
+
+    ok, details = check_mongo()
+
+    assert ok is False
+    assert "not connected" in details["error"]
+
+
+def test_bcrypt_check_is_down_when_the_queue_is_too_deep(monkeypatch):
+    pool = BcryptPool(max_workers=1)
+    pool.waiting = 3
+    monkeypatch.setenv("HEALTH_MAX_BCRYPT_QUEUE", "2")
+
+    with patch("infra.cryptography.bcrypt_adapter.bcrypt_pool", pool):
+        ok, details = check_bcrypt_queue()
+
+    assert ok is False
+    assert details == {"waiting": 3, "limit": 2}
+
+
+def test_legacy_health_endpoint_is_kept():
+    response = create_app().test_client().get("/health")
+
+    assert response.status_code == 200
+    assert response.get_json() == {"status": "healthy"}
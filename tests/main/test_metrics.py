@@ -0,0 +1,121 @@
+"""Tests for the Prometheus metrics endpoint and its multiprocess store."""
+import threading
+
+from flask import Flask, jsonify
+
+from main.config.metrics import (
+    MetricsRegistry,
+    MultiprocessStore,
+    _with_hit_ratios,
+    mark_process_dead,
+    merge_snapshots,
+    render,
+    setup_metrics,
+)
+from main.config.middlewares import setup_middlewares
+
+
+def _make_app():
+    app = Flask(__name__)
+    setup_metrics(app)
+    setup_middlewares(app)
+
+    @app.get("/api/things/<thing_id>")
+    def thing(thing_id):
+        return jsonify({"id": thing_id})
+
+    return app
+
+
+def test_requests_are_counted_per_route_and_status(monkeypatch):
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    client = _make_app().test_client()
+    client.get("/api/things/1")
+    client.get("/api/things/2")
+    client.get("/missing")
+
+    response = client.get("/metrics")
+    body = response.get_data(as_text=True)
+
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert 'http_requests_total{method="GET",route="/api/things/<thing_id>",status="200"} 2' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1' in body
+    assert (
+        'http_request_duration_seconds_bucket{method="GET",route="/api/things/<thing_id>",'
+        'status="200",le="+Inf"} 2'
+    ) in body
+    assert "http_requests_in_flight 1" in body
+    assert "# TYPE http_request_duration_seconds histogram" in body
+
+
+def test_rate_limited_requests_and_limiter_keys_are_reported(monkeypatch):
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    monkeypatch.setenv("AUTH_RATE_LIMIT_MAX_REQUESTS", "1")
+    app = _make_app()
+
+    @app.post("/api/login")
+    def login():
+        return jsonify({}), 200
+
+    client = app.test_client()
+    client.post("/api/login")
+    client.post("/api/login")
+
+    body = client.get("/metrics").get_data(as_text=True)
+
+    assert 'http_requests_total{method="POST",route="/api/login",status="429"} 1' in body
+    assert "rate_limiter_keys 1" in body
+
+
+def test_per_thread_shards_are_merged_on_snapshot():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+
+    def record():
+        for _ in range(1000):
+            registry.inc("http_requests_total", (("route", "/"),))
+            registry.observe("http_request_duration_seconds", (("route", "/"),), 0.5)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    samples = {sample["name"]: sample for sample in registry.snapshot()}
+
+    assert samples["http_requests_total"]["value"] == 4000
+    assert samples["http_request_duration_seconds"]["buckets"] == [0, 4000, 0]
+    assert samples["http_request_duration_seconds"]["sum"] == 2000
+
+
+def test_multiprocess_store_sums_workers_and_drops_dead_gauges(tmp_path):
+    store = MultiprocessStore(str(tmp_path))
+    (tmp_path / "metrics-1.json").write_text(
+        '{"live": true, "samples": ['
+        '{"name": "http_requests_total", "labels": {}, "value": 3},'
+        '{"name": "http_requests_in_flight", "labels": {}, "value": 2}]}'
+    )
+    (tmp_path / "metrics-2.json").write_text(
+        '{"live": true, "samples": ['
+        '{"name": "http_requests_total", "labels": {}, "value": 4},'
+        '{"name": "http_requests_in_flight", "labels": {}, "value": 1}]}'
+    )
+    mark_process_dead(str(tmp_path), 2)
+
+    body = render(merge_snapshots(store.read_all()))
+
+    assert "http_requests_total 7" in body
+    assert "http_requests_in_flight 2" in body
+
+
+def test_cache_hit_ratio_is_derived_from_merged_counts():
+    merged = merge_snapshots([
+        ([
+            {"name": "cache_hits_total", "labels": {"cache": "email"}, "value": 3},
+            {"name": "cache_misses_total", "labels": {"cache": "email"}, "value": 1},
+        ], True),
+    ])
+
+    body = render(_with_hit_ratios(merged))
+
+    assert 'cache_hit_ratio{cache="email"} 0.75' in body
@@ -0,0 +1,152 @@
+"""Tests for the sampling profiler, its admin route and per-request mode."""
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+
+from main.adapters import adapt_route
+from main.config.app import create_app
+from main.config.profiler import (
+    Profile,
+    SamplingProfiler,
+    render_collapsed,
+    render_speedscope,
+)
+from presentation.protocols import HttpResponse
+
+
+def busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_samples_stacks_of_other_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=busy_loop, args=(stop,))
+    worker.start()
+    try:
+        with SamplingProfiler(0.002, thread_ids={worker.ident}) as profiler:
+            time.sleep(0.1)
+    finally:
+        stop.set()
+        worker.join()
+
+    assert profiler.profile.sample_count > 0
+    assert any(
+        any(frame.startswith("busy_loop (") for frame in stack)
+        for stack in profiler.profile.samples
+    )
+
+
+def test_renders_collapsed_stacks_and_speedscope():
+    profile = Profile(interval=0.01)
+    profile.samples[("main (app.py:1)", "handle (app.py:9)")] = 3
+    profile.samples[("main (app.py:1)",)] = 1
+
+    assert render_collapsed(profile) == "main (app.py:1);handle (app.py:9) 3\nmain (app.py:1) 1\n"
+    speedscope = render_speedscope(profile, "worker")
+    assert speedscope["shared"]["frames"] == [
+        {"name": "main (app.py:1)"},
+        {"name": "handle (app.py:9)"},
+    ]
+    assert speedscope["profiles"][0]["samples"] == [[0, 1], [0]]
+    assert speedscope["profiles"][0]["weights"] == [30.0, 10.0]
+
+
+class TokenAuthMiddleware:
+    def __init__(self, role=None):
+        self.role = role
+
+    def handle(self, http_request):
+        if http_request.headers.get("x-access-token") != "admin-token":
+            return HttpResponse(403, Exception("Access denied"))
+        return HttpResponse(200, {"account_id": "admin"})
+
+
+@pytest.fixture
+def client(monkeypatch):
+    auth_factory = Mock(side_effect=lambda role=None: TokenAuthMiddleware(role))
+    monkeypatch.setattr("main.routes.profiler_routes.make_auth_middleware", auth_factory)
+    app = create_app()
+    yield app.test_client()
+    auth_factory.assert_called_with("admin")
+
+
+def test_profile_route_requires_admin(client):
+    response = client.get("/api/admin/profile?seconds=0.05")
+
+    assert response.status_code == 403
+
+
+def test_profile_route_returns_speedscope_for_admin(client):
+    response = client.get(
+        "/api/admin/profile?seconds=0.05&format=speedscope",
+        headers={"x-access-token": "admin-token"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Disposition"].endswith('.speedscope.json"')
+    assert response.get_json()["profiles"][0]["type"] == "sampled"
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["seconds=0", "seconds=3600", "seconds=abc", "format=pprof", "interval_ms=0"],
+)
+def test_profile_route_rejects_invalid_parameters(client, query):
+    response = client.get(
+        f"/api/admin/profile?{query}",
+        headers={"x-access-token": "admin-token"},
+    )
+
+    assert response.status_code == 400
+
+
+def _profiled_app(monkeypatch, token):
+    if token:
+        monkeypatch.setenv("PROFILER_TOKEN", token)
+    else:
+        monkeypatch.delenv("PROFILER_TOKEN", raising=False)
+    controller = Mock()
+
+    def handle(http_request):
+        time.sleep(0.02)
+        return HttpResponse(201, {"ok": True})
+
+    controller.handle.side_effect = handle
+    app = Flask(__name__)
+    app.add_url_rule("/things", "things", adapt_route(controller), methods=["POST"])
+    return app.test_client()
+
+
+def test_request_with_profile_header_returns_its_profile(monkeypatch):
+    client = _profiled_app(monkeypatch, "secret")
+
+    response = client.post("/things", headers={"X-Profile": "secret"})
+
+    assert response.status_code == 200
+    assert response.headers["X-Profiled-Status"] == "201"
+    assert "handle (" in response.get_data(as_text=True)
+
+
+def test_profile_header_is_ignored_without_matching_token(monkeypatch):
+    client = _profiled_app(monkeypatch, "secret")
+    assert client.post("/things", headers={"X-Profile": "wrong"}).status_code == 201
+
+    client = _profiled_app(monkeypatch, None)
+    assert client.post("/things", headers={"X-Profile": "secret"}).status_code == 201
+
+
+def test_profiles_end_before_gunicorn_would_stop_the_worker(client, monkeypatch):
+    monkeypatch.setenv("PROFILER_MAX_SECONDS", "60")
+    monkeypatch.setenv("WORKER_TIMEOUT_SECONDS", "30")
+    monkeypatch.setenv("GRACEFUL_TIMEOUT_SECONDS", "15")
+
+    response = client.get(
+        "/api/admin/profile?seconds=11", headers={"x-access-token": "admin-token"}
+    )
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "seconds must be between 0 and 10"}
@@ -0,0 +1,100 @@
+"""Tests for per-request query stats and the Server-Timing header."""
+import importlib
+import sys
+
+from flask import Flask, jsonify
+
+from infra.db.mongodb.helpers import current_query_stats
+from main.config.query_stats import setup_query_stats
+
+
+def _make_app(debug=False):
+    app = Flask(__name__)
+    app.debug = debug
+    setup_query_stats(app)
+
+    @app.get("/api/things/<thing_id>")
+    def thing(thing_id):
+        stats = current_query_stats()
+        stats.record("find", 2.5, 3)
+        stats.record("count", 0.5, 1)
+        return jsonify({"id": thing_id})
+
+    return app
+
+
+def test_server_timing_header_is_added_in_debug():
+    response = _make_app(debug=True).test_client().get("/api/things/1")
+
+    assert response.headers["Server-Timing"] == 'db;dur=3.00;desc="2 queries, 4 docs"'
+
+
+def test_server_timing_header_is_opt_in_outside_debug(monkeypatch):
+    monkeypatch.delenv("SERVER_TIMING", raising=False)
+    app = _make_app()
+    assert "Server-Timing" not in app.test_client().get("/api/things/1").headers
+
+    monkeypatch.setenv("SERVER_TIMING", "1")
+    assert "Server-Timing" in app.test_client().get("/api/things/1").headers
+
+
+def test_stats_are_aggregated_per_route_rule():
+    app = _make_app(debug=True)
+    client = app.test_client()
+    client.get("/api/things/1")
+    client.get("/api/things/2")
+
+    snapshot = client.get("/debug/query-stats").get_json()
+
+    assert snapshot["GET /api/things/<thing_id>"] == {
+        "requests": 2,
+        "commands": 4,
+        "duration_ms": 6.0,
+        "documents": 8,
+        "max_commands": 2,
+        "commands_per_request": 2.0,
+    }
+    assert current_query_stats() is None
+
+
+def test_debug_endpoint_is_not_registered_in_production():
+    response = _make_app().test_client().get("/debug/query-stats")
+
+    assert response.status_code == 404
+
+
+def test_requests_do_not_import_the_mongo_helpers(monkeypatch):
+    monkeypatch.delitem(sys.modules, "infra.db.mongodb.helpers.query_monitor")
+    app = Flask(__name__)
+    app.debug = True
+    setup_query_stats(app)
+
+    @app.get("/health")
+    def health():
+        return jsonify({"status": "ok"})
+
+    response = app.test_client().get("/health")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+    assert "infra.db.mongodb.helpers.query_monitor" not in sys.modules
+
+
+def test_the_request_that_first_loads_the_mongo_helpers_is_counted(monkeypatch):
+    monkeypatch.delitem(sys.modules, "infra.db.mongodb.helpers.query_monitor")
+    app = Flask(__name__)
+    app.debug = True
+    setup_query_stats(app)
+
+    @app.get("/api/things")
+    def things():
+        # Stands in for the first MongoHelper.connect of the process.
+        query_monitor = importlib.import_module("infra.db.mongodb.helpers.query_monitor")
+        query_monitor.current_query_stats().record("find", 1.0, 2)
+        return jsonify([])
+
+    client = app.test_client()
+    response = client.get("/api/things")
+
+    assert response.headers["Server-Timing"] == 'db;dur=1.00;desc="1 queries, 2 docs"'
+    assert client.get("/debug/query-stats").get_json()["GET /api/things"]["commands"] == 1
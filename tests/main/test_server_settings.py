@@ -0,0 +1,96 @@
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from infra.db.mongodb.helpers import MongoHelper
+from main.config.server import default_workers, post_fork, server_settings, worker_exit
+
+
+@pytest.fixture(autouse=True)
+def clear_server_env(monkeypatch):
+    for name in (
+        "HOST",
+        "PORT",
+        "WEB_CONCURRENCY",
+        "WORKER_CLASS",
+        "WORKER_THREADS",
+        "MAX_REQUESTS",
+        "MONGO_URL",
+        "DB_BACKEND",
+        "PRELOAD_APP",
+    ):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_default_workers_scale_with_cpu_cores():
+    assert default_workers(1) == 3
+    assert default_workers(4) == 9
+
+
+def test_server_settings_use_threaded_workers_by_default():
+    with patch("main.config.server.multiprocessing.cpu_count", return_value=2):
+        settings = server_settings()
+
+    assert settings["bind"] == "0.0.0.0:5000"
+    assert settings["workers"] == 5
+    assert settings["worker_class"] == "gthread"
+    assert settings["threads"] == 4
+    assert settings["max_requests"] > 0
+
+
+def test_app_is_imported_per_worker_by_default_so_sighup_reloads_code(monkeypatch):
+    assert server_settings()["preload_app"] is False
+
+    monkeypatch.setenv("PRELOAD_APP", "1")
+
+    assert server_settings()["preload_app"] is True
+
+
+def test_server_settings_read_overrides_from_env(monkeypatch):
+    monkeypatch.setenv("PORT", "8080")
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    monkeypatch.setenv("WORKER_CLASS", "gevent")
+    monkeypatch.setenv("MAX_REQUESTS", "0")
+
+    settings = server_settings()
+
+    assert settings["bind"] == "0.0.0.0:8080"
+    assert settings["workers"] == 3
+    assert settings["worker_class"] == "gevent"
+    assert settings["worker_connections"] == 1000
+    assert "threads" not in settings
+    assert settings["max_requests"] == 0
+
+
+def test_server_settings_reject_unknown_worker_class(monkeypatch):
+    monkeypatch.setenv("WORKER_CLASS", "eventlet")
+
+    with pytest.raises(ValueError):
+        server_settings()
+
+
+def test_post_fork_replaces_inherited_mongo_client(monkeypatch):
+    monkeypatch.setenv("MONGO_URL", "mongodb://localhost:27017")
+    inherited = object()
+    monkeypatch.setattr(MongoHelper, "_client", inherited)
+
+    with patch.object(MongoHelper, "connect", new=AsyncMock()) as connect:
+        post_fork(None, SimpleNamespace(pid=123))
+
+    connect.assert_awaited_once()
+    assert MongoHelper._client is not inherited
+
+
+def test_worker_hooks_leave_mongo_alone_on_sqlite(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "api.sqlite3"))
+    monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+    for module in ("infra.db.mongodb.helpers", "infra.db.mongodb.helpers.mongo_helper"):
+        monkeypatch.delitem(sys.modules, module)
+
+    post_fork(None, SimpleNamespace(pid=123))
+    worker_exit(None, SimpleNamespace(pid=123))
+
+    assert "infra.db.mongodb.helpers.mongo_helper" not in sys.modules
@@ -0,0 +1,172 @@
+"""Tests for span instrumentation across adapters, use cases and repositories."""
+import asyncio
+
+import mongomock
+import pytest
+
+from data.usecases import DbAddSurvey
+from infra.db.mongodb.helpers import MongoHelper
+from main.config.app import create_app
+from main.config.tracing import (
+    InMemorySpanExporter,
+    OtlpHttpSpanExporter,
+    configure_tracing,
+    current_span,
+    get_tracer,
+    traced,
+)
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    monkeypatch.setenv("TRACING_ENABLED", "1")
+    monkeypatch.setenv("TRACING_EXPORTER", "memory")
+    monkeypatch.setenv("BCRYPT_SALT", "4")
+    monkeypatch.setattr(MongoHelper, "_client", mongomock.MongoClient())
+    app = create_app()
+    yield app, app.extensions["tracer"].exporter
+    configure_tracing(None)
+
+
+def test_signup_spans_cover_every_layer(exporter):
+    app, spans = exporter
+    response = app.test_client().post("/api/signup", json={
+        "name": "Any Name",
+        "email": "any@mail.com",
+        "password": "Str0ng!Passw0rd",
+        "passwordConfirmation": "Str0ng!Passw0rd",
+    })
+    assert response.status_code == 200
+
+    finished = {span.name: span for span in spans.get_finished_spans()}
+    server = finished["POST /api/signup"]
+    controller = finished["SignUpController.handle"]
+    add_account = finished["DbAddAccount.add"]
+
+    assert server.kind == "SERVER"
+    assert server.attributes["http.response.status_code"] == 200
+    assert response.headers["traceparent"] == server.traceparent()
+    assert controller.parent_id == server.span_id
+    assert add_account.parent_id == controller.span_id
+    assert finished["MultiSchemeHasher.hash"].parent_id == add_account.span_id
+    assert finished["AccountMongoRepository.add"].kind == "CLIENT"
+    assert finished["AccountMongoRepository.add"].attributes["db.system"] == "mongodb"
+    assert finished["JwtAdapter.encrypt"].trace_id == server.trace_id
+
+
+def test_incoming_traceparent_is_continued(exporter):
+    app, spans = exporter
+    client = app.test_client()
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    token = client.post("/api/signup", json={
+        "name": "Any Name",
+        "email": "any@mail.com",
+        "password": "Str0ng!Passw0rd",
+        "passwordConfirmation": "Str0ng!Passw0rd",
+    }).get_json()["accessToken"]
+    MongoHelper.get_collection("surveys").insert_one({
+        "question": "Favourite language?",
+        "answers": [{"answer": "Python"}],
+    })
+    spans.clear()
+
+    response = client.get("/api/surveys", headers={
+        "traceparent": f"00-{trace_id}-00f067aa0ba902b7-01",
+        "x-access-token": token,
+    })
+    anonymous = client.get("/api/surveys")
+
+    assert (response.status_code, anonymous.status_code) == (200, 403)
+    finished = spans.get_finished_spans()
+    server = next(span for span in finished if span.kind == "SERVER")
+    assert server.trace_id == trace_id
+    assert server.parent_id == "00f067aa0ba902b7"
+    middleware = [span for span in finished if span.name == "AuthMiddleware.handle"]
+    assert [span.attributes["app.status_code"] for span in middleware] == [200, 403]
+    assert middleware[0].parent_id == server.span_id
+
+
+def test_unsampled_requests_record_nothing(exporter):
+    app, spans = exporter
+
+    app.test_client().get("/health", headers={
+        "traceparent": "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-00",
+    })
+
+    assert spans.get_finished_spans() == []
+
+
+def test_traced_returns_the_component_itself_when_disabled():
+    configure_tracing(None)
+    use_case = DbAddSurvey(object())
+
+    assert get_tracer() is None
+    assert traced(use_case) is use_case
+
+
+def test_failing_methods_mark_the_span_as_error():
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter)
+
+    class FailingRepository:
+        async def add(self, data):
+            assert current_span().name == "FailingRepository.add"
+            raise ValueError("boom")
+
+    FailingRepository.__module__ = "infra.db.mongodb.fake"
+    try:
+        with pytest.raises(ValueError):
+            asyncio.run(traced(FailingRepository()).add({}))
+    finally:
+        configure_tracing(None)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status == "ERROR"
+    assert span.status_message == "boom"
+    assert span.attributes["exception.type"] == "ValueError"
+
+
+@pytest.mark.parametrize("backend, db_system", [
+    ("mongodb", "mongodb"), ("sqlite", "sqlite"), ("postgres", "postgresql"),
+])
+def test_repository_spans_name_their_database(backend, db_system):
+    exporter = InMemorySpanExporter()
+    configure_tracing(exporter)
+
+    class Repository:
+        def load(self):
+            return None
+
+    Repository.__module__ = f"infra.db.{backend}.fake"
+    try:
+        traced(Repository()).load()
+    finally:
+        configure_tracing(None)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.attributes["db.system"] == db_system
+
+
+def test_otlp_payload_matches_the_collector_schema():
+    exporter = InMemorySpanExporter()
+    tracer = configure_tracing(exporter)
+    with tracer.span("parent", "SERVER", {"http.response.status_code": 200}):
+        with tracer.span("child"):
+            pass
+    configure_tracing(None)
+
+    payload = OtlpHttpSpanExporter("http://collector/v1/traces", "api").payload(
+        exporter.get_finished_spans()
+    )
+
+    resource_spans = payload["resourceSpans"][0]
+    child, parent = resource_spans["scopeSpans"][0]["spans"]
+    assert resource_spans["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "api"}}
+    ]
+    assert parent["kind"] == 2
+    assert parent["attributes"] == [
+        {"key": "http.response.status_code", "value": {"intValue": "200"}}
+    ]
+    assert child["parentSpanId"] == parent["spanId"]
+    assert child["status"] == {"code": 1, "message": ""}
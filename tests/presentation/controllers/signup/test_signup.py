@@ -219,7 +219,8 @@ class TestSignUpController(unittest.TestCase):
             password="hashed_password"
         ))
         authentication_spy = Mock()
-        authentication_spy.auth = AsyncMock(return_value=AuthenticationModel(
+        authentication_spy.auth = AsyncMock()
+        authentication_spy.auth_account = AsyncMock(return_value=AuthenticationModel(
             access_token="generated_token",
             name="any_name",
         ))
@@ -236,10 +237,11 @@ class TestSignUpController(unittest.TestCase):
         self.assertEqual(http_response.status_code, 200)
         self.assertEqual(http_response.body.access_token, "generated_token")
         self.assertEqual(http_response.body.name, "any_name")
-        authentication_spy.auth.assert_called_once()
-        auth_params = authentication_spy.auth.call_args.args[0]
-        self.assertEqual(auth_params.email, "any_email@mail.com")
-        self.assertEqual(auth_params.password, "Valid_password123")
+        authentication_spy.auth_account.assert_called_once_with(
+            add_account_spy.add.return_value
+        )
+        # Tokens come from the created account: no second lookup or password compare.
+        authentication_spy.auth.assert_not_called()
 
     def test_should_return_500_if_authentication_throws_after_account_creation(self):
         validation_stub = Mock()
@@ -252,7 +254,7 @@ class TestSignUpController(unittest.TestCase):
             password="hashed_password"
         ))
         authentication_spy = Mock()
-        authentication_spy.auth = AsyncMock(side_effect=Exception("Auth error"))
+        authentication_spy.auth_account = AsyncMock(side_effect=Exception("Auth error"))
         sut = SignUpController(add_account_spy, validation_stub, authentication_spy)
         http_request = HttpRequest({
             "name": "any_name",
@@ -0,0 +1,159 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+from domain.models.survey import SurveyAnswerModel, SurveyModel
+from domain.models.survey_result import SurveyResultAnswerModel, SurveyResultModel
+from presentation.controllers.graphql_controller import GraphQLController
+from presentation.errors import MissingParamError
+from presentation.errors.server_error import ServerError
+from presentation.protocols.http import HttpRequest
+
+
+def make_survey(survey_id):
+    return SurveyModel(
+        id=survey_id,
+        question=f"Question {survey_id}?",
+        answers=[SurveyAnswerModel("Yes"), SurveyAnswerModel("No")],
+        date=datetime(2026, 1, 1),
+    )
+
+
+def make_sut(surveys=5, **limits):
+    load_surveys = Mock()
+    load_surveys.load_page = AsyncMock(side_effect=lambda account_id, first, offset: [
+        make_survey(str(index)) for index in range(surveys)
+    ][offset:offset + first])
+    load_surveys_by_ids = Mock()
+    load_surveys_by_ids.load = AsyncMock(
+        side_effect=lambda survey_ids, account_id: [make_survey(id) for id in survey_ids]
+    )
+    load_survey_results = Mock()
+    load_survey_results.load = AsyncMock(side_effect=lambda survey_ids, account_id: {
+        survey_id: SurveyResultModel(
+            survey_id=survey_id,
+            question=f"Question {survey_id}?",
+            answers=[SurveyResultAnswerModel("Yes", 1, 100, True)],
+        )
+        for survey_id in survey_ids
+    })
+    load_account_answers = Mock()
+    load_account_answers.load = AsyncMock(return_value={"0": "Yes"})
+    sut = GraphQLController(
+        load_surveys, load_surveys_by_ids, load_survey_results, load_account_answers, **limits
+    )
+    return sut, load_surveys, load_surveys_by_ids, load_survey_results, load_account_answers
+
+
+def query(sut, text, variables=None):
+    return sut.handle(HttpRequest({"query": text, "variables": variables}, account_id="account"))
+
+
+def test_nested_fields_of_a_page_are_loaded_in_one_batch_per_loader():
+    sut, load_surveys, _, load_survey_results, load_account_answers = make_sut()
+
+    response = query(sut, """{
+        surveys(first: 3) { id myAnswer result { answers { answer count isCurrentAccountAnswer } } }
+    }""")
+
+    assert response.status_code == 200
+    assert response.body["data"]["surveys"][0] == {
+        "id": "0",
+        "myAnswer": "Yes",
+        "result": {"answers": [{"answer": "Yes", "count": 1, "isCurrentAccountAnswer": True}]},
+    }
+    assert [survey["myAnswer"] for survey in response.body["data"]["surveys"]] == ["Yes", None, None]
+    load_surveys.load_page.assert_awaited_once_with("account", 3, 0)
+    load_survey_results.load.assert_awaited_once_with(["0", "1", "2"], "account")
+    load_account_answers.load.assert_awaited_once_with("account", ["0", "1", "2"])
+
+
+def test_pages_are_requested_from_the_use_case():
+    sut, load_surveys, _, _, _ = make_sut()
+
+    response = query(sut, "{ surveys(first: 2, offset: 3) { id } }")
+
+    assert response.body["data"] == {"surveys": [{"id": "3"}, {"id": "4"}]}
+    load_surveys.load_page.assert_awaited_once_with("account", 2, 3)
+
+
+def test_surveys_requested_by_id_are_loaded_in_one_batch():
+    sut, _, load_surveys_by_ids, _, _ = make_sut()
+
+    response = query(sut, '{ a: survey(id: "1") { question } b: survey(id: "2") { question } }')
+
+    assert response.body["data"] == {"a": {"question": "Question 1?"}, "b": {"question": "Question 2?"}}
+    load_surveys_by_ids.load.assert_awaited_once_with(["1", "2"], "account")
+
+
+def test_queries_deeper_than_the_limit_are_rejected_before_running():
+    sut, load_surveys, _, _, _ = make_sut(max_depth=2)
+
+    response = query(sut, "{ surveys { result { answers { count } } } }")
+
+    assert response.status_code == 200
+    assert response.body == {"errors": [{
+        "message": "Query depth 4 exceeds the maximum of 2",
+        "locations": [{"line": 1, "column": 1}],
+    }]}
+    load_surveys.load_page.assert_not_awaited()
+
+
+def test_cost_counts_each_item_of_a_page():
+    sut, load_surveys, _, _, _ = make_sut(max_cost=30, max_page_size=50)
+    text = "query($first: Int) { surveys(first: $first) { id question } }"
+
+    literal = query(sut, "{ surveys(first: 10) { id question } }")
+    variable = query(sut, text, {"first": 1})
+
+    assert "errors" not in literal.body
+    assert variable.body["errors"][0]["message"] == "Query cost 101 exceeds the maximum of 30"
+    load_surveys.load_page.assert_awaited_once()
+
+
+def test_fragments_count_towards_depth_and_cost():
+    sut, _, _, _, _ = make_sut(max_depth=3)
+
+    response = query(sut, """
+        { surveys { ...withResult } }
+        fragment withResult on Survey { result { answers { count } } }
+    """)
+
+    assert response.body["errors"][0]["message"] == "Query depth 4 exceeds the maximum of 3"
+
+
+def test_page_size_is_bounded():
+    sut, load_surveys, _, _, _ = make_sut(max_page_size=10)
+
+    response = query(sut, "{ surveys(first: 11) { id } }")
+
+    assert response.body["errors"][0]["message"] == "first must be between 1 and 10"
+    assert response.body["data"] == {"surveys": None}
+    load_surveys.load_page.assert_not_awaited()
+
+
+def test_returns_400_without_a_query():
+    sut, _, _, _, _ = make_sut()
+
+    response = sut.handle(HttpRequest({}))
+
+    assert response.status_code == 400
+    assert isinstance(response.body, MissingParamError)
+
+
+def test_syntax_errors_are_reported_in_the_body():
+    sut, _, _, _, _ = make_sut()
+
+    response = query(sut, "{ surveys { id ")
+
+    assert response.status_code == 200
+    assert response.body["errors"][0]["message"].startswith("Syntax Error")
+
+
+def test_returns_500_if_a_use_case_fails():
+    sut, _, _, load_survey_results, _ = make_sut()
+    load_survey_results.load.side_effect = RuntimeError("database down")
+
+    response = query(sut, "{ surveys { result { question } } }")
+
+    assert response.status_code == 500
+    assert isinstance(response.body, ServerError)
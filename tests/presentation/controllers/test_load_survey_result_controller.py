@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, Mock
+
+from domain.models.survey_result import SurveyResultModel
+from domain.usecases import SurveyResultFreshness
+from presentation.controllers.load_survey_result_controller import (
+    LoadSurveyResultController,
+    freshness_headers,
+)
+from presentation.protocols.http import HttpRequest
+
+
+def make_sut(load_survey_result):
+    check_survey_by_id = Mock()
+    check_survey_by_id.check_by_id = AsyncMock(return_value=True)
+    return LoadSurveyResultController(check_survey_by_id, load_survey_result)
+
+
+def test_plain_loads_send_no_cache_headers():
+    load_survey_result = Mock(spec=["load"])
+    load_survey_result.load = AsyncMock(return_value=SurveyResultModel(survey_id="survey"))
+
+    response = make_sut(load_survey_result).handle(
+        HttpRequest(params={"survey_id": "survey"}, account_id="account")
+    )
+
+    assert response.status_code == 200
+    assert response.headers is None
+    load_survey_result.load.assert_awaited_once_with("survey", "account")
+
+
+def test_cached_loads_send_their_freshness():
+    load_survey_result = Mock(spec=["load", "load_with_freshness"])
+    load_survey_result.load_with_freshness = AsyncMock(return_value=(
+        SurveyResultModel(survey_id="survey"),
+        SurveyResultFreshness(hit=True, age_seconds=0.4, fresh_seconds=2),
+    ))
+
+    response = make_sut(load_survey_result).handle(
+        HttpRequest(params={"survey_id": "survey"}, account_id="account")
+    )
+
+    assert response.headers == {"Age": "0", "Cache-Status": "survey-results; hit; ttl=1"}
+    load_survey_result.load.assert_not_called()
+
+
+def test_stale_hits_have_a_negative_ttl_and_misses_are_stored():
+    stale = SurveyResultFreshness(hit=True, age_seconds=5.5, fresh_seconds=2)
+    miss = SurveyResultFreshness(hit=False, age_seconds=0, fresh_seconds=2)
+
+    assert freshness_headers(stale) == {"Age": "5", "Cache-Status": "survey-results; hit; ttl=-4"}
+    assert freshness_headers(miss)["Cache-Status"] == "survey-results; fwd=miss; stored"
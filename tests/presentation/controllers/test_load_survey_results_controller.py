@@ -0,0 +1,57 @@
+from unittest.mock import AsyncMock, Mock
+
+from domain.models.survey_result import SurveyResultModel
+from presentation.controllers.load_survey_results_controller import LoadSurveyResultsController
+from presentation.errors import InvalidParamError, MissingParamError
+from presentation.errors.server_error import ServerError
+from presentation.protocols.http import HttpRequest
+
+
+def make_sut(max_ids=100):
+    load_survey_results = Mock()
+    load_survey_results.load = AsyncMock(side_effect=lambda survey_ids, account_id: {
+        survey_id: SurveyResultModel(survey_id=survey_id) for survey_id in survey_ids
+    })
+    return LoadSurveyResultsController(load_survey_results, max_ids), load_survey_results
+
+
+def test_loads_comma_separated_and_repeated_ids_in_one_call():
+    sut, load_survey_results = make_sut()
+
+    response = sut.handle(HttpRequest(
+        query={"ids": ["a,b", "c", " b ,"]}, account_id="account"
+    ))
+
+    assert response.status_code == 200
+    assert list(response.body) == ["a", "b", "c"]
+    load_survey_results.load.assert_awaited_once_with(["a", "b", "c"], "account")
+
+
+def test_returns_400_without_ids():
+    sut, load_survey_results = make_sut()
+
+    response = sut.handle(HttpRequest(query={"ids": [","]}))
+
+    assert response.status_code == 400
+    assert isinstance(response.body, MissingParamError)
+    load_survey_results.load.assert_not_awaited()
+
+
+def test_returns_400_with_too_many_ids():
+    sut, load_survey_results = make_sut(max_ids=2)
+
+    response = sut.handle(HttpRequest(query={"ids": ["a,b,c"]}))
+
+    assert response.status_code == 400
+    assert isinstance(response.body, InvalidParamError)
+    load_survey_results.load.assert_not_awaited()
+
+
+def test_returns_500_if_load_survey_results_fails():
+    sut, load_survey_results = make_sut()
+    load_survey_results.load.side_effect = RuntimeError("database down")
+
+    response = sut.handle(HttpRequest(query={"ids": ["a"]}))
+
+    assert response.status_code == 500
+    assert isinstance(response.body, ServerError)
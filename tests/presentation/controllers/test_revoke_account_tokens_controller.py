@@ -0,0 +1,40 @@
+from unittest.mock import AsyncMock, Mock
+
+from presentation.controllers import RevokeAccountTokensController
+from presentation.errors import InvalidParamError
+from presentation.errors.server_error import ServerError
+from presentation.protocols.http import HttpRequest
+
+
+def make_sut(token_version=1):
+    revoke_account_tokens = Mock()
+    revoke_account_tokens.revoke = AsyncMock(return_value=token_version)
+    return RevokeAccountTokensController(revoke_account_tokens), revoke_account_tokens
+
+
+def test_revokes_the_account_in_the_path_not_the_caller():
+    sut, revoke_account_tokens = make_sut()
+
+    response = sut.handle(HttpRequest(params={"account_id": "bob"}, account_id="admin"))
+
+    assert response.status_code == 204
+    revoke_account_tokens.revoke.assert_awaited_once_with("bob")
+
+
+def test_returns_403_for_an_unknown_account():
+    sut, _ = make_sut(token_version=None)
+
+    response = sut.handle(HttpRequest(params={"account_id": "ghost"}))
+
+    assert response.status_code == 403
+    assert isinstance(response.body, InvalidParamError)
+
+
+def test_returns_500_if_revocation_fails():
+    sut, revoke_account_tokens = make_sut()
+    revoke_account_tokens.revoke.side_effect = RuntimeError("database down")
+
+    response = sut.handle(HttpRequest(params={"account_id": "bob"}))
+
+    assert response.status_code == 500
+    assert isinstance(response.body, ServerError)
@@ -61,6 +61,31 @@ class TestEmailValidatorAdapter(unittest.TestCase):
             sut.is_valid('any_email@mail.com')
             mock_validate.assert_called_once_with('any_email@mail.com', check_deliverability=False)
 
+    def test_should_reject_malformed_email_without_calling_validator(self):
+        sut = make_sut()
+        with patch('utils.email_validator_adapter.validate_email') as mock_validate:
+            self.assertFalse(sut.is_valid('no-domain@localhost'))
+            self.assertFalse(sut.is_valid('with space@mail.com'))
+            self.assertFalse(sut.is_valid('a' * 250 + '@mail.com'))
+            mock_validate.assert_not_called()
+
+    def test_should_cache_validation_result_per_email(self):
+        sut = make_sut()
+        with patch('utils.email_validator_adapter.validate_email') as mock_validate:
+            self.assertTrue(sut.is_valid('cached_email@mail.com'))
+            self.assertTrue(sut.is_valid('cached_email@mail.com'))
+            mock_validate.assert_called_once_with('cached_email@mail.com', check_deliverability=False)
+
+    def test_should_normalize_case_and_idna_domain(self):
+        sut = make_sut()
+        self.assertEqual(sut.normalize('Foo.Bar@BÜCHER.de'), 'foo.bar@xn--bcher-kva.de')
+        self.assertEqual(sut.normalize('foo.bar@xn--bcher-kva.de'), 'foo.bar@xn--bcher-kva.de')
+        self.assertEqual(sut.normalize('Ada@Example.COM'), 'ada@example.com')
+
+    def test_should_casefold_unparseable_email_when_normalizing(self):
+        sut = make_sut()
+        self.assertEqual(sut.normalize(' Not An Email '), 'not an email')
+
 
 if __name__ == '__main__':
     unittest.main()
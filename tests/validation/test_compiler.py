@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from presentation.errors import InvalidParamError, MissingParamError
+from validation import (
+    CompareFieldsValidation,
+    EmailValidation,
+    PasswordStrengthValidation,
+    RequiredFieldValidation,
+    ValidationComposite,
+    compile_validation,
+)
+
+
+def make_composite(email_validator):
+    return ValidationComposite([
+        RequiredFieldValidation("email"),
+        RequiredFieldValidation("password"),
+        ValidationComposite([
+            CompareFieldsValidation("password", "passwordConfirmation"),
+            PasswordStrengthValidation("password"),
+        ]),
+        EmailValidation("email", email_validator),
+    ])
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"email": "any@mail.com"},
+        {"email": "any@mail.com", "password": "Valid123", "passwordConfirmation": "x"},
+        {"email": "any@mail.com", "password": "weak", "passwordConfirmation": "weak"},
+        {"email": "bad", "password": "Valid123", "passwordConfirmation": "Valid123"},
+        {"email": "any@mail.com", "password": "Valid123", "passwordConfirmation": "Valid123"},
+    ],
+)
+def test_compiled_validation_returns_same_error_as_composite(payload):
+    email_validator = Mock()
+    email_validator.is_valid.side_effect = lambda email: "@" in email
+    composite = make_composite(email_validator)
+
+    expected = composite.validate(payload)
+    result = compile_validation(composite).validate(payload)
+
+    assert type(result) is type(expected)
+    assert str(result) == str(expected)
+
+
+def test_compiled_validation_flattens_nested_composites():
+    compiled = compile_validation(make_composite(Mock()))
+
+    assert [type(item) for item in compiled.validations] == [
+        RequiredFieldValidation,
+        RequiredFieldValidation,
+        CompareFieldsValidation,
+        PasswordStrengthValidation,
+        EmailValidation,
+    ]
+
+
+def test_compiled_validation_reads_attributes_from_objects():
+    compiled = compile_validation(ValidationComposite([
+        RequiredFieldValidation("name"),
+        RequiredFieldValidation("email"),
+    ]))
+
+    assert isinstance(compiled.validate(SimpleNamespace(name="Name")), MissingParamError)
+    assert compiled.validate(SimpleNamespace(name="Name", email="any@mail.com")) is None
+
+
+def test_compiled_validation_skips_email_check_for_empty_email():
+    email_validator = Mock()
+    compiled = compile_validation(EmailValidation("email", email_validator))
+
+    assert compiled.validate({"email": ""}) is None
+    email_validator.is_valid.assert_not_called()
+    email_validator.is_valid.return_value = False
+    assert isinstance(compiled.validate({"email": "x"}), InvalidParamError)
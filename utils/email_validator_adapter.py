@@ -1,12 +1,53 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
 from email_validator import validate_email, EmailNotValidError
+from data.protocols.email_normalizer import EmailNormalizer
 from presentation.protocols.email_validator import EmailValidator
 from validation.protocols import EmailValidator as ValidationEmailValidator
 
 
-class EmailValidatorAdapter(EmailValidator, ValidationEmailValidator):
+# Cheap shape check run before the full RFC/IDNA parse. It only rejects input
+# that validate_email would also reject, so it never changes the result.
+_EMAIL_SHAPE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+_MAX_EMAIL_LENGTH = 254
+
+
+class EmailValidatorAdapter(EmailValidator, ValidationEmailValidator, EmailNormalizer):
+    def __init__(self, cache_size: int = 4096):
+        self._is_valid_cached = lru_cache(maxsize=cache_size)(self._validate)
+        self._normalize_cached = lru_cache(maxsize=cache_size)(self._normalize)
+
     def is_valid(self, email: str) -> bool:
+        if not email or len(email) > _MAX_EMAIL_LENGTH or not _EMAIL_SHAPE.fullmatch(email):
+            return False
+        return self._is_valid_cached(email)
+
+    def normalize(self, email: str) -> str:
+        """Casefolded local part plus the punycode domain: ``foo@xn--bcher-kva.de``.
+
+        Input that does not parse as an address is only trimmed and casefolded,
+        so lookups with it still miss instead of raising.
+        """
+        return self._normalize_cached(email)
+
+    def cache_info(self):
+        return self._is_valid_cached.cache_info()
+
+    @staticmethod
+    def _validate(email: str) -> bool:
         try:
             validate_email(email, check_deliverability=False)
             return True
         except EmailNotValidError:
             return False
+
+    @staticmethod
+    def _normalize(email: str) -> str:
+        try:
+            parsed = validate_email(email, check_deliverability=False)
+        except EmailNotValidError:
+            return email.strip().casefold()
+        return f"{parsed.local_part.casefold()}@{parsed.ascii_domain.lower()}"
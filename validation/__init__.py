@@ -1,3 +1,4 @@
+from validation.compiler import CompiledValidation, compile_validation
 from validation.protocols import EmailValidator
 from validation.validators import (
     CompareFieldsValidation,
@@ -9,9 +10,11 @@ from validation.validators import (
 
 __all__ = [
     "CompareFieldsValidation",
+    "CompiledValidation",
     "EmailValidation",
     "EmailValidator",
     "PasswordStrengthValidation",
     "RequiredFieldValidation",
     "ValidationComposite",
+    "compile_validation",
 ]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterator, Tuple
+
+from presentation.errors import InvalidParamError, MissingParamError
+from presentation.protocols import Validation
+from validation.validators import (
+    CompareFieldsValidation,
+    EmailValidation,
+    RequiredFieldValidation,
+    ValidationComposite,
+)
+
+Getter = Callable[[str], Any]
+Rule = Callable[[Any, Getter], "Exception | None"]
+
+
+def _flatten(validation: Validation) -> Iterator[Validation]:
+    if isinstance(validation, (ValidationComposite, CompiledValidation)):
+        for child in validation.validations:
+            yield from _flatten(child)
+    else:
+        yield validation
+
+
+def _required(field_name: str) -> Rule:
+    def rule(input_data: Any, get: Getter) -> Exception | None:
+        return None if get(field_name) else MissingParamError(field_name)
+
+    return rule
+
+
+def _compare(field_name: str, field_to_compare: str) -> Rule:
+    def rule(input_data: Any, get: Getter) -> Exception | None:
+        if get(field_name) != get(field_to_compare):
+            return InvalidParamError(field_to_compare)
+        return None
+
+    return rule
+
+
+def _email(field_name: str, is_valid: Callable[[str], bool]) -> Rule:
+    def rule(input_data: Any, get: Getter) -> Exception | None:
+        email = get(field_name)
+        if email and not is_valid(email):
+            return InvalidParamError(field_name)
+        return None
+
+    return rule
+
+
+def _generic(validation: Validation) -> Rule:
+    validate = validation.validate
+
+    def rule(input_data: Any, get: Getter) -> Exception | None:
+        return validate(input_data)
+
+    return rule
+
+
+def _compile_rule(validation: Validation) -> Rule:
+    if type(validation) is RequiredFieldValidation:
+        return _required(validation.field_name)
+    if type(validation) is CompareFieldsValidation:
+        return _compare(validation.field_name, validation.field_to_compare)
+    if type(validation) is EmailValidation:
+        return _email(validation.field_name, validation.email_validator.is_valid)
+    return _generic(validation)
+
+
+class CompiledValidation(Validation):
+    """A flattened validation pipeline with rules specialized per validator type.
+
+    Built by ``compile_validation``; behaves exactly like the composite it was
+    compiled from, returning the first error in declaration order.
+    """
+
+    def __init__(self, validations: Tuple[Validation, ...], rules: Tuple[Rule, ...]):
+        self.validations = validations
+        self._rules = rules
+
+    def validate(self, input_data: Any) -> Exception | None:
+        if isinstance(input_data, dict):
+            get = input_data.get
+        else:
+            def get(field_name: str) -> Any:
+                return getattr(input_data, field_name, None)
+        for rule in self._rules:
+            error = rule(input_data, get)
+            if error:
+                return error
+        return None
+
+
+def compile_validation(validation: Validation) -> CompiledValidation:
+    """Compile a validation (usually a ValidationComposite) into one callable pipeline."""
+    validations = tuple(_flatten(validation))
+    return CompiledValidation(validations, tuple(_compile_rule(item) for item in validations))